@@ -232,6 +232,12 @@ MAX_PARALLEL_FILE_BATCHES = int(os.environ.get("MAX_PARALLEL_FILE_BATCHES", 1))
 MAX_PARALLEL_FILE_BATCHES_MAX_VALUE = int(
     os.environ.get("MAX_PARALLEL_FILE_BATCHES_MAX_VALUE", 100)
 )
+# Files of one batch a file-processing worker runs concurrently (1 = sequential)
+MAX_FILE_CONCURRENCY_PER_BATCH = int(os.environ.get("MAX_FILE_CONCURRENCY_PER_BATCH", 1))
+# Upper limit for per-organization overrides
+MAX_FILE_CONCURRENCY_PER_BATCH_MAX_VALUE = int(
+    os.environ.get("MAX_FILE_CONCURRENCY_PER_BATCH_MAX_VALUE", 16)
+)
 # Maximum number of times a file can be executed in a workflow
 MAX_FILE_EXECUTION_COUNT = int(os.environ.get("MAX_FILE_EXECUTION_COUNT", 3))
 
@@ -256,6 +262,16 @@ NOTIFICATION_CLUB_INTERVAL = int(os.environ.get("NOTIFICATION_CLUB_INTERVAL", "3
 NOTIFICATION_BUFFER_RETENTION_DAYS = int(
     os.environ.get("NOTIFICATION_BUFFER_RETENTION_DAYS", "7")
 )
+# ExecutionLog partitioning by event_time: partition width ("day" or "week"),
+# how many future partitions to keep created, and retention in days. Expired
+# partitions are dropped whole; 0 keeps logs forever.
+EXECUTION_LOG_PARTITION_INTERVAL = os.environ.get(
+    "EXECUTION_LOG_PARTITION_INTERVAL", "day"
+)
+EXECUTION_LOG_PARTITION_PREMAKE = int(
+    os.environ.get("EXECUTION_LOG_PARTITION_PREMAKE", "7")
+)
+EXECUTION_LOG_RETENTION_DAYS = int(os.environ.get("EXECUTION_LOG_RETENTION_DAYS", "0"))
 # Lease (seconds) for a buffer row claimed for dispatch (status=SENDING). If a row
 # stays SENDING longer than this — e.g. the backend crashed between committing the
 # claim and publishing the Celery task — the flush reaper returns it to PENDING for
@@ -61,6 +61,14 @@ class ConfigKey(Enum):
         max_value=settings.MAX_PARALLEL_FILE_BATCHES_MAX_VALUE,
     )
 
+    MAX_FILE_CONCURRENCY_PER_BATCH = ConfigSpec(
+        default=settings.MAX_FILE_CONCURRENCY_PER_BATCH,
+        value_type=ConfigType.INT,
+        help_text="Maximum number of files processed concurrently within one batch",
+        min_value=1,
+        max_value=settings.MAX_FILE_CONCURRENCY_PER_BATCH_MAX_VALUE,
+    )
+
     NOTIFICATION_CLUB_INTERVAL = ConfigSpec(
         default=settings.NOTIFICATION_CLUB_INTERVAL,
         value_type=ConfigType.INT,
@@ -20,7 +20,14 @@ from django.db import close_old_connections
 
 from pg_queue.models import PgTaskResult
 from pg_queue.producer import enqueue_task
+from unstract.core.pg_result_payload import (
+    ResultStorage,
+    decode_result,
+    delete_offloaded,
+    offload_path,
+)
 from unstract.core.polling import poll_for_row
+from unstract.filesystem import FileStorageType, FileSystem
 from unstract.sdk1.execution.dispatcher import ExecutionDispatcher
 from unstract.workflow_execution.executor_rpc import (
     EXECUTE_TASK,
@@ -55,6 +62,11 @@ def resolve_executor_transport(context: ExecutionContext) -> bool:
     return resolve_pg_transport(context)
 
 
+def _result_storage() -> ResultStorage:
+    """Storage the workers offload large results to (see ``unstract.core.pg_result_payload``)."""
+    return FileSystem(FileStorageType.WORKFLOW_EXECUTION).get_file_storage()
+
+
 class DjangoQueueTransport(QueueTransport):
     """:class:`QueueTransport` over the Django ORM (the backend half).
 
@@ -94,13 +106,22 @@ class DjangoQueueTransport(QueueTransport):
         — **dispatch must NOT be called inside an open transaction**
         (``transaction.atomic`` / ``ATOMIC_REQUESTS`` would pin one snapshot and never
         see the new row).
+
+        A result the executor stored compressed or offloaded is restored here, and
+        an offloaded file is deleted along with the consumed payload.
         """
+        offloaded: list[str] = []
 
         def _fetch() -> ExecResultRow | None:
             row = PgTaskResult.objects.filter(pk=reply_key).first()
             if row is None:
                 return None
-            return ExecResultRow(status=row.status, result=row.result, error=row.error)
+            offloaded[:] = [offload_path(row.result)]
+            return ExecResultRow(
+                status=row.status,
+                result=decode_result(row.result, _result_storage),
+                error=row.error,
+            )
 
         row = poll_for_row(_fetch, timeout, between_polls=close_old_connections)
         if row is not None:
@@ -112,6 +133,7 @@ class DjangoQueueTransport(QueueTransport):
             # must not fail a good RPC; the reaper's retention sweep is the backstop.
             try:
                 PgTaskResult.objects.filter(pk=reply_key).update(result=None, error="")
+                delete_offloaded(offloaded, _result_storage)
             except Exception:
                 logger.warning(
                     "DjangoQueueTransport: could not clear pg_task_result for "
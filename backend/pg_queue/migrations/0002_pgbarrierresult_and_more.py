@@ -0,0 +1,70 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pg_queue", "0001_initial_squashed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PgBarrierResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("execution_id", models.TextField()),
+                ("child_index", models.IntegerField()),
+                ("result", models.JSONField()),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "pg_barrier_result",
+            },
+        ),
+        # Results move to pg_barrier_result, but pg_barrier_state.results stays
+        # (expand/contract): workers from the previous release still arm and
+        # decrement barriers against it during a rolling deploy. New workers
+        # keep appending to it on decrement but omit it when arming, so give it
+        # a DB-level default for those INSERTs. Dropped by a later migration
+        # once no old worker runs.
+        migrations.RunSQL(
+            sql="ALTER TABLE pg_barrier_state ALTER COLUMN results SET DEFAULT '[]'::jsonb",
+            reverse_sql="ALTER TABLE pg_barrier_state ALTER COLUMN results DROP DEFAULT",
+        ),
+        migrations.AddField(
+            model_name="pgbarrierstate",
+            name="completed",
+            field=models.IntegerField(default=0),
+        ),
+        # As with pg_queue_message.state: AddField drops the DB default after the
+        # backfill, but the worker arms barriers with raw SQL, so keep a DB-level
+        # default for any INSERT that omits the column. Metadata-only.
+        migrations.RunSQL(
+            sql="ALTER TABLE pg_barrier_state ALTER COLUMN completed SET DEFAULT 0",
+            reverse_sql="ALTER TABLE pg_barrier_state ALTER COLUMN completed DROP DEFAULT",
+        ),
+        migrations.AddConstraint(
+            model_name="pgbarrierresult",
+            constraint=models.UniqueConstraint(
+                fields=("execution_id", "child_index"),
+                name="pg_barrier_result_exec_child_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="pgbarrierresult",
+            constraint=models.CheckConstraint(
+                check=models.Q(("child_index__gte", 0)),
+                name="pg_barrier_result_child_index_non_negative",
+            ),
+        ),
+    ]
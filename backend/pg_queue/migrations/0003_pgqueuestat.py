@@ -0,0 +1,67 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:41
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pg_queue", "0002_pgbarrierresult_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PgQueueStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("queue_name", models.TextField()),
+                ("org_id", models.TextField(blank=True, default="")),
+                ("state", models.TextField()),
+                ("shard", models.SmallIntegerField(default=0)),
+                ("depth", models.BigIntegerField(default=0)),
+                ("oldest_enqueued_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "pg_queue_stat",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="pgqueuestat",
+            constraint=models.UniqueConstraint(
+                fields=("queue_name", "org_id", "state", "shard"),
+                name="pg_queue_stat_queue_org_state_shard_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="pgqueuestat",
+            constraint=models.CheckConstraint(
+                check=models.Q(("state__in", ["ready", "claimed"])),
+                name="pg_queue_stat_state_valid",
+            ),
+        ),
+        # Seed the counters from the live backlog so the gauges are right from
+        # the first read. Rows written by previous-release workers while this
+        # deploy rolls out are picked up by the reaper's reconciliation, which
+        # also runs on its first leader tick.
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO pg_queue_stat
+                    (queue_name, org_id, state, shard, depth, oldest_enqueued_at,
+                     updated_at)
+                SELECT queue_name, org_id, state, 0, count(*), min(enqueued_at),
+                       now()
+                  FROM pg_queue_message
+                 GROUP BY queue_name, org_id, state
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -117,6 +117,60 @@ class PgQueueMessage(models.Model):
         ]
 
 
+class PgQueueStat(models.Model):
+    """Incrementally maintained ``pg_queue_message`` depth, per queue/org/state.
+
+    Every statement that adds, moves or removes queue rows (the workers' send /
+    claim / ack / re-arm, the PG scheduler's fire, the backend producer) applies
+    its ``+n`` / ``-n`` to the matching row here in the same transaction, so the
+    reaper's queue gauges and an autoscaler read a handful of rows instead of
+    aggregating the whole backlog. Each counter is split over a few ``shard`` rows
+    (a writer picks one by its backend pid) so concurrent writers on a busy queue
+    don't serialise on one row lock; a counter's value is the sum of its shards.
+    The reaper's retention sweep periodically recomputes the exact values from
+    ``pg_queue_message`` into shard 0 (reconciliation), which also repairs any
+    drift from a writer that predates this table.
+
+    A shard's ``depth`` can read below zero (rows enqueued through one connection
+    and claimed through another, a decrement that raced the reconciliation, or a
+    row enqueued before the table existed); readers sum the shards and clamp the
+    sum at zero. ``oldest_enqueued_at`` only moves earlier on an increment and is
+    cleared when the shard's depth reaches zero — a decrement can't know the
+    next-oldest row — so between reconciliations it is an upper bound on the
+    oldest age.
+
+    Managed=True / generated migration, no DB-side function (writers maintain it,
+    not triggers), extension-free — same posture as ``PgQueueMessage``.
+    """
+
+    queue_name = models.TextField()
+    # Same "" = no org convention as PgQueueMessage.org_id.
+    org_id = models.TextField(blank=True, default="")
+    state = models.TextField()
+    # Writer's ``pg_backend_pid() % 16`` (client._STAT_SHARDS); reconciliation
+    # writes the exact depth to 0 and zeroes the rest.
+    shard = models.SmallIntegerField(default=0)
+    depth = models.BigIntegerField(default=0)
+    # NULL while the depth is zero.
+    oldest_enqueued_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "pg_queue_stat"
+        constraints = [
+            # The writers' ON CONFLICT target: one row per shard of each
+            # (queue, org, state) counter.
+            models.UniqueConstraint(
+                fields=["queue_name", "org_id", "state", "shard"],
+                name="pg_queue_stat_queue_org_state_shard_uniq",
+            ),
+            models.CheckConstraint(
+                check=models.Q(state__in=[_READY, _CLAIMED]),
+                name="pg_queue_stat_state_valid",
+            ),
+        ]
+
+
 class PgOrchestratorLock(models.Model):
     """Single-row leader-election lease for the orchestrator/reaper singleton.
 
@@ -230,9 +284,12 @@ class PgBarrierState(models.Model):
 
     One row per in-flight barrier (keyed by ``execution_id``). The worker-side
     ``barrier_pg_decr_and_check`` link task atomically decrements ``remaining``
-    and appends to ``results`` in a single ``UPDATE … RETURNING``; the task that
-    drives ``remaining`` to 0 dispatches the aggregating callback and deletes the
-    row. A header-task failure aborts the barrier by deleting the row outright
+    and bumps ``completed`` in a single ``UPDATE … RETURNING``, writing its result
+    as its own ``PgBarrierResult`` row in the same statement — the barrier row
+    stays a fixed-size counter however many children the execution fans out to.
+    The task that drives ``remaining`` to 0 reads the children's results back in
+    one ordered ``SELECT``, dispatches the aggregating callback and deletes the
+    row (with its result rows). A header-task failure aborts the barrier by deleting the row outright
     (``DELETE … RETURNING`` — atomic claim+teardown), so the callback can never
     fire with partial results. The ``pg-queue-reaper`` marks a stranded execution
     ERROR when ``last_progress_at`` goes stale (no batch completed for
@@ -253,7 +310,16 @@ class PgBarrierState(models.Model):
     # callback. A value < 0 (decrement after expiry/cleanup) means the barrier
     # was already torn down — the task cleans up without firing.
     remaining = models.IntegerField()
-    # Aggregated header-task results, appended in completion order (JSONB array).
+    # Decrements applied so far. Unlike ``remaining`` it only ever grows (an
+    # executor hand-off extends ``remaining`` back up), so ``completed - 1`` is a
+    # unique, completion-ordered ``PgBarrierResult.child_index`` per decrement.
+    completed = models.IntegerField(default=0)
+    # Deprecated: superseded by PgBarrierResult. Kept (with a DB-level '[]'
+    # default, see migration 0002) and still appended to by every decrement so
+    # a previous-release worker that runs the final decrement during a rolling
+    # deploy aggregates every child; the worker reads whichever of this and the
+    # PgBarrierResult rows is longer. Stop writing it in the next release, then
+    # drop it in a later migration once no such worker remains.
     results = models.JSONField(default=list)
     created_at = models.DateTimeField(default=timezone.now)
     # Absolute orphan cap (Redis-TTL equivalent, WORKER_BARRIER_KEY_TTL_SECONDS,
@@ -292,6 +358,48 @@ class PgBarrierState(models.Model):
         ]
 
 
+class PgBarrierResult(models.Model):
+    """One header task's result for an in-flight ``PgBarrierState``.
+
+    Append-only: each barrier decrement inserts exactly one row, keyed by
+    ``(execution_id, child_index)`` where ``child_index`` is the barrier's
+    ``completed`` counter before the decrement — so the rows are numbered in
+    completion order, and the final decrementer rebuilds the callback's results
+    list with a single ``SELECT … ORDER BY child_index``. Keeping results out of
+    the barrier row means a decrement never ships an ever-growing JSONB array
+    back to the worker, and — once the transitional append to
+    ``PgBarrierState.results`` is dropped — writes one small row instead of
+    rewriting (and TOASTing) that array. Rows a previous-release finaliser
+    leaves behind (it deletes only the barrier row) are swept by the reaper.
+
+    The row is inserted in the same statement as the decrement, which only
+    matches while the barrier row exists; every path that deletes the barrier
+    row (finalise, abort, re-enqueue, the reaper's stranded recovery) deletes
+    these rows in the same transaction, so they never outlive their barrier.
+    No FK to ``PgBarrierState`` — same cascade-free posture as ``PgBatchDedup``.
+    """
+
+    execution_id = models.TextField()
+    child_index = models.IntegerField()
+    result = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "pg_barrier_result"
+        constraints = [
+            # One result per decrement; the index (execution_id leading) also
+            # serves the ordered aggregate read and the per-execution DELETE.
+            models.UniqueConstraint(
+                fields=["execution_id", "child_index"],
+                name="pg_barrier_result_exec_child_uniq",
+            ),
+            models.CheckConstraint(
+                check=models.Q(child_index__gte=0),
+                name="pg_barrier_result_child_index_non_negative",
+            ),
+        ]
+
+
 class PgPeriodicSchedule(models.Model):
     """Inert mirror of a scheduled pipeline's cron definition.
 
@@ -376,6 +484,8 @@ class PgTaskResult(models.Model):
     # "completed" = task returned (``result`` holds ExecutionResult.to_dict());
     # "failed" = task raised (``error`` holds the message).
     status = models.TextField()
+    # A large result may be a compressed / offloaded envelope instead — read it
+    # through ``unstract.core.pg_result_payload.decode_result``.
     result = models.JSONField(null=True, blank=True)
     # No-NULL text convention: "" on a completed row (no error), the message on a
     # failed row — avoids a string column having two empty states (NULL vs "").
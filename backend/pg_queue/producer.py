@@ -9,9 +9,10 @@ PG, so the backend enqueues it here.
 Same ``pg_queue_message`` row shape as the workers' ``PgQueueClient.send`` (a
 :class:`~unstract.core.data_models.TaskPayload` JSONB), written via the
 ``PgQueueMessage`` ORM (whose Python-level field defaults supply ``now()`` / ``0``
-for the vt/counter columns). The ``TaskPayload`` / ``FairnessPayload`` wire
-contract is shared via ``unstract.core`` so producer and consumer agree on the
-keys without one codebase importing the other.
+for the vt/counter columns), with the ``pg_queue_stat`` depth counter bumped in
+the same transaction as the workers' enqueue does. The ``TaskPayload`` /
+``FairnessPayload`` wire contract is shared via ``unstract.core`` so producer and
+consumer agree on the keys without one codebase importing the other.
 """
 
 from __future__ import annotations
@@ -20,6 +21,8 @@ import json
 import logging
 from typing import Any
 
+from django.db import connection, transaction
+
 from pg_queue.models import PgQueueMessage
 from unstract.core.data_models import (
     FAIRNESS_DEFAULT_PRIORITY,
@@ -42,6 +45,22 @@ DEFAULT_PRIORITY = FAIRNESS_DEFAULT_PRIORITY
 # (the Celery default queue), used when the caller passes no explicit queue.
 DEFAULT_GENERAL_QUEUE = "celery"
 
+# One enqueue's +1 on its pg_queue_stat counter — the single-row case of the
+# workers' ``queue_stat_delta_sql`` (queue_backend.pg_queue.client); keep the two
+# in sync.
+_COUNT_ENQUEUE_SQL = """
+INSERT INTO pg_queue_stat AS s
+    (queue_name, org_id, state, shard, depth, oldest_enqueued_at, updated_at)
+VALUES (%s, %s, %s, pg_backend_pid() % 16, 1, %s, now())
+ON CONFLICT (queue_name, org_id, state, shard) DO UPDATE
+   SET depth = s.depth + EXCLUDED.depth,
+       oldest_enqueued_at = CASE
+           WHEN s.depth + EXCLUDED.depth <= 0 THEN NULL
+           ELSE LEAST(s.oldest_enqueued_at, EXCLUDED.oldest_enqueued_at)
+       END,
+       updated_at = now()
+"""
+
 
 def _json_safe(value: Any) -> Any:
     """Round-trip through JSON with ``default=str`` so UUIDs / datetimes in the
@@ -61,6 +80,15 @@ def _json_safe(value: Any) -> Any:
     return json.loads(json.dumps(value, default=str, allow_nan=False))
 
 
+def _count_enqueue(row: PgQueueMessage) -> None:
+    """Add ``row`` to its ``pg_queue_stat`` counter (caller's transaction)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _COUNT_ENQUEUE_SQL,
+            (row.queue_name, row.org_id, row.state, row.enqueued_at),
+        )
+
+
 def enqueue_task(
     *,
     task_name: str,
@@ -135,12 +163,14 @@ def enqueue_task(
             message["on_error"] = _json_safe(on_error)
         if task_id is not None:
             message["task_id"] = task_id
-        row = PgQueueMessage.objects.create(
-            queue_name=pg_queue,
-            message=message,
-            org_id=org_id or "",
-            priority=priority,
-        )
+        with transaction.atomic():
+            row = PgQueueMessage.objects.create(
+                queue_name=pg_queue,
+                message=message,
+                org_id=org_id or "",
+                priority=priority,
+            )
+            _count_enqueue(row)
     except Exception:
         logger.exception(
             "PG-queue: failed to enqueue task=%r queue=%r org=%r",
@@ -103,6 +103,26 @@ class TestDjangoQueueTransportWait:
             DjangoQueueTransport().wait_for_result("rk", timeout=5)
         qs.filter.return_value.update.assert_called_once_with(result=None, error="")
 
+    def test_offloaded_result_is_restored_and_its_file_deleted(self):
+        row = MagicMock(
+            status="completed",
+            result={"__pg_result__": {"codec": "gzip", "path": "p/rk-1.json.gz"}},
+            error="",
+        )
+        qs = MagicMock()
+        qs.filter.return_value.first.return_value = row
+        with (
+            patch(f"{_MOD}.PgTaskResult", MagicMock(objects=qs)),
+            patch(f"{_MOD}.decode_result", return_value={"a": 1}) as decode,
+            patch(f"{_MOD}.delete_offloaded") as delete,
+        ):
+            out = DjangoQueueTransport().wait_for_result("rk", timeout=5)
+        assert out.result == {"a": 1}
+        decode.assert_called_once()
+        assert decode.call_args[0][0] is row.result
+        qs.filter.return_value.update.assert_called_once_with(result=None, error="")
+        assert delete.call_args[0][0] == ["p/rk-1.json.gz"]
+
     def test_timeout_does_not_clear(self):
         # Nothing consumed on timeout — no clear (the executor may still write the
         # row under this reply_key; the reaper sweeps the orphan at TTL).
@@ -16,6 +16,20 @@ from pg_queue import producer
 _MODEL = "pg_queue.producer.PgQueueMessage"
 
 
+@pytest.fixture(autouse=True)
+def _no_db_transaction():
+    """Keep the tests DB-free.
+
+    The enqueue's atomic block and its ``pg_queue_stat`` bump are stubbed
+    alongside the mocked model.
+    """
+    with (
+        patch("pg_queue.producer.transaction"),
+        patch("pg_queue.producer._count_enqueue") as count,
+    ):
+        yield count
+
+
 class TestEnqueueTask:
     def test_builds_taskpayload_row(self):
         with patch(_MODEL) as model:
@@ -45,6 +59,14 @@ class TestEnqueueTask:
         assert msg["kwargs"] == {"transport": "pg_queue"}
         assert msg["fairness"]["workload_type"] == "api"
 
+    def test_counts_the_row_in_the_same_transaction(self, _no_db_transaction):
+        with patch(_MODEL) as model:
+            row = MagicMock(msg_id=7)
+            model.objects.create.return_value = row
+            producer.enqueue_task(task_name="t", queue="q", org_id="org")
+        _no_db_transaction.assert_called_once_with(row)
+        assert producer.transaction.atomic.call_count == 1
+
     def test_uuid_args_kwargs_are_json_coerced(self):
         """PgQueueMessage.message is a plain JSONField → UUIDs in args/kwargs must
         be coerced to str (the worker consumer receives string ids)."""
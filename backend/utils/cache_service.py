@@ -13,6 +13,41 @@ redis_cache = get_redis_connection("default")
 
 logger = logging.getLogger(__name__)
 
+# Moves up to ARGV[1] items from the head of KEYS[1] onto KEYS[2] atomically and
+# returns them; RPUSH is chunked to stay under Lua's unpack() stack limit.
+_CLAIM_LIST_BATCH_LUA = """
+local items = redis.call("LRANGE", KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #items == 0 then
+    return items
+end
+redis.call("LTRIM", KEYS[1], #items, -1)
+for i = 1, #items, 1000 do
+    redis.call("RPUSH", KEYS[2], unpack(items, i, math.min(i + 999, #items)))
+end
+return items
+"""
+_claim_list_batch_script = redis_cache.register_script(_CLAIM_LIST_BATCH_LUA)
+
+# Appends all of KEYS[1] onto KEYS[2] and deletes KEYS[1]; returns the count.
+_MOVE_LIST_LUA = """
+local items = redis.call("LRANGE", KEYS[1], 0, -1)
+for i = 1, #items, 1000 do
+    redis.call("RPUSH", KEYS[2], unpack(items, i, math.min(i + 999, #items)))
+end
+redis.call("DEL", KEYS[1])
+return #items
+"""
+_move_list_script = redis_cache.register_script(_MOVE_LIST_LUA)
+
+# Deletes KEYS[1] only while it still holds ARGV[1] (lock release by owner).
+_DELETE_IF_EQUALS_LUA = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+_delete_if_equals_script = redis_cache.register_script(_DELETE_IF_EQUALS_LUA)
+
 
 class CacheService:
     @staticmethod
@@ -158,6 +193,74 @@ class CacheService:
     def llen(key: str) -> int:
         return redis_cache.llen(key)
 
+    @staticmethod
+    def claim_list_batch(key: str, processing_key: str, count: int) -> list[Any]:
+        """Pop up to ``count`` items from a list, keeping a copy until acknowledged.
+
+        A multi-element LPOP in one round trip that also appends the items to
+        ``processing_key``; delete that key once the items are durably handled.
+        Items left there by a crashed consumer can be re-read with ``lrange``.
+
+        Args:
+            key (str): The key of the source Redis list.
+            processing_key (str): The list holding claimed, unacknowledged items.
+            count (int): Maximum number of items to claim.
+
+        Returns:
+            list[Any]: The claimed items, oldest first.
+        """
+        return _claim_list_batch_script(keys=[key, processing_key], args=[count])
+
+    @staticmethod
+    def move_list(key: str, dest_key: str) -> int:
+        """Atomically append every item of one list to another and drop the source.
+
+        Args:
+            key (str): The list to empty.
+            dest_key (str): The list receiving the items, in order.
+
+        Returns:
+            int: Number of items moved.
+        """
+        return int(_move_list_script(keys=[key, dest_key]))
+
+    @staticmethod
+    def set_nx(key: str, value: Any, expire: int) -> bool:
+        """Set a raw Redis key only if it does not exist (e.g. as a lock)."""
+        return bool(redis_cache.set(key, value, nx=True, ex=expire))
+
+    @staticmethod
+    def delete_if_equals(key: str, value: str) -> bool:
+        """Delete a raw key only if it still holds ``value`` (compare-and-delete).
+
+        Releases a lock taken with :meth:`set_nx` without removing one that
+        expired and was re-acquired by another holder in the meantime.
+        """
+        return bool(_delete_if_equals_script(keys=[key], args=[value]))
+
+    @staticmethod
+    def delete_raw(*keys: str) -> int:
+        """Delete raw Redis keys (not namespaced by the Django cache)."""
+        return redis_cache.delete(*keys)
+
+    @staticmethod
+    def get_raw(key: str) -> Any:
+        """Get a raw Redis key (not namespaced by the Django cache)."""
+        return redis_cache.get(key)
+
+    @staticmethod
+    def incr_raw(key: str, amount: int = 1) -> int:
+        """Increment a raw Redis counter key and return its new value."""
+        return redis_cache.incr(key, amount)
+
+    @staticmethod
+    def scan_keys(key_pattern: str) -> list[str]:
+        """List raw keys matching a pattern with SCAN (non-blocking, unlike KEYS)."""
+        return [
+            key.decode("utf-8") if isinstance(key, bytes) else key
+            for key in redis_cache.scan_iter(match=key_pattern, count=1000)
+        ]
+
     @staticmethod
     def lrem(key: str, value: str) -> None:
         redis_cache.lrem(key, value)
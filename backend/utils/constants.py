@@ -71,6 +71,15 @@ class ExecutionLogConstants:
         PERIODIC_TASK_NAME (str): The name of the Celery periodic task to schedule
             log history consumers.
         TASK (str): The name of the Celery task to schedule log history consumers.
+        DEFAULT_CONSUMER (str): Consumer name owning the processing list when the
+            caller does not name one.
+        DRAIN_LOCK_TTL (int): Seconds a drain holds its per-consumer lock.
+        INSERT_BATCH_SIZE (int): Rows per multi-row INSERT when storing logs.
+        MAX_BATCH_LIMIT (int): Upper bound on a caller-requested batch size.
+        MAX_DELIVERY_ATTEMPTS (int): Failed stores of one claimed batch before it
+            is moved to the dead-letter list.
+        RECLAIM_INTERVAL (int): Minimum seconds between passes that take over
+            processing lists abandoned by departed consumers.
     """
 
     IS_ENABLED: bool = CommonUtils.str_to_bool(settings.ENABLE_LOG_HISTORY)
@@ -80,3 +89,9 @@ class ExecutionLogConstants:
     CELERY_QUEUE_NAME = "celery_periodic_logs"
     PERIODIC_TASK_NAME_V2 = "workflow_log_history_v2"
     TASK_V2 = "consume_log_history"
+    DEFAULT_CONSUMER: str = "default"
+    DRAIN_LOCK_TTL: int = 120
+    INSERT_BATCH_SIZE: int = 1000
+    MAX_BATCH_LIMIT: int = 5000
+    MAX_DELIVERY_ATTEMPTS: int = 5
+    RECLAIM_INTERVAL: int = 60
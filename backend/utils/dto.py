@@ -63,7 +63,15 @@ class LogDataDTO:
                     log_type=log_type,
                     data=data,
                 )
-        except (json.JSONDecodeError, AttributeError):
+        except (
+            json.JSONDecodeError,
+            AttributeError,
+            # Unusable timestamp (wrong type / out of range)
+            TypeError,
+            ValueError,
+            OverflowError,
+            OSError,
+        ):
             logger.warning("Invalid log data: %s", json_data)
         return None
 
@@ -0,0 +1,427 @@
+"""Set-based implementations of the internal file-execution batch endpoints.
+
+Each operation issues a fixed number of queries regardless of batch size: one
+org-scoped fetch of every referenced row, then one ``bulk_update`` /
+``bulk_create`` per column set. Per-item validation failures are reported in
+the same ``(successful, failed)`` shape the endpoints have always returned.
+
+Callers own the transaction and the org scoping — pass querysets already
+filtered with ``filter_queryset_by_organization``.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
+from utils.common_utils import CommonUtils
+
+from workflow_manager.endpoint_v2.dto import FileHash
+from workflow_manager.file_execution.models import WorkflowFileExecution
+from workflow_manager.workflow_v2.enums import ExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+# Statuses for which ``WorkflowFileExecution.update_status`` stamps execution_time.
+_TIMED_STATUSES = frozenset(
+    {ExecutionStatus.COMPLETED, ExecutionStatus.ERROR, ExecutionStatus.STOPPED}
+)
+
+
+def _parse_uuid(value: Any) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _fetch_by_id(
+    queryset: QuerySet, ids: set[uuid.UUID], fields: tuple[str, ...]
+) -> dict[uuid.UUID, Any]:
+    """Fetch rows with the given ids in a single query, keyed by id."""
+    if not ids:
+        return {}
+    return {row.id: row for row in queryset.filter(id__in=ids).only(*fields)}
+
+
+def bulk_update_file_execution_status(
+    queryset: QuerySet, status_updates: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Apply a batch of status updates with one fetch and one UPDATE.
+
+    Mirrors ``WorkflowFileExecution.update_status`` per item: the status and
+    execution_error are always written and execution_time is derived from
+    ``created_at`` for terminal statuses. Repeated ids apply in request order.
+
+    Args:
+        queryset: Org-scoped ``WorkflowFileExecution`` queryset
+        status_updates: Items with ``file_execution_id``, ``status`` and
+            optional ``error_message``
+
+    Returns:
+        Tuple of (successful_updates, failed_updates)
+    """
+    successful_updates: list[dict[str, Any]] = []
+    failed_updates: list[dict[str, Any]] = []
+
+    parsed = []
+    for update_data in status_updates:
+        file_execution_id = update_data.get("file_execution_id")
+        status_value = update_data.get("status")
+        if not file_execution_id or not status_value:
+            failed_updates.append(
+                {
+                    "file_execution_id": file_execution_id,
+                    "error": "file_execution_id and status are required",
+                }
+            )
+            continue
+        pk = _parse_uuid(file_execution_id)
+        if pk is None:
+            failed_updates.append(
+                {
+                    "file_execution_id": file_execution_id,
+                    "error": f"'{file_execution_id}' is not a valid UUID",
+                }
+            )
+            continue
+        try:
+            status_enum = ExecutionStatus(status_value)
+        except ValueError as e:
+            failed_updates.append(
+                {"file_execution_id": file_execution_id, "error": str(e)}
+            )
+            continue
+        parsed.append((file_execution_id, pk, status_enum, update_data))
+
+    file_executions = _fetch_by_id(
+        queryset,
+        {pk for _, pk, _, _ in parsed},
+        ("id", "file_name", "created_at", "status", "execution_time"),
+    )
+
+    changed = {}
+    for file_execution_id, pk, status_enum, update_data in parsed:
+        file_execution = file_executions.get(pk)
+        if file_execution is None:
+            failed_updates.append(
+                {
+                    "file_execution_id": file_execution_id,
+                    "error": "WorkflowFileExecution not found",
+                }
+            )
+            continue
+
+        file_execution.status = status_enum.value
+        if status_enum in _TIMED_STATUSES:
+            file_execution.execution_time = CommonUtils.time_since(
+                file_execution.created_at, 3
+            )
+        file_execution.execution_error = update_data.get("error_message")
+        changed[pk] = file_execution
+
+        successful_updates.append(
+            {
+                "file_execution_id": str(file_execution.id),
+                "status": file_execution.status,
+                "file_name": file_execution.file_name,
+            }
+        )
+
+    if changed:
+        WorkflowFileExecution.objects.bulk_update(
+            list(changed.values()),
+            ["status", "execution_time", "execution_error"],
+        )
+
+    return successful_updates, failed_updates
+
+
+def bulk_update_file_execution_hash(
+    queryset: QuerySet, hash_updates: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Apply a batch of hash updates with one fetch and at most two UPDATEs.
+
+    Mirrors ``WorkflowFileExecution.update``: ``fs_metadata`` is only written
+    for items that supply it, so rows are grouped by the columns they change.
+
+    Args:
+        queryset: Org-scoped ``WorkflowFileExecution`` queryset
+        hash_updates: Items with ``file_execution_id``, ``file_hash`` and
+            optional ``fs_metadata``
+
+    Returns:
+        Tuple of (successful_updates, failed_updates)
+    """
+    successful_updates: list[dict[str, Any]] = []
+    failed_updates: list[dict[str, Any]] = []
+
+    parsed = []
+    for update_data in hash_updates:
+        file_execution_id = update_data.get("file_execution_id")
+        file_hash = update_data.get("file_hash")
+        if not file_execution_id or not file_hash:
+            failed_updates.append(
+                {
+                    "file_execution_id": file_execution_id,
+                    "error": "file_execution_id and file_hash are required",
+                }
+            )
+            continue
+        pk = _parse_uuid(file_execution_id)
+        if pk is None:
+            failed_updates.append(
+                {
+                    "file_execution_id": file_execution_id,
+                    "error": f"'{file_execution_id}' is not a valid UUID",
+                }
+            )
+            continue
+        parsed.append((file_execution_id, pk, file_hash, update_data))
+
+    # fs_metadata is deliberately not fetched — it is only ever overwritten.
+    file_executions = _fetch_by_id(
+        queryset, {pk for _, pk, _, _ in parsed}, ("id", "file_name", "file_hash")
+    )
+
+    hash_only: dict[uuid.UUID, WorkflowFileExecution] = {}
+    with_metadata: dict[uuid.UUID, WorkflowFileExecution] = {}
+    for file_execution_id, pk, file_hash, update_data in parsed:
+        file_execution = file_executions.get(pk)
+        if file_execution is None:
+            failed_updates.append(
+                {
+                    "file_execution_id": file_execution_id,
+                    "error": "WorkflowFileExecution not found",
+                }
+            )
+            continue
+
+        file_execution.file_hash = file_hash
+        fs_metadata = update_data.get("fs_metadata")
+        if fs_metadata is not None:
+            file_execution.fs_metadata = fs_metadata
+            hash_only.pop(pk, None)
+            with_metadata[pk] = file_execution
+        elif pk not in with_metadata:
+            hash_only[pk] = file_execution
+
+        successful_updates.append(
+            {
+                "file_execution_id": str(file_execution.id),
+                "file_hash": file_hash[:16] + "..." if file_hash else None,
+                "file_name": file_execution.file_name,
+            }
+        )
+
+    if hash_only:
+        WorkflowFileExecution.objects.bulk_update(list(hash_only.values()), ["file_hash"])
+    if with_metadata:
+        WorkflowFileExecution.objects.bulk_update(
+            list(with_metadata.values()), ["file_hash", "fs_metadata"]
+        )
+
+    return successful_updates, failed_updates
+
+
+def _file_hash_from_request(file_hash_data: dict[str, Any]) -> FileHash:
+    return FileHash(
+        file_path=file_hash_data.get("file_path", ""),
+        file_name=file_hash_data.get("file_name", ""),
+        source_connection_type=file_hash_data.get("source_connection_type", ""),
+        file_hash=file_hash_data.get("file_hash"),
+        file_size=file_hash_data.get("file_size"),
+        provider_file_uuid=file_hash_data.get("provider_file_uuid"),
+        mime_type=file_hash_data.get("mime_type"),
+        fs_metadata=file_hash_data.get("fs_metadata"),
+        file_destination=file_hash_data.get("file_destination"),
+        is_executed=file_hash_data.get("is_executed", False),
+        file_number=file_hash_data.get("file_number"),
+    )
+
+
+def _lookup_key(
+    execution_id: uuid.UUID, file_path: str | None, file_hash: FileHash
+) -> tuple[uuid.UUID, str | None, str, str | None]:
+    """Key equivalent to the ``get_or_create_file_execution`` lookup fields."""
+    if file_hash.file_hash:
+        return (execution_id, file_path, "file_hash", file_hash.file_hash)
+    if file_hash.provider_file_uuid:
+        return (
+            execution_id,
+            file_path,
+            "provider_file_uuid",
+            file_hash.provider_file_uuid,
+        )
+    return (execution_id, file_path, "", None)
+
+
+def _matches(row: WorkflowFileExecution, key: tuple) -> bool:
+    execution_id, file_path, field, value = key
+    if row.workflow_execution_id != execution_id or row.file_path != file_path:
+        return False
+    return not field or getattr(row, field) == value
+
+
+def bulk_create_file_executions(
+    execution_queryset: QuerySet, file_executions: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Get-or-create a batch of file executions with a constant query count.
+
+    Equivalent to ``get_or_create_file_execution`` per item: one fetch of the
+    org-scoped workflow executions, one fetch of candidate existing rows, and
+    one ``bulk_create`` for the rest. If the bulk insert races a concurrent
+    creator on the unique constraints, the new items fall back to the per-item
+    ``get_or_create`` path.
+
+    Args:
+        execution_queryset: Org-scoped ``WorkflowExecution`` queryset
+        file_executions: Items with ``execution_id`` and ``file_hash`` data
+
+    Returns:
+        Tuple of (successful_creations, failed_creations)
+    """
+    successful_creations: list[dict[str, Any]] = []
+    failed_creations: list[dict[str, Any]] = []
+
+    parsed = []
+    for index, file_execution_data in enumerate(file_executions):
+        file_hash_data = file_execution_data.get("file_hash", {})
+        file_name = file_hash_data.get("file_name", "unknown")
+        execution_id = file_execution_data.get("execution_id")
+        if not execution_id:
+            failed_creations.append(
+                {"file_name": file_name, "error": "execution_id is required"}
+            )
+            continue
+        execution_pk = _parse_uuid(execution_id)
+        if execution_pk is None:
+            failed_creations.append(
+                {
+                    "file_name": file_name,
+                    "error": "WorkflowExecution not found or access denied",
+                }
+            )
+            continue
+        try:
+            file_hash = _file_hash_from_request(file_hash_data)
+        except Exception as e:
+            failed_creations.append({"file_name": file_name, "error": str(e)})
+            continue
+        is_api = file_hash_data.get("source_connection_type", "") == "API"
+        file_path = file_hash.file_path if not is_api else None
+        parsed.append((index, file_name, execution_pk, file_hash, file_path, is_api))
+
+    workflow_executions = {
+        execution.id: execution
+        for execution in execution_queryset.filter(id__in={item[2] for item in parsed})
+    }
+
+    resolved = []
+    for index, file_name, execution_pk, file_hash, file_path, is_api in parsed:
+        workflow_execution = workflow_executions.get(execution_pk)
+        if workflow_execution is None:
+            failed_creations.append(
+                {
+                    "file_name": file_name,
+                    "error": "WorkflowExecution not found or access denied",
+                }
+            )
+            continue
+        resolved.append(
+            (index, file_name, workflow_execution, file_hash, file_path, is_api)
+        )
+
+    existing_rows = []
+    if resolved:
+        paths = {item[4] for item in resolved if item[4] is not None}
+        path_filter = Q(file_path__in=paths)
+        if any(item[4] is None for item in resolved):
+            path_filter |= Q(file_path__isnull=True)
+        existing_rows = list(
+            WorkflowFileExecution.objects.filter(
+                path_filter,
+                workflow_execution_id__in={item[2].id for item in resolved},
+            )
+        )
+
+    # lookup key -> row, shared by repeated items within the batch
+    by_key: dict[tuple, WorkflowFileExecution] = {}
+    outcomes: dict[int, WorkflowFileExecution | Exception] = {}
+    to_create = []
+    for index, _, workflow_execution, file_hash, file_path, is_api in resolved:
+        key = _lookup_key(workflow_execution.id, file_path, file_hash)
+        if key in by_key:
+            outcomes[index] = by_key[key]
+            continue
+        matches = [row for row in existing_rows if _matches(row, key)]
+        if len(matches) > 1:
+            outcomes[index] = WorkflowFileExecution.MultipleObjectsReturned(
+                f"get() returned more than one WorkflowFileExecution -- "
+                f"it returned {len(matches)}!"
+            )
+            continue
+        if matches:
+            by_key[key] = outcomes[index] = matches[0]
+            continue
+        new_row = WorkflowFileExecution(
+            workflow_execution=workflow_execution,
+            file_path=file_path,
+            file_hash=file_hash.file_hash or None,
+            file_name=file_hash.file_name,
+            file_size=file_hash.file_size,
+            mime_type=file_hash.mime_type,
+            provider_file_uuid=file_hash.provider_file_uuid,
+            fs_metadata=file_hash.fs_metadata,
+        )
+        by_key[key] = outcomes[index] = new_row
+        to_create.append((index, workflow_execution, file_hash, is_api, new_row))
+
+    if to_create:
+        try:
+            with transaction.atomic():
+                WorkflowFileExecution.objects.bulk_create(
+                    [new_row for *_, new_row in to_create]
+                )
+        except IntegrityError:
+            logger.warning(
+                f"Bulk file execution create conflicted; falling back to per-item "
+                f"get_or_create for {len(to_create)} files"
+            )
+            replacements = {}
+            for _, workflow_execution, file_hash, is_api, new_row in to_create:
+                try:
+                    replacements[id(new_row)] = (
+                        WorkflowFileExecution.objects.get_or_create_file_execution(
+                            workflow_execution=workflow_execution,
+                            file_hash=file_hash,
+                            is_api=is_api,
+                        )
+                    )
+                except Exception as e:
+                    replacements[id(new_row)] = e
+            # Repeated items in the batch share the unsaved row; repoint them all
+            for index, outcome in outcomes.items():
+                if id(outcome) in replacements:
+                    outcomes[index] = replacements[id(outcome)]
+
+    for index, file_name, _, file_hash, _, _ in resolved:
+        outcome = outcomes[index]
+        if isinstance(outcome, Exception):
+            failed_creations.append({"file_name": file_name, "error": str(outcome)})
+            continue
+        # Workers require file_path; the model stores None for API files
+        response_file_path = outcome.file_path
+        if not response_file_path and file_hash.file_path:
+            response_file_path = file_hash.file_path
+        successful_creations.append(
+            {
+                "id": str(outcome.id),
+                "file_name": outcome.file_name,
+                "file_path": response_file_path,
+                "status": outcome.status,
+            }
+        )
+
+    return successful_creations, failed_creations
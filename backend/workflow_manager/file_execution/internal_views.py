@@ -13,6 +13,11 @@ from rest_framework.views import APIView
 from utils.organization_utils import filter_queryset_by_organization
 
 from workflow_manager.endpoint_v2.dto import FileHash
+from workflow_manager.file_execution.batch_operations import (
+    bulk_create_file_executions,
+    bulk_update_file_execution_hash,
+    bulk_update_file_execution_status,
+)
 from workflow_manager.file_execution.models import WorkflowFileExecution
 
 # Import serializers from workflow_manager internal API
@@ -267,7 +272,10 @@ class FileExecutionInternalViewSet(viewsets.ModelViewSet):
 
 
 class FileExecutionBatchCreateAPIView(APIView):
-    """Internal API endpoint for creating multiple file executions in a single batch."""
+    """Internal API endpoint for creating multiple file executions in a single batch.
+
+    Set-based: a constant number of queries however many files are sent.
+    """
 
     def post(self, request):
         """Create multiple file executions in a single batch request."""
@@ -280,105 +288,15 @@ class FileExecutionBatchCreateAPIView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            successful_creations = []
-            failed_creations = []
+            from workflow_manager.workflow_v2.models.execution import WorkflowExecution
 
             with transaction.atomic():
-                for file_execution_data in file_executions:
-                    try:
-                        from workflow_manager.workflow_v2.models.execution import (
-                            WorkflowExecution,
-                        )
-
-                        execution_id = file_execution_data.get("execution_id")
-                        file_hash_data = file_execution_data.get("file_hash", {})
-
-                        if not execution_id:
-                            failed_creations.append(
-                                {
-                                    "file_name": file_hash_data.get(
-                                        "file_name", "unknown"
-                                    ),
-                                    "error": "execution_id is required",
-                                }
-                            )
-                            continue
-
-                        # Get workflow execution with organization filtering
-                        try:
-                            workflow_execution = WorkflowExecution.objects.get(
-                                id=execution_id
-                            )
-                            # Verify organization access
-                            filter_queryset_by_organization(
-                                WorkflowExecution.objects.filter(id=execution_id),
-                                request,
-                                "workflow__organization",
-                            ).get()
-                        except WorkflowExecution.DoesNotExist:
-                            failed_creations.append(
-                                {
-                                    "file_name": file_hash_data.get(
-                                        "file_name", "unknown"
-                                    ),
-                                    "error": "WorkflowExecution not found or access denied",
-                                }
-                            )
-                            continue
-
-                        # Convert request data to FileHash object
-                        file_hash = FileHash(
-                            file_path=file_hash_data.get("file_path", ""),
-                            file_name=file_hash_data.get("file_name", ""),
-                            source_connection_type=file_hash_data.get(
-                                "source_connection_type", ""
-                            ),
-                            file_hash=file_hash_data.get("file_hash"),
-                            file_size=file_hash_data.get("file_size"),
-                            provider_file_uuid=file_hash_data.get("provider_file_uuid"),
-                            mime_type=file_hash_data.get("mime_type"),
-                            fs_metadata=file_hash_data.get("fs_metadata"),
-                            file_destination=file_hash_data.get("file_destination"),
-                            is_executed=file_hash_data.get("is_executed", False),
-                            file_number=file_hash_data.get("file_number"),
-                        )
-
-                        # Determine if this is an API request
-                        is_api = file_hash_data.get("source_connection_type", "") == "API"
-
-                        # Use existing manager method
-                        file_execution = (
-                            WorkflowFileExecution.objects.get_or_create_file_execution(
-                                workflow_execution=workflow_execution,
-                                file_hash=file_hash,
-                                is_api=is_api,
-                            )
-                        )
-
-                        # ROOT CAUSE FIX: Ensure file_path is always present in batch response
-                        # The backend model sets file_path to None for API files, but workers require it
-                        response_file_path = file_execution.file_path
-                        if not response_file_path and file_hash.file_path:
-                            response_file_path = file_hash.file_path
-
-                        successful_creations.append(
-                            {
-                                "id": str(file_execution.id),
-                                "file_name": file_execution.file_name,
-                                "file_path": response_file_path,
-                                "status": file_execution.status,
-                            }
-                        )
-
-                    except Exception as e:
-                        failed_creations.append(
-                            {
-                                "file_name": file_execution_data.get("file_hash", {}).get(
-                                    "file_name", "unknown"
-                                ),
-                                "error": str(e),
-                            }
-                        )
+                execution_queryset = filter_queryset_by_organization(
+                    WorkflowExecution.objects.all(), request, "workflow__organization"
+                )
+                successful_creations, failed_creations = bulk_create_file_executions(
+                    execution_queryset, file_executions
+                )
 
             logger.info(
                 f"Batch file execution creation: {len(successful_creations)} successful, {len(failed_creations)} failed"
@@ -405,7 +323,10 @@ class FileExecutionBatchCreateAPIView(APIView):
 
 
 class FileExecutionBatchStatusUpdateAPIView(APIView):
-    """Internal API endpoint for updating multiple file execution statuses in a single batch."""
+    """Internal API endpoint for updating multiple file execution statuses in a single batch.
+
+    Set-based: one org-scoped fetch and one bulk UPDATE for the whole batch.
+    """
 
     def post(self, request):
         """Update multiple file execution statuses in a single batch request."""
@@ -418,62 +339,15 @@ class FileExecutionBatchStatusUpdateAPIView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            successful_updates = []
-            failed_updates = []
-
             with transaction.atomic():
-                for update_data in status_updates:
-                    try:
-                        file_execution_id = update_data.get("file_execution_id")
-                        status_value = update_data.get("status")
-
-                        if not file_execution_id or not status_value:
-                            failed_updates.append(
-                                {
-                                    "file_execution_id": file_execution_id,
-                                    "error": "file_execution_id and status are required",
-                                }
-                            )
-                            continue
-
-                        # Get file execution with organization filtering
-                        base_queryset = WorkflowFileExecution.objects.all()
-                        base_queryset = filter_queryset_by_organization(
-                            base_queryset,
-                            request,
-                            "workflow_execution__workflow__organization",
-                        )
-
-                        try:
-                            file_execution = base_queryset.get(id=file_execution_id)
-                        except WorkflowFileExecution.DoesNotExist:
-                            failed_updates.append(
-                                {
-                                    "file_execution_id": file_execution_id,
-                                    "error": "WorkflowFileExecution not found",
-                                }
-                            )
-                            continue
-
-                        # Update file execution using the model's update_status method
-                        file_execution.update_status(
-                            status=status_value,
-                            execution_error=update_data.get("error_message"),
-                            execution_time=update_data.get("execution_time"),
-                        )
-
-                        successful_updates.append(
-                            {
-                                "file_execution_id": str(file_execution.id),
-                                "status": file_execution.status,
-                                "file_name": file_execution.file_name,
-                            }
-                        )
-
-                    except Exception as e:
-                        failed_updates.append(
-                            {"file_execution_id": file_execution_id, "error": str(e)}
-                        )
+                queryset = filter_queryset_by_organization(
+                    WorkflowFileExecution.objects.all(),
+                    request,
+                    "workflow_execution__workflow__organization",
+                )
+                successful_updates, failed_updates = bulk_update_file_execution_status(
+                    queryset, status_updates
+                )
 
             logger.info(
                 f"Batch file execution status update: {len(successful_updates)} successful, {len(failed_updates)} failed"
@@ -501,7 +375,10 @@ class FileExecutionBatchStatusUpdateAPIView(APIView):
 
 
 class FileExecutionBatchHashUpdateAPIView(APIView):
-    """Internal API endpoint for updating multiple file execution hashes in a single batch."""
+    """Internal API endpoint for updating multiple file execution hashes in a single batch.
+
+    Set-based: one org-scoped fetch and at most two bulk UPDATEs for the batch.
+    """
 
     def post(self, request):
         """Update multiple file execution hashes in a single batch request."""
@@ -514,63 +391,15 @@ class FileExecutionBatchHashUpdateAPIView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            successful_updates = []
-            failed_updates = []
-
             with transaction.atomic():
-                for update_data in hash_updates:
-                    try:
-                        file_execution_id = update_data.get("file_execution_id")
-                        file_hash = update_data.get("file_hash")
-
-                        if not file_execution_id or not file_hash:
-                            failed_updates.append(
-                                {
-                                    "file_execution_id": file_execution_id,
-                                    "error": "file_execution_id and file_hash are required",
-                                }
-                            )
-                            continue
-
-                        # Get file execution with organization filtering
-                        base_queryset = WorkflowFileExecution.objects.all()
-                        base_queryset = filter_queryset_by_organization(
-                            base_queryset,
-                            request,
-                            "workflow_execution__workflow__organization",
-                        )
-
-                        try:
-                            file_execution = base_queryset.get(id=file_execution_id)
-                        except WorkflowFileExecution.DoesNotExist:
-                            failed_updates.append(
-                                {
-                                    "file_execution_id": file_execution_id,
-                                    "error": "WorkflowFileExecution not found",
-                                }
-                            )
-                            continue
-
-                        # Update file execution hash using the model's update method
-                        file_execution.update(
-                            file_hash=file_hash,
-                            fs_metadata=update_data.get("fs_metadata"),
-                        )
-
-                        successful_updates.append(
-                            {
-                                "file_execution_id": str(file_execution.id),
-                                "file_hash": file_hash[:16] + "..."
-                                if file_hash
-                                else None,
-                                "file_name": file_execution.file_name,
-                            }
-                        )
-
-                    except Exception as e:
-                        failed_updates.append(
-                            {"file_execution_id": file_execution_id, "error": str(e)}
-                        )
+                queryset = filter_queryset_by_organization(
+                    WorkflowFileExecution.objects.all(),
+                    request,
+                    "workflow_execution__workflow__organization",
+                )
+                successful_updates, failed_updates = bulk_update_file_execution_hash(
+                    queryset, hash_updates
+                )
 
             logger.info(
                 f"Batch file execution hash update: {len(successful_updates)} successful, {len(failed_updates)} failed"
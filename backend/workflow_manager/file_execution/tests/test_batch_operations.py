@@ -0,0 +1,270 @@
+"""Set-based file-execution batch operations (internal batch endpoints).
+
+The batch endpoints used to run a fetch plus a save per item (~2N queries for a
+N-file callback). These pin the per-item response contract of the set-based
+replacements and, as a query-count benchmark, that their cost no longer grows
+with the batch size while the per-item path it replaced does.
+"""
+
+import uuid
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from workflow_manager.file_execution.batch_operations import (
+    bulk_create_file_executions,
+    bulk_update_file_execution_hash,
+    bulk_update_file_execution_status,
+)
+from workflow_manager.file_execution.models import WorkflowFileExecution
+from workflow_manager.workflow_v2.enums import ExecutionStatus
+from workflow_manager.workflow_v2.models.execution import WorkflowExecution
+from workflow_manager.workflow_v2.models.workflow import Workflow
+
+
+class BatchOperationsTestBase(TestCase):
+    def setUp(self):
+        self.workflow = Workflow.objects.create(workflow_name="test-batch-ops-wf")
+        self.execution = WorkflowExecution.objects.create(
+            workflow=self.workflow, status=ExecutionStatus.EXECUTING
+        )
+
+    def _files(self, count):
+        return [
+            WorkflowFileExecution.objects.create(
+                workflow_execution=self.execution,
+                file_name=f"f{i}.pdf",
+                file_path=f"/in/f{i}.pdf",
+                status=ExecutionStatus.PENDING.value,
+            )
+            for i in range(count)
+        ]
+
+    def _status_updates(self, files, status=ExecutionStatus.COMPLETED):
+        return [{"file_execution_id": str(fe.id), "status": status.value} for fe in files]
+
+    def _create_items(self, count, offset=0):
+        return [
+            {
+                "execution_id": str(self.execution.id),
+                "file_hash": {
+                    "file_name": f"n{i}.pdf",
+                    "file_path": f"/in/n{i}.pdf",
+                    "provider_file_uuid": f"uuid-{i}",
+                    "source_connection_type": "FILESYSTEM",
+                },
+            }
+            for i in range(offset, offset + count)
+        ]
+
+
+class BulkStatusUpdateTests(BatchOperationsTestBase):
+    def test_updates_status_and_derives_execution_time(self):
+        files = self._files(3)
+        updates = self._status_updates(files[:2])
+        updates.append(
+            {
+                "file_execution_id": str(files[2].id),
+                "status": ExecutionStatus.EXECUTING.value,
+                "error_message": "retrying",
+            }
+        )
+
+        successful, failed = bulk_update_file_execution_status(
+            WorkflowFileExecution.objects.all(), updates
+        )
+
+        assert failed == []
+        assert [s["file_name"] for s in successful] == ["f0.pdf", "f1.pdf", "f2.pdf"]
+        files = [WorkflowFileExecution.objects.get(id=fe.id) for fe in files]
+        assert files[0].status == ExecutionStatus.COMPLETED.value
+        assert files[0].execution_time is not None
+        assert files[2].status == ExecutionStatus.EXECUTING.value
+        assert files[2].execution_time is None
+        assert files[2].execution_error == "retrying"
+
+    def test_reports_per_item_failures(self):
+        (file_execution,) = self._files(1)
+        updates = [
+            {"file_execution_id": str(file_execution.id)},
+            {"file_execution_id": "not-a-uuid", "status": "COMPLETED"},
+            {"file_execution_id": str(uuid.uuid4()), "status": "COMPLETED"},
+            {"file_execution_id": str(file_execution.id), "status": "BOGUS"},
+            {"file_execution_id": str(file_execution.id), "status": "ERROR"},
+        ]
+
+        successful, failed = bulk_update_file_execution_status(
+            WorkflowFileExecution.objects.all(), updates
+        )
+
+        assert len(successful) == 1
+        assert [f["error"] for f in failed][:2] == [
+            "file_execution_id and status are required",
+            "'not-a-uuid' is not a valid UUID",
+        ]
+        assert "WorkflowFileExecution not found" in [f["error"] for f in failed]
+        assert len(failed) == 4
+
+    def test_out_of_scope_rows_are_not_found(self):
+        (file_execution,) = self._files(1)
+
+        successful, failed = bulk_update_file_execution_status(
+            WorkflowFileExecution.objects.none(), self._status_updates([file_execution])
+        )
+
+        assert successful == []
+        assert failed[0]["error"] == "WorkflowFileExecution not found"
+
+
+class BulkHashUpdateTests(BatchOperationsTestBase):
+    def test_only_supplied_metadata_is_written(self):
+        files = self._files(2)
+        WorkflowFileExecution.objects.filter(id=files[1].id).update(
+            fs_metadata={"keep": True}
+        )
+
+        successful, failed = bulk_update_file_execution_hash(
+            WorkflowFileExecution.objects.all(),
+            [
+                {
+                    "file_execution_id": str(files[0].id),
+                    "file_hash": "a" * 64,
+                    "fs_metadata": {"size": 1},
+                },
+                {"file_execution_id": str(files[1].id), "file_hash": "b" * 64},
+            ],
+        )
+
+        assert failed == []
+        assert successful[0]["file_hash"] == "a" * 16 + "..."
+        first, second = (WorkflowFileExecution.objects.get(id=fe.id) for fe in files)
+        assert (first.file_hash, first.fs_metadata) == ("a" * 64, {"size": 1})
+        assert (second.file_hash, second.fs_metadata) == ("b" * 64, {"keep": True})
+
+
+class BulkCreateTests(BatchOperationsTestBase):
+    def test_creates_new_and_returns_existing_rows(self):
+        first, _ = bulk_create_file_executions(
+            WorkflowExecution.objects.all(), self._create_items(2)
+        )
+
+        successful, failed = bulk_create_file_executions(
+            WorkflowExecution.objects.all(), self._create_items(3)
+        )
+
+        assert failed == []
+        assert [s["id"] for s in successful[:2]] == [s["id"] for s in first]
+        assert WorkflowFileExecution.objects.count() == 3
+        created = WorkflowFileExecution.objects.get(id=successful[2]["id"])
+        assert created.provider_file_uuid == "uuid-2"
+        assert created.file_path == "/in/n2.pdf"
+
+    def test_repeated_item_resolves_to_one_row(self):
+        items = self._create_items(1) * 2
+
+        successful, _ = bulk_create_file_executions(
+            WorkflowExecution.objects.all(), items
+        )
+
+        assert successful[0]["id"] == successful[1]["id"]
+        assert WorkflowFileExecution.objects.count() == 1
+
+    def test_api_files_store_no_path_but_report_it(self):
+        items = self._create_items(1)
+        items[0]["file_hash"]["source_connection_type"] = "API"
+
+        successful, _ = bulk_create_file_executions(
+            WorkflowExecution.objects.all(), items
+        )
+
+        assert successful[0]["file_path"] == "/in/n0.pdf"
+        assert WorkflowFileExecution.objects.get().file_path is None
+
+    def test_unknown_execution_fails_the_item(self):
+        items = self._create_items(1)
+        items[0]["execution_id"] = str(uuid.uuid4())
+
+        successful, failed = bulk_create_file_executions(
+            WorkflowExecution.objects.all(), items
+        )
+
+        assert successful == []
+        assert failed[0]["error"] == "WorkflowExecution not found or access denied"
+
+
+class BatchQueryCountBenchmark(BatchOperationsTestBase):
+    """Query-count benchmark: set-based cost is flat, per-item cost is linear."""
+
+    def _count(self, fn):
+        with CaptureQueriesContext(connection) as ctx:
+            fn()
+        return len(ctx.captured_queries)
+
+    def _per_item_status_update(self, updates):
+        # The loop the batch status endpoint used to run
+        for update in updates:
+            WorkflowFileExecution.objects.all().get(
+                id=update["file_execution_id"]
+            ).update_status(status=update["status"])
+
+    def test_status_update_query_count_is_flat(self):
+        small, large = self._files(5), self._files(50)
+
+        per_item = self._count(
+            lambda: self._per_item_status_update(self._status_updates(large))
+        )
+        bulk_small = self._count(
+            lambda: bulk_update_file_execution_status(
+                WorkflowFileExecution.objects.all(), self._status_updates(small)
+            )
+        )
+        bulk_large = self._count(
+            lambda: bulk_update_file_execution_status(
+                WorkflowFileExecution.objects.all(), self._status_updates(large)
+            )
+        )
+
+        print(
+            f"\n[benchmark] status update, 50 files: per-item={per_item} "
+            f"queries, set-based={bulk_large} queries"
+        )
+        assert bulk_small == bulk_large == 2
+        assert per_item >= 100
+
+    def test_hash_update_query_count_is_flat(self):
+        small, large = self._files(5), self._files(50)
+
+        def updates(files):
+            return [
+                {"file_execution_id": str(fe.id), "file_hash": uuid.uuid4().hex}
+                for fe in files
+            ]
+
+        bulk_small = self._count(
+            lambda: bulk_update_file_execution_hash(
+                WorkflowFileExecution.objects.all(), updates(small)
+            )
+        )
+        bulk_large = self._count(
+            lambda: bulk_update_file_execution_hash(
+                WorkflowFileExecution.objects.all(), updates(large)
+            )
+        )
+
+        assert bulk_small == bulk_large == 2
+
+    def test_create_query_count_is_flat(self):
+        bulk_small = self._count(
+            lambda: bulk_create_file_executions(
+                WorkflowExecution.objects.all(), self._create_items(5)
+            )
+        )
+        bulk_large = self._count(
+            lambda: bulk_create_file_executions(
+                WorkflowExecution.objects.all(), self._create_items(50, offset=5)
+            )
+        )
+
+        print(f"\n[benchmark] batch create, 50 files: set-based={bulk_large} queries")
+        assert bulk_small == bulk_large
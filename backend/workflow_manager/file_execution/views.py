@@ -9,6 +9,9 @@ from workflow_manager.file_execution.models import (
     WorkflowFileExecution as FileExecution,
 )
 from workflow_manager.file_execution.serializers import FileCentricExecutionSerializer
+from workflow_manager.workflow_v2.execution_log_partitions import (
+    execution_event_time_floor,
+)
 from workflow_manager.workflow_v2.models.execution_log import ExecutionLog
 
 
@@ -29,9 +32,15 @@ class FileCentricExecutionViewSet(viewsets.ReadOnlyModelViewSet):
 
         # Subquery to get latest non-DEBUG/WARN log data per file execution
         # Avoids N+1 queries when serializing status_msg
+        latest_log_subquery = ExecutionLog.objects.filter(file_execution=OuterRef("pk"))
+        # Constant event_time floor lets Postgres prune older log partitions.
+        event_time_floor = execution_event_time_floor(execution_id)
+        if event_time_floor is not None:
+            latest_log_subquery = latest_log_subquery.filter(
+                event_time__gte=event_time_floor
+            )
         latest_log_subquery = (
-            ExecutionLog.objects.filter(file_execution=OuterRef("pk"))
-            .exclude(data__level__in=["DEBUG", "WARN"])
+            latest_log_subquery.exclude(data__level__in=["DEBUG", "WARN"])
             .order_by("-event_time")
             .values("data")[:1]
         )
@@ -33,4 +33,9 @@ urlpatterns = [
         execution_log_internal_views.ProcessLogHistoryAPIView.as_view(),
         name="process_log_history",
     ),
+    path(
+        "maintain-partitions/",
+        execution_log_internal_views.MaintainLogPartitionsAPIView.as_view(),
+        name="maintain_log_partitions",
+    ),
 ]
@@ -10,8 +10,10 @@ from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from utils.constants import ExecutionLogConstants
 
 from workflow_manager.file_execution.models import WorkflowFileExecution
+from workflow_manager.workflow_v2.execution_log_partitions import maintain_partitions
 from workflow_manager.workflow_v2.execution_log_utils import (
     process_log_history_from_cache,
 )
@@ -155,14 +157,34 @@ class ProcessLogHistoryAPIView(APIView):
         """Process log history batch from Redis cache.
 
         Args:
-            request: HTTP request (no parameters needed)
+            request: HTTP request; the body may carry an optional ``batch_limit``
+                (capped at ``MAX_BATCH_LIMIT``) and ``consumer`` name used by the
+                streaming ingestor
 
         Returns:
             JSON response with processing results
         """
         try:
+            try:
+                batch_limit = int(
+                    request.data.get(
+                        "batch_limit", ExecutionLogConstants.LOGS_BATCH_LIMIT
+                    )
+                )
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "batch_limit must be an integer"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            batch_limit = min(max(batch_limit, 1), ExecutionLogConstants.MAX_BATCH_LIMIT)
+            consumer = str(
+                request.data.get("consumer") or ExecutionLogConstants.DEFAULT_CONSUMER
+            )
+
             # Reuse existing business logic (uses ExecutionLogConstants for config)
-            result = process_log_history_from_cache()
+            result = process_log_history_from_cache(
+                batch_limit=batch_limit, consumer=consumer
+            )
 
             return Response(result)
 
@@ -171,3 +193,25 @@ class ProcessLogHistoryAPIView(APIView):
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class MaintainLogPartitionsAPIView(APIView):
+    """API view for execution log partition maintenance.
+
+    Called periodically by the log consumer scheduler: creates upcoming
+    ``execution_log`` partitions and drops those past the retention window.
+    """
+
+    def post(self, request: Request) -> Response:
+        """Run one partition maintenance pass.
+
+        Returns:
+            JSON response with the partitions created and expired
+        """
+        try:
+            return Response(maintain_partitions())
+        except Exception as e:
+            logger.error(f"Error maintaining log partitions: {e}", exc_info=True)
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,275 @@
+"""Partition maintenance for the range-partitioned ``execution_log`` table.
+
+``execution_log`` is partitioned by ``event_time`` (see migration
+``0026_partition_execution_log``). This module keeps it healthy:
+
+* ``ensure_partitions`` creates the current and upcoming partitions ahead of
+  time. Rows that landed in the DEFAULT partition because maintenance lagged
+  are moved into the new partition as it is created, so no insert ever fails.
+* ``drop_expired_partitions`` applies retention by detaching (and dropping) whole
+  partitions — no row-by-row ``DELETE``, no table/index bloat, no vacuum debt.
+* ``execution_event_time_floor`` gives log queries an ``event_time`` lower bound
+  so they only touch partitions from the execution's start onward.
+
+Driven by the ``maintain_execution_log_partitions`` management command and the
+internal ``execution-logs/maintain-partitions/`` endpoint the log consumer
+scheduler calls on its own cadence. Every function is a no-op on a database
+where the table is not partitioned.
+"""
+
+import logging
+import re
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from workflow_manager.workflow_v2.models import ExecutionLog, WorkflowExecution
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = ExecutionLog._meta.db_table
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+LEGACY_PARTITION = f"{PARENT_TABLE}_legacy"
+
+DAILY = "day"
+WEEKLY = "week"
+
+# Logs are emitted by workers after the execution row exists; the slack absorbs
+# clock skew between worker hosts and the database.
+EVENT_TIME_FLOOR_SLACK = timedelta(hours=1)
+
+# pg_get_expr(relpartbound) renders e.g.
+#   FOR VALUES FROM ('2026-10-19 00:00:00+00') TO ('2026-10-20 00:00:00+00')
+#   FOR VALUES FROM (MINVALUE) TO ('2026-10-20 00:00:00+00')
+_BOUND_RE = re.compile(r"FROM \((?P<lower>[^)]*)\) TO \((?P<upper>[^)]*)\)")
+
+
+def _parse_bound(value: str) -> datetime | None:
+    """Parse one rendered range bound; ``None`` for MINVALUE / MAXVALUE."""
+    value = value.strip()
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    parsed = datetime.fromisoformat(value.strip("'"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def is_partitioned() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions() -> list[dict[str, Any]]:
+    """Return the range partitions of ``execution_log`` ordered by lower bound.
+
+    Each entry is ``{"name", "lower", "upper"}``; ``lower`` is ``None`` for a
+    ``MINVALUE`` bound (the legacy partition). The DEFAULT partition is omitted.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            """,
+            [PARENT_TABLE],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND_RE.search(bound or "")
+        if not match:
+            continue  # DEFAULT
+        partitions.append(
+            {
+                "name": name,
+                "lower": _parse_bound(match.group("lower")),
+                "upper": _parse_bound(match.group("upper")),
+            }
+        )
+    partitions.sort(key=lambda p: p["lower"] or datetime.min.replace(tzinfo=UTC))
+    return partitions
+
+
+def period_start(day: date, interval: str) -> date:
+    """First day of the partition period containing ``day`` (weeks start Monday)."""
+    if interval == WEEKLY:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def period_bounds(start: date, interval: str) -> tuple[datetime, datetime]:
+    """UTC ``[lower, upper)`` bounds of the period starting on ``start``."""
+    lower = datetime(start.year, start.month, start.day, tzinfo=UTC)
+    step = timedelta(weeks=1) if interval == WEEKLY else timedelta(days=1)
+    return lower, lower + step
+
+
+def partition_name(lower: datetime) -> str:
+    return f"{PARENT_TABLE}_p{lower:%Y%m%d}"
+
+
+def _clip_to_free_range(
+    lower: datetime, upper: datetime, partitions: list[dict[str, Any]]
+) -> tuple[datetime, datetime] | None:
+    """Shrink ``[lower, upper)`` so it does not overlap an existing partition.
+
+    Existing partitions may not line up with the configured period (the legacy
+    partition ends at the cutover day, or the interval setting changed), so the
+    new partition starts where the overlapping one ends. Returns ``None`` when
+    the whole period is already covered.
+    """
+    for partition in partitions:
+        p_lower, p_upper = partition["lower"], partition["upper"]
+        overlaps = (p_lower is None or p_lower < upper) and (
+            p_upper is None or p_upper > lower
+        )
+        if not overlaps:
+            continue
+        if p_upper is None or p_upper >= upper:
+            return None
+        lower = max(lower, p_upper)
+    return lower, upper
+
+
+def _create_partition(name: str, lower: datetime, upper: datetime) -> int:
+    """Create and attach one partition; return rows moved out of DEFAULT.
+
+    Built as a standalone table, filled with any matching rows parked in the
+    DEFAULT partition, then attached — attaching an overlapping range while the
+    DEFAULT partition still holds its rows would fail.
+    """
+    quoted = connection.ops.quote_name(name)
+    parent = connection.ops.quote_name(PARENT_TABLE)
+    default = connection.ops.quote_name(DEFAULT_PARTITION)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {quoted} "
+            f"(LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {default} "
+            "WHERE event_time >= %s AND event_time < %s RETURNING *) "
+            f"INSERT INTO {quoted} SELECT * FROM moved",
+            [lower, upper],
+        )
+        moved = cursor.rowcount
+        cursor.execute(
+            f"ALTER TABLE {parent} ATTACH PARTITION {quoted} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [lower, upper],
+        )
+    return moved
+
+
+def ensure_partitions(
+    premake: int | None = None,
+    interval: str | None = None,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> list[str]:
+    """Create partitions for the current period and the next ``premake`` ones.
+
+    Returns the names of the partitions created (or that would be, on dry run).
+    """
+    premake = settings.EXECUTION_LOG_PARTITION_PREMAKE if premake is None else premake
+    interval = interval or settings.EXECUTION_LOG_PARTITION_INTERVAL
+    today = (now or timezone.now()).astimezone(UTC).date()
+    partitions = list_partitions()
+
+    created = []
+    start = period_start(today, interval)
+    for _ in range(premake + 1):
+        lower, upper = period_bounds(start, interval)
+        start = upper.date()
+        free = _clip_to_free_range(lower, upper, partitions)
+        if free is None:
+            continue
+        name = partition_name(free[0])
+        if not dry_run:
+            moved = _create_partition(name, *free)
+            if moved:
+                logger.warning(
+                    f"Moved {moved} execution logs from {DEFAULT_PARTITION} into {name}"
+                )
+        partitions.append({"name": name, "lower": free[0], "upper": free[1]})
+        created.append(name)
+    return created
+
+
+def drop_expired_partitions(
+    retention_days: int | None = None,
+    detach_only: bool = False,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> list[str]:
+    """Detach (and drop) partitions entirely older than the retention window.
+
+    A partition is expired once its upper bound is at or before
+    ``now - retention_days``; the legacy partition goes the same way once its
+    cutover day ages out. ``retention_days <= 0`` keeps everything.
+    ``detach_only`` leaves detached tables in place for archival.
+    """
+    if retention_days is None:
+        retention_days = settings.EXECUTION_LOG_RETENTION_DAYS
+    if retention_days <= 0:
+        return []
+    cutoff = (now or timezone.now()) - timedelta(days=retention_days)
+    parent = connection.ops.quote_name(PARENT_TABLE)
+
+    expired = [
+        p["name"]
+        for p in list_partitions()
+        if p["upper"] is not None and p["upper"] <= cutoff
+    ]
+    if dry_run:
+        return expired
+    for name in expired:
+        quoted = connection.ops.quote_name(name)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {parent} DETACH PARTITION {quoted}")
+            if not detach_only:
+                cursor.execute(f"DROP TABLE {quoted}")
+        logger.info(
+            f"{'Detached' if detach_only else 'Dropped'} execution log partition "
+            f"{name} (older than {retention_days} days)"
+        )
+    return expired
+
+
+def maintain_partitions(dry_run: bool = False, detach_only: bool = False) -> dict:
+    """Create upcoming partitions and apply retention in one pass."""
+    if not is_partitioned():
+        return {"partitioned": False, "created": [], "expired": []}
+    return {
+        "partitioned": True,
+        "created": ensure_partitions(dry_run=dry_run),
+        "expired": drop_expired_partitions(detach_only=detach_only, dry_run=dry_run),
+    }
+
+
+def execution_event_time_floor(execution_id: str) -> datetime | None:
+    """Earliest ``event_time`` a log of ``execution_id`` can carry.
+
+    Adding ``event_time__gte=<floor>`` to a log query lets Postgres prune every
+    partition older than the execution, so log views stay flat as history grows.
+    ``None`` when the execution is unknown (no pruning).
+    """
+    created_at = (
+        WorkflowExecution.objects.filter(pk=execution_id)
+        .values_list("created_at", flat=True)
+        .first()
+    )
+    if created_at is None:
+        return None
+    return created_at - EVENT_TIME_FLOOR_SLACK
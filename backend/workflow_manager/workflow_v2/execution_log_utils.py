@@ -1,10 +1,12 @@
 import logging
 import sys
+import uuid
 from collections import defaultdict
 
 from celery import shared_task
-from django.db import IntegrityError
-from django.db.utils import OperationalError, ProgrammingError
+from django.db import IntegrityError, transaction
+from django.db.utils import InterfaceError, OperationalError, ProgrammingError
+from django.utils import timezone
 from django_celery_beat.models import IntervalSchedule, PeriodicTask
 from utils.cache_service import CacheService
 from utils.constants import ExecutionLogConstants
@@ -19,6 +21,7 @@ logger = logging.getLogger(__name__)
 def process_log_history_from_cache(
     queue_name: str = ExecutionLogConstants.LOG_QUEUE_NAME,
     batch_limit: int = ExecutionLogConstants.LOGS_BATCH_LIMIT,
+    consumer: str = ExecutionLogConstants.DEFAULT_CONSUMER,
 ) -> dict:
     """Process log history from Redis cache.
 
@@ -26,100 +29,285 @@ def process_log_history_from_cache(
     from Redis cache to database. It can be called by both the Celery task and
     internal API endpoints.
 
+    Logs are claimed with one multi-element pop that keeps a copy on a
+    per-consumer processing list; the copy is dropped only after the batch is
+    committed, so a drain that dies mid-way is redelivered on the consumer's
+    next call (at-least-once). Concurrent drains for the same consumer are
+    serialised by a short lock. A batch that keeps failing to store is moved to
+    the dead-letter list after ``MAX_DELIVERY_ATTEMPTS``, and processing lists
+    left behind by consumers that are gone (e.g. a replaced pod) are taken over.
+
     Args:
         queue_name: Redis queue name to process logs from
         batch_limit: Maximum number of logs to process in one batch
+        consumer: Consumer name owning the processing list
 
     Returns:
         Dictionary with processing results:
         - processed_count: Number of logs successfully stored
-        - skipped_count: Number of logs skipped (invalid references)
+        - skipped_count: Number of logs skipped (malformed or invalid references)
         - total_logs: Total number of logs retrieved from cache
         - organizations_processed: Number of organizations affected
+        - redelivered_count: Logs re-read from an unacknowledged batch
+        - dead_lettered_count: Logs moved aside after repeated failures
+        - remaining: Logs still queued after this batch
+        - lag_seconds: Age of the oldest stored log at commit time
     """
-    organization_logs = defaultdict(list)
-    logs_count = 0
-    logs_to_process = []
-    skipped_count = 0
+    processing_key = _processing_key(queue_name, consumer)
+    attempts_key = f"{processing_key}:attempts"
+    lock_key = f"{processing_key}:lock"
+    lock_token = uuid.uuid4().hex
+    if not CacheService.set_nx(
+        lock_key, lock_token, ExecutionLogConstants.DRAIN_LOCK_TTL
+    ):
+        logger.info(f"Log history drain for consumer '{consumer}' already running")
+        return {
+            **_empty_result(),
+            "remaining": CacheService.llen(queue_name),
+        }
+
+    dead_lettered_count = 0
+    try:
+        raw_logs = CacheService.lrange(processing_key, 0, -1)
+        if not raw_logs and _reclaim_abandoned_batches(queue_name, processing_key):
+            raw_logs = CacheService.lrange(processing_key, 0, -1)
+        redelivered_count = len(raw_logs)
+        if redelivered_count:
+            logger.warning(
+                f"Redelivering {redelivered_count} unacknowledged logs for "
+                f"consumer '{consumer}'"
+            )
+        else:
+            raw_logs = CacheService.claim_list_batch(
+                queue_name, processing_key, batch_limit
+            )
+
+        try:
+            result = _store_logs(raw_logs, queue_name) if raw_logs else _empty_result()
+        except Exception as error:
+            if not _dead_letter_if_exhausted(
+                queue_name, processing_key, attempts_key, error
+            ):
+                raise
+            result = _empty_result()
+            dead_lettered_count = len(raw_logs)
+        else:
+            # Acknowledge only once the batch is committed
+            CacheService.delete_raw(processing_key, attempts_key)
+    finally:
+        CacheService.delete_if_equals(lock_key, lock_token)
+
+    result["redelivered_count"] = redelivered_count
+    result["dead_lettered_count"] = dead_lettered_count
+    result["remaining"] = CacheService.llen(queue_name)
+    return result
 
-    # Collect logs from cache (batch retrieval)
-    while logs_count < batch_limit:
-        log = CacheService.lpop(queue_name)
-        if not log:
-            break
 
+def _processing_key(queue_name: str, consumer: str) -> str:
+    return f"{queue_name}:processing:{consumer}"
+
+
+def _dead_letter_if_exhausted(
+    queue_name: str, processing_key: str, attempts_key: str, error: Exception
+) -> bool:
+    """Count a failed store; move the batch aside once it has failed too often.
+
+    Database outages are not the batch's fault and are not counted, so they
+    never dead-letter logs. Returns True when the batch was moved.
+    """
+    if isinstance(error, OperationalError | InterfaceError):
+        return False
+    attempts = CacheService.incr_raw(attempts_key)
+    if attempts < ExecutionLogConstants.MAX_DELIVERY_ATTEMPTS:
+        logger.warning(
+            f"Storing claimed logs failed (attempt {attempts}/"
+            f"{ExecutionLogConstants.MAX_DELIVERY_ATTEMPTS}): {error}"
+        )
+        return False
+    dead_letter_key = f"{queue_name}:dead_letter"
+    moved = CacheService.move_list(processing_key, dead_letter_key)
+    CacheService.delete_raw(attempts_key)
+    logger.error(
+        f"Moved {moved} logs to '{dead_letter_key}' after {attempts} failed "
+        f"attempts to store them: {error}"
+    )
+    return True
+
+
+def _reclaim_abandoned_batches(queue_name: str, processing_key: str) -> int:
+    """Take over processing lists whose consumer no longer holds its lock.
+
+    Consumer names come from the caller (the ingestor defaults to its hostname),
+    so a replaced pod never reads its old list again. At most once per
+    ``RECLAIM_INTERVAL`` across all consumers, this moves such lists, with their
+    failure counts, onto ``processing_key`` for redelivery. Each list is moved
+    while holding its owner's lock, so it cannot race that owner's own drain.
+
+    Returns:
+        int: Number of logs taken over.
+    """
+    if not CacheService.set_nx(
+        f"{queue_name}:reclaim", "1", ExecutionLogConstants.RECLAIM_INTERVAL
+    ):
+        return 0
+    reclaimed = 0
+    for key in CacheService.scan_keys(_processing_key(queue_name, "*")):
+        if key == processing_key or key.endswith((":lock", ":attempts")):
+            continue
+        owner_lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        if not CacheService.set_nx(
+            owner_lock_key, token, ExecutionLogConstants.DRAIN_LOCK_TTL
+        ):
+            continue  # its consumer is draining it right now
+        try:
+            moved = CacheService.move_list(key, processing_key)
+            attempts = int(CacheService.get_raw(f"{key}:attempts") or 0)
+            if moved and attempts:
+                CacheService.incr_raw(f"{processing_key}:attempts", attempts)
+            CacheService.delete_raw(f"{key}:attempts")
+        finally:
+            CacheService.delete_if_equals(owner_lock_key, token)
+        if moved:
+            logger.warning(f"Took over {moved} unacknowledged logs from '{key}'")
+            reclaimed += moved
+    return reclaimed
+
+
+def _empty_result() -> dict:
+    return {
+        "processed_count": 0,
+        "skipped_count": 0,
+        "total_logs": 0,
+        "organizations_processed": 0,
+        "redelivered_count": 0,
+        "dead_lettered_count": 0,
+        "lag_seconds": 0.0,
+    }
+
+
+def _canonical_uuid(value: object) -> str | None:
+    """Return ``value`` as a canonical UUID string, or None if it is not one."""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def _store_logs(raw_logs: list, queue_name: str) -> dict:
+    """Validate claimed logs, resolve their FKs in bulk and insert them at once.
+
+    Malformed entries are dropped (and counted as skipped) before any query, so
+    one bad log cannot fail the whole batch.
+    """
+    logs_to_process = []
+    malformed_count = 0
+    for log in raw_logs:
         log_data: LogDataDTO | None = LogDataDTO.from_json(log)
-        if log_data:
-            logs_to_process.append(log_data)
-            logs_count += 1
+        execution_id = _canonical_uuid(log_data.execution_id) if log_data else None
+        file_execution_id = (
+            _canonical_uuid(log_data.file_execution_id)
+            if log_data and log_data.file_execution_id
+            else None
+        )
+        if not execution_id or (log_data.file_execution_id and not file_execution_id):
+            logger.warning(f"Dropping malformed log from queue '{queue_name}': {log}")
+            malformed_count += 1
+            continue
+        log_data.execution_id = execution_id
+        log_data.file_execution_id = file_execution_id
+        logs_to_process.append(log_data)
 
     if not logs_to_process:
         return {
-            "processed_count": 0,
-            "skipped_count": 0,
-            "total_logs": 0,
-            "organizations_processed": 0,
+            **_empty_result(),
+            "skipped_count": malformed_count,
+            "total_logs": len(raw_logs),
         }
 
+    logs_count = len(logs_to_process)
     logger.info(f"Processing {logs_count} logs from queue '{queue_name}'")
 
-    # Preload required WorkflowExecution and WorkflowFileExecution objects
+    # Resolve FK references with id-only queries; rows are never materialised
     execution_ids = {log.execution_id for log in logs_to_process}
     file_execution_ids = {
         log.file_execution_id for log in logs_to_process if log.file_execution_id
     }
-
-    execution_map = {
-        str(obj.id): obj for obj in WorkflowExecution.objects.filter(id__in=execution_ids)
-    }
-    file_execution_map = {
-        str(obj.id): obj
-        for obj in WorkflowFileExecution.objects.filter(id__in=file_execution_ids)
+    known_execution_ids = {
+        str(pk)
+        for pk in WorkflowExecution.objects.filter(id__in=execution_ids).values_list(
+            "id", flat=True
+        )
     }
+    known_file_execution_ids = (
+        {
+            str(pk)
+            for pk in WorkflowFileExecution.objects.filter(
+                id__in=file_execution_ids
+            ).values_list("id", flat=True)
+        }
+        if file_execution_ids
+        else set()
+    )
 
-    # Process logs with preloaded data
+    execution_logs = []
+    organization_counts = defaultdict(int)
+    skipped_count = 0
     for log_data in logs_to_process:
-        execution = execution_map.get(log_data.execution_id)
-        if not execution:
+        if log_data.execution_id not in known_execution_ids:
             logger.warning(
                 f"Execution not found for execution_id: {log_data.execution_id}, "
                 "skipping log push"
             )
             skipped_count += 1
             continue
+        if (
+            log_data.file_execution_id
+            and log_data.file_execution_id not in known_file_execution_ids
+        ):
+            logger.warning(
+                f"File execution not found for file_execution_id: {log_data.file_execution_id}, "
+                "skipping log push"
+            )
+            skipped_count += 1
+            continue
 
-        execution_log = ExecutionLog(
-            wf_execution=execution,
-            data=log_data.data,
-            event_time=log_data.event_time,
+        execution_logs.append(
+            ExecutionLog(
+                wf_execution_id=log_data.execution_id,
+                file_execution_id=log_data.file_execution_id or None,
+                data=log_data.data,
+                event_time=log_data.event_time,
+            )
         )
+        organization_counts[log_data.organization_id] += 1
+
+    # One multi-row INSERT per INSERT_BATCH_SIZE logs across all organizations
+    if execution_logs:
+        with transaction.atomic():
+            ExecutionLog.objects.bulk_create(
+                objs=execution_logs,
+                batch_size=ExecutionLogConstants.INSERT_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+    for organization_id, count in organization_counts.items():
+        logger.info(f"Stored {count} logs for org: {organization_id}")
 
-        if log_data.file_execution_id:
-            file_execution = file_execution_map.get(log_data.file_execution_id)
-            if file_execution:
-                execution_log.file_execution = file_execution
-            else:
-                logger.warning(
-                    f"File execution not found for file_execution_id: {log_data.file_execution_id}, "
-                    "skipping log push"
-                )
-                skipped_count += 1
-                continue
-
-        organization_logs[log_data.organization_id].append(execution_log)
-
-    # Bulk insert logs for each organization
-    processed_count = 0
-    for organization_id, logs in organization_logs.items():
-        logger.info(f"Storing {len(logs)} logs for org: {organization_id}")
-        ExecutionLog.objects.bulk_create(objs=logs, ignore_conflicts=True)
-        processed_count += len(logs)
+    oldest_event_time = (
+        min(log.event_time for log in execution_logs) if execution_logs else None
+    )
+    lag_seconds = (
+        round((timezone.now() - oldest_event_time).total_seconds(), 3)
+        if oldest_event_time
+        else 0.0
+    )
 
     return {
-        "processed_count": processed_count,
-        "skipped_count": skipped_count,
-        "total_logs": logs_count,
-        "organizations_processed": len(organization_logs),
+        "processed_count": len(execution_logs),
+        "skipped_count": skipped_count + malformed_count,
+        "total_logs": len(raw_logs),
+        "organizations_processed": len(organization_counts),
+        "lag_seconds": lag_seconds,
     }
 
 
@@ -14,6 +14,9 @@ from rest_framework.versioning import URLPathVersioning
 from utils.pagination import CustomPagination
 
 from workflow_manager.execution.access import assert_execution_accessible
+from workflow_manager.workflow_v2.execution_log_partitions import (
+    execution_event_time_floor,
+)
 from workflow_manager.workflow_v2.filters import ExecutionLogFilter
 from workflow_manager.workflow_v2.models.execution_log import ExecutionLog
 from workflow_manager.workflow_v2.serializers import WorkflowExecutionLogSerializer
@@ -46,9 +49,15 @@ class WorkflowExecutionLogViewSet(viewsets.ReadOnlyModelViewSet):
         # ``execution_id`` is the deprecated pre-``wf_execution`` column. Org
         # scoping joins through ``wf_execution``, so this term matches nothing in
         # request context; it stays until those rows are rotated out.
-        return ExecutionLog.objects.filter(
+        queryset = ExecutionLog.objects.filter(
             Q(wf_execution_id=execution_id) | Q(execution_id=execution_id)
         )
+        # Lower-bound event_time so only partitions from the execution's start
+        # onward are scanned.
+        event_time_floor = execution_event_time_floor(execution_id)
+        if event_time_floor is not None:
+            queryset = queryset.filter(event_time__gte=event_time_floor)
+        return queryset
 
     def export(self, request, *args, **kwargs):
         """Export logs for a single workflow execution as CSV or JSON.
@@ -0,0 +1,82 @@
+"""Create upcoming ``execution_log`` partitions and drop expired ones.
+
+Idempotent and safe to run anytime; the log consumer scheduler also triggers the
+same maintenance through the internal API. Run it by hand to pre-create
+partitions further ahead, to apply a one-off retention, or to preview either.
+
+Usage:
+    python manage.py maintain_execution_log_partitions
+    python manage.py maintain_execution_log_partitions --dry-run
+    python manage.py maintain_execution_log_partitions --premake=30
+    python manage.py maintain_execution_log_partitions --retention-days=90 --detach-only
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from workflow_manager.workflow_v2 import execution_log_partitions as partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming execution_log partitions and detach/drop partitions "
+        "older than the retention window. Idempotent."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--premake",
+            type=int,
+            default=settings.EXECUTION_LOG_PARTITION_PREMAKE,
+            help="Future partitions to keep created (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--interval",
+            choices=[partitions.DAILY, partitions.WEEKLY],
+            default=settings.EXECUTION_LOG_PARTITION_INTERVAL,
+            help="Width of new partitions (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.EXECUTION_LOG_RETENTION_DAYS,
+            help="Drop partitions older than this many days; 0 keeps everything "
+            "(default: %(default)s)",
+        )
+        parser.add_argument(
+            "--detach-only",
+            action="store_true",
+            help="Detach expired partitions but keep their tables (for archival).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not partitions.is_partitioned():
+            raise CommandError(
+                f"{partitions.PARENT_TABLE} is not partitioned; run migrations first"
+            )
+        dry_run = options["dry_run"]
+        created = partitions.ensure_partitions(
+            premake=options["premake"], interval=options["interval"], dry_run=dry_run
+        )
+        expired = partitions.drop_expired_partitions(
+            retention_days=options["retention_days"],
+            detach_only=options["detach_only"],
+            dry_run=dry_run,
+        )
+
+        prefix = "[dry-run] " if dry_run else ""
+        for name in created:
+            self.stdout.write(f"{prefix}create {name}")
+        action = "detach" if options["detach_only"] else "drop"
+        for name in expired:
+            self.stdout.write(f"{prefix}{action} {name}")
+        self.stdout.write(
+            self.style.SUCCESS(f"{prefix}created={len(created)} expired={len(expired)}")
+        )
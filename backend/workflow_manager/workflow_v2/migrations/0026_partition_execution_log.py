@@ -0,0 +1,198 @@
+"""Range-partition ``execution_log`` by ``event_time``.
+
+``execution_log`` grows without bound across every tenant, and retention on a
+single heap means huge ``DELETE``s that bloat the table and its indexes and
+leave vacuum debt behind. As a partitioned table, retention becomes a metadata
+operation (detach + drop a whole partition) and log queries that carry an
+``event_time`` lower bound only touch the partitions they need.
+
+Design
+------
+* NO DATA COPY — the existing table is renamed to ``execution_log_legacy`` and
+  attached as the partition ``FROM (MINVALUE) TO (<cutover>)``, where cutover is
+  the start of the day after the newest existing row (or after today). It is
+  dropped by retention like any other partition once that day ages out.
+* PRIMARY KEY ``(id, event_time)`` — Postgres requires the partition key in
+  every unique constraint. Django keeps ``id`` as the model's primary key;
+  ids are UUID4 so they stay unique in practice.
+* INDEXES / FKs are recreated on the parent from the legacy table's own
+  definitions, under the same names, so Django's view of the schema does not
+  change and attaching the legacy table reuses its existing indexes. Those are
+  renamed out of the way first (a possibly truncated ``<name>_legacy``); the
+  reverse migration restores their exact names from the parent index each one
+  is attached to, read from ``pg_inherits`` before detaching.
+* DEFAULT partition catches rows outside every range (e.g. maintenance fell
+  behind) so an insert never fails; ``execution_log_partitions`` moves such rows
+  into the proper partition when it creates it.
+* Partitions for the next week are created here; afterwards
+  ``manage.py maintain_execution_log_partitions`` (also triggered by the log
+  consumer scheduler) keeps them ahead and applies retention.
+
+Deployment
+----------
+Re-keying the legacy table builds its ``(id, event_time)`` primary key index and
+attaching it validates its range, both under an exclusive lock, so
+``execution_log`` writes block for that long (minutes on a very large table).
+Log producers buffer in Redis meanwhile, so nothing is lost, but prefer a quiet
+window.
+"""
+
+from django.db import migrations
+
+# Runs in the migration's schema (search_path); catalog lookups use to_regclass.
+_PARTITION_SQL = """
+DO $$
+DECLARE
+    idx record;
+    fk record;
+    cutover timestamptz;
+    day_start timestamptz;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = to_regclass('execution_log')
+    ) THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE execution_log RENAME TO execution_log_legacy;
+    -- A partition's primary key must match the parent's (id, event_time).
+    ALTER TABLE execution_log_legacy
+        DROP CONSTRAINT execution_log_pkey,
+        ADD CONSTRAINT execution_log_legacy_pkey PRIMARY KEY (id, event_time);
+
+    SELECT date_trunc('day', greatest(max(event_time), now()) AT TIME ZONE 'UTC')
+           AT TIME ZONE 'UTC' + interval '1 day'
+      INTO cutover
+      FROM execution_log_legacy;
+
+    CREATE TABLE execution_log (
+        LIKE execution_log_legacy INCLUDING DEFAULTS INCLUDING COMMENTS
+    ) PARTITION BY RANGE (event_time);
+    ALTER TABLE execution_log ADD PRIMARY KEY (id, event_time);
+
+    -- Recreate secondary indexes under their original names; the legacy copies
+    -- are renamed out of the way and re-used as the partition's indexes.
+    FOR idx IN
+        SELECT c.relname AS name, pg_get_indexdef(i.indexrelid) AS def
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass('execution_log_legacy')
+          AND NOT i.indisprimary AND NOT i.indisunique
+    LOOP
+        EXECUTE format(
+            'ALTER INDEX %I RENAME TO %I', idx.name, left(idx.name, 55) || '_legacy'
+        );
+        EXECUTE format(
+            'CREATE INDEX %I ON execution_log %s',
+            idx.name,
+            substring(idx.def FROM ' USING .*$')
+        );
+    END LOOP;
+
+    FOR fk IN
+        SELECT conname, pg_get_constraintdef(oid) AS def
+        FROM pg_constraint
+        WHERE conrelid = to_regclass('execution_log_legacy') AND contype = 'f'
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE execution_log ADD CONSTRAINT %I %s', fk.conname, fk.def
+        );
+    END LOOP;
+
+    EXECUTE format(
+        'ALTER TABLE execution_log ATTACH PARTITION execution_log_legacy '
+        'FOR VALUES FROM (MINVALUE) TO (%L)',
+        cutover
+    );
+    CREATE TABLE execution_log_default PARTITION OF execution_log DEFAULT;
+
+    FOR day_start IN
+        SELECT generate_series(cutover, cutover + interval '6 days', interval '1 day')
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF execution_log FOR VALUES FROM (%L) TO (%L)',
+            'execution_log_p' || to_char(day_start AT TIME ZONE 'UTC', 'YYYYMMDD'),
+            day_start,
+            day_start + interval '1 day'
+        );
+    END LOOP;
+END
+$$;
+"""
+
+# Fold every partition back into the legacy heap and restore it as a plain table.
+_UNPARTITION_SQL = """
+DO $$
+DECLARE
+    part record;
+    idx record;
+    legacy_names text[];
+    original_names text[];
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = to_regclass('execution_log')
+    ) THEN
+        RETURN;
+    END IF;
+
+    -- The forward migration may have truncated a legacy index's name to fit
+    -- its _legacy suffix, so take each one's original name from the parent
+    -- index it is attached to — a link that detaching severs.
+    SELECT array_agg(child.relname), array_agg(parent.relname)
+      INTO legacy_names, original_names
+      FROM pg_inherits inh
+      JOIN pg_index ci ON ci.indexrelid = inh.inhrelid
+      JOIN pg_class child ON child.oid = inh.inhrelid
+      JOIN pg_class parent ON parent.oid = inh.inhparent
+     WHERE ci.indrelid = to_regclass('execution_log_legacy')
+       AND NOT ci.indisprimary;
+
+    ALTER TABLE execution_log DETACH PARTITION execution_log_legacy;
+    INSERT INTO execution_log_legacy SELECT * FROM execution_log;
+
+    FOR part IN
+        SELECT c.relname AS name
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass('execution_log')
+    LOOP
+        EXECUTE format('DROP TABLE %I', part.name);
+    END LOOP;
+    DROP TABLE execution_log;
+
+    ALTER TABLE execution_log_legacy RENAME TO execution_log;
+    ALTER TABLE execution_log
+        DROP CONSTRAINT execution_log_legacy_pkey,
+        ADD CONSTRAINT execution_log_pkey PRIMARY KEY (id);
+    FOR i IN 1 .. coalesce(array_length(legacy_names, 1), 0) LOOP
+        EXECUTE format(
+            'ALTER INDEX %I RENAME TO %I', legacy_names[i], original_names[i]
+        );
+    END LOOP;
+    -- Fallback for a legacy index left unattached (a duplicate definition).
+    FOR idx IN
+        SELECT c.relname AS name
+        FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass('execution_log')
+          AND c.relname LIKE '%\\_legacy'
+    LOOP
+        EXECUTE format(
+            'ALTER INDEX %I RENAME TO %I',
+            idx.name,
+            left(idx.name, length(idx.name) - length('_legacy'))
+        );
+    END LOOP;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workflow_v2", "0025_workflow_workflow_org_modified_idx"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=_PARTITION_SQL, reverse_sql=_UNPARTITION_SQL),
+    ]
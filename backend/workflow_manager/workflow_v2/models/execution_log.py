@@ -49,6 +49,9 @@ class ExecutionLog(BaseModel):
         )
 
     class Meta:
+        # Range-partitioned by ``event_time`` in the database (migration 0026);
+        # the physical primary key is ``(id, event_time)``. Partitions are
+        # managed by ``execution_log_partitions``.
         verbose_name = "Execution Log"
         verbose_name_plural = "Execution Logs"
         db_table = "execution_log"
@@ -0,0 +1,238 @@
+"""Log history drain: claim, acknowledge, dead-letter and reclaim.
+
+``process_log_history_from_cache`` keeps a claimed batch on a per-consumer
+processing list until it is stored. These pin that a batch that keeps failing is
+moved to the dead-letter list instead of stalling ingestion, that lists left by
+departed consumers are taken over, that the drain lock is released only by its
+holder, and that malformed logs are dropped before any query.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import uuid
+from unittest import mock
+
+import django
+import pytest
+from django.apps import apps
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings.test")
+if not apps.ready:
+    django.setup()
+
+from django.db.utils import OperationalError  # noqa: E402
+from utils.constants import ExecutionLogConstants  # noqa: E402
+
+from workflow_manager.workflow_v2 import execution_log_utils as utils  # noqa: E402
+
+QUEUE = "log_history_queue"
+PROCESSING = f"{QUEUE}:processing:pod-a"
+
+
+class _FakeCache:
+    """In-memory stand-in for the raw-Redis ``CacheService`` calls used here."""
+
+    def __init__(self):
+        self.lists: dict[str, list] = {}
+        self.values: dict[str, object] = {}
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def claim_list_batch(self, key, processing_key, count):
+        items = self.lists.get(key, [])[:count]
+        self.lists[key] = self.lists.get(key, [])[len(items) :]
+        self.lists.setdefault(processing_key, []).extend(items)
+        return items
+
+    def move_list(self, key, dest_key):
+        items = self.lists.pop(key, [])
+        self.lists.setdefault(dest_key, []).extend(items)
+        return len(items)
+
+    def set_nx(self, key, value, expire):
+        if key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    def delete_if_equals(self, key, value):
+        if self.values.get(key) == value:
+            del self.values[key]
+            return True
+        return False
+
+    def delete_raw(self, *keys):
+        for key in keys:
+            self.lists.pop(key, None)
+            self.values.pop(key, None)
+
+    def get_raw(self, key):
+        return self.values.get(key)
+
+    def incr_raw(self, key, amount=1):
+        self.values[key] = int(self.values.get(key, 0)) + amount
+        return self.values[key]
+
+    def scan_keys(self, pattern):
+        return [k for k in [*self.lists, *self.values] if fnmatch.fnmatch(k, pattern)]
+
+
+def _log(execution_id=None, **overrides) -> str:
+    return json.dumps(
+        {
+            "execution_id": execution_id or str(uuid.uuid4()),
+            "organization_id": "org",
+            "timestamp": 1760000000,
+            "type": "LOG",
+            "data": {"message": "hi"},
+            **overrides,
+        }
+    )
+
+
+class _DrainTestBase:
+    @pytest.fixture(autouse=True)
+    def _fake_cache(self):
+        self.cache = _FakeCache()
+        with mock.patch.object(utils, "CacheService", self.cache):
+            yield
+
+    def drain(self, consumer="pod-a"):
+        return utils.process_log_history_from_cache(
+            queue_name=QUEUE, batch_limit=10, consumer=consumer
+        )
+
+
+class TestAcknowledgeAndRetry(_DrainTestBase):
+    def test_stored_batch_is_acknowledged_and_lock_released(self):
+        self.cache.lists[QUEUE] = [_log(), _log()]
+        with mock.patch.object(utils, "_store_logs", return_value=utils._empty_result()):
+            self.drain()
+
+        assert PROCESSING not in self.cache.lists
+        assert f"{PROCESSING}:lock" not in self.cache.values
+
+    def test_failed_batch_is_kept_for_redelivery(self):
+        self.cache.lists[QUEUE] = [_log()]
+        with mock.patch.object(utils, "_store_logs", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                self.drain()
+
+        assert len(self.cache.lists[PROCESSING]) == 1
+        assert self.cache.values[f"{PROCESSING}:attempts"] == 1
+
+    def test_lock_taken_over_after_expiry_is_not_released(self):
+        self.cache.lists[QUEUE] = [_log()]
+
+        def _store(raw_logs, queue_name):
+            # Our lock expired mid-drain and another drain now holds it.
+            self.cache.values[f"{PROCESSING}:lock"] = "someone-else"
+            return utils._empty_result()
+
+        with mock.patch.object(utils, "_store_logs", side_effect=_store):
+            self.drain()
+
+        assert self.cache.values[f"{PROCESSING}:lock"] == "someone-else"
+
+
+class TestDeadLetter(_DrainTestBase):
+    def test_batch_is_dead_lettered_after_max_attempts(self):
+        self.cache.lists[QUEUE] = [_log(), _log()]
+        attempts = ExecutionLogConstants.MAX_DELIVERY_ATTEMPTS
+        with mock.patch.object(utils, "_store_logs", side_effect=ValueError("bad")):
+            for _ in range(attempts - 1):
+                with pytest.raises(ValueError):
+                    self.drain()
+            result = self.drain()
+
+        assert result["dead_lettered_count"] == 2
+        assert len(self.cache.lists[f"{QUEUE}:dead_letter"]) == 2
+        assert PROCESSING not in self.cache.lists
+        assert f"{PROCESSING}:attempts" not in self.cache.values
+
+    def test_next_drain_claims_new_logs_after_dead_lettering(self):
+        self.cache.lists[QUEUE] = [_log()]
+        self.cache.lists[PROCESSING] = [_log()]
+        self.cache.values[f"{PROCESSING}:attempts"] = (
+            ExecutionLogConstants.MAX_DELIVERY_ATTEMPTS - 1
+        )
+        with mock.patch.object(utils, "_store_logs", side_effect=ValueError("bad")):
+            self.drain()
+        with mock.patch.object(
+            utils, "_store_logs", return_value=utils._empty_result()
+        ) as store:
+            self.drain()
+
+        store.assert_called_once()
+        assert self.cache.llen(QUEUE) == 0
+
+    def test_database_outage_never_dead_letters(self):
+        self.cache.lists[PROCESSING] = [_log()]
+        with mock.patch.object(
+            utils, "_store_logs", side_effect=OperationalError("db down")
+        ):
+            for _ in range(ExecutionLogConstants.MAX_DELIVERY_ATTEMPTS + 1):
+                with pytest.raises(OperationalError):
+                    self.drain()
+
+        assert len(self.cache.lists[PROCESSING]) == 1
+        assert f"{QUEUE}:dead_letter" not in self.cache.lists
+
+
+class TestReclaim(_DrainTestBase):
+    def test_abandoned_processing_list_is_taken_over(self):
+        stale = f"{QUEUE}:processing:old-pod"
+        self.cache.lists[stale] = [_log(), _log()]
+        self.cache.values[f"{stale}:attempts"] = 2
+        with mock.patch.object(utils, "_store_logs", side_effect=ValueError("bad")):
+            with pytest.raises(ValueError):
+                self.drain()
+
+        assert stale not in self.cache.lists
+        assert len(self.cache.lists[PROCESSING]) == 2
+        # Failure count travels with the batch (2 carried + this failure).
+        assert self.cache.values[f"{PROCESSING}:attempts"] == 3
+        assert f"{stale}:lock" not in self.cache.values
+
+    def test_list_of_a_draining_consumer_is_left_alone(self):
+        busy = f"{QUEUE}:processing:pod-b"
+        self.cache.lists[busy] = [_log()]
+        self.cache.values[f"{busy}:lock"] = "pod-b-token"
+        with mock.patch.object(utils, "_store_logs", return_value=utils._empty_result()):
+            self.drain()
+
+        assert len(self.cache.lists[busy]) == 1
+        assert self.cache.values[f"{busy}:lock"] == "pod-b-token"
+
+    def test_reclaim_runs_at_most_once_per_interval(self):
+        with mock.patch.object(utils, "_store_logs", return_value=utils._empty_result()):
+            self.drain()
+            stale = f"{QUEUE}:processing:old-pod"
+            self.cache.lists[stale] = [_log()]
+            self.drain()
+
+        assert len(self.cache.lists[stale]) == 1
+
+
+class TestMalformedLogs:
+    def test_malformed_logs_are_dropped_before_any_query(self):
+        raw_logs = [
+            _log(execution_id="not-a-uuid"),
+            _log(file_execution_id="also-not-a-uuid"),
+            _log(timestamp="yesterday"),
+            "{not json",
+        ]
+        with mock.patch.object(utils.WorkflowExecution.objects, "filter") as query:
+            result = utils._store_logs(raw_logs, QUEUE)
+
+        query.assert_not_called()
+        assert result["skipped_count"] == 4
+        assert result["total_logs"] == 4
+        assert result["processed_count"] == 0
@@ -0,0 +1,130 @@
+"""Execution log partition maintenance.
+
+Pins the period/overlap arithmetic ``ensure_partitions`` relies on, and — against
+the migrated (partitioned) test database — that partitions are created ahead,
+rows parked in DEFAULT are moved into the new partition, and retention drops
+whole partitions.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, date, datetime, timedelta
+
+import django
+from django.apps import apps
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings.test")
+if not apps.ready:
+    django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test import TestCase  # noqa: E402
+
+from workflow_manager.workflow_v2 import execution_log_partitions as p  # noqa: E402
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def test_period_start_aligns_weeks_to_monday():
+    assert p.period_start(date(2026, 10, 22), p.WEEKLY) == date(2026, 10, 19)
+    assert p.period_start(date(2026, 10, 22), p.DAILY) == date(2026, 10, 22)
+
+
+def test_period_bounds_are_utc_half_open():
+    assert p.period_bounds(date(2026, 10, 19), p.DAILY) == (
+        _utc(2026, 10, 19),
+        _utc(2026, 10, 20),
+    )
+    assert p.period_bounds(date(2026, 10, 19), p.WEEKLY)[1] == _utc(2026, 10, 26)
+
+
+def test_parse_bound_handles_minvalue_and_short_offsets():
+    assert p._parse_bound("MINVALUE") is None
+    assert p._parse_bound("'2026-10-19 00:00:00+00'") == _utc(2026, 10, 19)
+
+
+def test_clip_skips_fully_covered_period():
+    legacy = {"name": p.LEGACY_PARTITION, "lower": None, "upper": _utc(2026, 10, 21)}
+    assert p._clip_to_free_range(_utc(2026, 10, 20), _utc(2026, 10, 21), [legacy]) is None
+
+
+def test_clip_starts_after_partially_overlapping_partition():
+    # Weekly period straddling the legacy cutover starts where legacy ends.
+    legacy = {"name": p.LEGACY_PARTITION, "lower": None, "upper": _utc(2026, 10, 21)}
+    assert p._clip_to_free_range(_utc(2026, 10, 19), _utc(2026, 10, 26), [legacy]) == (
+        _utc(2026, 10, 21),
+        _utc(2026, 10, 26),
+    )
+
+
+def test_clip_keeps_free_period():
+    other = {"name": "x", "lower": _utc(2026, 10, 1), "upper": _utc(2026, 10, 2)}
+    assert p._clip_to_free_range(_utc(2026, 10, 19), _utc(2026, 10, 20), [other]) == (
+        _utc(2026, 10, 19),
+        _utc(2026, 10, 20),
+    )
+
+
+class PartitionMaintenanceTest(TestCase):
+    """Runs against the partitioned table created by migration 0026."""
+
+    def _far_future(self) -> datetime:
+        # Beyond the partitions the migration pre-created.
+        return _utc(datetime.now(UTC).year + 5, 1, 5)
+
+    def test_table_is_partitioned(self):
+        self.assertTrue(p.is_partitioned())
+        names = {partition["name"] for partition in p.list_partitions()}
+        self.assertIn(p.LEGACY_PARTITION, names)
+
+    def test_ensure_partitions_is_idempotent(self):
+        now = self._far_future()
+        created = p.ensure_partitions(premake=2, interval=p.DAILY, now=now)
+        self.assertEqual(
+            created,
+            [
+                p.partition_name(now),
+                p.partition_name(now + timedelta(days=1)),
+                p.partition_name(now + timedelta(days=2)),
+            ],
+        )
+        self.assertEqual(p.ensure_partitions(premake=2, interval=p.DAILY, now=now), [])
+
+    def test_dry_run_creates_nothing(self):
+        now = self._far_future()
+        planned = p.ensure_partitions(premake=0, now=now, dry_run=True)
+        self.assertEqual(planned, [p.partition_name(now)])
+        names = {partition["name"] for partition in p.list_partitions()}
+        self.assertNotIn(planned[0], names)
+
+    def test_rows_in_default_move_into_new_partition(self):
+        now = self._far_future()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {p.DEFAULT_PARTITION} "
+                "(id, data, event_time, created_at, modified_at) "
+                "VALUES (gen_random_uuid(), '{}'::jsonb, %s, now(), now())",
+                [now + timedelta(hours=3)],
+            )
+        p.ensure_partitions(premake=0, interval=p.DAILY, now=now)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {p.DEFAULT_PARTITION}")
+            self.assertEqual(cursor.fetchone()[0], 0)
+            cursor.execute(f"SELECT count(*) FROM {p.partition_name(now)}")
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+    def test_retention_drops_whole_partitions(self):
+        now = self._far_future()
+        p.ensure_partitions(premake=0, interval=p.DAILY, now=now)
+        expired = p.drop_expired_partitions(retention_days=1, now=now + timedelta(days=2))
+
+        self.assertIn(p.partition_name(now), expired)
+        names = {partition["name"] for partition in p.list_partitions()}
+        self.assertNotIn(p.partition_name(now), names)
+
+    def test_retention_disabled_keeps_everything(self):
+        self.assertEqual(p.drop_expired_partitions(retention_days=0), [])
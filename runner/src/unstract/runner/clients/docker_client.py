@@ -22,6 +22,7 @@ class DockerContainer(ContainerInterface):
     def __init__(self, container: Container, logger: logging.Logger) -> None:
         self.container: Container = container
         self.logger = logger
+        self._exec_exit_code: int | None = None
 
     @property
     def name(self):
@@ -31,6 +32,34 @@ class DockerContainer(ContainerInterface):
         for line in self.container.logs(stream=True, follow=follow):
             yield line.decode().strip()
 
+    def exec_logs(self, command: list[str], envs: dict[str, Any]) -> Iterator[str]:
+        api = self.container.client.api
+        exec_id = api.exec_create(
+            self.container.id, command, environment=envs, stdout=True, stderr=True
+        )["Id"]
+        self._exec_exit_code = None
+        pending = ""
+        for chunk in api.exec_start(exec_id, stream=True):
+            pending += chunk.decode(errors="replace")
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.strip()
+        if pending.strip():
+            yield pending.strip()
+        self._exec_exit_code = api.exec_inspect(exec_id).get("ExitCode")
+
+    @property
+    def exec_exit_code(self) -> int | None:
+        return self._exec_exit_code
+
+    def is_running(self) -> bool:
+        try:
+            self.container.reload()
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh container {self.name}: {e}")
+            return False
+        return self.container.status == "running"
+
     def wait_until_stop(
         self, main_container_status: dict[str, Any] | None = None
     ) -> dict:
@@ -30,6 +30,30 @@ class ContainerInterface(ABC):
         """Stops and removes the running container."""
         pass
 
+    def exec_logs(self, command: list[str], envs: dict[str, Any]) -> Iterator[str]:
+        """Runs a command inside the running container and streams its output.
+
+        Used by the warm container pool. Clients that cannot exec into a
+        running container leave this unimplemented and the pool stays off.
+
+        Args:
+            command (list[str]): Command to execute.
+            envs (dict[str, Any]): Environment for this command only.
+
+        Yields:
+            Iterator[str]: Yields output line by line.
+        """
+        raise NotImplementedError
+
+    @property
+    def exec_exit_code(self) -> int | None:
+        """Exit code of the last command run through ``exec_logs``."""
+        return None
+
+    def is_running(self) -> bool:
+        """Whether the container is still up and able to accept commands."""
+        raise NotImplementedError
+
 
 class ContainerClientInterface(ABC):
     @abstractmethod
@@ -58,6 +58,27 @@ def test_logs(docker_container, mocker):
     assert logs == ["log line 1", "log line 2"]
 
 
+def test_exec_logs(docker_container, mocker):
+    """Test exec_logs splits streamed chunks into lines and keeps the exit code."""
+    mock_container = mocker.patch.object(docker_container, "container")
+    api = mock_container.client.api
+    api.exec_create.return_value = {"Id": "exec-1"}
+    api.exec_start.return_value = [b"line 1\nli", b"ne 2\n", b"line 3"]
+    api.exec_inspect.return_value = {"ExitCode": 3}
+
+    logs = list(docker_container.exec_logs(["python", "main.py"], {"A": "1"}))
+
+    assert logs == ["line 1", "line 2", "line 3"]
+    assert docker_container.exec_exit_code == 3
+    api.exec_create.assert_called_once_with(
+        mock_container.id,
+        ["python", "main.py"],
+        environment={"A": "1"},
+        stdout=True,
+        stderr=True,
+    )
+
+
 def test_cleanup(docker_container, mocker):
     """Test the cleanup method to ensure it removes the container."""
     mock_container = mocker.patch.object(docker_container, "container")
@@ -35,6 +35,9 @@ class Env:
     TOOL_SIDECAR_IMAGE_NAME = "TOOL_SIDECAR_IMAGE_NAME"
     TOOL_SIDECAR_CONTAINER_WAIT_TIMEOUT = "TOOL_SIDECAR_CONTAINER_WAIT_TIMEOUT"
     TOOL_SIDECAR_IMAGE_TAG = "TOOL_SIDECAR_IMAGE_TAG"
+    TOOL_CONTAINER_POOL_SIZE = "TOOL_CONTAINER_POOL_SIZE"
+    TOOL_CONTAINER_POOL_MAX_RUNS = "TOOL_CONTAINER_POOL_MAX_RUNS"
+    TOOL_CONTAINER_POOL_IDLE_TIMEOUT = "TOOL_CONTAINER_POOL_IDLE_TIMEOUT"
     REDIS_HOST = "REDIS_HOST"
     REDIS_PORT = "REDIS_PORT"
     REDIS_USER = "REDIS_USER"
@@ -0,0 +1,205 @@
+"""Warm tool container pool.
+
+Keeps a few idle containers per tool image running so a file execution can
+exec the tool command in one of them instead of creating, starting and
+removing a container of its own. Containers are recycled after a number of
+runs or on failure, and evicted once idle for too long.
+
+Only used without the tool sidecar, whose log volume and environment are
+bound to a single file execution.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from unstract.runner.clients.interface import (
+    ContainerClientInterface,
+    ContainerInterface,
+)
+from unstract.runner.constants import Env
+from unstract.runner.utils import Utils
+
+# Keeps the container alive without consuming CPU and exits promptly on stop.
+IDLE_COMMAND = [
+    "/bin/sh",
+    "-c",
+    "trap 'exit 0' TERM INT; while :; do sleep 3600 & wait $!; done",
+]
+
+
+@dataclass
+class PooledContainer:
+    container: ContainerInterface
+    runs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def name(self) -> str:
+        return self.container.name
+
+
+class WarmContainerPool:
+    """Pool of warm containers for one tool image and tag.
+
+    ``acquire`` hands out an idle container, starting one while the pool is
+    below ``size``. When every container is busy it returns None and the
+    caller runs a one-off container as before, so a burst never waits on
+    the pool.
+    """
+
+    def __init__(
+        self,
+        client: ContainerClientInterface,
+        image_name: str,
+        image_tag: str,
+        size: int,
+        max_runs: int,
+        idle_timeout: float,
+        logger: logging.Logger,
+    ) -> None:
+        self.client = client
+        self.image_name = image_name
+        self.image_tag = image_tag
+        self.size = size
+        self.max_runs = max_runs
+        self.idle_timeout = idle_timeout
+        self.logger = logger
+        self._idle: list[PooledContainer] = []
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> PooledContainer | None:
+        """Return a warm container for exclusive use, or None if all are busy."""
+        self.evict_idle()
+        while True:
+            with self._lock:
+                if self._idle:
+                    pooled = self._idle.pop()
+                elif self._total < self.size:
+                    self._total += 1
+                    pooled = None
+                else:
+                    return None
+            if pooled is None:
+                return self._start()
+            if pooled.container.is_running():
+                return pooled
+            self._retire(pooled, reason="no longer running")
+
+    def release(self, pooled: PooledContainer, healthy: bool = True) -> None:
+        """Return a container to the pool, or retire it if it should not be reused."""
+        pooled.runs += 1
+        pooled.last_used = time.monotonic()
+        if not healthy:
+            self._retire(pooled, reason="failed run")
+        elif pooled.runs >= self.max_runs:
+            self._retire(pooled, reason=f"reached {self.max_runs} runs")
+        else:
+            with self._lock:
+                self._idle.append(pooled)
+        self.evict_idle()
+
+    def evict_idle(self) -> None:
+        """Retire containers that have sat idle longer than ``idle_timeout``."""
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            expired = [p for p in self._idle if p.last_used < cutoff]
+            self._idle = [p for p in self._idle if p.last_used >= cutoff]
+        for pooled in expired:
+            self._retire(pooled, reason="idle")
+
+    def shutdown(self) -> None:
+        """Retire every idle container. Busy ones retire on release."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._retire(pooled, reason="shutdown")
+
+    def _start(self) -> PooledContainer | None:
+        container_name = f"{self.image_name.split('/')[-1]}-pool-{uuid.uuid4().hex[:12]}"
+        try:
+            config = self.client.get_container_run_config(
+                command=IDLE_COMMAND,
+                file_execution_id=container_name,
+                shared_log_dir="/shared/logs",
+                container_name=container_name,
+                envs={},
+            )
+            container = self.client.run_container(config)
+        except Exception as e:
+            with self._lock:
+                self._total -= 1
+            self.logger.warning(
+                f"Failed to start warm container for "
+                f"{self.image_name}:{self.image_tag}: {e}"
+            )
+            return None
+        self.logger.info(f"Started warm container {container.name}")
+        return PooledContainer(container=container)
+
+    def _retire(self, pooled: PooledContainer, reason: str) -> None:
+        with self._lock:
+            self._total -= 1
+        self.logger.info(
+            f"Retiring warm container {pooled.name} after {pooled.runs} runs ({reason})"
+        )
+        self.client.remove_container_by_name(pooled.name, force=True)
+
+
+_pools: dict[tuple[str, str], WarmContainerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_container_pool(
+    client: ContainerClientInterface,
+    image_name: str,
+    image_tag: str,
+    logger: logging.Logger,
+) -> WarmContainerPool | None:
+    """Return the process-wide pool for an image, or None when pooling is off.
+
+    Pooling is enabled by setting ``TOOL_CONTAINER_POOL_SIZE`` above zero and
+    is never used together with the tool sidecar.
+    """
+    size = Utils.str_to_int(os.getenv(Env.TOOL_CONTAINER_POOL_SIZE), default=0)
+    if size <= 0 or Utils.is_sidecar_enabled():
+        return None
+
+    key = (image_name, image_tag)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = WarmContainerPool(
+                client=client,
+                image_name=image_name,
+                image_tag=image_tag,
+                size=size,
+                max_runs=Utils.str_to_int(
+                    os.getenv(Env.TOOL_CONTAINER_POOL_MAX_RUNS), default=50
+                ),
+                idle_timeout=Utils.str_to_int(
+                    os.getenv(Env.TOOL_CONTAINER_POOL_IDLE_TIMEOUT), default=300
+                ),
+                logger=logger,
+            )
+            _pools[key] = pool
+    return pool
+
+
+def shutdown_pools() -> None:
+    """Retire idle containers of every pool in this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_pools)
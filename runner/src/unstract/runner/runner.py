@@ -28,6 +28,7 @@ from unstract.runner.clients.interface import (
 )
 from unstract.runner.constants import Env, LogLevel, LogType, ToolKey
 from unstract.runner.exception import ToolImageNotFoundError, ToolRunException
+from unstract.runner.pool import PooledContainer, get_container_pool
 from unstract.runner.utils import Utils
 
 load_dotenv()
@@ -69,6 +70,45 @@ class UnstractRunner:
                 container_name=container_name,
             )
 
+    def _run_in_pooled_container(
+        self,
+        pooled: PooledContainer,
+        command: list[str],
+        envs: dict[str, Any],
+        tool_instance_id: str,
+        execution_id: str,
+        organization_id: str,
+        file_execution_id: str,
+        container_name: str,
+        channel: str | None = None,
+    ) -> bool:
+        """Exec the tool command in a warm container and stream its logs.
+
+        Returns:
+            bool: Whether the container is fit for reuse (the command exited 0)
+        """
+        self.logger.info(
+            f"Execution ID: {execution_id}, running tool for "
+            f"{container_name} in warm container: {pooled.name}"
+        )
+        for line in pooled.container.exec_logs(command, envs):
+            self.process_log_message(
+                log_message=line,
+                tool_instance_id=tool_instance_id,
+                channel=channel,
+                execution_id=execution_id,
+                organization_id=organization_id,
+                file_execution_id=file_execution_id,
+                container_name=container_name,
+            )
+        exit_code = pooled.container.exec_exit_code
+        if exit_code:
+            self.logger.warning(
+                f"Execution ID: {execution_id}, tool exited with code {exit_code} "
+                f"in warm container: {pooled.name}"
+            )
+        return not exit_code
+
     def get_valid_log_message(self, log_message: str) -> dict[str, Any] | None:
         """Get a valid log message from the log message.
 
@@ -466,6 +506,54 @@ class UnstractRunner:
             tool_container_name=container_name,
         )
 
+        # Run in a warm pooled container when pooling is enabled and one is free
+        pool = get_container_pool(
+            self.client, self.image_name, self.image_tag, self.logger
+        )
+        pooled = pool.acquire() if pool else None
+        pooled_healthy = False
+        if pooled:
+            result = {"type": "RESULT", "result": None, "status": "RUNNING"}
+            try:
+                pooled_healthy = self._run_in_pooled_container(
+                    pooled=pooled,
+                    command=["/bin/sh", "-c", container_command],
+                    envs={**envs, **additional_env},
+                    tool_instance_id=tool_instance_id,
+                    channel=messaging_channel,
+                    execution_id=execution_id,
+                    organization_id=organization_id,
+                    file_execution_id=file_execution_id,
+                    container_name=container_name,
+                )
+                result = {"type": "RESULT", "result": None, "status": "SUCCESS"}
+            except ToolRunException as te:
+                self.logger.error(
+                    f"Error while running tool in warm container {pooled.name}: {te}",
+                    stack_info=True,
+                    exc_info=True,
+                )
+                result = {
+                    "type": "RESULT",
+                    "result": None,
+                    "error": str(te.message),
+                    "status": "ERROR",
+                }
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to run tool in warm container {pooled.name}: {e}",
+                    stack_info=True,
+                    exc_info=True,
+                )
+                result = {
+                    "type": "RESULT",
+                    "result": None,
+                    "error": str(e),
+                    "status": "ERROR",
+                }
+            pool.release(pooled, healthy=pooled_healthy)
+            return result
+
         # Run the Docker container
         container = None
         sidecar = None
@@ -0,0 +1,254 @@
+import logging
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from unstract.runner import pool as pool_module
+from unstract.runner.clients.interface import (
+    ContainerClientInterface,
+    ContainerInterface,
+)
+from unstract.runner.constants import Env
+from unstract.runner.pool import WarmContainerPool, get_container_pool
+
+logger = logging.getLogger("test-logger")
+
+
+class FakeContainer(ContainerInterface):
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self.running = True
+        self.output: list[str] = []
+        self.exit_code: int | None = 0
+        self.execs: list[tuple[list[str], dict[str, Any]]] = []
+
+    @property
+    def name(self):
+        return self._name
+
+    def logs(self, follow=True) -> Iterator[str]:
+        return iter([])
+
+    def cleanup(self, client=None) -> None:
+        pass
+
+    def exec_logs(self, command, envs) -> Iterator[str]:
+        self.execs.append((command, envs))
+        yield from self.output
+
+    @property
+    def exec_exit_code(self) -> int | None:
+        return self.exit_code
+
+    def is_running(self) -> bool:
+        return self.running
+
+
+class FakeClient(ContainerClientInterface):
+    def __init__(
+        self, image_name="tool", image_tag="1.0", logger=logger, sidecar_enabled=False
+    ):
+        self.started: list[FakeContainer] = []
+        self.removed: list[str] = []
+        self.fail_start = False
+
+    def run_container(self, config):
+        if self.fail_start:
+            raise RuntimeError("daemon unavailable")
+        container = FakeContainer(config["name"])
+        self.started.append(container)
+        return container
+
+    def run_container_with_sidecar(self, container_config, sidecar_config):
+        raise NotImplementedError
+
+    def get_image(self) -> str:
+        return "tool:1.0"
+
+    def wait_for_container_stop(self, container, main_container_status=None):
+        return None
+
+    def get_container_run_config(
+        self,
+        command,
+        file_execution_id,
+        shared_log_dir,
+        container_name=None,
+        envs=None,
+        auto_remove=False,
+        sidecar=False,
+        **kwargs,
+    ):
+        return {"name": container_name, "entrypoint": command, "environment": envs}
+
+    def cleanup_volume(self) -> None:
+        pass
+
+    def get_container_status(self, container_name: str) -> str:
+        return "RUNNING"
+
+    def remove_container_by_name(self, container_name, with_sidecar=False, force=True):
+        self.removed.append(container_name)
+        return True
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+def _pool(client, size=2, max_runs=3, idle_timeout=300):
+    return WarmContainerPool(
+        client=client,
+        image_name="unstract/tool",
+        image_tag="1.0",
+        size=size,
+        max_runs=max_runs,
+        idle_timeout=idle_timeout,
+        logger=logger,
+    )
+
+
+def test_acquire_starts_idle_container(client):
+    pooled = _pool(client).acquire()
+
+    assert pooled.container is client.started[0]
+    assert client.started[0].name.startswith("tool-pool-")
+
+
+def test_released_container_is_reused(client):
+    pool = _pool(client)
+    first = pool.acquire()
+    pool.release(first)
+
+    assert pool.acquire() is first
+    assert len(client.started) == 1
+
+
+def test_full_pool_returns_none(client):
+    pool = _pool(client, size=1)
+    assert pool.acquire() is not None
+    assert pool.acquire() is None
+
+
+def test_recycled_after_max_runs(client):
+    pool = _pool(client, max_runs=2)
+    pooled = pool.acquire()
+    pool.release(pooled)
+    pool.release(pool.acquire())
+
+    assert client.removed == [pooled.name]
+    assert pool.acquire() is not pooled
+
+
+def test_recycled_on_failure(client):
+    pool = _pool(client, size=1)
+    pooled = pool.acquire()
+    pool.release(pooled, healthy=False)
+
+    assert client.removed == [pooled.name]
+    assert pool.acquire() is not None
+
+
+def test_dead_container_is_replaced(client):
+    pool = _pool(client)
+    pooled = pool.acquire()
+    pool.release(pooled)
+    pooled.container.running = False
+
+    replacement = pool.acquire()
+    assert replacement is not pooled
+    assert client.removed == [pooled.name]
+
+
+def test_idle_containers_are_evicted(client, mocker):
+    pool = _pool(client, idle_timeout=10)
+    clock = mocker.patch.object(pool_module.time, "monotonic", return_value=100.0)
+    pooled = pool.acquire()
+    pool.release(pooled)
+
+    clock.return_value = 111.0
+    pool.evict_idle()
+
+    assert client.removed == [pooled.name]
+
+
+def test_failed_start_frees_the_slot(client):
+    pool = _pool(client, size=1)
+    client.fail_start = True
+    assert pool.acquire() is None
+
+    client.fail_start = False
+    assert pool.acquire() is not None
+
+
+def test_pool_disabled_by_default(client, monkeypatch):
+    monkeypatch.delenv(Env.TOOL_CONTAINER_POOL_SIZE, raising=False)
+    assert get_container_pool(client, "unstract/tool", "1.0", logger) is None
+
+
+def test_pool_disabled_with_sidecar(client, monkeypatch, mocker):
+    monkeypatch.setenv(Env.TOOL_CONTAINER_POOL_SIZE, "2")
+    mocker.patch.object(pool_module.Utils, "is_sidecar_enabled", return_value=True)
+    assert get_container_pool(client, "unstract/tool", "1.0", logger) is None
+
+
+def test_pool_shared_per_image(client, monkeypatch, mocker):
+    monkeypatch.setenv(Env.TOOL_CONTAINER_POOL_SIZE, "2")
+    mocker.patch.object(pool_module.Utils, "is_sidecar_enabled", return_value=False)
+    mocker.patch.dict(pool_module._pools, clear=True)
+
+    pool = get_container_pool(client, "unstract/tool", "1.0", logger)
+    assert pool.size == 2
+    assert get_container_pool(FakeClient(), "unstract/tool", "1.0", logger) is pool
+    assert get_container_pool(client, "unstract/tool", "2.0", logger) is not pool
+
+
+def test_runner_execs_tool_in_pooled_container(client, mocker):
+    from unstract.runner.runner import UnstractRunner
+
+    mocker.patch("unstract.runner.runner.client_class", FakeClient)
+    runner = UnstractRunner("unstract/tool", "1.0", MagicMock(logger=logger))
+    pooled = _pool(client).acquire()
+    pooled.container.output = ['{"type": "RESULT", "result": {}}']
+    process = mocker.patch.object(runner, "process_log_message")
+
+    healthy = runner._run_in_pooled_container(
+        pooled=pooled,
+        command=["/bin/sh", "-c", "python main.py"],
+        envs={"EXECUTION_DATA_DIR": "/data/fe-1"},
+        tool_instance_id="ti-1",
+        execution_id="exec-1",
+        organization_id="org-1",
+        file_execution_id="fe-1",
+        container_name="tool-fe-1",
+    )
+
+    assert healthy
+    assert pooled.container.execs == [
+        (["/bin/sh", "-c", "python main.py"], {"EXECUTION_DATA_DIR": "/data/fe-1"})
+    ]
+    process.assert_called_once()
+    assert process.call_args.kwargs["file_execution_id"] == "fe-1"
+
+
+def test_runner_flags_nonzero_exit_for_recycling(client, mocker):
+    from unstract.runner.runner import UnstractRunner
+
+    mocker.patch("unstract.runner.runner.client_class", FakeClient)
+    runner = UnstractRunner("unstract/tool", "1.0", MagicMock(logger=logger))
+    pooled = _pool(client).acquire()
+    pooled.container.exit_code = 137
+
+    assert not runner._run_in_pooled_container(
+        pooled=pooled,
+        command=["true"],
+        envs={},
+        tool_instance_id="ti-1",
+        execution_id="exec-1",
+        organization_id="org-1",
+        file_execution_id="fe-1",
+        container_name="tool-fe-1",
+    )
@@ -0,0 +1,82 @@
+"""Fixtures for the throughput bench (driven by ``python -m tests.rig bench``).
+
+The rig hands each pytest session one workload via ``UNSTRACT_BENCH_WORKLOAD``;
+without it every test here skips, so a plain e2e run that happens to collect
+this directory costs nothing.
+
+``provisioned_workflow`` is overridden with the workload's prompt count and the
+bench's NoOp-adapter latency, so the ETL fixtures imported below build on the
+bench tool rather than the default single-prompt one.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+
+import pytest
+import requests
+
+from tests.e2e.api_deployment.conftest import ApiDeployment
+from tests.e2e.conftest import ProvisionedWorkflow, provision_workflow
+from tests.e2e.etl.conftest import etl_workflow, minio_store  # noqa: F401
+from tests.rig.bench import (
+    BENCH_ADAPTER_LATENCY_ENV,
+    BENCH_WORKLOAD_ENV,
+    Workload,
+)
+from tests.rig.runtime import PlatformEndpoints
+
+
+@pytest.fixture(scope="session")
+def bench_workload() -> Workload:
+    raw = os.environ.get(BENCH_WORKLOAD_ENV)
+    if not raw:
+        pytest.skip(f"{BENCH_WORKLOAD_ENV} not set — run via `python -m tests.rig bench`")
+    return Workload.from_json(raw)
+
+
+@pytest.fixture(scope="session")
+def provisioned_workflow(
+    platform: PlatformEndpoints,
+    authed_session: requests.Session,
+    bench_workload: Workload,
+) -> ProvisionedWorkflow:
+    return provision_workflow(
+        authed_session,
+        platform.backend_url.rstrip("/"),
+        prompt_count=bench_workload.prompts,
+        adapter_wait_time=float(os.environ.get(BENCH_ADAPTER_LATENCY_ENV) or 0),
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_api_deployment(provisioned_workflow: ProvisionedWorkflow) -> ApiDeployment:
+    """Deploy the bench workflow as an API."""
+    pw = provisioned_workflow
+    api_name = f"bench{uuid.uuid4().hex[:8]}"
+    resp = pw.session.post(
+        f"{pw.prefix}/api/deployment/",
+        json={
+            "workflow": pw.workflow_id,
+            "display_name": f"bench {api_name}",
+            "description": "throughput bench",
+            "api_name": api_name,
+            "is_active": True,
+        },
+        timeout=30,
+    )
+    assert resp.status_code == 201, f"deploy: {resp.text}"
+    body = resp.json()
+    endpoint = body["api_endpoint"]
+    return ApiDeployment(
+        session=pw.session,
+        base=pw.base,
+        prefix=pw.prefix,
+        exec_url=(
+            endpoint
+            if endpoint.startswith("http")
+            else f"{pw.base}/{endpoint.lstrip('/')}"
+        ),
+        api_key=body["api_key"],
+    )
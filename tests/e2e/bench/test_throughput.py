@@ -0,0 +1,184 @@
+"""Bench: run one workload end to end and record what it cost.
+
+Speed is not asserted here — the rig compares the recorded numbers against a
+saved baseline. The test fails only when the workload itself does: an
+execution that doesn't complete every file measures nothing worth comparing.
+
+Timings come from the server's own timestamps (execution and file-execution
+``created_at`` / ``modified_at``), so the 2s status poll adds no error.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+from tests.e2e.api_deployment.conftest import ApiDeployment, dispatch_async
+from tests.e2e.conftest import ProvisionedWorkflow, wait_for_execution
+from tests.e2e.etl.conftest import EtlWorkflow, MinioFixture
+from tests.rig.bench import (
+    BENCH_RESULT_ENV,
+    BENCH_TIMEOUT_ENV,
+    Workload,
+    metrics_urls_from_env,
+    read_counters,
+    summarize,
+)
+
+pytestmark = [pytest.mark.e2e, pytest.mark.slow]
+
+_DEFAULT_TIMEOUT_SECONDS = 1800
+_DOCUMENT = b"Bench document. This document is about throughput and invoices."
+
+
+def test_workload_throughput(
+    request: pytest.FixtureRequest,
+    bench_workload: Workload,
+    provisioned_workflow: ProvisionedWorkflow,
+    llm_mock_response: str,
+) -> None:
+    pw = provisioned_workflow
+    if bench_workload.mode == "api":
+        start = _api_starter(
+            request.getfixturevalue("bench_api_deployment"), bench_workload
+        )
+    else:
+        start = _etl_starter(
+            request.getfixturevalue("etl_workflow"),
+            request.getfixturevalue("minio_store"),
+            bench_workload,
+        )
+
+    metrics_urls = metrics_urls_from_env()
+    before = read_counters(metrics_urls)
+    execution_id = start()
+    execution = wait_for_execution(
+        pw.session,
+        pw.prefix,
+        execution_id,
+        timeout=float(os.environ.get(BENCH_TIMEOUT_ENV) or _DEFAULT_TIMEOUT_SECONDS),
+    )
+    after = read_counters(metrics_urls)
+
+    files = _file_executions(pw.session, pw.prefix, execution_id)
+    latencies = [
+        _seconds_between(f["created_at"], f["modified_at"])
+        for f in files
+        if f["status"] == "COMPLETED"
+    ]
+    result = summarize(
+        bench_workload,
+        wall_seconds=_seconds_between(execution["created_at"], execution["modified_at"]),
+        file_latencies=latencies,
+        failed_files=len(files) - len(latencies),
+        before=before,
+        after=after,
+    )
+    if out := os.environ.get(BENCH_RESULT_ENV):
+        Path(out).write_text(json.dumps(result, indent=2))
+
+    assert execution.get("status") == "COMPLETED", execution
+    assert len(latencies) == bench_workload.files, result
+
+
+def _api_starter(deployment: ApiDeployment, workload: Workload) -> Callable[[], str]:
+    files = [
+        ("files", (f"bench-{i}.txt", _DOCUMENT, "text/plain"))
+        for i in range(workload.files)
+    ]
+
+    def start() -> str:
+        execution_id, _ = dispatch_async(deployment, files)
+        return execution_id
+
+    return start
+
+
+def _etl_starter(
+    workflow: EtlWorkflow, store: MinioFixture, workload: Workload
+) -> Callable[[], str]:
+    """Seed the source, lift the fixture's one-file cap, and create the pipeline;
+    the returned callable only triggers the run.
+    """
+    for i in range(workload.files):
+        store.client.put_object(
+            store.bucket,
+            f"{workflow.input_prefix}/bench-{i}.txt",
+            io.BytesIO(_DOCUMENT),
+            length=len(_DOCUMENT),
+            content_type="text/plain",
+        )
+    _set_source_max_files(workflow, workload.files)
+
+    resp = workflow.session.post(
+        f"{workflow.prefix}/pipeline/",
+        # Name is capped at 32 characters; no cron_string keeps it on demand.
+        json={
+            "pipeline_name": f"bench-{uuid.uuid4().hex[:8]}",
+            "workflow": workflow.workflow_id,
+            "pipeline_type": "ETL",
+        },
+        timeout=60,
+    )
+    assert resp.status_code == 201, f"create pipeline: {resp.text}"
+    pipeline_id = resp.json()["id"]
+
+    def start() -> str:
+        resp = workflow.session.post(
+            f"{workflow.prefix}/pipeline/execute/",
+            json={"pipeline_id": pipeline_id},
+            timeout=60,
+        )
+        assert resp.status_code == 200, f"execute pipeline: {resp.text}"
+        return resp.json()["execution"]["execution_id"]
+
+    return start
+
+
+def _set_source_max_files(workflow: EtlWorkflow, max_files: int) -> None:
+    resp = workflow.session.get(
+        f"{workflow.prefix}/workflow/endpoint/",
+        params={"workflow": workflow.workflow_id},
+        timeout=30,
+    )
+    resp.raise_for_status()
+    body = resp.json()
+    endpoints = body if isinstance(body, list) else body.get("results", [])
+    source = next(
+        e
+        for e in endpoints
+        if e.get("workflow") == workflow.workflow_id and e["endpoint_type"] == "SOURCE"
+    )
+    resp = workflow.session.patch(
+        f"{workflow.prefix}/workflow/endpoint/{source['id']}/",
+        json={"configuration": {**source["configuration"], "maxFiles": max_files}},
+        timeout=60,
+    )
+    assert resp.status_code == 200, f"source endpoint: {resp.text}"
+
+
+def _file_executions(
+    session: requests.Session, prefix: str, execution_id: str
+) -> list[dict]:
+    rows: list[dict] = []
+    url: str | None = f"{prefix}/execution/{execution_id}/files/"
+    params: dict[str, int] | None = {"page_size": 1000}
+    while url:
+        resp = session.get(url, params=params, timeout=30)
+        resp.raise_for_status()
+        page = resp.json()
+        rows.extend(page["results"])
+        url, params = page.get("next"), None  # `next` carries the query string
+    return rows
+
+
+def _seconds_between(start: str, end: str) -> float:
+    return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
@@ -225,8 +225,22 @@ def provisioned_workflow(
     surface as the app. Executes hermetically: the LLM is mocked, and
     chunk_size=0 keeps embedding and vectordb out of the path.
     """
-    s = authed_session
-    base = platform.backend_url.rstrip("/")
+    return provision_workflow(authed_session, platform.backend_url.rstrip("/"))
+
+
+def provision_workflow(
+    s: requests.Session,
+    base: str,
+    *,
+    prompt_count: int = 1,
+    adapter_wait_time: float = 0,
+) -> ProvisionedWorkflow:
+    """The body of ``provisioned_workflow``, for callers that need more prompts
+    or a fixed NoOp-adapter latency (the throughput bench).
+
+    The returned ``prompt_id`` / ``prompt_key`` are the first prompt's; the
+    rest are keyed ``answer_2``, ``answer_3``, ...
+    """
     org_id = _org_id(s, base)
     prefix = f"{base}/api/v1/unstract/{org_id}"
     sfx = uuid.uuid4().hex[:8]  # adapter/tool names are unique per org
@@ -262,8 +276,10 @@ def provisioned_workflow(
         "EMBEDDING",
         {"api_key": "sk-test", "model": "text-embedding-3-small"},
     )
-    vdb_id = create_adapter(_VECTORDB_ADAPTER, "VECTOR_DB", {"wait_time": 0})
-    x2t_id = create_adapter(_X2TEXT_ADAPTER, "X2TEXT", {"wait_time": 0})
+    vdb_id = create_adapter(
+        _VECTORDB_ADAPTER, "VECTOR_DB", {"wait_time": adapter_wait_time}
+    )
+    x2t_id = create_adapter(_X2TEXT_ADAPTER, "X2TEXT", {"wait_time": adapter_wait_time})
 
     resp = _post(
         s,
@@ -291,25 +307,27 @@ def provisioned_workflow(
     )
     assert resp.status_code == 200, f"profile patch: {resp.text}"
 
-    prompt_key = "answer"
-    resp = _post(
-        s,
-        f"{prefix}/prompt-studio/prompt-studio-prompt/{tool_id}/",
-        json={
-            "tool_id": tool_id,
-            "prompt_key": prompt_key,
-            "prompt": "What is this document about?",
-            "prompt_type": "PROMPT",
-            # text keeps the answer the raw completion; the structured types are
-            # re-serialised on the way out and would not match the mock verbatim.
-            "enforce_type": "text",
-            "sequence_number": 1,
-            "active": True,
-            "profile_manager": profile_id,
-        },
-    )
-    assert resp.status_code == 201, f"add prompt: {resp.text}"
-    prompt_id = resp.json()["prompt_id"]
+    prompt_ids: list[str] = []
+    for seq in range(1, prompt_count + 1):
+        resp = _post(
+            s,
+            f"{prefix}/prompt-studio/prompt-studio-prompt/{tool_id}/",
+            json={
+                "tool_id": tool_id,
+                "prompt_key": "answer" if seq == 1 else f"answer_{seq}",
+                "prompt": "What is this document about?",
+                "prompt_type": "PROMPT",
+                # text keeps the answer the raw completion; the structured types
+                # are re-serialised on the way out and would not match the mock
+                # verbatim.
+                "enforce_type": "text",
+                "sequence_number": seq,
+                "active": True,
+                "profile_manager": profile_id,
+            },
+        )
+        assert resp.status_code == 201, f"add prompt {seq}: {resp.text}"
+        prompt_ids.append(resp.json()["prompt_id"])
 
     resp = _post(
         s,
@@ -367,6 +385,6 @@ def provisioned_workflow(
         tool_id=tool_id,
         prompt_registry_id=prompt_registry_id,
         profile_id=profile_id,
-        prompt_id=prompt_id,
-        prompt_key=prompt_key,
+        prompt_id=prompt_ids[0],
+        prompt_key="answer",
     )
@@ -0,0 +1,442 @@
+"""Throughput bench — fixed-latency end-to-end workloads against the platform.
+
+``python -m tests.rig bench`` runs a matrix of workloads (N files × M prompts,
+API deployment vs ETL pipeline, PG queue vs Celery transport), each as one
+pytest session of ``tests/e2e/bench`` against a platform the rig brings up
+once. Provider latency is pinned rather than removed: the LLM is mocked with
+a fixed delay (``UNSTRACT_LLM_MOCK_LATENCY``) and the x2text / vectordb
+adapters are the NoOp ones with ``wait_time`` set, so a shift in the numbers
+is the platform's, not a provider's. Embeddings stay off the path as in every
+e2e run (``chunk_size=0``).
+
+This module holds everything except the HTTP driving: the workload matrix,
+the measurements (per-file latency percentiles, queue wait scraped from the
+PG consumers' ``/metrics``, Postgres transactions and Redis commands read
+from the containers), the JSON report, and the baseline comparison that turns
+a report into a pass/fail.
+
+The DB and Redis figures are server-wide counter deltas over the run, so
+background work (schedulers, heartbeats) is included; compare them against a
+baseline taken on the same stack rather than reading them as exact per-file
+costs.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import os
+import shutil
+import subprocess
+import urllib.request
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from tests.rig.groups import REPO_ROOT
+
+log = logging.getLogger(__name__)
+
+# The rig → pytest hand-off: the workload to run and where to write its result.
+BENCH_WORKLOAD_ENV = "UNSTRACT_BENCH_WORKLOAD"
+BENCH_RESULT_ENV = "UNSTRACT_BENCH_RESULT"
+# Adapter wait_time for the NoOp x2text / vectordb, in seconds.
+BENCH_ADAPTER_LATENCY_ENV = "UNSTRACT_BENCH_ADAPTER_LATENCY"
+# Seconds one workload's execution may take before the run is failed.
+BENCH_TIMEOUT_ENV = "UNSTRACT_BENCH_TIMEOUT"
+# Comma-separated /metrics URLs to scrape queue wait from.
+BENCH_METRICS_URLS_ENV = "UNSTRACT_BENCH_METRICS_URLS"
+# Host directory holding the transport flag snapshot; the overlay mounts it.
+BENCH_FLAGS_DIR_ENV = "UNSTRACT_BENCH_FLAGS_DIR"
+
+BENCH_COMPOSE_OVERLAY = REPO_ROOT / "tests" / "compose" / "docker-compose.bench.yaml"
+BENCH_TESTS = REPO_ROOT / "tests" / "e2e" / "bench"
+BENCH_PG_PROFILE = "pg-queue"
+
+MODES = ("api", "etl")
+TRANSPORTS = ("celery", "pg")
+
+# Published health ports of the PG consumers in docker/docker-compose.yaml
+# (orchestrator-api, orchestrator-general, fileproc, callback, executor).
+DEFAULT_METRICS_URLS = tuple(
+    f"http://localhost:{port}/metrics" for port in (8093, 8094, 8095, 8096, 8099)
+)
+
+# The single rollout flag that routes an execution onto the PG queue.
+PG_QUEUE_FLAG_KEY = "pg_queue_enabled"
+FLAG_SNAPSHOT_NAME = "flags.json"
+# Matches FLIPT_SNAPSHOT_TTL in the bench overlay: a rewritten snapshot is
+# picked up by every process within this long.
+FLAG_SNAPSHOT_TTL_SECONDS = 1.0
+
+_QUEUE_WAIT_SERIES = "worker_pipeline_stage_duration_seconds"
+
+
+@dataclass(frozen=True)
+class Workload:
+    """One cell of the bench matrix."""
+
+    files: int
+    prompts: int
+    mode: str
+    transport: str
+
+    def __post_init__(self) -> None:
+        if self.files < 1 or self.prompts < 1:
+            raise ValueError(f"files and prompts must be >= 1, got {self}")
+        if self.mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {self.mode!r}")
+        if self.transport not in TRANSPORTS:
+            raise ValueError(
+                f"transport must be one of {TRANSPORTS}, got {self.transport!r}"
+            )
+
+    @property
+    def name(self) -> str:
+        return f"{self.mode}-{self.transport}-{self.files}f-{self.prompts}p"
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, raw: str) -> Workload:
+        return cls(**json.loads(raw))
+
+
+def parse_int_list(raw: str) -> list[int]:
+    """``"1,10,50"`` → ``[1, 10, 50]`` (argparse ``type=``)."""
+    try:
+        values = [int(part) for part in raw.split(",") if part.strip()]
+    except ValueError as exc:
+        raise ValueError(f"expected comma-separated integers, got {raw!r}") from exc
+    if not values:
+        raise ValueError("expected at least one value")
+    return values
+
+
+def expand_matrix(
+    files: list[int], prompts: list[int], modes: list[str], transports: list[str]
+) -> list[Workload]:
+    """The cross product, in a stable order with duplicates dropped.
+
+    Transport varies slowest so a run flips the routing flag as few times as
+    possible.
+    """
+    seen: dict[str, Workload] = {}
+    for transport, mode, n_files, n_prompts in itertools.product(
+        transports, modes, files, prompts
+    ):
+        workload = Workload(
+            files=n_files, prompts=n_prompts, mode=mode, transport=transport
+        )
+        seen.setdefault(workload.name, workload)
+    return list(seen.values())
+
+
+# ── transport selection ──────────────────────────────────────────────────────
+
+
+def write_transport_snapshot(directory: Path, transport: str) -> Path:
+    """Write the flag snapshot that routes new executions onto ``transport``.
+
+    The overlay points the backend and the file-processing workers at this
+    file with local flag evaluation on, so flipping it switches every new
+    execution without a restart. Replaced atomically: a reader never sees a
+    half-written file.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of {TRANSPORTS}, got {transport!r}")
+    directory.mkdir(parents=True, exist_ok=True)
+    snapshot = {
+        "namespace": {"key": "default"},
+        "flags": [
+            {
+                "key": PG_QUEUE_FLAG_KEY,
+                "type": "BOOLEAN_FLAG_TYPE",
+                "enabled": transport == "pg",
+            }
+        ],
+    }
+    target = directory / FLAG_SNAPSHOT_NAME
+    staging = target.with_suffix(".tmp")
+    staging.write_text(json.dumps(snapshot))
+    staging.replace(target)
+    return target
+
+
+# ── counters ─────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class Counters:
+    """Cumulative server-side counters; a run's cost is ``after - before``.
+
+    ``None`` means the source could not be read — the per-file figure is then
+    reported as ``null`` rather than guessed.
+    """
+
+    db_transactions: int | None = None
+    redis_commands: int | None = None
+    queue_wait_sum: float | None = None
+    queue_wait_count: float | None = None
+
+
+def queue_wait_totals(text: str) -> tuple[float, float]:
+    """Sum and count of the ``queue_wait`` stage over all label sets in a
+    Prometheus text exposition.
+    """
+    total = count = 0.0
+    for line in text.splitlines():
+        if not line.startswith(_QUEUE_WAIT_SERIES) or 'stage="queue_wait"' not in line:
+            continue
+        name = line.split("{", 1)[0]
+        value = float(line.rsplit(" ", 1)[1])
+        if name == f"{_QUEUE_WAIT_SERIES}_sum":
+            total += value
+        elif name == f"{_QUEUE_WAIT_SERIES}_count":
+            count += value
+    return total, count
+
+
+def _scrape_queue_wait(urls: tuple[str, ...]) -> tuple[float | None, float | None]:
+    total = count = 0.0
+    reached = False
+    for url in urls:
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:  # noqa: S310
+                text = response.read().decode()
+        except OSError as exc:
+            log.debug("bench: %s unreachable: %s", url, exc)
+            continue
+        reached = True
+        url_sum, url_count = queue_wait_totals(text)
+        total += url_sum
+        count += url_count
+    return (total, count) if reached else (None, None)
+
+
+def _docker_exec(container: str, *cmd: str) -> str | None:
+    if shutil.which("docker") is None:
+        return None
+    try:
+        completed = subprocess.run(  # noqa: S603
+            ["docker", "exec", container, *cmd],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        log.debug("bench: docker exec %s failed: %s", container, exc)
+        return None
+    if completed.returncode != 0:
+        log.debug("bench: docker exec %s: %s", container, completed.stderr.strip())
+        return None
+    return completed.stdout
+
+
+def db_transaction_count() -> int | None:
+    """Committed + rolled-back transactions on the platform database."""
+    out = _docker_exec(
+        os.environ.get("UNSTRACT_BENCH_DB_CONTAINER", "unstract-db"),
+        "psql",
+        "-U",
+        os.environ.get("UNSTRACT_BENCH_DB_USER", "unstract_dev"),
+        "-d",
+        os.environ.get("UNSTRACT_BENCH_DB_NAME", "unstract_db"),
+        "-tAc",
+        "SELECT xact_commit + xact_rollback FROM pg_stat_database "
+        "WHERE datname = current_database()",
+    )
+    try:
+        return int(out.strip()) if out else None
+    except ValueError:
+        return None
+
+
+def redis_command_count() -> int | None:
+    """Commands the Redis server has processed since it started."""
+    out = _docker_exec(
+        os.environ.get("UNSTRACT_BENCH_REDIS_CONTAINER", "unstract-redis"),
+        "redis-cli",
+        "INFO",
+        "stats",
+    )
+    for line in (out or "").splitlines():
+        key, _, value = line.partition(":")
+        if key == "total_commands_processed":
+            return int(value.strip())
+    return None
+
+
+def metrics_urls_from_env() -> tuple[str, ...]:
+    raw = os.environ.get(BENCH_METRICS_URLS_ENV, "").strip()
+    if not raw:
+        return DEFAULT_METRICS_URLS
+    return tuple(url.strip() for url in raw.split(",") if url.strip())
+
+
+def read_counters(metrics_urls: tuple[str, ...]) -> Counters:
+    queue_wait_sum, queue_wait_count = _scrape_queue_wait(metrics_urls)
+    return Counters(
+        db_transactions=db_transaction_count(),
+        redis_commands=redis_command_count(),
+        queue_wait_sum=queue_wait_sum,
+        queue_wait_count=queue_wait_count,
+    )
+
+
+# ── measurement → report ─────────────────────────────────────────────────────
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Linear-interpolated percentile (numpy's default method); ``None`` if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _delta(after: float | None, before: float | None) -> float | None:
+    if after is None or before is None:
+        return None
+    return after - before
+
+
+def _per_file(value: float | None, files: int) -> float | None:
+    return None if value is None else round(value / files, 3)
+
+
+def summarize(
+    workload: Workload,
+    *,
+    wall_seconds: float,
+    file_latencies: list[float],
+    failed_files: int,
+    before: Counters,
+    after: Counters,
+) -> dict:
+    """One workload's entry in the report."""
+    wait_sum = _delta(after.queue_wait_sum, before.queue_wait_sum)
+    wait_count = _delta(after.queue_wait_count, before.queue_wait_count)
+    queue_wait = None
+    if wait_sum is not None and wait_count:
+        queue_wait = {"mean": round(wait_sum / wait_count, 4), "samples": wait_count}
+    completed = len(file_latencies)
+    return {
+        "workload": asdict(workload),
+        "completed_files": completed,
+        "failed_files": failed_files,
+        "wall_seconds": round(wall_seconds, 3),
+        "files_per_second": round(completed / wall_seconds, 4) if wall_seconds else None,
+        "latency_seconds": {
+            name: None if value is None else round(value, 4)
+            for name, value in (
+                ("p50", percentile(file_latencies, 50)),
+                ("p95", percentile(file_latencies, 95)),
+                ("p99", percentile(file_latencies, 99)),
+                ("max", max(file_latencies, default=None)),
+            )
+        },
+        "queue_wait_seconds": queue_wait,
+        "db_transactions_per_file": _per_file(
+            _delta(after.db_transactions, before.db_transactions), workload.files
+        ),
+        "redis_commands_per_file": _per_file(
+            _delta(after.redis_commands, before.redis_commands), workload.files
+        ),
+    }
+
+
+def build_report(
+    results: dict[str, dict], *, llm_latency: float, adapter_latency: float
+) -> dict:
+    return {
+        "version": 1,
+        "mocks": {
+            "llm_latency_seconds": llm_latency,
+            "adapter_latency_seconds": adapter_latency,
+        },
+        "workloads": results,
+    }
+
+
+def write_report(report: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load_report(path: Path) -> dict:
+    report = json.loads(path.read_text())
+    if report.get("version") != 1 or not isinstance(report.get("workloads"), dict):
+        raise ValueError(f"{path} is not a bench report (version 1)")
+    return report
+
+
+# ── baseline comparison ──────────────────────────────────────────────────────
+
+# (dotted metric path, True when a larger value is worse)
+COMPARED_METRICS = (
+    ("files_per_second", False),
+    ("latency_seconds.p50", True),
+    ("latency_seconds.p95", True),
+    ("latency_seconds.p99", True),
+    ("queue_wait_seconds.mean", True),
+    ("db_transactions_per_file", True),
+    ("redis_commands_per_file", True),
+)
+
+
+@dataclass(frozen=True)
+class Regression:
+    workload: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        change = (self.current - self.baseline) / self.baseline * 100
+        return (
+            f"{self.workload}: {self.metric} {self.baseline:g} → "
+            f"{self.current:g} ({change:+.1f}%)"
+        )
+
+
+def _lookup(entry: dict, dotted: str) -> float | None:
+    value: object = entry
+    for key in dotted.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value if isinstance(value, int | float) else None
+
+
+def compare(report: dict, baseline: dict, *, tolerance: float) -> list[Regression]:
+    """Metrics that moved the wrong way by more than ``tolerance`` (a fraction).
+
+    Only workloads present in both reports are compared, and a metric missing
+    on either side is skipped. Reports taken with different mock latencies
+    measure different things, so comparing them is refused outright.
+    """
+    if report.get("mocks") != baseline.get("mocks"):
+        raise ValueError(
+            f"baseline mock latencies {baseline.get('mocks')} differ from this "
+            f"run's {report.get('mocks')}; re-take the baseline"
+        )
+    regressions: list[Regression] = []
+    for name, entry in report["workloads"].items():
+        base_entry = baseline["workloads"].get(name)
+        if base_entry is None:
+            continue
+        for metric, higher_is_worse in COMPARED_METRICS:
+            current = _lookup(entry, metric)
+            base = _lookup(base_entry, metric)
+            if current is None or not base:
+                continue
+            change = (current - base) / base
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append(Regression(name, metric, base, current))
+    return regressions
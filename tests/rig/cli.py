@@ -8,11 +8,13 @@ Subcommands:
   validate            Validate manifests; non-zero on schema errors.
   platform            ``up | down | status`` the e2e platform stack.
   report              ``combine`` — re-aggregate reports/ after the fact.
+  bench               Throughput workloads against the platform (see bench.py).
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import shutil
 import subprocess
@@ -24,6 +26,7 @@ from pathlib import Path
 from urllib.parse import urlsplit
 from xml.sax import saxutils
 
+from tests.rig import bench
 from tests.rig import critical_paths as cp
 from tests.rig.coverage import combine_and_report, coverage_env
 from tests.rig.groups import (
@@ -42,6 +45,8 @@ from tests.rig.reporting import (
 )
 from tests.rig.runtime import (
     DEFAULT_LLM_MOCK_RESPONSE,
+    EXTRA_COMPOSE_ENV,
+    LLM_MOCK_LATENCY_ENV,
     LLM_MOCK_RESPONSE_ENV,
     PlatformEndpoints,
     PlatformRuntime,
@@ -220,9 +225,90 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     pre.set_defaults(func=cmd_report)
 
+    pb = sub.add_parser(
+        "bench", help="Run throughput workloads against the platform (JSON report)."
+    )
+    pb.add_argument(
+        "--files", type=_int_list, default=[10], help="File counts, e.g. 1,10,50."
+    )
+    pb.add_argument(
+        "--prompts", type=_int_list, default=[1], help="Prompt counts, e.g. 1,5."
+    )
+    pb.add_argument(
+        "--modes", type=_choice_list(bench.MODES), default=["api"], help="api,etl"
+    )
+    pb.add_argument(
+        "--transports",
+        type=_choice_list(bench.TRANSPORTS),
+        default=["celery"],
+        help="celery,pg",
+    )
+    pb.add_argument(
+        "--llm-latency",
+        type=float,
+        default=1.0,
+        help="Seconds each mocked LLM completion takes.",
+    )
+    pb.add_argument(
+        "--adapter-latency",
+        type=float,
+        default=0.5,
+        help="Seconds the NoOp x2text / vectordb adapters wait per call.",
+    )
+    pb.add_argument("--runtime", choices=["compose", "testcontainers", "local"])
+    pb.add_argument(
+        "--timeout",
+        type=int,
+        default=1800,
+        help="Per-workload execution timeout in seconds.",
+    )
+    pb.add_argument(
+        "--output",
+        type=Path,
+        default=REPO_ROOT / "reports" / "bench" / "bench-report.json",
+    )
+    pb.add_argument(
+        "--baseline",
+        type=Path,
+        help="Saved report to compare against; regressions fail the run.",
+    )
+    pb.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed fractional change in the wrong direction (default 0.10).",
+    )
+    pb.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's report to --baseline instead of comparing (green runs only).",
+    )
+    pb.add_argument("--dry-run", action="store_true", help="Print the matrix only.")
+    pb.set_defaults(func=cmd_bench)
+
     return p
 
 
+def _int_list(raw: str) -> list[int]:
+    try:
+        return bench.parse_int_list(raw)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _choice_list(choices: tuple[str, ...]):
+    def parse(raw: str) -> list[str]:
+        values = [v.strip() for v in raw.split(",") if v.strip()]
+        unknown = sorted(set(values) - set(choices))
+        if not values or unknown:
+            raise argparse.ArgumentTypeError(
+                f"expected a comma-separated subset of {', '.join(choices)}, got {raw!r}"
+            )
+        return values
+
+    return parse
+
+
 # ── subcommands ───────────────────────────────────────────────────────────────
 
 
@@ -456,6 +542,127 @@ def cmd_report(args: argparse.Namespace) -> int:
     return 1 if unknown_marker_ids or regressions or baseline_corrupt else 0
 
 
+def cmd_bench(args: argparse.Namespace) -> int:
+    """Run the throughput matrix once per workload and gate on a baseline.
+
+    Each workload is its own pytest session of ``tests/e2e/bench`` against one
+    platform bring-up; the session writes a result JSON that this command
+    folds into the report. Exit 1 on a failed workload or a regression past
+    ``--tolerance``, 2 on a usage error.
+    """
+    workloads = bench.expand_matrix(args.files, args.prompts, args.modes, args.transports)
+    if args.dry_run:
+        for workload in workloads:
+            print(workload.name)
+        return 0
+    if args.update_baseline and args.baseline is None:
+        print("ERROR: --update-baseline needs --baseline.", file=sys.stderr)
+        return 2
+    baseline: dict | None = None
+    if args.baseline is not None and not args.update_baseline:
+        try:
+            baseline = bench.load_report(args.baseline)
+        except (OSError, ValueError) as exc:
+            print(f"ERROR: baseline {args.baseline}: {exc}", file=sys.stderr)
+            return 2
+
+    output: Path = args.output
+    bench_dir = output.parent
+    flags_dir = bench_dir / "flags"
+    bench.write_transport_snapshot(flags_dir, workloads[0].transport)
+    # Read by the bench overlay: the flags dir is mounted into every service
+    # that resolves the transport, and the mock latency into both executors.
+    os.environ[bench.BENCH_FLAGS_DIR_ENV] = str(flags_dir.resolve())
+    if not os.environ.get(LLM_MOCK_RESPONSE_ENV):
+        os.environ[LLM_MOCK_RESPONSE_ENV] = DEFAULT_LLM_MOCK_RESPONSE
+    os.environ[LLM_MOCK_LATENCY_ENV] = str(args.llm_latency)
+    os.environ[EXTRA_COMPOSE_ENV] = os.pathsep.join(
+        filter(
+            None,
+            (os.environ.get(EXTRA_COMPOSE_ENV), str(bench.BENCH_COMPOSE_OVERLAY)),
+        )
+    )
+    if any(w.transport == "pg" for w in workloads):
+        profiles = os.environ.get("COMPOSE_PROFILES", "").split(",")
+        if bench.BENCH_PG_PROFILE not in profiles:
+            os.environ["COMPOSE_PROFILES"] = ",".join(
+                filter(None, [*profiles, bench.BENCH_PG_PROFILE])
+            )
+
+    results: dict[str, dict] = {}
+    failed: list[str] = []
+    runtime = pick_runtime(args.runtime)
+    try:
+        print(f"[rig] bringing platform up via runtime={runtime.name}")
+        endpoints = runtime.up()
+        transport = workloads[0].transport
+        for workload in workloads:
+            if workload.transport != transport:
+                transport = workload.transport
+                bench.write_transport_snapshot(flags_dir, transport)
+                # Let every service's cached snapshot expire before dispatching.
+                time.sleep(2 * bench.FLAG_SNAPSHOT_TTL_SECONDS)
+            result_path = bench_dir / "results" / f"{workload.name}.json"
+            result_path.unlink(missing_ok=True)
+            group = GroupDefinition(
+                name=f"bench-{workload.name}",
+                tier="e2e",
+                paths=(str(bench.BENCH_TESTS.relative_to(REPO_ROOT)),),
+                env={
+                    bench.BENCH_WORKLOAD_ENV: workload.to_json(),
+                    bench.BENCH_RESULT_ENV: str(result_path.resolve()),
+                    bench.BENCH_ADAPTER_LATENCY_ENV: str(args.adapter_latency),
+                    bench.BENCH_TIMEOUT_ENV: str(args.timeout),
+                },
+                requires_platform=True,
+                parallel=False,
+            )
+            print(f"[rig] bench {workload.name}")
+            # Headroom over the execution timeout for provisioning and teardown.
+            _, exit_code = _execute_group(
+                group,
+                reports_dir=bench_dir / "sessions",
+                marker=None,
+                paths_override=None,
+                coverage=False,
+                parallel=False,
+                workers="1",
+                timeout=args.timeout + 600,
+                endpoints=endpoints,
+            )
+            if exit_code != 0 or not result_path.is_file():
+                failed.append(workload.name)
+                continue
+            results[workload.name] = json.loads(result_path.read_text())
+    finally:
+        runtime.down()
+
+    report = bench.build_report(
+        results, llm_latency=args.llm_latency, adapter_latency=args.adapter_latency
+    )
+    bench.write_report(report, output)
+    print(f"[rig] bench report: {output}")
+    for name in failed:
+        print(f"FAIL {name}", file=sys.stderr)
+
+    if args.update_baseline:
+        if failed:
+            print("[rig] baseline not updated: the run had failures", file=sys.stderr)
+        else:
+            bench.write_report(report, args.baseline)
+            print(f"[rig] baseline updated: {args.baseline}")
+    regressions: list[bench.Regression] = []
+    if baseline is not None:
+        try:
+            regressions = bench.compare(report, baseline, tolerance=args.tolerance)
+        except ValueError as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 2
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if failed or regressions else 0
+
+
 def cmd_run(args: argparse.Namespace) -> int:
     manifest = load_groups()
     registry = cp.load_critical_paths()
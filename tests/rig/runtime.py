@@ -83,6 +83,8 @@ def _drop_missing_files(args: list[str]) -> list[str]:
 # Shared by the workers and the tests, so the exact completion is assertable.
 LLM_MOCK_RESPONSE_ENV = "UNSTRACT_LLM_MOCK_RESPONSE"
 DEFAULT_LLM_MOCK_RESPONSE = "MOCK_LLM_OK"
+# Seconds each mocked completion sleeps (the bench's fixed provider latency).
+LLM_MOCK_LATENCY_ENV = "UNSTRACT_LLM_MOCK_LATENCY"
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,209 @@
+"""Self-tests for the throughput bench: matrix, measurements, baseline gate."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.rig import bench
+from tests.rig.bench import Counters, Workload
+
+
+def _entry(**overrides) -> dict:
+    entry = {
+        "files_per_second": 2.0,
+        "latency_seconds": {"p50": 1.0, "p95": 2.0, "p99": 3.0, "max": 3.0},
+        "queue_wait_seconds": {"mean": 0.5, "samples": 10},
+        "db_transactions_per_file": 40.0,
+        "redis_commands_per_file": 100.0,
+    }
+    entry.update(overrides)
+    return entry
+
+
+def _report(entry: dict, *, llm_latency: float = 1.0) -> dict:
+    return bench.build_report(
+        {"api-celery-10f-1p": entry}, llm_latency=llm_latency, adapter_latency=0.5
+    )
+
+
+def test_expand_matrix_varies_transport_slowest_and_dedupes() -> None:
+    workloads = bench.expand_matrix([1, 1, 10], [1], ["api", "etl"], ["pg", "celery"])
+    assert [w.name for w in workloads] == [
+        "api-pg-1f-1p",
+        "api-pg-10f-1p",
+        "etl-pg-1f-1p",
+        "etl-pg-10f-1p",
+        "api-celery-1f-1p",
+        "api-celery-10f-1p",
+        "etl-celery-1f-1p",
+        "etl-celery-10f-1p",
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"files": 0, "prompts": 1, "mode": "api", "transport": "pg"},
+        {"files": 1, "prompts": 0, "mode": "api", "transport": "pg"},
+        {"files": 1, "prompts": 1, "mode": "batch", "transport": "pg"},
+        {"files": 1, "prompts": 1, "mode": "api", "transport": "kafka"},
+    ],
+)
+def test_workload_rejects_invalid_cells(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        Workload(**kwargs)
+
+
+def test_workload_round_trips_through_json() -> None:
+    workload = Workload(files=5, prompts=3, mode="etl", transport="celery")
+    assert Workload.from_json(workload.to_json()) == workload
+
+
+def test_parse_int_list() -> None:
+    assert bench.parse_int_list("1, 10,50") == [1, 10, 50]
+    with pytest.raises(ValueError):
+        bench.parse_int_list("1,ten")
+    with pytest.raises(ValueError):
+        bench.parse_int_list(",")
+
+
+def test_percentile_interpolates_linearly() -> None:
+    values = [4.0, 1.0, 3.0, 2.0]
+    assert bench.percentile(values, 50) == pytest.approx(2.5)
+    assert bench.percentile(values, 100) == 4.0
+    assert bench.percentile([7.0], 95) == 7.0
+    assert bench.percentile([], 50) is None
+
+
+def test_queue_wait_totals_sums_only_the_queue_wait_stage() -> None:
+    text = "\n".join(
+        [
+            "# TYPE worker_pipeline_stage_duration_seconds histogram",
+            'worker_pipeline_stage_duration_seconds_bucket{stage="queue_wait",le="1.0"} 3.0',
+            'worker_pipeline_stage_duration_seconds_sum{stage="queue_wait",queue="a"} 1.5',
+            'worker_pipeline_stage_duration_seconds_count{stage="queue_wait",queue="a"} 3.0',
+            'worker_pipeline_stage_duration_seconds_sum{stage="queue_wait",queue="b"} 0.5',
+            'worker_pipeline_stage_duration_seconds_count{stage="queue_wait",queue="b"} 1.0',
+            'worker_pipeline_stage_duration_seconds_sum{stage="tool_run",queue="a"} 99.0',
+            'worker_pipeline_stage_total{stage="queue_wait",outcome="success"} 4.0',
+        ]
+    )
+    assert bench.queue_wait_totals(text) == (2.0, 4.0)
+
+
+def test_summarize_reports_deltas_per_file() -> None:
+    workload = Workload(files=4, prompts=1, mode="api", transport="pg")
+    entry = bench.summarize(
+        workload,
+        wall_seconds=8.0,
+        file_latencies=[1.0, 2.0, 3.0, 4.0],
+        failed_files=0,
+        before=Counters(100, 1000, 1.0, 2.0),
+        after=Counters(180, 1400, 3.0, 6.0),
+    )
+    assert entry["completed_files"] == 4
+    assert entry["files_per_second"] == 0.5
+    assert entry["latency_seconds"]["max"] == 4.0
+    assert entry["queue_wait_seconds"] == {"mean": 0.5, "samples": 4.0}
+    assert entry["db_transactions_per_file"] == 20.0
+    assert entry["redis_commands_per_file"] == 100.0
+
+
+def test_summarize_leaves_unreadable_counters_null() -> None:
+    """Celery runs have no queue-wait series and a host without docker can't
+    read the DB/Redis counters; those report null instead of a made-up zero.
+    """
+    workload = Workload(files=2, prompts=1, mode="etl", transport="celery")
+    entry = bench.summarize(
+        workload,
+        wall_seconds=0.0,
+        file_latencies=[],
+        failed_files=2,
+        before=Counters(),
+        after=Counters(db_transactions=5),
+    )
+    assert entry["files_per_second"] is None
+    assert entry["latency_seconds"]["p50"] is None
+    assert entry["queue_wait_seconds"] is None
+    assert entry["db_transactions_per_file"] is None
+    assert entry["redis_commands_per_file"] is None
+
+
+def test_compare_flags_moves_in_the_wrong_direction_only() -> None:
+    baseline = _report(_entry())
+    report = _report(
+        _entry(
+            files_per_second=1.5,  # -25% throughput: regression
+            latency_seconds={"p50": 0.5, "p95": 2.1, "p99": 3.0, "max": 9.0},
+            db_transactions_per_file=60.0,  # +50%: regression
+            redis_commands_per_file=50.0,  # improvement
+        )
+    )
+    regressions = bench.compare(report, baseline, tolerance=0.10)
+    assert {r.metric for r in regressions} == {
+        "files_per_second",
+        "db_transactions_per_file",
+    }
+    assert "-25.0%" in str(next(r for r in regressions if r.metric == "files_per_second"))
+
+
+def test_compare_skips_missing_metrics_and_workloads() -> None:
+    baseline = _report(_entry(queue_wait_seconds=None, redis_commands_per_file=0))
+    report = _report(_entry(queue_wait_seconds={"mean": 9.0, "samples": 1}))
+    report["workloads"]["etl-pg-1f-1p"] = _entry(files_per_second=0.01)
+    assert bench.compare(report, baseline, tolerance=0.10) == []
+
+
+def test_compare_refuses_reports_taken_with_different_mocks() -> None:
+    with pytest.raises(ValueError, match="mock latencies"):
+        bench.compare(
+            _report(_entry(), llm_latency=2.0), _report(_entry()), tolerance=0.1
+        )
+
+
+def test_report_round_trips_and_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "bench" / "report.json"
+    report = _report(_entry())
+    bench.write_report(report, path)
+    assert bench.load_report(path) == report
+
+    (tmp_path / "summary.json").write_text(json.dumps({"groups": []}))
+    with pytest.raises(ValueError, match="not a bench report"):
+        bench.load_report(tmp_path / "summary.json")
+
+
+def test_write_transport_snapshot_toggles_the_pg_queue_flag(tmp_path: Path) -> None:
+    path = bench.write_transport_snapshot(tmp_path / "flags", "pg")
+    (flag,) = json.loads(path.read_text())["flags"]
+    assert flag == {
+        "key": bench.PG_QUEUE_FLAG_KEY,
+        "type": "BOOLEAN_FLAG_TYPE",
+        "enabled": True,
+    }
+
+    bench.write_transport_snapshot(tmp_path / "flags", "celery")
+    (flag,) = json.loads(path.read_text())["flags"]
+    assert flag["enabled"] is False
+    assert [p.name for p in (tmp_path / "flags").iterdir()] == [bench.FLAG_SNAPSHOT_NAME]
+
+
+def test_cmd_bench_dry_run_prints_the_matrix(capsys) -> None:
+    import tests.rig.cli as cli_mod
+
+    args = cli_mod._build_parser().parse_args(
+        ["bench", "--files", "1,5", "--modes", "etl", "--transports", "pg", "--dry-run"]
+    )
+    assert cli_mod.cmd_bench(args) == 0
+    assert capsys.readouterr().out.split() == ["etl-pg-1f-1p", "etl-pg-5f-1p"]
+
+
+def test_cmd_bench_rejects_an_unreadable_baseline(tmp_path: Path) -> None:
+    import tests.rig.cli as cli_mod
+
+    args = cli_mod._build_parser().parse_args(
+        ["bench", "--baseline", str(tmp_path / "missing.json")]
+    )
+    assert cli_mod.cmd_bench(args) == 2
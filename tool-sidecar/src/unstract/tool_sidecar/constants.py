@@ -29,3 +29,17 @@ class Env:
     FILE_EXECUTION_ID = "FILE_EXECUTION_ID"
     MESSAGING_CHANNEL = "MESSAGING_CHANNEL"
     CONTAINER_NAME = "CONTAINER_NAME"
+    LOG_BATCH_SIZE = "LOG_BATCH_SIZE"
+    LOG_FLUSH_INTERVAL = "LOG_FLUSH_INTERVAL"
+
+
+class LogMonitor:
+    # Logs are published once this many are pending...
+    DEFAULT_BATCH_SIZE = 50
+    # ...or once the oldest pending one has waited this long (seconds)
+    DEFAULT_FLUSH_INTERVAL = 0.25
+    # Sleep between checks when file change notifications are unavailable
+    POLL_INTERVAL = 0.1
+    # Longest wait for a notification before re-checking the file anyway
+    RESCAN_INTERVAL = 1.0
+    READ_CHUNK_SIZE = 64 * 1024
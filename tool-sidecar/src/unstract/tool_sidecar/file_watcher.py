@@ -0,0 +1,107 @@
+"""Change notifications for the tool's log directory.
+
+The sidecar used to poll the log file every 100ms. On Linux it now blocks on
+inotify (through libc, so no extra dependency) and wakes as soon as the tool
+writes a line or drops the ``completed`` marker. Where inotify is unavailable
+(non-Linux hosts, exhausted watch limits, ...) it falls back to polling.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import time
+from typing import Self
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+
+class DirectoryWatcher:
+    """Blocks until something in a directory changes or a timeout elapses."""
+
+    def __init__(
+        self, directory: str, poll_interval: float, rescan_interval: float
+    ) -> None:
+        """Watch ``directory``, falling back to polling if inotify is unavailable.
+
+        Args:
+            directory: Directory to watch (the log file's parent)
+            poll_interval: Longest sleep between checks when polling
+            rescan_interval: Longest wait for an event before checking anyway,
+                for filesystems that do not deliver inotify events
+        """
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self.rescan_interval = rescan_interval
+        self._fd = self._open_inotify(directory)
+
+    @property
+    def is_event_driven(self) -> bool:
+        return self._fd is not None
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for a change in the directory.
+
+        Args:
+            timeout: Maximum seconds to wait, None for the idle maximum
+
+        Returns:
+            bool: True if woken by a change notification
+        """
+        limit = self.rescan_interval if self._fd is not None else self.poll_interval
+        timeout = limit if timeout is None else max(0.0, min(timeout, limit))
+        if self._fd is None:
+            time.sleep(timeout)
+            return False
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        self._drain()
+        return True
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        """Discard queued events; callers re-read the file rather than the events."""
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    @staticmethod
+    def _open_inotify(directory: str) -> int | None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+                error = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(error, f"inotify_add_watch failed for {directory}")
+        except (AttributeError, OSError) as e:
+            logger.warning(f"File change notifications unavailable, polling: {e}")
+            return None
+        logger.info(f"Watching {directory} for changes")
+        return fd
@@ -2,6 +2,11 @@
 This sidecar runs alongside the tool container in the same pod, monitoring
 the tool's output log file and streaming logs to Redis while watching for
 completion signals.
+
+The log file is read in chunks whenever the tool writes to it (inotify, with a
+polling fallback), and logs are published in small batches bounded by size and
+age. Status-changing lines (errors, the result, the termination marker) flush
+the pending batch and are acted on straight away.
 """
 
 import json
@@ -22,8 +27,9 @@ from unstract.core.tool_execution_status import (
 )
 from unstract.core.utilities import redact_sensitive_string
 
-from .constants import Env, LogLevel, LogType
+from .constants import Env, LogLevel, LogMonitor, LogType
 from .dto import LogLineDTO
+from .file_watcher import DirectoryWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +56,8 @@ class LogProcessor:
         file_execution_id: str,
         messaging_channel: str,
         container_name: str = "",
+        log_batch_size: int = LogMonitor.DEFAULT_BATCH_SIZE,
+        log_flush_interval: float = LogMonitor.DEFAULT_FLUSH_INTERVAL,
     ):
         """Initialize the log processor with necessary connections and paths.
 
@@ -60,6 +68,9 @@ class LogProcessor:
             execution_id: ID of the execution
             organization_id: ID of the organization
             file_execution_id: ID of the file execution
+            log_batch_size: Publish pending logs once this many are queued
+            log_flush_interval: Publish pending logs once the oldest has
+                waited this many seconds
         """
         self.log_path = log_path
         self.redis_host = redis_host
@@ -72,6 +83,10 @@ class LogProcessor:
         self.file_execution_id = file_execution_id
         self.messaging_channel = messaging_channel
         self.container_name = container_name
+        self.log_batch_size = max(1, log_batch_size)
+        self.log_flush_interval = log_flush_interval
+        self._pending_logs: list[dict[str, Any]] = []
+        self._flush_deadline: float | None = None
         self.tool_execution_tracker = ToolExecutionTracker()
         self._update_tool_execution_status(status=ToolExecutionStatus.RUNNING)
 
@@ -93,22 +108,56 @@ class LogProcessor:
         except Exception as e:
             logger.error(f"Failed to update tool execution status: {e}", exc_info=True)
 
-    def wait_for_log_file(self, timeout: int = 300) -> bool:
+    def wait_for_log_file(
+        self, timeout: int = 300, watcher: DirectoryWatcher | None = None
+    ) -> bool:
         """Wait for the log file to be created by the tool container.
 
         Args:
             timeout: Maximum time to wait in seconds
+            watcher: Watcher on the log directory, to wake on its creation
 
         Returns:
             bool: True if file exists, False if timeout occurred
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         while not os.path.exists(self.log_path):
-            if time.time() - start_time > timeout:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return False
-            time.sleep(0.1)
+            if watcher:
+                watcher.wait(remaining)
+            else:
+                time.sleep(min(LogMonitor.POLL_INTERVAL, remaining))
         return True
 
+    def queue_log(self, log_dict: dict[str, Any]) -> None:
+        """Add a log to the pending batch, publishing it once the batch is full."""
+        if not self._pending_logs:
+            self._flush_deadline = time.monotonic() + self.log_flush_interval
+        self._pending_logs.append(log_dict)
+        if len(self._pending_logs) >= self.log_batch_size:
+            self.flush_logs()
+
+    def flush_logs(self) -> None:
+        """Publish all pending logs."""
+        if not self._pending_logs:
+            return
+        pending, self._pending_logs = self._pending_logs, []
+        self._flush_deadline = None
+        # Publish to channel of socket io
+        LogPublisher.publish_batch(self.messaging_channel, pending)
+
+    def flush_logs_if_due(self) -> None:
+        if self._flush_deadline is not None and time.monotonic() >= self._flush_deadline:
+            self.flush_logs()
+
+    def seconds_until_flush(self) -> float | None:
+        """Time left before the pending batch is due, None if nothing is pending."""
+        if self._flush_deadline is None:
+            return None
+        return max(0.0, self._flush_deadline - time.monotonic())
+
     def process_log_line(self, line: str) -> LogLineDTO:
         """Process a single log line, checking for completion signal.
 
@@ -124,6 +173,7 @@ class LogProcessor:
                 "Tool container terminated with status "
                 f"{LogFieldName.TOOL_TERMINATION_MARKER}"
             )
+            self.flush_logs()
             return LogLineDTO(is_terminated=True)
 
         log_dict = self.get_valid_log_message(line)
@@ -151,6 +201,8 @@ class LogProcessor:
                 logger.info(f"{log_dict.get('log')}")
         elif log_type == LogType.RESULT:
             logger.info(f"Tool '{self.container_name}' completed running")
+            # Deliver the tool's logs before signalling its completion
+            self.flush_logs()
             self._update_tool_execution_status(status=ToolExecutionStatus.SUCCESS)
             return LogLineDTO(with_result=True)
         elif log_type == LogType.UPDATE:
@@ -161,8 +213,9 @@ class LogProcessor:
         log_dict[LogFieldName.ORGANIZATION_ID] = self.organization_id
         log_dict[LogFieldName.TIMESTAMP] = self.get_log_timestamp(log_dict)
         log_dict[LogFieldName.FILE_EXECUTION_ID] = self.file_execution_id
-        # Publish to channel of socket io
-        LogPublisher.publish(self.messaging_channel, log_dict)
+        self.queue_log(log_dict)
+        if log_process_status.error:
+            self.flush_logs()
         return log_process_status
 
     def get_log_timestamp(self, log_dict: dict[str, Any]) -> float:
@@ -219,37 +272,60 @@ class LogProcessor:
 
     def monitor_logs(self) -> None:
         """Main loop to monitor log file for new content and completion signals.
-        Uses file polling with position tracking to efficiently read new lines.
+
+        Reads whatever the tool has appended in chunks, then sleeps until the
+        log directory changes or the pending log batch is due.
         """
         logger.info("Starting log monitoring...")
-        if not self.wait_for_log_file():
-            raise TimeoutError("Log file was not created within timeout period")
-
-        # Monitor the file for new content
-        with open(self.log_path) as f:
+        log_dir = os.path.dirname(self.log_path)
+        completed_path = os.path.join(log_dir, "completed")
+
+        with DirectoryWatcher(
+            log_dir,
+            poll_interval=LogMonitor.POLL_INTERVAL,
+            rescan_interval=LogMonitor.RESCAN_INTERVAL,
+        ) as watcher:
+            if not self.wait_for_log_file(watcher=watcher):
+                raise TimeoutError("Log file was not created within timeout period")
+
+            try:
+                self._follow_log_file(watcher, completed_path)
+            finally:
+                self.flush_logs()
+
+    def _follow_log_file(self, watcher: DirectoryWatcher, completed_path: str) -> None:
+        with open(self.log_path, "rb") as f:
+            # Trailing bytes of a line the tool has not finished writing yet
+            partial = b""
             while True:
-                # Remember current position
-                where = f.tell()
-                line = f.readline()
-
-                if not line:
-                    # No new data, check if tool container is done
-                    if os.path.exists(
-                        os.path.join(os.path.dirname(self.log_path), "completed")
-                    ):
-                        break
-
-                    # Sleep briefly to avoid CPU spinning
-                    time.sleep(0.1)
-                    # Go back to where we were
-                    f.seek(where)
+                chunk = f.read(LogMonitor.READ_CHUNK_SIZE)
+                if chunk:
+                    *lines, partial = (partial + chunk).split(b"\n")
+                    if self._process_lines(lines):
+                        return
+                    self.flush_logs_if_due()
                     continue
 
-                # Process the log line
-                log_line = self.process_log_line(line)
-                if log_line.is_terminated:
-                    logger.info("Completion signal received")
-                    break
+                # No new data, check if tool container is done
+                if os.path.exists(completed_path):
+                    # Lines written just before the marker may not have been
+                    # read yet, and the last line may lack a newline
+                    self._process_lines((partial + f.read()).split(b"\n"))
+                    return
+
+                self.flush_logs_if_due()
+                watcher.wait(self.seconds_until_flush())
+
+    def _process_lines(self, lines: list[bytes]) -> bool:
+        """Process complete log lines; True once the termination marker is seen."""
+        for raw_line in lines:
+            line = raw_line.decode("utf-8", errors="replace")
+            if not line.strip():
+                continue
+            if self.process_log_line(line).is_terminated:
+                logger.info("Completion signal received")
+                return True
+        return False
 
 
 def main():
@@ -278,6 +354,12 @@ def main():
     file_execution_id = os.getenv(Env.FILE_EXECUTION_ID)
     messaging_channel = os.getenv(Env.MESSAGING_CHANNEL)
     container_name = os.getenv(Env.CONTAINER_NAME)
+    log_batch_size = int(
+        os.getenv(Env.LOG_BATCH_SIZE, str(LogMonitor.DEFAULT_BATCH_SIZE))
+    )
+    log_flush_interval = float(
+        os.getenv(Env.LOG_FLUSH_INTERVAL, str(LogMonitor.DEFAULT_FLUSH_INTERVAL))
+    )
 
     # Validate required parameters
     required_params = {
@@ -315,6 +397,8 @@ def main():
         organization_id=organization_id,
         file_execution_id=file_execution_id,
         container_name=container_name,
+        log_batch_size=log_batch_size,
+        log_flush_interval=log_flush_interval,
     )
     processor.monitor_logs()
 
@@ -0,0 +1,53 @@
+"""Unit tests for the sidecar's log directory watcher."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from unstract.tool_sidecar import file_watcher
+from unstract.tool_sidecar.file_watcher import DirectoryWatcher
+
+inotify_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+@inotify_only
+class TestInotify:
+    def test_wakes_on_a_write_in_the_directory(self, tmp_path: Path) -> None:
+        with DirectoryWatcher(str(tmp_path), 0.1, 5.0) as watcher:
+            assert watcher.is_event_driven
+            (tmp_path / "logs.txt").write_text("line\n")
+            assert watcher.wait(5.0) is True
+            # Queued events were drained, so the next wait blocks again.
+            assert watcher.wait(0.05) is False
+
+    def test_times_out_without_a_change(self, tmp_path: Path) -> None:
+        with DirectoryWatcher(str(tmp_path), 0.1, 5.0) as watcher:
+            assert watcher.wait(0.05) is False
+
+    def test_close_is_idempotent(self, tmp_path: Path) -> None:
+        watcher = DirectoryWatcher(str(tmp_path), 0.1, 5.0)
+        watcher.close()
+        watcher.close()
+        assert not watcher.is_event_driven
+
+
+class TestPollingFallback:
+    @pytest.fixture
+    def watcher(self, tmp_path: Path) -> DirectoryWatcher:
+        with patch.object(file_watcher.ctypes, "CDLL", side_effect=OSError("no libc")):
+            return DirectoryWatcher(str(tmp_path), 0.1, 5.0)
+
+    def test_falls_back_when_inotify_is_unavailable(
+        self, watcher: DirectoryWatcher
+    ) -> None:
+        assert not watcher.is_event_driven
+
+    def test_sleeps_at_most_the_poll_interval(self, watcher: DirectoryWatcher) -> None:
+        with patch.object(file_watcher.time, "sleep") as sleep:
+            assert watcher.wait(30.0) is False
+            assert watcher.wait() is False
+            assert watcher.wait(0.02) is False
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.1, 0.02]
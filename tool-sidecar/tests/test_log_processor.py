@@ -0,0 +1,150 @@
+"""Unit tests for the sidecar's log following and batched publishing."""
+
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from unstract.core.constants import LogFieldName
+from unstract.core.tool_execution_status import ToolExecutionStatus
+from unstract.tool_sidecar import log_processor
+from unstract.tool_sidecar.log_processor import LogProcessor
+
+
+def _log(message: str, level: str = "INFO", log_type: str = "LOG") -> str:
+    return json.dumps({"type": log_type, "level": level, "log": message})
+
+
+class _ScriptedWatcher:
+    """Runs one scripted file change per ``wait`` instead of blocking."""
+
+    def __init__(self, steps: list[Callable[[], None]]) -> None:
+        self.steps = list(steps)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        assert self.steps, "follower waited after the tool finished"
+        self.steps.pop(0)()
+        return True
+
+
+@pytest.fixture
+def publisher() -> Iterator[MagicMock]:
+    with (
+        patch.object(log_processor, "ToolExecutionTracker"),
+        patch.object(log_processor.LogPublisher, "publish_batch") as publish_batch,
+    ):
+        yield publish_batch
+
+
+def _processor(tmp_path: Path, **kwargs) -> LogProcessor:
+    return LogProcessor(
+        log_path=str(tmp_path / "logs.txt"),
+        redis_host="localhost",
+        redis_port="6379",
+        redis_user="",
+        redis_password="",
+        tool_instance_id="tool-1",
+        execution_id="exec-1",
+        organization_id="org-1",
+        file_execution_id="file-exec-1",
+        messaging_channel="channel-1",
+        **{"log_flush_interval": 60.0, **kwargs},
+    )
+
+
+def _published(publish_batch: MagicMock) -> list[str]:
+    return [p["log"] for c in publish_batch.call_args_list for p in c.args[1]]
+
+
+def _updated_statuses(processor: LogProcessor) -> list[ToolExecutionStatus]:
+    update_status = processor.tool_execution_tracker.update_status
+    return [c.kwargs["tool_execution_data"].status for c in update_status.call_args_list]
+
+
+class TestFollowLogFile:
+    def _follow(self, processor: LogProcessor, watcher: _ScriptedWatcher) -> None:
+        completed = Path(processor.log_path).parent / "completed"
+        processor._follow_log_file(watcher, str(completed))
+        processor.flush_logs()
+
+    def test_partial_trailing_line_waits_for_its_newline(self, tmp_path, publisher):
+        processor = _processor(tmp_path)
+        log_file, second = tmp_path / "logs.txt", _log("second")
+        log_file.write_text(f"{_log('first')}\n{second[:10]}")
+
+        def _finish_line() -> None:
+            with log_file.open("a") as f:
+                f.write(f"{second[10:]}\n")
+
+        watcher = _ScriptedWatcher([_finish_line, (tmp_path / "completed").touch])
+        self._follow(processor, watcher)
+
+        assert _published(publisher) == ["first", "second"]
+        assert watcher.steps == []
+
+    def test_completed_marker_reads_last_line_without_newline(self, tmp_path, publisher):
+        processor = _processor(tmp_path)
+        (tmp_path / "logs.txt").write_text(f"{_log('first')}\n{_log('last')}")
+        (tmp_path / "completed").touch()
+
+        self._follow(processor, _ScriptedWatcher([]))
+
+        assert _published(publisher) == ["first", "last"]
+
+    def test_termination_marker_stops_following(self, tmp_path, publisher):
+        processor = _processor(tmp_path)
+        (tmp_path / "logs.txt").write_text(
+            f"{_log('before')}\n{LogFieldName.TOOL_TERMINATION_MARKER}\n{_log('after')}\n"
+        )
+
+        self._follow(processor, _ScriptedWatcher([]))
+
+        assert _published(publisher) == ["before"]
+
+
+class TestProcessLines:
+    def test_logs_are_batched_until_the_batch_is_full(self, tmp_path, publisher):
+        processor = _processor(tmp_path, log_batch_size=2)
+        processor._process_lines([_log(m).encode() for m in ("a", "b", "c")])
+
+        publisher.assert_called_once()
+        assert _published(publisher) == ["a", "b"]
+        processor.flush_logs()
+        assert _published(publisher) == ["a", "b", "c"]
+
+    def test_error_log_forces_a_flush(self, tmp_path, publisher):
+        processor = _processor(tmp_path)
+        processor._process_lines(
+            [_log("working").encode(), _log("boom", level="ERROR").encode()]
+        )
+
+        publisher.assert_called_once()
+        assert _published(publisher) == ["working", "boom"]
+        assert _updated_statuses(processor)[-1] == ToolExecutionStatus.FAILED
+
+    def test_result_flushes_logs_before_recording_success(self, tmp_path, publisher):
+        processor = _processor(tmp_path)
+        events = MagicMock()
+        events.attach_mock(publisher, "publish_batch")
+        events.attach_mock(
+            processor.tool_execution_tracker.update_status, "update_status"
+        )
+        processor._process_lines(
+            [_log("working").encode(), _log("{}", log_type="RESULT").encode()]
+        )
+
+        names = [name for name, _, _ in events.mock_calls]
+        assert names == ["publish_batch", "update_status"]
+        assert _published(publisher) == ["working"]
+        assert _updated_statuses(processor)[-1] == ToolExecutionStatus.SUCCESS
+
+    def test_pending_logs_flush_once_due(self, tmp_path, publisher):
+        processor = _processor(tmp_path, log_flush_interval=0.0)
+        processor._process_lines([_log("a").encode()])
+        publisher.assert_not_called()
+
+        processor.flush_logs_if_due()
+        assert publisher.call_args.args[0] == "channel-1"
+        assert _published(publisher) == ["a"]
+        assert processor.seconds_until_flush() is None
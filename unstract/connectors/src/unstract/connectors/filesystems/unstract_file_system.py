@@ -2,7 +2,9 @@ import base64
 import logging
 import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import UTC, date, datetime
+from itertools import islice
 from typing import Any
 
 from fsspec import AbstractFileSystem
@@ -120,6 +122,57 @@ class UnstractFileSystem(UnstractConnector, ABC):
         """
         pass
 
+    @staticmethod
+    def get_native_listing_order() -> str | None:
+        """Processing order the backend already lists files in, if any.
+
+        Override to return ``"oldest_first"`` or ``"newest_first"`` when
+        :meth:`iter_files` yields files in that last-modified order; ordered
+        discovery then stops after the first matches instead of scanning the
+        whole listing. ``None`` (the default) means no guaranteed order.
+        """
+        return None
+
+    def get_modified_date_utc(self, metadata: dict[str, Any]) -> datetime:
+        """Last modified date of a file as a UTC-aware datetime.
+
+        Files without a usable timestamp fall back to the epoch so ordering
+        never fails; extraction errors are stored for user reporting.
+
+        Args:
+            metadata: File metadata dictionary from fsspec
+
+        Returns:
+            UTC-aware datetime
+        """
+        try:
+            dt = self.extract_modified_date(metadata)
+            if dt is None:
+                # Fallback to epoch for files without timestamp
+                logger.warning(
+                    f"No modified date found for file: {metadata['name']}, "
+                    "falling back to epoch for such files with no timestamp"
+                )
+                return datetime.fromtimestamp(0, tz=UTC)
+            # Ensure the extracted date is normalized to UTC and timezone-aware
+            if dt.tzinfo is None:
+                # Naive datetime - assume UTC
+                return dt.replace(tzinfo=UTC)
+            else:
+                # Convert to UTC
+                return dt.astimezone(UTC)
+        except Exception as e:
+            # Log per-file warning and store error for this specific metadata entry
+            file_name = metadata.get("name", "unknown file")
+            msg = (
+                f"Failed to extract modified date for file: {file_name}, "
+                "falling back to epoch for such files and continuing execution"
+            )
+            logger.exception(f"{msg}: {e}")
+            self._store_user_error(msg)
+            # Return epoch as fallback so sorting never fails
+            return datetime.fromtimestamp(0, tz=UTC)
+
     def sort_files_by_modified_date(
         self, file_metadata_list: list[dict[str, Any]], ascending: bool = True
     ) -> list[dict[str, Any]]:
@@ -132,37 +185,9 @@ class UnstractFileSystem(UnstractConnector, ABC):
         Returns:
             Sorted list of file metadata
         """
-
-        def get_modified_date(metadata: dict[str, Any]) -> datetime:
-            try:
-                dt = self.extract_modified_date(metadata)
-                if dt is None:
-                    # Fallback to epoch for files without timestamp
-                    logger.warning(
-                        f"No modified date found for file: {metadata['name']}, "
-                        "falling back to epoch for such files with no timestamp"
-                    )
-                    return datetime.fromtimestamp(0, tz=UTC)
-                # Ensure the extracted date is normalized to UTC and timezone-aware
-                if dt.tzinfo is None:
-                    # Naive datetime - assume UTC
-                    return dt.replace(tzinfo=UTC)
-                else:
-                    # Convert to UTC
-                    return dt.astimezone(UTC)
-            except Exception as e:
-                # Log per-file warning and store error for this specific metadata entry
-                file_name = metadata.get("name", "unknown file")
-                msg = (
-                    f"Failed to extract modified date for file: {file_name}, "
-                    "falling back to epoch for such files and continuing execution"
-                )
-                logger.exception(f"{msg}: {e}")
-                self._store_user_error(msg)
-                # Return epoch as fallback so sorting never fails
-                return datetime.fromtimestamp(0, tz=UTC)
-
-        return sorted(file_metadata_list, key=get_modified_date, reverse=not ascending)
+        return sorted(
+            file_metadata_list, key=self.get_modified_date_utc, reverse=not ascending
+        )
 
     def _store_user_error(self, error_msg: str) -> None:
         """Store user-friendly error message for later reporting.
@@ -174,25 +199,25 @@ class UnstractFileSystem(UnstractConnector, ABC):
             self._user_errors = []
         self._user_errors.append(error_msg)
 
-    def list_files(
+    def iter_files(
         self,
         directory: str,
         max_depth: int = 1,
         include_dirs: bool = False,
-        limit: int | None = None,
-    ) -> list[dict[str, Any]]:
-        """List files in a directory with optional sorting.
+    ) -> Iterator[dict[str, Any]]:
+        """Yield file metadata from a directory walk as it is listed.
+
+        Lets callers that only keep a bounded subset (e.g. ordered discovery's
+        top-K selection) stream the listing instead of materialising it.
 
         Args:
             directory: Directory path to list
             max_depth: Maximum depth for recursive traversal
             include_dirs: Whether to include directories in results
-            limit: Maximum number of files to collect (for performance)
 
-        Returns:
-            List of file metadata dictionaries
+        Yields:
+            File metadata dictionaries
         """
-        all_files: list[dict[str, Any]] = []
         fs_fsspec = self.get_fsspec_fs()
 
         def _on_walk_error(error: Exception) -> None:
@@ -213,11 +238,34 @@ class UnstractFileSystem(UnstractConnector, ABC):
                 # is_directory tag) mis-classify directories as files.
                 if not include_dirs and self.is_dir_by_metadata(metadata):
                     continue
-                all_files.append(metadata)
+                yield metadata
 
-                if limit is not None and len(all_files) >= limit:
-                    return all_files
-        return all_files
+    def list_files(
+        self,
+        directory: str,
+        max_depth: int = 1,
+        include_dirs: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List files in a directory with optional sorting.
+
+        Args:
+            directory: Directory path to list
+            max_depth: Maximum depth for recursive traversal
+            include_dirs: Whether to include directories in results
+            limit: Maximum number of files to collect (for performance)
+
+        Returns:
+            List of file metadata dictionaries
+        """
+        return list(
+            islice(
+                self.iter_files(
+                    directory=directory, max_depth=max_depth, include_dirs=include_dirs
+                ),
+                limit,
+            )
+        )
 
     def report_errors_to_user(self) -> list[str]:
         """Get accumulated errors and clear the list.
@@ -426,6 +426,9 @@ class FileOperationConstants:
     MAX_RECURSIVE_DEPTH = 10  # Maximum directory traversal depth
     DEFAULT_MAX_FILES = 100  # Default maximum files to process
     MAX_FILES_FOR_SORTING = 40000
+    # Ordered discovery keeps limit × factor candidates per selection pass and
+    # grows by the same factor when filters leave it short of the limit
+    ORDERED_CANDIDATE_FACTOR = 4
 
     # File pattern defaults
     DEFAULT_FILE_PATTERNS = ["*"]
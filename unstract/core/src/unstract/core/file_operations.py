@@ -58,6 +58,40 @@ class FileOperations:
             fallback_string = f"{file_path}:{time.time()}"
             return hashlib.sha256(fallback_string.encode()).hexdigest()
 
+    @staticmethod
+    def compute_metadata_file_identity(
+        source_fs, fs_metadata: dict[str, Any]
+    ) -> str | None:
+        """Derive a file identity from listing metadata without reading content.
+
+        Used when the provider exposes no checksum. Size and last-modified
+        time are hashed into a value that fits ``provider_file_uuid``; a file
+        that is rewritten gets a new identity and is processed again, where
+        its content hash is still checked against file history.
+
+        Args:
+            source_fs: File system object (UnstractFileSystem)
+            fs_metadata: Metadata from fsspec
+
+        Returns:
+            str | None: SHA256 hex of the metadata identity, or None when the
+            size or modified time is not available
+        """
+        file_size = fs_metadata.get("size")
+        if file_size is None or not hasattr(source_fs, "extract_modified_date"):
+            return None
+
+        try:
+            modified_at = source_fs.extract_modified_date(fs_metadata)
+        except Exception as e:
+            logger.debug(f"Could not read modified date for metadata identity: {e}")
+            return None
+        if modified_at is None:
+            return None
+
+        identity = f"metadata:{file_size}:{modified_at.isoformat()}"
+        return hashlib.sha256(identity.encode()).hexdigest()
+
     @staticmethod
     def compute_file_hash(file_path: str, chunk_size: int = 8192) -> str:
         """Compute SHA-256 hash of file content.
@@ -145,6 +179,14 @@ class FileOperations:
         elif hasattr(source_fs, "extract_metadata_file_hash"):
             provider_file_uuid = source_fs.extract_metadata_file_hash(fs_metadata)
 
+        # Providers without a content checksum (SFTP, local, HTTP, Box) fall back
+        # to a size + modified-time identity so file history can still skip them
+        # at discovery instead of downloading every file to hash its content.
+        if not provider_file_uuid:
+            provider_file_uuid = FileOperations.compute_metadata_file_identity(
+                source_fs, fs_metadata
+            )
+
         # Detect MIME type if possible
         mime_type = fs_metadata.get("ContentType") or fs_metadata.get("content_type")
 
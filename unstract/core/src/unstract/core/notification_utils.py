@@ -2,14 +2,28 @@
 
 This module contains notification processing utilities that can be used by both
 backend Django services and worker processes for consistent notification handling.
+
+Deliveries share one pooled HTTP session (single sends) or one pooled async
+client per batch (``WebhookDeliveryEngine``), and a process-wide per-host
+circuit breaker. Retries are never slept in-process: callers re-enqueue.
 """
 
+import asyncio
 import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
+from urllib.parse import urlsplit
 from uuid import UUID
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from unstract.core.notification_enums import AuthorizationType
 
@@ -18,6 +32,20 @@ logger = logging.getLogger(__name__)
 # Constants
 APPLICATION_JSON = "application/json"
 
+# Delivery pool sizing. Total sockets a batch may hold open, and how many of
+# them may target one host at a time — a slow customer endpoint can only ever
+# occupy its own share, never the whole pool.
+WEBHOOK_MAX_CONNECTIONS = int(os.environ.get("WEBHOOK_MAX_CONNECTIONS", "1000"))
+WEBHOOK_PER_HOST_CONCURRENCY = int(os.environ.get("WEBHOOK_PER_HOST_CONCURRENCY", "20"))
+# Consecutive retryable failures that open a host's circuit, and how long it
+# stays open before a single probe is let through.
+WEBHOOK_BREAKER_FAILURE_THRESHOLD = int(
+    os.environ.get("WEBHOOK_BREAKER_FAILURE_THRESHOLD", "5")
+)
+WEBHOOK_BREAKER_RESET_SECONDS = float(
+    os.environ.get("WEBHOOK_BREAKER_RESET_SECONDS", "60")
+)
+
 
 def serialize_notification_data(data: Any) -> Any:
     """Serialize notification data to handle UUIDs and datetimes.
@@ -107,6 +135,95 @@ def build_webhook_headers(
     return headers
 
 
+def webhook_host(url: str) -> str:
+    """Circuit-breaker / pool key for a webhook URL (scheme + host + port)."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class HostCircuitBreaker:
+    """Per-host circuit breaker shared by every delivery in the process.
+
+    A host's circuit opens after ``failure_threshold`` consecutive retryable
+    failures (connection errors, timeouts, 429 / 5xx). While open, deliveries to
+    it fail fast without a request; after ``reset_timeout`` one probe is let
+    through (half-open) — success closes the circuit, failure re-opens it.
+    Thread-safe; state is process-local.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = WEBHOOK_BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probing: set[str] = set()
+
+    def retry_after(self, host: str) -> float:
+        """Return 0 if a request to ``host`` may go out now, else seconds to wait.
+
+        Calling this when the open period has elapsed claims the half-open probe,
+        so concurrent callers keep failing fast until the probe reports back.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return 0.0
+            remaining = opened_at + self.reset_timeout - self._clock()
+            if remaining > 0:
+                return remaining
+            if host in self._probing:
+                return self.reset_timeout
+            self._probing.add(host)
+            return 0.0
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._probing.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if host in self._probing or failures >= self.failure_threshold:
+                if host not in self._opened_at or host in self._probing:
+                    logger.warning(
+                        f"Opening webhook circuit for {host} after {failures} "
+                        f"consecutive failures"
+                    )
+                self._opened_at[host] = self._clock()
+            self._probing.discard(host)
+
+
+_host_breaker = HostCircuitBreaker()
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Process-wide pooled session so repeat deliveries reuse connections."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=100, pool_maxsize=WEBHOOK_PER_HOST_CONCURRENCY
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
 def send_webhook_request(
     url: str,
     payload: dict[str, Any],
@@ -138,13 +255,27 @@ def send_webhook_request(
     """
     # Serialize payload to handle UUIDs and datetimes
     serialized_payload = serialize_notification_data(payload)
+    host = webhook_host(url)
 
     try:
         logger.debug(f"Sending webhook to {url} (attempt {current_retry + 1})")
 
-        response = requests.post(
-            url=url, json=serialized_payload, headers=headers or {}, timeout=timeout
-        )
+        wait = _host_breaker.retry_after(host)
+        if wait > 0:
+            raise requests.exceptions.ConnectionError(
+                f"Circuit open for {host}; retry in {wait:.0f}s"
+            )
+        try:
+            response = _get_session().post(
+                url=url, json=serialized_payload, headers=headers or {}, timeout=timeout
+            )
+        except requests.exceptions.RequestException:
+            _host_breaker.record_failure(host)
+            raise
+        if _is_retryable_status(response.status_code):
+            _host_breaker.record_failure(host)
+        else:
+            _host_breaker.record_success(host)
 
         # Check response status
         response.raise_for_status()
@@ -195,6 +326,157 @@ def send_webhook_request(
             }
 
 
+def _is_retryable_status(status_code: int) -> bool:
+    """429 and 5xx mean "try again later"; other 4xx will fail the same way."""
+    return status_code == 429 or status_code >= 500
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class WebhookDelivery:
+    """One outgoing webhook request; ``context`` is carried through untouched."""
+
+    url: str
+    payload: Any
+    headers: dict[str, str] = field(default_factory=dict)
+    timeout: float = 10
+    context: Any = None
+
+
+@dataclass
+class WebhookDeliveryResult:
+    """Outcome of one delivery.
+
+    ``retryable`` failures should be re-enqueued (not slept on) after
+    ``retry_after`` seconds when the endpoint or the open circuit said when.
+    """
+
+    delivery: WebhookDelivery
+    success: bool
+    status_code: int | None = None
+    response_text: str = ""
+    error: str | None = None
+    retryable: bool = False
+    retry_after: float | None = None
+
+
+class WebhookDeliveryEngine:
+    """Concurrent webhook delivery over one pooled async HTTP client.
+
+    All deliveries of a batch are in flight at once, bounded by
+    ``max_connections`` overall and ``per_host_concurrency`` per host, so one
+    slow endpoint cannot starve the others. A host whose circuit is open fails
+    fast. Nothing here retries or sleeps: retryable failures are returned for
+    the caller to re-enqueue with a countdown.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = WEBHOOK_MAX_CONNECTIONS,
+        per_host_concurrency: int = WEBHOOK_PER_HOST_CONCURRENCY,
+        breaker: HostCircuitBreaker | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.per_host_concurrency = per_host_concurrency
+        self.breaker = breaker or _host_breaker
+        self._transport = transport
+
+    def deliver(
+        self, deliveries: Sequence[WebhookDelivery]
+    ) -> list[WebhookDeliveryResult]:
+        """Deliver ``deliveries`` concurrently; results keep the input order."""
+        if not deliveries:
+            return []
+        return asyncio.run(self.deliver_async(deliveries))
+
+    async def deliver_async(
+        self, deliveries: Sequence[WebhookDelivery]
+    ) -> list[WebhookDeliveryResult]:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+        host_slots: dict[str, asyncio.Semaphore] = {}
+        async with httpx.AsyncClient(limits=limits, transport=self._transport) as client:
+            return list(
+                await asyncio.gather(
+                    *(self._deliver_one(client, host_slots, d) for d in deliveries)
+                )
+            )
+
+    async def _deliver_one(
+        self,
+        client: httpx.AsyncClient,
+        host_slots: dict[str, asyncio.Semaphore],
+        delivery: WebhookDelivery,
+    ) -> WebhookDeliveryResult:
+        host = webhook_host(delivery.url)
+        slot = host_slots.setdefault(host, asyncio.Semaphore(self.per_host_concurrency))
+        async with slot:
+            # Checked inside the slot so a circuit opened by earlier deliveries
+            # to the same host stops the rest of the batch for it.
+            wait = self.breaker.retry_after(host)
+            if wait > 0:
+                return WebhookDeliveryResult(
+                    delivery=delivery,
+                    success=False,
+                    error=f"Circuit open for {host}",
+                    retryable=True,
+                    retry_after=wait,
+                )
+            try:
+                response = await client.post(
+                    delivery.url,
+                    json=serialize_notification_data(delivery.payload),
+                    headers=delivery.headers,
+                    timeout=delivery.timeout,
+                )
+            except httpx.HTTPError as exc:
+                self.breaker.record_failure(host)
+                logger.warning(f"Webhook to {delivery.url} failed: {exc!r}")
+                return WebhookDeliveryResult(
+                    delivery=delivery, success=False, error=str(exc), retryable=True
+                )
+
+        status_code = response.status_code
+        if 200 <= status_code < 300:
+            self.breaker.record_success(host)
+            return WebhookDeliveryResult(
+                delivery=delivery,
+                success=True,
+                status_code=status_code,
+                response_text=response.text,
+            )
+        retryable = _is_retryable_status(status_code)
+        if retryable:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        return WebhookDeliveryResult(
+            delivery=delivery,
+            success=False,
+            status_code=status_code,
+            response_text=response.text,
+            error=f"Request to {delivery.url} failed with status code {status_code}",
+            retryable=retryable,
+            retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+
 def validate_webhook_data(
     url: str | None,
     payload: dict[str, Any] | None,
@@ -0,0 +1,225 @@
+"""Compression and offload for large ``pg_task_result`` payloads.
+
+Executor results (structure_pipeline, answer_prompt) can be megabytes of JSON
+with metadata and highlight data. Stored inline in the ``pg_task_result.result``
+JSONB column they bloat WAL, TOAST and vacuum on a hot table, so the writer may
+replace a large result with an **envelope** in the same column:
+
+- above ``PG_RESULT_COMPRESS_THRESHOLD_BYTES`` the JSON is gzip-compressed and
+  kept inline (base64) — ``{"__pg_result__": {"codec": "gzip", "data": ...}}``;
+- above ``PG_RESULT_OFFLOAD_THRESHOLD_BYTES`` the compressed bytes go to file
+  storage and only the reference stays in the row —
+  ``{"__pg_result__": {"codec": "gzip", "path": ...}}``.
+
+Both thresholds default to ``0`` (off): writer and readers live in separate
+trees and roll independently, and a reader that predates this module would hand
+the envelope to its caller as the result. Enable them once every reader decodes.
+
+Shared in ``unstract.core`` like :mod:`unstract.core.polling` — the workers'
+``PgResultBackend`` (psycopg2) and the backend's ``DjangoQueueTransport`` (ORM)
+both read the column, so the envelope format lives in one place. No Django /
+psycopg / SDK dependency: callers pass a factory for their ``FileStorage``, which
+is only built when a result is actually offloaded.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+import os
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Protocol, Self
+
+logger = logging.getLogger(__name__)
+
+ENVELOPE_KEY = "__pg_result__"
+CODEC_GZIP = "gzip"
+
+COMPRESS_THRESHOLD_ENV = "PG_RESULT_COMPRESS_THRESHOLD_BYTES"
+OFFLOAD_THRESHOLD_ENV = "PG_RESULT_OFFLOAD_THRESHOLD_BYTES"
+OFFLOAD_PATH_PREFIX_ENV = "PG_RESULT_OFFLOAD_PATH_PREFIX"
+DEFAULT_OFFLOAD_PATH_PREFIX = "unstract/pg-task-result"
+
+# gzip's default level: each result is compressed once, on the executor, and
+# decompressed once by its caller.
+_GZIP_LEVEL = 6
+
+
+class ResultStorage(Protocol):
+    """The slice of ``unstract.sdk1.file_storage.FileStorage`` used here."""
+
+    def read(self, path: str, mode: str) -> bytes | str: ...
+
+    def write(self, path: str, mode: str, data: bytes | str = "") -> int: ...
+
+    def mkdir(self, path: str, create_parents: bool) -> None: ...
+
+    def rm(self, path: str, recursive: bool = True) -> None: ...
+
+
+StorageFactory = Callable[[], ResultStorage]
+
+
+@dataclass(frozen=True)
+class ResultPayloadLimits:
+    """Size thresholds (bytes of serialized JSON); ``0`` disables a tier."""
+
+    compress_threshold: int = 0
+    offload_threshold: int = 0
+    offload_path_prefix: str = DEFAULT_OFFLOAD_PATH_PREFIX
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Read the thresholds per call so a flag flip needs no redeploy.
+
+        A malformed value disables its tier with a warning rather than failing
+        the result write.
+        """
+        return cls(
+            compress_threshold=_threshold_from_env(COMPRESS_THRESHOLD_ENV),
+            offload_threshold=_threshold_from_env(OFFLOAD_THRESHOLD_ENV),
+            offload_path_prefix=os.environ.get(
+                OFFLOAD_PATH_PREFIX_ENV, DEFAULT_OFFLOAD_PATH_PREFIX
+            ).rstrip("/"),
+        )
+
+
+def _threshold_from_env(name: str) -> int:
+    raw = os.environ.get(name, "0")
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring %s=%r: not an integer byte count", name, raw)
+        return 0
+
+
+@dataclass(frozen=True)
+class EncodedResult:
+    """The JSON text for the ``result`` column, plus any file written for it."""
+
+    json_text: str
+    offload_path: str | None = None
+
+
+def encode_result(
+    task_id: str,
+    result: dict[str, Any],
+    limits: ResultPayloadLimits,
+    storage_factory: StorageFactory,
+) -> EncodedResult:
+    """Serialize *result* for the ``result`` column, compressing/offloading by size.
+
+    Each offload writes a fresh path (``<prefix>/<task_id>-<uuid>.json.gz``) so an
+    at-least-once redelivery never overwrites the file a stored row points at;
+    the caller deletes :attr:`EncodedResult.offload_path` when its insert loses
+    the first-write-wins race. An offload that fails falls back to the inline
+    compressed form, so the result is still delivered.
+    """
+    raw = json.dumps(result).encode()
+    size = len(raw)
+    if not (limits.compress_threshold and size > limits.compress_threshold) and not (
+        limits.offload_threshold and size > limits.offload_threshold
+    ):
+        return EncodedResult(json_text=raw.decode())
+
+    compressed = gzip.compress(raw, compresslevel=_GZIP_LEVEL)
+    if limits.offload_threshold and size > limits.offload_threshold:
+        path = f"{limits.offload_path_prefix}/{task_id}-{uuid.uuid4().hex}.json.gz"
+        try:
+            storage = storage_factory()
+            storage.mkdir(limits.offload_path_prefix, create_parents=True)
+            storage.write(path=path, mode="wb", data=compressed)
+        except Exception:
+            logger.warning(
+                "Could not offload the %d-byte result of task_id=%s to %s; "
+                "storing it compressed inline instead",
+                size,
+                task_id,
+                path,
+                exc_info=True,
+            )
+        else:
+            envelope = {"codec": CODEC_GZIP, "path": path, "size": size}
+            return EncodedResult(
+                json_text=json.dumps({ENVELOPE_KEY: envelope}), offload_path=path
+            )
+
+    envelope = {
+        "codec": CODEC_GZIP,
+        "data": base64.b64encode(compressed).decode("ascii"),
+        "size": size,
+    }
+    return EncodedResult(json_text=json.dumps({ENVELOPE_KEY: envelope}))
+
+
+def _envelope(result: Any) -> dict[str, Any] | None:
+    if isinstance(result, dict) and len(result) == 1:
+        envelope = result.get(ENVELOPE_KEY)
+        if isinstance(envelope, dict):
+            return envelope
+    return None
+
+
+def decode_result(
+    result: dict[str, Any] | None, storage_factory: StorageFactory
+) -> dict[str, Any] | None:
+    """Return the original result for a ``result`` column value.
+
+    Plain (inline) values pass through untouched, as does ``None`` (a failed row
+    or a consumed tombstone). Raises if an offloaded file cannot be read — the
+    row is then unusable, the same as a corrupt payload.
+    """
+    envelope = _envelope(result)
+    if envelope is None:
+        return result
+    if envelope.get("codec") != CODEC_GZIP:
+        raise ValueError(f"Unsupported pg_task_result codec: {envelope.get('codec')!r}")
+    if "data" in envelope:
+        compressed = base64.b64decode(envelope["data"])
+    else:
+        compressed = storage_factory().read(path=envelope["path"], mode="rb")
+    return json.loads(gzip.decompress(compressed))
+
+
+def offload_path(result: Any) -> str | None:
+    """The file an encoded ``result`` column value points at, if any."""
+    envelope = _envelope(result)
+    return envelope.get("path") if envelope else None
+
+
+def delete_offloaded(paths: Iterable[str], storage_factory: StorageFactory) -> int:
+    """Best-effort delete of offloaded result files; returns how many were removed.
+
+    Never raises: callers run this after the row is already gone or cleared, so
+    a storage failure only leaves an orphaned file (logged) behind.
+    """
+    paths = [path for path in paths if path]
+    if not paths:
+        return 0
+    removed = 0
+    try:
+        storage = storage_factory()
+    except Exception:
+        logger.warning(
+            "Could not open file storage to delete %d offloaded result(s)",
+            len(paths),
+            exc_info=True,
+        )
+        return 0
+    for path in paths:
+        try:
+            storage.rm(path=path, recursive=False)
+            removed += 1
+        except FileNotFoundError:
+            removed += 1
+        except Exception:
+            logger.warning(
+                "Could not delete offloaded result %s; it is orphaned",
+                path,
+                exc_info=True,
+            )
+    return removed
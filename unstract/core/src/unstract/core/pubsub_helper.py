@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import threading
 import time
 import traceback
 from datetime import UTC, datetime
@@ -22,6 +23,9 @@ class LogPublisher:
     )
     kombu_conn = Connection(broker_url)
     _redis_client: Any = None
+    # The shared broker connection is not thread-safe; file-processing workers
+    # may publish from several threads of one batch at once.
+    _publish_lock = threading.Lock()
 
     @classmethod
     def _get_redis_client(cls) -> Any:
@@ -158,33 +162,50 @@ class LogPublisher:
     @classmethod
     def publish(cls, channel_id: str, payload: dict[str, Any]) -> bool:
         """Publish a message to the queue."""
+        return cls.publish_batch(channel_id, [payload])
+
+    @classmethod
+    def publish_batch(cls, channel_id: str, payloads: list[dict[str, Any]]) -> bool:
+        """Publish several messages to the queue in one go.
+
+        Each payload is still its own ``logs_consumer`` task, but the batch
+        shares one producer (one channel checkout) and its unified
+        notification writes go to Redis in a single pipeline.
+        """
+        if not payloads:
+            return True
         try:
             event = f"logs:{channel_id}"
-            with cls.kombu_conn.Producer(serializer="json") as producer:
-                task_message = cls._get_task_message(
-                    user_session_id=channel_id,
-                    event=event,
-                    message=payload,
-                )
-                headers = cls._get_task_header(LogProcessingTask.TASK_NAME)
-                # Publish the message to the queue
-                producer.publish(
-                    body=task_message,
-                    exchange="",
-                    headers=headers,
-                    routing_key=LogProcessingTask.QUEUE_NAME,
-                    compression=None,
-                    retry=True,
-                )
-                logging.debug(f"Published '{channel_id}' <= {payload}")
-
-                # Persisting messages for unified notification
-                if payload.get("type") == "LOG":
-                    cls.store_for_unified_notification(event, payload)
+            headers = cls._get_task_header(LogProcessingTask.TASK_NAME)
+            with (
+                cls._publish_lock,
+                cls.kombu_conn.Producer(serializer="json") as producer,
+            ):
+                for payload in payloads:
+                    task_message = cls._get_task_message(
+                        user_session_id=channel_id,
+                        event=event,
+                        message=payload,
+                    )
+                    # Publish the message to the queue
+                    producer.publish(
+                        body=task_message,
+                        exchange="",
+                        headers=headers,
+                        routing_key=LogProcessingTask.QUEUE_NAME,
+                        compression=None,
+                        retry=True,
+                    )
+                    logging.debug(f"Published '{channel_id}' <= {payload}")
+
+            # Persisting messages for unified notification
+            notifications = [p for p in payloads if p.get("type") == "LOG"]
+            if notifications:
+                cls.store_for_unified_notification_batch(event, notifications)
         except Exception as e:
             logging.error(
-                f"Failed to publish '{channel_id}' <= {payload}"
-                f": {e}\n{traceback.format_exc()}"
+                f"Failed to publish {len(payloads)} message(s) to '{channel_id}' "
+                f"<= {payloads[-1]}: {e}\n{traceback.format_exc()}"
             )
             return False
         return True
@@ -200,16 +221,30 @@ class LogPublisher:
             event (str): User session ID
             payload (dict[str, Any]): Message being sent
         """
+        cls.store_for_unified_notification_batch(event, [payload])
+
+    @classmethod
+    def store_for_unified_notification_batch(
+        cls, event: str, payloads: list[dict[str, Any]]
+    ) -> None:
+        """Persist several unified notification messages in one Redis round trip.
+
+        Args:
+            event (str): User session ID
+            payloads (list[dict[str, Any]]): Messages being sent
+        """
         try:
             logs_expiration = os.environ.get(
                 "LOGS_EXPIRATION_TIME_IN_SECOND", "3600"
             )  # Defaults to 1 hour
-            timestamp = payload.get("timestamp", round(time.time(), 6))
-            redis_key = f"{event}:{timestamp}"
-            log_data = json.dumps(payload)
-            cls._get_redis_client().setex(redis_key, logs_expiration, log_data)
+            pipeline = cls._get_redis_client().pipeline(transaction=False)
+            for payload in payloads:
+                timestamp = payload.get("timestamp", round(time.time(), 6))
+                redis_key = f"{event}:{timestamp}"
+                pipeline.setex(redis_key, logs_expiration, json.dumps(payload))
+            pipeline.execute()
         except Exception as e:
             logging.error(
-                f"Failed to store unified notification log for '{event}' "
-                f"<= {payload}: {e}\n{traceback.format_exc()}"
+                f"Failed to store {len(payloads)} unified notification log(s) for "
+                f"'{event}' <= {payloads[-1]}: {e}\n{traceback.format_exc()}"
             )
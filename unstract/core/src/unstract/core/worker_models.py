@@ -954,6 +954,9 @@ class FileProcessingResult:
     # Duplicate detection indicator
     is_duplicate_skip: bool = False  # True when file skipped due to duplicate detection
 
+    # Continuation indicator
+    is_deferred: bool = False  # True when the file resumes in an executor continuation
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for backward compatibility."""
         return serialize_dataclass_to_dict(self)
@@ -976,6 +979,7 @@ class FileProcessingResult:
             destination_processed=data.get("destination_processed", True),
             destination_error=data.get("destination_error"),
             is_duplicate_skip=data.get("is_duplicate_skip", False),
+            is_deferred=data.get("is_deferred", False),
         )
 
     def is_successful(self) -> bool:
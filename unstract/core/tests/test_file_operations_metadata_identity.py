@@ -0,0 +1,78 @@
+"""Unit tests for the metadata-derived file identity used at discovery.
+
+Providers that expose no checksum fall back to a size + modified-time identity
+so file history can skip already-processed files without downloading them.
+"""
+
+import unittest
+from datetime import UTC, datetime
+from unittest import mock
+
+from unstract.core.file_operations import FileOperations
+
+_MODIFIED = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+
+def _fs(checksum=None, modified=_MODIFIED):
+    fs = mock.Mock(spec=["extract_metadata_file_hash", "extract_modified_date"])
+    fs.extract_metadata_file_hash.return_value = checksum
+    fs.extract_modified_date.return_value = modified
+    return fs
+
+
+class MetadataFileIdentityTests(unittest.TestCase):
+    def test_same_size_and_mtime_give_same_identity(self):
+        first = FileOperations.compute_metadata_file_identity(_fs(), {"size": 10})
+        second = FileOperations.compute_metadata_file_identity(_fs(), {"size": 10})
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 64)
+
+    def test_size_or_mtime_change_gives_new_identity(self):
+        base = FileOperations.compute_metadata_file_identity(_fs(), {"size": 10})
+        resized = FileOperations.compute_metadata_file_identity(_fs(), {"size": 11})
+        touched = FileOperations.compute_metadata_file_identity(
+            _fs(modified=datetime(2026, 1, 2, 3, 4, 6, tzinfo=UTC)), {"size": 10}
+        )
+        self.assertNotEqual(base, resized)
+        self.assertNotEqual(base, touched)
+
+    def test_missing_size_or_mtime_gives_none(self):
+        self.assertIsNone(FileOperations.compute_metadata_file_identity(_fs(), {}))
+        self.assertIsNone(
+            FileOperations.compute_metadata_file_identity(
+                _fs(modified=None), {"size": 10}
+            )
+        )
+
+    def test_modified_date_errors_give_none(self):
+        fs = _fs()
+        fs.extract_modified_date.side_effect = ValueError("bad mtime")
+        self.assertIsNone(FileOperations.compute_metadata_file_identity(fs, {"size": 1}))
+
+
+class CreateFileHashIdentityTests(unittest.TestCase):
+    def _create(self, fs):
+        return FileOperations.create_file_hash_from_backend_logic(
+            file_path="/in/a.pdf",
+            source_fs=fs,
+            source_connection_type="FILESYSTEM",
+            file_size=10,
+            fs_metadata={"size": 10},
+        )
+
+    def test_provider_checksum_is_preferred(self):
+        self.assertEqual(
+            self._create(_fs(checksum="etag-1")).provider_file_uuid, "etag-1"
+        )
+
+    def test_falls_back_to_metadata_identity(self):
+        file_hash = self._create(_fs())
+        self.assertEqual(
+            file_hash.provider_file_uuid,
+            FileOperations.compute_metadata_file_identity(_fs(), {"size": 10}),
+        )
+        self.assertIsNone(file_hash.file_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Unit tests for compressing / offloading large ``pg_task_result`` payloads.
+
+Below the thresholds a result is stored as plain JSON exactly as before; above
+them it becomes a small envelope that ``decode_result`` restores, inline
+(compressed) or from file storage (offloaded).
+"""
+
+import json
+import unittest
+from unittest import mock
+
+from unstract.core.pg_result_payload import (
+    ENVELOPE_KEY,
+    ResultPayloadLimits,
+    decode_result,
+    delete_offloaded,
+    encode_result,
+    offload_path,
+)
+
+_RESULT = {"output": {"answer": "x" * 2000}, "metadata": {"highlight": [1, 2, 3]}}
+
+
+class _MemoryStorage:
+    def __init__(self):
+        self.files = {}
+
+    def read(self, path, mode):
+        return self.files[path]
+
+    def write(self, path, mode, data=""):
+        self.files[path] = data
+        return len(data)
+
+    def mkdir(self, path, create_parents):
+        pass
+
+    def rm(self, path, recursive=True):
+        del self.files[path]
+
+
+class EncodeDecodeTests(unittest.TestCase):
+    def setUp(self):
+        self.storage = _MemoryStorage()
+
+    def _encode(self, **limits):
+        return encode_result(
+            "task-1", _RESULT, ResultPayloadLimits(**limits), lambda: self.storage
+        )
+
+    def test_disabled_by_default_stores_plain_json(self):
+        encoded = self._encode()
+        self.assertEqual(json.loads(encoded.json_text), _RESULT)
+        self.assertIsNone(encoded.offload_path)
+
+    def test_small_result_stays_plain(self):
+        encoded = self._encode(compress_threshold=10**6, offload_threshold=10**7)
+        self.assertEqual(json.loads(encoded.json_text), _RESULT)
+
+    def test_large_result_is_compressed_inline(self):
+        encoded = self._encode(compress_threshold=100)
+        column = json.loads(encoded.json_text)
+        self.assertEqual(list(column), [ENVELOPE_KEY])
+        self.assertLess(len(encoded.json_text), len(json.dumps(_RESULT)))
+        self.assertEqual(decode_result(column, lambda: self.storage), _RESULT)
+        self.assertEqual(self.storage.files, {})
+
+    def test_huge_result_is_offloaded_by_reference(self):
+        encoded = self._encode(compress_threshold=100, offload_threshold=1000)
+        column = json.loads(encoded.json_text)
+        self.assertEqual(offload_path(column), encoded.offload_path)
+        self.assertIn(encoded.offload_path, self.storage.files)
+        self.assertTrue(
+            encoded.offload_path.startswith("unstract/pg-task-result/task-1-")
+        )
+        self.assertEqual(decode_result(column, lambda: self.storage), _RESULT)
+
+    def test_each_offload_gets_its_own_path(self):
+        first = self._encode(offload_threshold=1000)
+        second = self._encode(offload_threshold=1000)
+        self.assertNotEqual(first.offload_path, second.offload_path)
+
+    def test_failed_offload_falls_back_to_inline(self):
+        broken = mock.Mock()
+        broken.write.side_effect = OSError("bucket unavailable")
+        encoded = encode_result(
+            "task-1", _RESULT, ResultPayloadLimits(offload_threshold=1000), lambda: broken
+        )
+        self.assertIsNone(encoded.offload_path)
+        column = json.loads(encoded.json_text)
+        self.assertIsNone(offload_path(column))
+        self.assertEqual(decode_result(column, lambda: self.storage), _RESULT)
+
+    def test_plain_and_null_values_pass_through(self):
+        factory = mock.Mock()
+        self.assertEqual(decode_result({"a": 1}, factory), {"a": 1})
+        self.assertIsNone(decode_result(None, factory))
+        self.assertIsNone(offload_path({"a": 1}))
+        factory.assert_not_called()
+
+
+class LimitsFromEnvTests(unittest.TestCase):
+    def test_reads_thresholds_and_prefix(self):
+        env = {
+            "PG_RESULT_COMPRESS_THRESHOLD_BYTES": "65536",
+            "PG_RESULT_OFFLOAD_THRESHOLD_BYTES": "1048576",
+            "PG_RESULT_OFFLOAD_PATH_PREFIX": "bucket/results/",
+        }
+        with mock.patch.dict("os.environ", env):
+            limits = ResultPayloadLimits.from_env()
+        self.assertEqual(limits, ResultPayloadLimits(65536, 1048576, "bucket/results"))
+
+    def test_invalid_threshold_disables_the_tier(self):
+        with mock.patch.dict("os.environ", {"PG_RESULT_COMPRESS_THRESHOLD_BYTES": "1MB"}):
+            self.assertEqual(ResultPayloadLimits.from_env().compress_threshold, 0)
+
+
+class DeleteOffloadedTests(unittest.TestCase):
+    def test_deletes_files_and_skips_empty_paths(self):
+        storage = _MemoryStorage()
+        storage.files = {"p/a": b"", "p/b": b""}
+        self.assertEqual(delete_offloaded(["p/a", None, "p/b"], lambda: storage), 2)
+        self.assertEqual(storage.files, {})
+
+    def test_missing_file_counts_as_deleted(self):
+        storage = mock.Mock()
+        storage.rm.side_effect = FileNotFoundError("p/a")
+        self.assertEqual(delete_offloaded(["p/a"], lambda: storage), 1)
+
+    def test_storage_failure_is_logged_not_raised(self):
+        storage = mock.Mock()
+        storage.rm.side_effect = OSError("denied")
+        with self.assertLogs("unstract.core.pg_result_payload", "WARNING"):
+            self.assertEqual(delete_offloaded(["p/a"], lambda: storage), 0)
+
+    def test_nothing_to_delete_builds_no_storage(self):
+        factory = mock.Mock()
+        self.assertEqual(delete_offloaded([None], factory), 0)
+        factory.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
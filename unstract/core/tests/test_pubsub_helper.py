@@ -0,0 +1,82 @@
+"""Unit tests for ``LogPublisher.publish_batch``.
+
+A batch is still one ``logs_consumer`` task per payload, but it is published
+through a single producer and its unified-notification copies (LOG payloads
+only) are written to Redis in a single pipeline.
+"""
+
+import unittest
+from unittest import mock
+
+from unstract.core.constants import LogProcessingTask
+from unstract.core.pubsub_helper import LogPublisher
+
+
+def _payload(log_type, message):
+    return {"type": log_type, "timestamp": float(len(message)), "log": message}
+
+
+class PublishBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.kombu_conn = mock.MagicMock()
+        self.producer = self.kombu_conn.Producer.return_value.__enter__.return_value
+        self.redis = mock.MagicMock()
+        self.pipeline = self.redis.pipeline.return_value
+        patches = [
+            mock.patch.object(LogPublisher, "kombu_conn", self.kombu_conn),
+            mock.patch.object(LogPublisher, "_redis_client", self.redis),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_batch_shares_one_producer(self):
+        payloads = [_payload("LOG", "a"), _payload("UPDATE", "bb"), _payload("LOG", "c")]
+        self.assertTrue(LogPublisher.publish_batch("channel", payloads))
+
+        self.kombu_conn.Producer.assert_called_once_with(serializer="json")
+        self.assertEqual(self.producer.publish.call_count, 3)
+        bodies = [c.kwargs["body"] for c in self.producer.publish.call_args_list]
+        self.assertEqual([b["kwargs"]["message"] for b in bodies], payloads)
+        for call in self.producer.publish.call_args_list:
+            self.assertEqual(call.kwargs["routing_key"], LogProcessingTask.QUEUE_NAME)
+            self.assertEqual(
+                call.kwargs["headers"], {"task": LogProcessingTask.TASK_NAME}
+            )
+
+    def test_only_log_payloads_are_stored_in_one_pipeline(self):
+        LogPublisher.publish_batch(
+            "channel",
+            [_payload("LOG", "a"), _payload("UPDATE", "bb"), _payload("LOG", "ccc")],
+        )
+
+        self.redis.pipeline.assert_called_once_with(transaction=False)
+        stored_keys = [c.args[0] for c in self.pipeline.setex.call_args_list]
+        self.assertEqual(stored_keys, ["logs:channel:1.0", "logs:channel:3.0"])
+        self.pipeline.execute.assert_called_once()
+        self.redis.setex.assert_not_called()
+
+    def test_batch_without_log_payloads_skips_redis(self):
+        LogPublisher.publish_batch("channel", [_payload("UPDATE", "a")])
+        self.redis.pipeline.assert_not_called()
+
+    def test_empty_batch_is_a_no_op(self):
+        self.assertTrue(LogPublisher.publish_batch("channel", []))
+        self.kombu_conn.Producer.assert_not_called()
+
+    def test_publish_failure_returns_false(self):
+        self.producer.publish.side_effect = ConnectionError("broker down")
+        with self.assertLogs(level="ERROR"):
+            self.assertFalse(
+                LogPublisher.publish_batch("channel", [_payload("LOG", "a")])
+            )
+        self.redis.pipeline.assert_not_called()
+
+    def test_publish_is_a_batch_of_one(self):
+        self.assertTrue(LogPublisher.publish("channel", _payload("LOG", "a")))
+        self.producer.publish.assert_called_once()
+        self.pipeline.setex.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Concurrent webhook delivery engine and per-host circuit breaker."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from unstract.core.notification_utils import (
+    HostCircuitBreaker,
+    WebhookDelivery,
+    WebhookDeliveryEngine,
+    _parse_retry_after,
+    webhook_host,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> HostCircuitBreaker:
+    return HostCircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+
+
+def _engine(handler, breaker, **kwargs) -> WebhookDeliveryEngine:
+    return WebhookDeliveryEngine(
+        breaker=breaker, transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def test_webhook_host_keys_on_scheme_host_and_port():
+    assert webhook_host("https://Hooks.Example.com:8443/a?b=1") == (
+        "https://hooks.example.com:8443"
+    )
+
+
+def test_breaker_opens_after_threshold_then_half_opens(breaker, clock):
+    host = "https://h"
+    breaker.record_failure(host)
+    assert breaker.retry_after(host) == 0
+
+    breaker.record_failure(host)
+    assert breaker.retry_after(host) == pytest.approx(30)
+
+    clock.now += 31
+    assert breaker.retry_after(host) == 0  # this caller is the probe
+    assert breaker.retry_after(host) == 30  # others keep failing fast
+
+    breaker.record_success(host)
+    assert breaker.retry_after(host) == 0
+
+
+def test_failed_probe_reopens_circuit(breaker, clock):
+    host = "https://h"
+    breaker.record_failure(host)
+    breaker.record_failure(host)
+    clock.now += 31
+    assert breaker.retry_after(host) == 0
+
+    breaker.record_failure(host)
+    assert breaker.retry_after(host) == pytest.approx(30)
+
+
+def test_parse_retry_after_seconds_and_garbage():
+    assert _parse_retry_after("12") == 12
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def test_results_keep_input_order_and_classify_failures(breaker):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/ok":
+            return httpx.Response(200, text="fine")
+        if path == "/busy":
+            return httpx.Response(503, headers={"Retry-After": "7"})
+        if path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(400)
+
+    deliveries = [
+        WebhookDelivery(url=f"https://h{i}{path}", payload={"i": i}, context=i)
+        for i, path in enumerate(["/ok", "/busy", "/down", "/bad"])
+    ]
+    results = _engine(handler, breaker).deliver(deliveries)
+
+    assert [r.delivery.context for r in results] == [0, 1, 2, 3]
+    ok, busy, down, bad = results
+    assert ok.success and ok.status_code == 200 and ok.response_text == "fine"
+    assert not busy.success and busy.retryable and busy.retry_after == 7
+    assert not down.success and down.retryable
+    assert not bad.success and not bad.retryable
+
+
+def test_open_circuit_fails_fast_without_a_request(breaker):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500)
+
+    deliveries = [WebhookDelivery(url="https://slow/hook", payload={}) for _ in range(5)]
+    results = _engine(handler, breaker, per_host_concurrency=1).deliver(deliveries)
+
+    # Two 500s open the circuit; the remaining three never reach the host.
+    assert len(calls) == 2
+    assert all(r.retryable for r in results)
+    assert [r.retry_after for r in results[2:]] == [pytest.approx(30)] * 3
+
+
+def test_per_host_concurrency_is_bounded(breaker):
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return httpx.Response(204)
+
+    deliveries = [WebhookDelivery(url="https://one/hook", payload={}) for _ in range(12)]
+    results = _engine(handler, breaker, per_host_concurrency=3).deliver(deliveries)
+
+    assert all(r.success for r in results)
+    assert in_flight["peak"] == 3
+
+
+def test_payload_is_serialized(breaker):
+    import uuid
+
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = request.content
+        return httpx.Response(200)
+
+    value = uuid.uuid4()
+    _engine(handler, breaker).deliver(
+        [WebhookDelivery(url="https://h/x", payload={"id": value})]
+    )
+    assert str(value).encode() in seen["body"]
@@ -3,6 +3,7 @@
 import logging
 
 from .client.flipt import FliptClient
+from .snapshot import get_local_evaluator
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +29,29 @@ def check_feature_flag_status(
     Returns:
         bool:
         True if the feature flag is enabled for the entity, False otherwise.
+
+    With ``FLIPT_LOCAL_EVALUATION=true`` the flag is evaluated in memory from
+    the process's rules snapshot (see :mod:`unstract.flags.snapshot`); Flipt
+    is only called when no snapshot could be loaded yet.
     """
+    try:
+        evaluator = get_local_evaluator()
+        if evaluator is not None and evaluator.ready():
+            return evaluator.evaluate_boolean(
+                flag_key=flag_key, entity_id=entity_id, context=context
+            )
+    except Exception:
+        logger.warning(
+            "check_feature_flag_status: local evaluation failed for flag %r; "
+            "treating as disabled",
+            flag_key,
+            exc_info=True,
+        )
+        return False
     try:
         # Initialize Flipt client
         client = FliptClient()
 
-        logger.info(f"Client has been Initialised {client.list_feature_flags()}")
-
         # Evaluate boolean flag
         result = client.evaluate_boolean(
             flag_key=flag_key,
@@ -130,6 +147,21 @@ def check_feature_flag_variant(
         "variant_attachment": "",
         "segment_keys": [],
     }
+    try:
+        evaluator = get_local_evaluator()
+        if evaluator is not None and evaluator.ready():
+            result = evaluator.evaluate_variant(
+                flag_key=flag_key, entity_id=entity_id, context=context
+            )
+            return result if result["enabled"] else default_result
+    except Exception:
+        logger.warning(
+            "check_feature_flag_variant: local evaluation failed for flag %r; "
+            "returning disabled default",
+            flag_key,
+            exc_info=True,
+        )
+        return default_result
     try:
         client = FliptClient()
 
@@ -0,0 +1,460 @@
+"""Process-local feature-flag evaluation from a refreshed rules snapshot.
+
+Instead of one gRPC round trip per evaluation, :class:`LocalFlagEvaluator`
+keeps the namespace's flag rules (the snapshot Flipt serves to its
+client-side SDKs) in memory and evaluates boolean and variant flags locally.
+A daemon thread refreshes the snapshot every TTL; the source reports
+"unchanged" through an ETag, so an idle refresh costs one conditional request.
+If the source can't be reached the last good snapshot keeps serving.
+
+Sources:
+    - :class:`FliptSnapshotSource` — Flipt's HTTP snapshot endpoint
+      (``/internal/v1/evaluation/snapshot/namespace/<ns>``).
+    - :class:`FileSnapshotSource` — a JSON file in the same format, for tests
+      and air-gapped setups.
+
+Enable with ``FLIPT_LOCAL_EVALUATION=true``. ``FLIPT_SNAPSHOT_FILE`` selects
+the file source; otherwise ``FLIPT_SNAPSHOT_URL`` (default
+``http://<EVALUATION_SERVER_IP>:<FLIPT_HTTP_PORT or 8080>``) is polled every
+``FLIPT_SNAPSHOT_TTL`` seconds (default 30).
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import zlib
+from collections.abc import Callable
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 30.0
+
+# Flipt buckets variant distributions into 1000 slots (0.1% resolution).
+_TOTAL_BUCKETS = 1000
+_PERCENT_MULTIPLIER = _TOTAL_BUCKETS / 100
+
+
+class SnapshotSource(Protocol):
+    def fetch(self, etag: str | None) -> tuple[str | None, dict[str, Any]] | None:
+        """Return ``(etag, snapshot)``, or None when unchanged since ``etag``."""
+
+
+class FliptSnapshotSource:
+    """Flipt's HTTP evaluation-snapshot endpoint, fetched conditionally."""
+
+    def __init__(
+        self,
+        base_url: str,
+        namespace_key: str = "default",
+        timeout: float = 5.0,
+        client_token: str | None = None,
+    ) -> None:
+        self.url = (
+            f"{base_url.rstrip('/')}/internal/v1/evaluation/snapshot/namespace/"
+            f"{namespace_key}"
+        )
+        self.timeout = timeout
+        self.client_token = client_token
+
+    def fetch(self, etag: str | None) -> tuple[str | None, dict[str, Any]] | None:
+        request = urllib.request.Request(self.url, headers={"Accept": "application/json"})
+        if etag:
+            request.add_header("If-None-Match", etag)
+        if self.client_token:
+            request.add_header("Authorization", f"Bearer {self.client_token}")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.headers.get("ETag"), json.load(response)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+
+class FileSnapshotSource:
+    """A snapshot JSON file; its modification time and size act as the ETag."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def fetch(self, etag: str | None) -> tuple[str | None, dict[str, Any]] | None:
+        stat = os.stat(self.path)
+        current = f"{stat.st_mtime_ns}-{stat.st_size}"
+        if current == etag:
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            return current, json.load(f)
+
+
+def _threshold_bucket(entity_id: str, flag_key: str) -> int:
+    """Flipt's boolean threshold bucket: ``crc32(entityId + flagKey) % 100``."""
+    return zlib.crc32(f"{entity_id}{flag_key}".encode()) % 100
+
+
+def _variant_bucket(flag_key: str, entity_id: str) -> int:
+    """Flipt's variant bucket: ``crc32(flagKey + entityId) % 1000``.
+
+    Note the order differs from the boolean threshold hash; both mirror Flipt
+    so a flag evaluated locally lands in the same bucket as on the server.
+    """
+    return zlib.crc32(f"{flag_key}{entity_id}".encode()) % _TOTAL_BUCKETS
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.UTC)
+    return parsed
+
+
+def _compare(operator: str, actual: Any, expected: Any) -> bool:
+    return {
+        "eq": actual == expected,
+        "neq": actual != expected,
+        "lt": actual < expected,
+        "lte": actual <= expected,
+        "gt": actual > expected,
+        "gte": actual >= expected,
+    }.get(operator, False)
+
+
+def _one_of(value: Any, raw: str, cast: Callable[[Any], Any]) -> bool:
+    try:
+        return value in {cast(v) for v in json.loads(raw)}
+    except (TypeError, ValueError):
+        return False
+
+
+def _match_constraint(
+    constraint: dict[str, Any], context: dict[str, str], entity_id: str
+) -> bool:
+    kind = constraint.get("type", "STRING_COMPARISON_TYPE")
+    operator = str(constraint.get("operator", "")).lower()
+    expected = str(constraint.get("value", ""))
+    if kind == "ENTITY_ID_COMPARISON_TYPE":
+        value: str | None = entity_id
+    else:
+        value = context.get(constraint.get("property", ""))
+
+    if operator == "present":
+        return bool(value)
+    if operator == "notpresent":
+        return not value
+
+    try:
+        if kind == "NUMBER_COMPARISON_TYPE":
+            if not value:
+                return False
+            number = float(value)
+            if operator == "isoneof":
+                return _one_of(number, expected, float)
+            if operator == "isnotoneof":
+                return not _one_of(number, expected, float)
+            return _compare(operator, number, float(expected))
+        if kind == "BOOLEAN_COMPARISON_TYPE":
+            if not value:
+                return False
+            flag = {"true": True, "false": False}[value.strip().lower()]
+            return flag is (operator == "true")
+        if kind == "DATETIME_COMPARISON_TYPE":
+            if not value:
+                return False
+            return _compare(operator, _parse_datetime(value), _parse_datetime(expected))
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    # String and entity-id comparisons; a missing property compares as "".
+    value = value or ""
+    if operator == "empty":
+        return not value.strip()
+    if operator == "notempty":
+        return bool(value.strip())
+    if operator == "prefix":
+        return value.startswith(expected)
+    if operator == "suffix":
+        return value.endswith(expected)
+    if operator == "contains":
+        return expected in value
+    if operator == "notcontains":
+        return expected not in value
+    if operator == "isoneof":
+        return _one_of(value, expected, str)
+    if operator == "isnotoneof":
+        return not _one_of(value, expected, str)
+    return _compare(operator, value, expected) if operator in ("eq", "neq") else False
+
+
+def _match_segment(
+    segment: dict[str, Any], context: dict[str, str], entity_id: str
+) -> bool:
+    constraints = segment.get("constraints") or []
+    if not constraints:
+        return True
+    results = (_match_constraint(c, context, entity_id) for c in constraints)
+    if segment.get("matchType") == "ANY_SEGMENT_MATCH_TYPE":
+        return any(results)
+    return all(results)
+
+
+def _match_segments(
+    holder: dict[str, Any], context: dict[str, str], entity_id: str
+) -> list[str] | None:
+    """Matched segment keys when ``holder``'s segments apply, else None."""
+    segments = holder.get("segments") or []
+    matched = [
+        s.get("key", "") for s in segments if _match_segment(s, context, entity_id)
+    ]
+    if not matched:
+        return None
+    if holder.get("segmentOperator") == "AND_SEGMENT_OPERATOR" and len(matched) != len(
+        segments
+    ):
+        return None
+    return matched
+
+
+def _by_rank(items: list[dict[str, Any]] | None) -> list[dict[str, Any]]:
+    return sorted(items or [], key=lambda item: item.get("rank", 0))
+
+
+def evaluate_boolean_flag(
+    flag: dict[str, Any], entity_id: str, context: dict[str, str]
+) -> bool:
+    """Flipt boolean evaluation: first matching rollout, else the flag's state."""
+    for rollout in _by_rank(flag.get("rollouts")):
+        if rollout.get("type") == "THRESHOLD_ROLLOUT_TYPE":
+            threshold = rollout.get("threshold") or {}
+            bucket = _threshold_bucket(entity_id, flag["key"])
+            if bucket < float(threshold.get("percentage", 0)):
+                return bool(threshold.get("value", False))
+        elif rollout.get("type") == "SEGMENT_ROLLOUT_TYPE":
+            segment = rollout.get("segment") or {}
+            if _match_segments(segment, context, entity_id) is not None:
+                return bool(segment.get("value", False))
+    return bool(flag.get("enabled", False))
+
+
+def evaluate_variant_flag(
+    flag: dict[str, Any], entity_id: str, context: dict[str, str]
+) -> dict[str, Any]:
+    """Flipt variant evaluation, in ``FliptClient.evaluate_variant``'s shape."""
+    result: dict[str, Any] = {
+        "match": False,
+        "variant_key": "",
+        "variant_attachment": "",
+        "segment_keys": [],
+    }
+    if not flag.get("enabled", False):
+        return result
+    for rule in _by_rank(flag.get("rules")):
+        segment_keys = _match_segments(rule, context, entity_id)
+        if segment_keys is None:
+            continue
+        result["segment_keys"] = segment_keys
+        distributions = [
+            d for d in rule.get("distributions") or [] if float(d.get("rollout", 0)) > 0
+        ]
+        if not distributions:
+            result["match"] = True
+            return result
+        bucket = _variant_bucket(flag["key"], entity_id)
+        # Flipt truncates each cumulative boundary to a whole bucket.
+        upper = 0
+        for distribution in distributions:
+            upper = int(float(distribution["rollout"]) * _PERCENT_MULTIPLIER + upper)
+            if bucket < upper:
+                result.update(
+                    match=True,
+                    variant_key=distribution.get("variantKey", ""),
+                    variant_attachment=distribution.get("variantAttachment", ""),
+                )
+                return result
+        return result
+    default = flag.get("defaultVariant") or {}
+    if default:
+        result["variant_key"] = default.get("key", "")
+        result["variant_attachment"] = default.get("attachment", "")
+    return result
+
+
+class LocalFlagEvaluator:
+    """Evaluates flags in memory against a periodically refreshed snapshot."""
+
+    def __init__(
+        self,
+        source: SnapshotSource,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.source = source
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flags: dict[str, dict[str, Any]] | None = None
+        self._etag: str | None = None
+        self._attempted_at: float | None = None
+        self._refresher: threading.Thread | None = None
+        self._refresher_pid: int | None = None
+        self._stop = threading.Event()
+        self.last_error: Exception | None = None
+
+    def ready(self) -> bool:
+        """Whether a snapshot is loaded, loading it inline if it's due."""
+        return self._snapshot() is not None
+
+    def refresh(self) -> bool:
+        """Fetch the snapshot if it changed; True when the rules were replaced.
+
+        On failure the last good snapshot stays in place.
+        """
+        with self._lock:
+            self._attempted_at = self._clock()
+            try:
+                fetched = self.source.fetch(self._etag)
+            except Exception as e:
+                self.last_error = e
+                logger.warning(
+                    "Feature flag snapshot refresh failed; %s",
+                    "serving last good snapshot"
+                    if self._flags is not None
+                    else "no snapshot",
+                    exc_info=True,
+                )
+                return False
+            self.last_error = None
+            if fetched is None:
+                return False
+            etag, snapshot = fetched
+            self._flags = {
+                flag["key"]: flag for flag in snapshot.get("flags") or [] if "key" in flag
+            }
+            self._etag = etag
+            logger.debug(
+                "Feature flag snapshot loaded: %d flags (etag=%s)", len(self._flags), etag
+            )
+            return True
+
+    def start(self) -> None:
+        """Start (or, after a fork, restart) the background refresher."""
+        pid = os.getpid()
+        if self._refresher is not None and self._refresher_pid == pid:
+            return
+        self._stop = threading.Event()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="flag-snapshot-refresher", daemon=True
+        )
+        self._refresher_pid = pid
+        self._refresher.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.ttl):
+            self.refresh()
+
+    def _snapshot(self) -> dict[str, dict[str, Any]] | None:
+        # Fetch inline only for the first load (or without a background
+        # refresher), and at most once per TTL so an unreachable source
+        # doesn't stall every evaluation.
+        attempted = self._attempted_at
+        due = attempted is None or self._clock() - attempted >= self.ttl
+        if due and (self._flags is None or self._refresher is None):
+            self.refresh()
+        return self._flags
+
+    def _flag(self, flag_key: str) -> dict[str, Any]:
+        flags = self._snapshot()
+        if flags is None:
+            raise LookupError("no feature flag snapshot available")
+        if flag_key not in flags:
+            raise KeyError(f"feature flag {flag_key!r} not in snapshot")
+        return flags[flag_key]
+
+    def evaluate_boolean(
+        self,
+        flag_key: str,
+        entity_id: str = "unstract",
+        context: dict[str, str] | None = None,
+    ) -> bool:
+        """Evaluate a boolean flag; raises if it's unknown or not boolean."""
+        flag = self._flag(flag_key)
+        if flag.get("type", "BOOLEAN_FLAG_TYPE") != "BOOLEAN_FLAG_TYPE":
+            raise ValueError(f"feature flag {flag_key!r} is not a boolean flag")
+        return evaluate_boolean_flag(flag, entity_id, context or {})
+
+    def evaluate_variant(
+        self,
+        flag_key: str,
+        entity_id: str = "unstract",
+        context: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Evaluate a variant flag; ``enabled`` reports the flag's state."""
+        flag = self._flag(flag_key)
+        if flag.get("type") != "VARIANT_FLAG_TYPE":
+            raise ValueError(f"feature flag {flag_key!r} is not a variant flag")
+        return {
+            "enabled": bool(flag.get("enabled", False)),
+            **evaluate_variant_flag(flag, entity_id, context or {}),
+        }
+
+
+_evaluator: LocalFlagEvaluator | None = None
+_evaluator_lock = threading.Lock()
+
+
+def _source_from_env() -> SnapshotSource | None:
+    path = os.environ.get("FLIPT_SNAPSHOT_FILE")
+    if path:
+        return FileSnapshotSource(path)
+    if os.environ.get("FLIPT_SERVICE_AVAILABLE", "false").lower() != "true":
+        return None
+    url = os.environ.get("FLIPT_SNAPSHOT_URL")
+    if not url:
+        host = os.environ.get("EVALUATION_SERVER_IP")
+        if not host:
+            return None
+        if "://" not in host:
+            host = f"http://{host}"
+        url = f"{host}:{os.environ.get('FLIPT_HTTP_PORT', '8080')}"
+    return FliptSnapshotSource(
+        url,
+        namespace_key=os.environ.get("UNSTRACT_FEATURE_FLAG_NAMESPACE", "default"),
+        client_token=os.environ.get("FLIPT_CLIENT_TOKEN") or None,
+    )
+
+
+def get_local_evaluator() -> LocalFlagEvaluator | None:
+    """The process's evaluator, or None when local evaluation is off."""
+    global _evaluator
+    if os.environ.get("FLIPT_LOCAL_EVALUATION", "false").lower() != "true":
+        return None
+    evaluator = _evaluator
+    if evaluator is None:
+        with _evaluator_lock:
+            if _evaluator is None:
+                source = _source_from_env()
+                if source is None:
+                    return None
+                _evaluator = LocalFlagEvaluator(
+                    source,
+                    ttl=float(os.environ.get("FLIPT_SNAPSHOT_TTL", DEFAULT_TTL)),
+                )
+            evaluator = _evaluator
+    evaluator.start()
+    return evaluator
+
+
+def reset_local_evaluator() -> None:
+    """Drop the process's evaluator (tests, config reloads)."""
+    global _evaluator
+    with _evaluator_lock:
+        if _evaluator is not None:
+            _evaluator.stop()
+        _evaluator = None
@@ -0,0 +1,250 @@
+"""Local flag evaluation against a file-backed snapshot."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from unstract.flags import feature_flag
+from unstract.flags.snapshot import (
+    FileSnapshotSource,
+    LocalFlagEvaluator,
+    _threshold_bucket,
+    _variant_bucket,
+    evaluate_boolean_flag,
+    evaluate_variant_flag,
+    reset_local_evaluator,
+)
+
+
+def _segment(key, constraints, match_type="ALL_SEGMENT_MATCH_TYPE"):
+    return {"key": key, "matchType": match_type, "constraints": constraints}
+
+
+def _org_constraint(operator, value):
+    return {
+        "type": "STRING_COMPARISON_TYPE",
+        "property": "organization_id",
+        "operator": operator,
+        "value": value,
+    }
+
+
+SNAPSHOT = {
+    "namespace": {"key": "default"},
+    "flags": [
+        {"key": "plain_on", "type": "BOOLEAN_FLAG_TYPE", "enabled": True},
+        {
+            "key": "pg_queue",
+            "type": "BOOLEAN_FLAG_TYPE",
+            "enabled": False,
+            "rollouts": [
+                {
+                    "type": "SEGMENT_ROLLOUT_TYPE",
+                    "rank": 1,
+                    "segment": {
+                        "value": True,
+                        "segmentOperator": "OR_SEGMENT_OPERATOR",
+                        "segments": [
+                            _segment("beta", [_org_constraint("isoneof", '["o1","o2"]')])
+                        ],
+                    },
+                },
+                {
+                    "type": "THRESHOLD_ROLLOUT_TYPE",
+                    "rank": 2,
+                    "threshold": {"percentage": 0, "value": True},
+                },
+            ],
+        },
+        {
+            "key": "engine",
+            "type": "VARIANT_FLAG_TYPE",
+            "enabled": True,
+            "rules": [
+                {
+                    "rank": 1,
+                    "segmentOperator": "OR_SEGMENT_OPERATOR",
+                    "segments": [
+                        _segment(
+                            "big_docs",
+                            [
+                                {
+                                    "type": "NUMBER_COMPARISON_TYPE",
+                                    "property": "pages",
+                                    "operator": "gte",
+                                    "value": "100",
+                                }
+                            ],
+                        )
+                    ],
+                    "distributions": [
+                        {
+                            "variantKey": "fast",
+                            "variantAttachment": '{"engine": "fast"}',
+                            "rollout": 100,
+                        }
+                    ],
+                }
+            ],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text(json.dumps(SNAPSHOT))
+    return path
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLocalFlagEvaluator:
+    def test_boolean_rollouts_and_default(self, snapshot_file):
+        evaluator = LocalFlagEvaluator(FileSnapshotSource(str(snapshot_file)))
+        assert evaluator.evaluate_boolean("plain_on") is True
+        assert evaluator.evaluate_boolean("pg_queue", context={"organization_id": "o2"})
+        assert not evaluator.evaluate_boolean(
+            "pg_queue", context={"organization_id": "o9"}
+        )
+
+    def test_variant_rules(self, snapshot_file):
+        evaluator = LocalFlagEvaluator(FileSnapshotSource(str(snapshot_file)))
+        matched = evaluator.evaluate_variant("engine", context={"pages": "250"})
+        assert matched == {
+            "enabled": True,
+            "match": True,
+            "variant_key": "fast",
+            "variant_attachment": '{"engine": "fast"}',
+            "segment_keys": ["big_docs"],
+        }
+        assert not evaluator.evaluate_variant("engine", context={"pages": "3"})["match"]
+
+    def test_unknown_or_mistyped_flag_raises(self, snapshot_file):
+        evaluator = LocalFlagEvaluator(FileSnapshotSource(str(snapshot_file)))
+        with pytest.raises(KeyError):
+            evaluator.evaluate_boolean("missing")
+        with pytest.raises(ValueError):
+            evaluator.evaluate_boolean("engine")
+
+    def test_unchanged_source_is_not_reloaded(self, snapshot_file):
+        clock = _Clock()
+        evaluator = LocalFlagEvaluator(
+            FileSnapshotSource(str(snapshot_file)), ttl=10, clock=clock
+        )
+        assert evaluator.refresh() is True
+        clock.now = 11
+        assert evaluator.refresh() is False
+
+        changed = dict(SNAPSHOT, flags=[{"key": "plain_on", "enabled": False}])
+        snapshot_file.write_text(json.dumps(changed))
+        os.utime(snapshot_file, ns=(1, 1))
+        assert evaluator.refresh() is True
+        assert evaluator.evaluate_boolean("plain_on") is False
+
+    def test_last_good_snapshot_survives_source_failure(self, snapshot_file):
+        clock = _Clock()
+        evaluator = LocalFlagEvaluator(
+            FileSnapshotSource(str(snapshot_file)), ttl=10, clock=clock
+        )
+        assert evaluator.ready()
+        snapshot_file.unlink()
+        clock.now = 11
+        assert evaluator.evaluate_boolean("plain_on") is True
+        assert isinstance(evaluator.last_error, FileNotFoundError)
+
+    def test_failed_first_load_is_retried_once_per_ttl(self, tmp_path):
+        clock = _Clock()
+        source = FileSnapshotSource(str(tmp_path / "missing.json"))
+        evaluator = LocalFlagEvaluator(source, ttl=10, clock=clock)
+        with patch.object(source, "fetch", wraps=source.fetch) as fetch:
+            assert not evaluator.ready()
+            assert not evaluator.ready()
+            clock.now = 10
+            assert not evaluator.ready()
+        assert fetch.call_count == 2
+
+
+class TestFliptBucketing:
+    """Buckets pinned to Flipt's hashing so local and server evaluation agree.
+
+    Variants hash ``crc32(flagKey + entityId) % 1000``; boolean thresholds
+    hash ``crc32(entityId + flagKey) % 100``.
+    """
+
+    def test_variant_bucket_hashes_flag_key_then_entity(self):
+        assert _variant_bucket("engine", "org-1") == 82
+        assert _variant_bucket("engine", "org-2") == 760
+
+    def test_threshold_bucket_hashes_entity_then_flag_key(self):
+        assert _threshold_bucket("org-1", "engine") == 53
+        assert _threshold_bucket("org-2", "engine") == 88
+
+    def test_variant_split_follows_flipt_buckets(self):
+        flag = {
+            "key": "engine",
+            "enabled": True,
+            "rules": [
+                {
+                    "rank": 1,
+                    "segments": [_segment("everyone", [])],
+                    "distributions": [
+                        {"variantKey": "a", "rollout": 50},
+                        {"variantKey": "b", "rollout": 50},
+                    ],
+                }
+            ],
+        }
+        assert evaluate_variant_flag(flag, "org-1", {})["variant_key"] == "a"
+        assert evaluate_variant_flag(flag, "org-2", {})["variant_key"] == "b"
+
+    def test_threshold_rollout_follows_flipt_buckets(self):
+        flag = {
+            "key": "engine",
+            "enabled": False,
+            "rollouts": [
+                {
+                    "type": "THRESHOLD_ROLLOUT_TYPE",
+                    "threshold": {"percentage": 60, "value": True},
+                }
+            ],
+        }
+        assert evaluate_boolean_flag(flag, "org-1", {}) is True
+        assert evaluate_boolean_flag(flag, "org-2", {}) is False
+
+
+class TestCheckFeatureFlagWithSnapshot:
+    @pytest.fixture(autouse=True)
+    def _local_evaluation(self, monkeypatch, snapshot_file):
+        monkeypatch.setenv("FLIPT_LOCAL_EVALUATION", "true")
+        monkeypatch.setenv("FLIPT_SNAPSHOT_FILE", str(snapshot_file))
+        reset_local_evaluator()
+        yield
+        reset_local_evaluator()
+
+    def test_status_and_variant_do_not_call_flipt(self):
+        with patch.object(feature_flag, "FliptClient") as client:
+            assert feature_flag.check_feature_flag_status("plain_on") is True
+            assert feature_flag.check_feature_flag_status("missing") is False
+            variant = feature_flag.check_feature_flag_variant(
+                "engine", context={"pages": "100"}
+            )
+        assert variant["variant_key"] == "fast"
+        client.assert_not_called()
+
+    def test_falls_back_to_flipt_without_snapshot(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("FLIPT_SNAPSHOT_FILE", str(tmp_path / "missing.json"))
+        reset_local_evaluator()
+        with patch.object(feature_flag, "FliptClient") as client:
+            client.return_value.evaluate_boolean.return_value = True
+            assert feature_flag.check_feature_flag_status("plain_on") is True
+        client.return_value.evaluate_boolean.assert_called_once()
@@ -8,6 +8,7 @@ from unstract.sdk1.constants import LogLevel, ToolEnv
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.stream import StreamMixin
 from unstract.sdk1.utils.common import TokenCounterCompat
+from unstract.sdk1.utils.http_session import get_platform_session
 
 logger = logging.getLogger(__name__)
 
@@ -129,7 +130,9 @@ class Audit(StreamMixin):
         headers = {"Authorization": f"Bearer {bearer_token}"}
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = get_platform_session().post(
+                url, headers=headers, json=data, timeout=30
+            )
             if response.status_code != 200:
                 self.stream_log(
                     log=(
@@ -183,7 +186,9 @@ class Audit(StreamMixin):
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = get_platform_session().post(
+                url, headers=headers, json=data, timeout=30
+            )
             if response.status_code != 200:
                 self.stream_log(
                     log=(
@@ -23,6 +23,8 @@ from unstract.sdk1.utils.retry_utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
     from unstract.sdk1.tool.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -108,7 +110,7 @@ class Embedding:
             self.kwargs: dict[str, object] = self.adapter.validate(self._adapter_metadata)
             self._cost_model: str | None = self.kwargs.pop("cost_model", None)
             # Client-side batching hint, not an API field — keep it off the wire.
-            self.kwargs.pop("embed_batch_size", None)
+            self._embed_batch_size: int | None = self.kwargs.pop("embed_batch_size", None)
         except (ValidationError, ValueError) as e:
             raise SdkError("Invalid embedding adapter metadata: " + str(e)) from e
 
@@ -233,6 +235,10 @@ class EmbeddingCompat(BaseEmbedding):
         )
         self._length = self._embedding_instance._length
         self._tool = tool
+        self._query_embedding_cache: MutableMapping | None = None
+        # Adapter's provider-sized batch, used when indexing documents.
+        if self._embedding_instance._embed_batch_size:
+            self.embed_batch_size = self._embedding_instance._embed_batch_size
 
         # For compatibility with SDK Callback Manager.
         # Prefer cost_model (actual model name) for pricing lookup accuracy,
@@ -262,8 +268,46 @@ class EmbeddingCompat(BaseEmbedding):
                 },
             )
 
+    def use_query_embedding_cache(self, cache: MutableMapping | None) -> None:
+        """Reuse query embeddings through ``cache``, shareable across instances.
+
+        Entries are keyed by ``(cache_scope, query text)``, so retrievers of
+        several prompts over the same embedding adapter embed a repeated query
+        once. ``None`` turns caching off (the default), as does an unscoped
+        (metadata-built) embedding.
+        """
+        self._query_embedding_cache = cache
+
+    @property
+    def cache_scope(self) -> str | None:
+        """Namespace for cached vectors: the adapter instance and its model.
+
+        Instances sharing a model name may point at different endpoints,
+        deployments or credentials (and organizations), so their vectors are
+        never shared. ``None`` for an embedding built from adapter metadata,
+        which has no instance to scope by and so is never cached.
+        """
+        adapter_instance_id = self._embedding_instance._adapter_instance_id
+        if not adapter_instance_id:
+            return None
+        return f"{adapter_instance_id}:{self.model_name}"
+
+    def _query_cache(self) -> MutableMapping | None:
+        return self._query_embedding_cache if self.cache_scope else None
+
+    def _query_cache_key(self, query: str) -> tuple[str, str]:
+        return self.cache_scope, query
+
     def _get_query_embedding(self, query: str) -> list[float]:
-        return self._embedding_instance.get_embedding(query, input_type="query")
+        cache = self._query_cache()
+        if cache is None:
+            return self._embedding_instance.get_embedding(query, input_type="query")
+        key = self._query_cache_key(query)
+        vector = cache.get(key)
+        if vector is None:
+            vector = self._embedding_instance.get_embedding(query, input_type="query")
+            cache[key] = vector
+        return list(vector)
 
     def _get_text_embedding(self, text: str) -> list[float]:
         return self._embedding_instance.get_embedding(text, input_type="passage")
@@ -275,7 +319,19 @@ class EmbeddingCompat(BaseEmbedding):
         return self._get_query_embedding(query)
 
     async def _aget_query_embedding(self, query: str) -> list[float]:
-        return await self._embedding_instance.get_aembedding(query, input_type="query")
+        cache = self._query_cache()
+        if cache is None:
+            return await self._embedding_instance.get_aembedding(
+                query, input_type="query"
+            )
+        key = self._query_cache_key(query)
+        vector = cache.get(key)
+        if vector is None:
+            vector = await self._embedding_instance.get_aembedding(
+                query, input_type="query"
+            )
+            cache[key] = vector
+        return list(vector)
 
     async def _aget_text_embedding(self, text: str) -> list[float]:
         return await self._embedding_instance.get_aembedding(text, input_type="passage")
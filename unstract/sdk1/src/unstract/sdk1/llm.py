@@ -73,6 +73,9 @@ def is_prompt_caching_enabled() -> bool:
 # Lets tests force a deterministic completion without a provider or a secret.
 # Unset in production, where this is a no-op.
 _MOCK_RESPONSE_ENV = "UNSTRACT_LLM_MOCK_RESPONSE"
+# Seconds each mocked completion sleeps, so benchmarks see a fixed provider
+# latency instead of an instant reply. Ignored unless the mock is active.
+_MOCK_LATENCY_ENV = "UNSTRACT_LLM_MOCK_LATENCY"
 
 
 @lru_cache(maxsize=1)
@@ -92,6 +95,20 @@ def _inject_mock_response(completion_kwargs: dict[str, object]) -> None:
         return
     _warn_mock_active()
     completion_kwargs["mock_response"] = mock
+    delay = _mock_latency()
+    if delay:
+        completion_kwargs["mock_delay"] = delay
+
+
+def _mock_latency() -> float:
+    raw = os.getenv(_MOCK_LATENCY_ENV, "").strip()
+    if not raw:
+        return 0.0
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        logger.warning("Ignoring non-numeric %s=%r", _MOCK_LATENCY_ENV, raw)
+        return 0.0
 
 
 # Drop unsupported params rather than raising errors.
@@ -215,6 +232,12 @@ class LLM:
     JSON_REGEX = re.compile(r"\[(?:.|\n)*\]|\{(?:.|\n)*\}")
     JSON_CONTENT_MARKER = os.environ.get("JSON_SELECTION_MARKER", "§§§")
 
+    # Per-instance prompt-cache token totals (see ``get_prompt_cache_usage``).
+    # Unlike ``_pending_usage`` they survive ``flush_pending_usage``.
+    _prompt_tokens_total = 0
+    _cache_read_tokens_total = 0
+    _cache_write_tokens_total = 0
+
     def __init__(  # noqa: C901
         self,
         adapter_id: str = "",
@@ -941,6 +964,18 @@ class LLM:
             return None
         return self._pending_usage[-1]
 
+    def get_prompt_cache_usage(self) -> Mapping[str, int]:
+        """Prompt and prompt-cache token totals across every call so far.
+
+        ``cache_read_input_tokens / prompt_tokens`` is the cached-token hit
+        rate. Both cache counts stay 0 for providers that don't report them.
+        """
+        return {
+            "prompt_tokens": self._prompt_tokens_total,
+            "cache_read_input_tokens": self._cache_read_tokens_total,
+            "cache_creation_input_tokens": self._cache_write_tokens_total,
+        }
+
     def get_usage_reason(self) -> object:
         return self.platform_kwargs.get("llm_usage_reason")
 
@@ -1060,6 +1095,10 @@ class LLM:
             id_suffix,
         )
 
+        self._prompt_tokens_total += prompt_tokens
+        self._cache_read_tokens_total += cache_read_tokens
+        self._cache_write_tokens_total += cache_creation_tokens
+
         cost = self._compute_call_cost(
             model=model,
             prompt_tokens=prompt_tokens,
@@ -2,7 +2,6 @@ import json
 import logging
 from typing import Any, Self
 
-import requests
 from requests import RequestException, Response
 from requests.exceptions import ConnectionError, HTTPError
 from unstract.sdk1.constants import (
@@ -19,6 +18,7 @@ from unstract.sdk1.exceptions import SdkError
 from unstract.sdk1.tool.base import BaseTool
 from unstract.sdk1.tool.stream import StreamMixin
 from unstract.sdk1.utils.common import Utils
+from unstract.sdk1.utils.http_session import get_platform_session
 from unstract.sdk1.utils.retry_utils import retry_platform_service_call
 
 logger = logging.getLogger(__name__)
@@ -132,7 +132,9 @@ class PlatformHelper:
         query_params = {AdapterKeys.ADAPTER_INSTANCE_ID: adapter_instance_id}
         headers = {"Authorization": f"Bearer {bearer_token}"}
         try:
-            response = requests.get(url, headers=headers, params=query_params)
+            response = get_platform_session().get(
+                url, headers=headers, params=query_params
+            )
             response.raise_for_status()
             adapter_data: dict[str, Any] = response.json()
 
@@ -230,7 +232,8 @@ class PlatformHelper:
         """Talks to platform-service to make GET / POST calls.
 
         Only GET calls are made to platform-service though functionality exists.
-        This method automatically retries on connection errors with exponential backoff.
+        Requests share the process's pooled keep-alive session. This method
+        automatically retries on connection errors with exponential backoff.
 
         Retry behavior is configurable via environment variables:
         - PLATFORM_SERVICE_MAX_RETRIES (default: 3)
@@ -258,13 +261,14 @@ class PlatformHelper:
         url: str = f"{self.base_url}/{url_path}"
         req_headers = self._get_headers(headers)
         response: Response = Response()
+        session = get_platform_session()
         try:
             if method.upper() == "POST":
-                response = requests.post(
+                response = session.post(
                     url=url, json=payload, params=params, headers=req_headers
                 )
             elif method.upper() == "GET":
-                response = requests.get(url=url, params=params, headers=req_headers)
+                response = session.get(url=url, params=params, headers=req_headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -1,7 +1,7 @@
-import requests
 from unstract.sdk1.constants import LogLevel
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.utils.http_session import get_platform_session
 
 
 class ToolCache(PlatformHelper):
@@ -41,7 +41,7 @@ class ToolCache(PlatformHelper):
         url = f"{self.base_url}/cache"
         json = {"key": key, "value": value}
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.post(url, json=json, headers=headers)
+        response = get_platform_session().post(url, json=json, headers=headers)
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully cached data for key: {key}")
@@ -64,7 +64,7 @@ class ToolCache(PlatformHelper):
         """
         url = f"{self.base_url}/cache?key={key}"
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.get(url, headers=headers)
+        response = get_platform_session().get(url, headers=headers)
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully retrieved cached data for key: {key}")
@@ -90,7 +90,7 @@ class ToolCache(PlatformHelper):
         """
         url = f"{self.base_url}/cache?key={key}"
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.delete(url, headers=headers)
+        response = get_platform_session().delete(url, headers=headers)
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully deleted cached data for key: {key}")
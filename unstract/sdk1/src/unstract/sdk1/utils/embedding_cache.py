@@ -0,0 +1,88 @@
+"""Process-local cache of chunk embeddings reused across re-indexing."""
+
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+
+# Upper bound on cached vectors; 0 disables the cache. A 1536-dim vector
+# costs ~12 KB, so the default stays in the tens of megabytes.
+EMBEDDING_CACHE_MAX_ENTRIES_ENV = "EMBEDDING_CACHE_MAX_ENTRIES"
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 2000
+
+CacheKey = tuple[str, int, str]
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embedding vectors keyed by adapter scope and chunk text.
+
+    Vectors are stored as ``array("d")`` to keep memory down without
+    losing precision; callers always get plain lists back.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Create a cache holding at most ``max_entries`` vectors (0 disables)."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, array] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(scope: str, dimension: int, text: str) -> CacheKey:
+        """Key a chunk under its embedding adapter's scope.
+
+        ``scope`` must identify the adapter instance, not just the model name
+        (see ``EmbeddingCompat.cache_scope``): the cache is process-wide and
+        shared across organizations.
+        """
+        return (scope, dimension, hashlib.sha256(text.encode()).hexdigest())
+
+    def get_many(self, keys: list[CacheKey]) -> list[list[float] | None]:
+        if self.max_entries <= 0:
+            return [None] * len(keys)
+        found: list[list[float] | None] = []
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is None:
+                    found.append(None)
+                    continue
+                self._entries.move_to_end(key)
+                found.append(vector.tolist())
+        return found
+
+    def put_many(self, items: list[tuple[CacheKey, list[float]]]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            for key, vector in items:
+                self._entries[key] = array("d", vector)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached vectors."""
+        return len(self._entries)
+
+
+_cache: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache, sized from the environment."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            raw = os.environ.get(EMBEDDING_CACHE_MAX_ENTRIES_ENV, "")
+            try:
+                max_entries = int(raw) if raw else DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+            except ValueError:
+                max_entries = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+            _cache = EmbeddingCache(max_entries)
+        return _cache
@@ -0,0 +1,139 @@
+"""Process-wide pooled HTTP session for platform-service calls.
+
+Adapter configs, usage pushes, cache reads and tool lookups all go to the same
+platform-service host several times per prompt. Sharing one keep-alive pool
+per process saves the TCP (and TLS) setup each fresh ``requests.get`` paid.
+
+Pool size is configured through ``PLATFORM_SERVICE_POOL_SIZE`` (default 10,
+connections kept per host). Retries stay with the callers'
+``retry_platform_service_call`` (exponential backoff with jitter), so the
+transport itself never retries.
+
+Reuse is observable through :func:`platform_session_stats` (requests sent vs.
+connections opened by the pools) and a debug log line per new connection.
+"""
+
+import logging
+import os
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_session_pid: int | None = None
+# Counted per process: reset on fork along with the session.
+_stats_lock = threading.Lock()
+_stats = {"requests": 0, "new_connections": 0}
+
+
+def _count(name: str) -> dict[str, int]:
+    with _stats_lock:
+        _stats[name] += 1
+        return dict(_stats)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self) -> Any:  # noqa: ANN401
+        stats = _count("new_connections")
+        logger.debug(
+            "Opened platform-service connection to %s:%s (%d opened for %d "
+            "requests so far)",
+            self.host,
+            self.port,
+            stats["new_connections"],
+            stats["requests"],
+        )
+        return super()._new_conn()
+
+
+# Counting wraps HTTPSConnectionPool._new_conn, which does not call up the chain.
+class _CountingHTTPSConnectionPool(_CountingHTTPConnectionPool, HTTPSConnectionPool):
+    pass
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` counting requests sent and connections opened."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # noqa: ANN401
+        _count("requests")
+        return super().send(request, **kwargs)
+
+
+def _pool_size() -> int:
+    try:
+        size = int(os.getenv("PLATFORM_SERVICE_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+    except ValueError:
+        logger.warning("Invalid PLATFORM_SERVICE_POOL_SIZE; using %d", DEFAULT_POOL_SIZE)
+        return DEFAULT_POOL_SIZE
+    return max(size, 1)
+
+
+def get_platform_session() -> requests.Session:
+    """Return the process's pooled ``requests.Session``.
+
+    Created on first use and recreated after a fork, so prefork workers never
+    share sockets inherited from their parent.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    session = _session
+    if session is not None and _session_pid == pid:
+        return session
+    with _lock:
+        if _session is None or _session_pid != pid:
+            size = _pool_size()
+            session = requests.Session()
+            adapter = _CountingHTTPAdapter(pool_connections=size, pool_maxsize=size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if _session_pid is not None:
+                # A forked child inherits the parent's counts; start over.
+                _reset_stats()
+            _session, _session_pid = session, pid
+        return _session
+
+
+def _reset_stats() -> None:
+    with _stats_lock:
+        _stats.update(requests=0, new_connections=0)
+
+
+def platform_session_stats() -> dict[str, int]:
+    """Requests sent and connections opened through the shared session.
+
+    ``reused_connections`` is the number of requests that went out on an
+    already-open keep-alive connection.
+    """
+    with _stats_lock:
+        sent, opened = _stats["requests"], _stats["new_connections"]
+    return {
+        "requests": sent,
+        "new_connections": opened,
+        "reused_connections": max(sent - opened, 0),
+    }
+
+
+def close_platform_sessions() -> None:
+    """Close the shared session and reset its counts (tests, shutdown)."""
+    global _session, _session_pid
+    with _lock:
+        if _session is not None:
+            logger.debug("Closing platform-service session: %s", platform_session_stats())
+            _session.close()
+        _session, _session_pid = None, None
+        _reset_stats()
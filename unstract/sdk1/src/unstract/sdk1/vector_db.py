@@ -1,11 +1,15 @@
 import logging
+import os
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 from deprecated import deprecated
 from llama_index.core import StorageContext, VectorStoreIndex
+from llama_index.core.callbacks import CBEventType, EventPayload
 from llama_index.core.indices.base import IndexType
+from llama_index.core.ingestion import run_transformations
 from llama_index.core.node_parser import SentenceSplitter
-from llama_index.core.schema import BaseNode, Document
+from llama_index.core.schema import BaseNode, Document, MetadataMode
 from llama_index.core.vector_stores.types import (
     BasePydanticVectorStore,
     VectorStore,
@@ -19,9 +23,14 @@ from unstract.sdk1.embedding import EmbeddingCompat
 from unstract.sdk1.exceptions import SdkError, VectorDBError
 from unstract.sdk1.platform import PlatformHelper
 from unstract.sdk1.tool.base import BaseTool
+from unstract.sdk1.utils.embedding_cache import EmbeddingCache, get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
+# Embedding batches in flight at once while indexing a document.
+EMBEDDING_INDEX_MAX_CONCURRENCY_ENV = "EMBEDDING_INDEX_MAX_CONCURRENCY"
+DEFAULT_EMBEDDING_INDEX_MAX_CONCURRENCY = 4
+
 
 class VectorDB:
     """Class to handle VectorDB for Unstract Tools."""
@@ -147,8 +156,18 @@ class VectorDB:
         if callback_manager is not None:
             index_kwargs_with_callback["callback_manager"] = callback_manager
 
-        return VectorStoreIndex.from_documents(
-            documents,
+        # Same steps as VectorStoreIndex.from_documents, except the chunks are
+        # embedded up front (cached, batched, concurrent); the index then
+        # only writes the pre-embedded nodes to the store in bulk.
+        for doc in documents:
+            storage_context.docstore.set_document_hash(doc.id_, doc.hash)
+        nodes = run_transformations(
+            documents, [parser], show_progress=show_progress, **index_kwargs
+        )
+        self._embed_nodes(nodes)
+
+        return VectorStoreIndex(
+            nodes=nodes,
             storage_context=storage_context,
             show_progress=show_progress,
             embed_model=self._embedding_instance,
@@ -156,6 +175,80 @@ class VectorDB:
             **index_kwargs_with_callback,
         )
 
+    def _embed_nodes(self, nodes: Sequence[BaseNode]) -> None:
+        """Set embeddings on nodes, reusing cached vectors for unchanged chunks."""
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        # Scoped to the adapter instance; an embedding without one is not cached.
+        scope = getattr(self._embedding_instance, "cache_scope", None)
+        cache = get_embedding_cache() if scope else EmbeddingCache(max_entries=0)
+        keys = [cache.key(scope, self._embedding_dimension, text) for text in texts]
+        vectors = cache.get_many(keys)
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = self._embed_texts([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh, strict=True):
+                vectors[i] = vector
+            cache.put_many([(keys[i], vectors[i]) for i in missing])
+        logger.debug(
+            "Embedded %d of %d chunks (%d reused from cache)",
+            len(missing),
+            len(nodes),
+            len(nodes) - len(missing),
+        )
+
+        for node, vector in zip(nodes, vectors, strict=True):
+            node.embedding = vector
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in the model's batch size with bounded concurrency.
+
+        Each batch is wrapped in an EMBEDDING callback event, as LlamaIndex
+        does, so token counting and usage recording are unchanged. Events
+        fire on the calling thread since the handlers are not thread-safe.
+        """
+        embed_model = self._embedding_instance
+        callback_manager = getattr(embed_model, "callback_manager", None)
+        batch_size = embed_model.embed_batch_size
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        try:
+            max_concurrency = int(
+                os.environ.get(
+                    EMBEDDING_INDEX_MAX_CONCURRENCY_ENV,
+                    DEFAULT_EMBEDDING_INDEX_MAX_CONCURRENCY,
+                )
+            )
+        except ValueError:
+            max_concurrency = DEFAULT_EMBEDDING_INDEX_MAX_CONCURRENCY
+
+        event_ids: list[str | None] = []
+        for _ in batches:
+            event_id = None
+            if callback_manager is not None:
+                event_id = callback_manager.on_event_start(
+                    CBEventType.EMBEDDING,
+                    payload={EventPayload.SERIALIZED: embed_model.to_dict()},
+                )
+            event_ids.append(event_id)
+
+        workers = max(1, min(max_concurrency, len(batches)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="embed-index"
+        ) as pool:
+            results = list(pool.map(embed_model._get_text_embeddings, batches))
+
+        for batch, vectors, event_id in zip(batches, results, event_ids, strict=True):
+            if callback_manager is not None:
+                callback_manager.on_event_end(
+                    CBEventType.EMBEDDING,
+                    payload={
+                        EventPayload.CHUNKS: batch,
+                        EventPayload.EMBEDDINGS: vectors,
+                    },
+                    event_id=event_id,
+                )
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
     def get_vector_store_index(self, **kwargs: object) -> VectorStoreIndex:
         if not self._embedding_instance:
             raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
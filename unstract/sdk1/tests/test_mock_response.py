@@ -67,6 +67,39 @@ def test_inject_does_not_clobber_explicit_mock_response(
     assert _inject({"mock_response": "explicit"})["mock_response"] == "explicit"
 
 
+def test_inject_adds_fixed_latency_when_configured(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("UNSTRACT_LLM_MOCK_RESPONSE", "canned answer")
+    monkeypatch.setenv("UNSTRACT_LLM_MOCK_LATENCY", "0.25")
+    assert _inject({"model": "gpt-4o"})["mock_delay"] == 0.25
+
+
+def test_inject_ignores_latency_without_mock_or_when_invalid(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A latency alone must never slow a real provider call.
+    monkeypatch.delenv("UNSTRACT_LLM_MOCK_RESPONSE", raising=False)
+    monkeypatch.setenv("UNSTRACT_LLM_MOCK_LATENCY", "0.25")
+    assert "mock_delay" not in _inject({"model": "gpt-4o"})
+    monkeypatch.setenv("UNSTRACT_LLM_MOCK_RESPONSE", "canned answer")
+    monkeypatch.setenv("UNSTRACT_LLM_MOCK_LATENCY", "slow")
+    assert "mock_delay" not in _inject({"model": "gpt-4o"})
+
+
+def test_litellm_mock_delay_contract() -> None:
+    import time
+
+    start = time.monotonic()
+    litellm.completion(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "anything"}],
+        mock_response="canned answer",
+        mock_delay=0.2,
+    )
+    assert time.monotonic() - start >= 0.2
+
+
 def test_inject_warns_once_while_active(
     monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
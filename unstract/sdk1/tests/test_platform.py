@@ -54,7 +54,7 @@ class TestPlatformHelperRetry:
         """Test successful calls on first attempt for various methods."""
         expected_data = {"adapter_id": "test", "config": {}}
 
-        patch_target = f"requests.{http_method.lower()}"
+        patch_target = f"requests.Session.{http_method.lower()}"
         with patch(patch_target) as mock_request:
             mock_response = Mock()
             mock_response.json.return_value = expected_data
@@ -86,7 +86,7 @@ class TestPlatformHelperRetry:
         """Test methods retry on ConnectionError."""
         expected_data = {"result": "success"}
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = expected_data
             mock_response.raise_for_status = Mock()
@@ -114,7 +114,7 @@ class TestPlatformHelperRetry:
             platform_port="3001",
         )
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = ConnectionError("Persistent failure")
 
             with pytest.raises(ConnectionError):
@@ -127,7 +127,7 @@ class TestPlatformHelperRetry:
         self, mock_tool: MagicMock, clean_env: MonkeyPatch
     ) -> None:
         """Test non-retryable HTTP errors (404, 400) don't trigger retry."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_response.json.return_value = {"error": "Not found"}
@@ -149,7 +149,7 @@ class TestPlatformHelperRetry:
         """Test retryable HTTP errors (502, 503, 504) trigger retry."""
         expected_data = {"adapter_id": "test", "config": {}}
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             # First attempt: retryable HTTP error
             http_error = HTTPError()
             error_response = Mock()
@@ -177,7 +177,7 @@ class TestPlatformHelperRetry:
         self, mock_tool: MagicMock, clean_env: MonkeyPatch
     ) -> None:
         """Test get_adapter_config wraps ConnectionError as SdkError."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = ConnectionError("Connection failed")
 
             with pytest.raises(SdkError, match="Unable to connect to platform service"):
@@ -190,7 +190,7 @@ class TestPlatformHelperRetry:
         payload = {"key": "value"}
         expected_response = {"status": "OK"}
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = expected_response
             mock_response.raise_for_status = Mock()
@@ -209,7 +209,7 @@ class TestPlatformHelperRetry:
 
     def test_retry_logging(self, mock_tool: MagicMock, clean_env: MonkeyPatch) -> None:
         """Test that retry attempts are logged."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = {}
             mock_response.raise_for_status = Mock()
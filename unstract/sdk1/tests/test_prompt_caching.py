@@ -549,3 +549,39 @@ def test_env_var_truthy_lookalike_stays_off_and_warns(
     with caplog.at_level(logging.WARNING):
         assert is_prompt_caching_enabled() is False
     assert any("not recognized as enabled" in r.message for r in caplog.records)
+
+
+# ── hit-rate reporting: cache token totals accumulate across calls ──────────
+
+
+def test_prompt_cache_usage_accumulates_and_survives_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import types
+
+    import unstract.sdk1.llm as llm_mod
+    from unstract.sdk1.llm import LLM
+
+    monkeypatch.setattr(llm_mod.litellm, "completion_cost", lambda **_: 0.0)
+    monkeypatch.setattr(llm_mod.litellm, "cost_per_token", lambda **_: (0.0, 0.0))
+    llm = LLM.__new__(LLM)
+    llm.platform_kwargs = {}
+    llm._usage_kwargs = {}
+    llm._pending_usage = []
+    llm.adapter = types.SimpleNamespace(get_provider=lambda: "anthropic")
+
+    for usage in (
+        {"prompt_tokens": 1000, "cache_creation_input_tokens": 900},
+        {"prompt_tokens": 1000, "cache_read_input_tokens": 900},
+    ):
+        llm._record_usage(
+            model="anthropic/claude-opus-4-8", messages=[], usage=usage, llm_api="x"
+        )
+    llm.flush_pending_usage()
+
+    assert llm.get_prompt_cache_usage() == {
+        "prompt_tokens": 2000,
+        "cache_read_input_tokens": 900,
+        "cache_creation_input_tokens": 900,
+    }
+    assert LLM.__new__(LLM).get_prompt_cache_usage()["prompt_tokens"] == 0
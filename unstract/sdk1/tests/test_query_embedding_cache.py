@@ -0,0 +1,88 @@
+"""EmbeddingCompat's opt-in query-embedding cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from unstract.sdk1.embedding import EmbeddingCompat
+
+
+def _compat(
+    adapter_instance_id: str = "emb-1", model: str = "text-embedding-3-small"
+) -> tuple[EmbeddingCompat, MagicMock]:
+    instance = MagicMock()
+    instance._length = 3
+    instance._embed_batch_size = None
+    instance._cost_model = model
+    instance._adapter_instance_id = adapter_instance_id
+    instance.get_embedding.return_value = [0.1, 0.2, 0.3]
+    instance.get_aembedding = AsyncMock(return_value=[0.4, 0.5, 0.6])
+    with (
+        patch("unstract.sdk1.embedding.Embedding", return_value=instance),
+        patch(
+            "unstract.sdk1.embedding.PlatformHelper.is_public_adapter",
+            return_value=True,
+        ),
+    ):
+        return EmbeddingCompat(adapter_instance_id=adapter_instance_id), instance
+
+
+def test_no_cache_by_default() -> None:
+    compat, instance = _compat()
+    compat.get_query_embedding("q")
+    compat.get_query_embedding("q")
+    assert instance.get_embedding.call_count == 2
+
+
+def test_shared_cache_embeds_a_query_once_across_instances() -> None:
+    cache: dict = {}
+    first, first_instance = _compat()
+    second, second_instance = _compat()
+    first.use_query_embedding_cache(cache)
+    second.use_query_embedding_cache(cache)
+
+    assert first.get_query_embedding("What is X?") == [0.1, 0.2, 0.3]
+    assert second.get_query_embedding("What is X?") == [0.1, 0.2, 0.3]
+
+    first_instance.get_embedding.assert_called_once_with("What is X?", input_type="query")
+    second_instance.get_embedding.assert_not_called()
+
+
+def test_cache_is_keyed_by_embedding_model() -> None:
+    cache: dict = {}
+    first, _ = _compat(adapter_instance_id="emb-1")
+    other, other_instance = _compat(adapter_instance_id="emb-2")
+    first.use_query_embedding_cache(cache)
+    other.use_query_embedding_cache(cache)
+
+    first.get_query_embedding("q")
+    other.get_query_embedding("q")
+    other_instance.get_embedding.assert_called_once()
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("warm", [False, True])
+def test_async_query_embedding_uses_cache(warm: bool) -> None:
+    cache: dict = {}
+    compat, instance = _compat()
+    compat.use_query_embedding_cache(cache)
+    if warm:
+        compat.get_query_embedding("q")
+
+    vector = asyncio.run(compat._aget_query_embedding("q"))
+
+    assert vector == ([0.1, 0.2, 0.3] if warm else [0.4, 0.5, 0.6])
+    assert instance.get_aembedding.await_count == (0 if warm else 1)
+
+
+def test_unscoped_embedding_skips_the_cache() -> None:
+    cache: dict = {}
+    compat, instance = _compat(adapter_instance_id="")
+    compat.use_query_embedding_cache(cache)
+
+    compat.get_query_embedding("q")
+    compat.get_query_embedding("q")
+
+    assert compat.cache_scope is None
+    assert instance.get_embedding.call_count == 2
+    assert cache == {}
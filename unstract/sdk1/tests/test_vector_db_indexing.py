@@ -0,0 +1,167 @@
+"""Tests for the batched, cached embedding path of ``VectorDB.index_document``."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from llama_index.core.callbacks import CallbackManager, TokenCountingHandler
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import Document
+from pydantic import PrivateAttr
+from unstract.sdk1 import embedding as embedding_module
+from unstract.sdk1.adapters.embedding1.openai_compatible import (
+    OpenAICompatibleEmbeddingAdapter,
+)
+from unstract.sdk1.embedding import EmbeddingCompat
+from unstract.sdk1.utils import embedding_cache
+from unstract.sdk1.utils.embedding_cache import EmbeddingCache
+from unstract.sdk1.vector_db import VectorDB
+
+
+class CountingEmbedding(MockEmbedding):
+    """Mock embedding recording each provider call and its thread."""
+
+    _length: int = PrivateAttr(default=8)
+    _calls: list = PrivateAttr(default_factory=list)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _scope: str | None = PrivateAttr(default="adapter-1:mock-model")
+
+    @property
+    def cache_scope(self) -> str | None:
+        return self._scope
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self._calls.append(list(texts))
+        return [[float(len(text))] * self.embed_dim for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> EmbeddingCache:
+    cache = EmbeddingCache(max_entries=1000)
+    monkeypatch.setattr(embedding_cache, "_cache", cache)
+    return cache
+
+
+def _vector_db(
+    embed_batch_size: int = 2,
+    callback_manager: CallbackManager | None = None,
+    scope: str | None = "adapter-1:mock-model",
+) -> VectorDB:
+    embedding = CountingEmbedding(embed_dim=8, embed_batch_size=embed_batch_size)
+    embedding.callback_manager = callback_manager
+    embedding._scope = scope
+    return VectorDB(tool=MagicMock(), embedding=embedding)
+
+
+def _documents(count: int = 5) -> list[Document]:
+    return [
+        Document(text=f"Paragraph number {i} about topic {i}.", id_=f"doc-{i}")
+        for i in range(count)
+    ]
+
+
+def test_index_embeds_every_chunk_in_model_batches() -> None:
+    vector_db = _vector_db(embed_batch_size=2)
+
+    index = vector_db.index_document(_documents(5), chunk_size=1024)
+
+    calls = vector_db._embedding_instance._calls
+    assert sorted(len(batch) for batch in calls) == [1, 2, 2]
+    nodes = index.vector_store.data.embedding_dict
+    assert len(nodes) == 5
+
+
+def test_reindex_reuses_cached_embeddings() -> None:
+    first = _vector_db()
+    first.index_document(_documents(5))
+    second = _vector_db()
+
+    second.index_document(_documents(5))
+
+    assert second._embedding_instance._calls == []
+
+
+def test_only_changed_chunks_are_embedded() -> None:
+    _vector_db().index_document(_documents(4))
+    vector_db = _vector_db()
+    documents = _documents(4)
+    documents[1] = Document(text="A brand new paragraph.", id_="doc-1")
+
+    vector_db.index_document(documents)
+
+    assert vector_db._embedding_instance._calls == [["A brand new paragraph."]]
+
+
+def test_adapters_sharing_a_model_do_not_share_vectors() -> None:
+    _vector_db(scope="adapter-1:mock-model").index_document(_documents(3))
+    other_adapter = _vector_db(scope="adapter-2:mock-model")
+
+    other_adapter.index_document(_documents(3))
+
+    assert sum(len(b) for b in other_adapter._embedding_instance._calls) == 3
+
+
+def test_embedding_without_adapter_scope_is_not_cached(
+    monkeypatch: pytest.MonkeyPatch, fresh_cache: EmbeddingCache
+) -> None:
+    # Built from metadata (e.g. test connection): no adapter instance to scope
+    # by, so two such adapters on the same model must not share vectors.
+    calls: list[list[str]] = []
+
+    def fake_embedding(model: str, input: list, **kwargs: object) -> dict:  # noqa: A002
+        calls.append(list(input))
+        return {"data": [{"embedding": [float(len(t))] * 8} for t in input]}
+
+    monkeypatch.setattr(embedding_module.litellm, "embedding", fake_embedding)
+
+    def _metadata_vector_db(api_base: str) -> VectorDB:
+        embedding = EmbeddingCompat(
+            adapter_id=OpenAICompatibleEmbeddingAdapter.get_id(),
+            adapter_metadata={"model": "bge-m3", "api_base": api_base, "api_key": "k"},
+        )
+        assert embedding.cache_scope is None
+        return VectorDB(tool=MagicMock(), embedding=embedding)
+
+    _metadata_vector_db("https://gw-a.example/v1").index_document(_documents(3))
+    vector_db = _metadata_vector_db("https://gw-b.example/v1")
+    calls.clear()
+
+    vector_db.index_document(_documents(3))
+
+    assert sum(len(batch) for batch in calls) == 3
+    assert len(fresh_cache) == 0
+
+
+def test_cache_disabled_embeds_everything(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(embedding_cache, "_cache", EmbeddingCache(max_entries=0))
+    _vector_db().index_document(_documents(3))
+    vector_db = _vector_db()
+
+    vector_db.index_document(_documents(3))
+
+    assert sum(len(b) for b in vector_db._embedding_instance._calls) == 3
+
+
+def test_embedding_usage_is_still_counted() -> None:
+    token_counter = TokenCountingHandler()
+    vector_db = _vector_db(callback_manager=CallbackManager([token_counter]))
+
+    vector_db.index_document(_documents(3))
+
+    assert token_counter.total_embedding_token_count > 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = EmbeddingCache(max_entries=2)
+    keys = [EmbeddingCache.key("m", 1, text) for text in ("a", "b", "c")]
+    cache.put_many([(keys[0], [0.0]), (keys[1], [1.0])])
+    cache.get_many([keys[0]])
+    cache.put_many([(keys[2], [2.0])])
+
+    assert cache.get_many(keys) == [[0.0], None, [2.0]]
+
+
+def test_cache_key_separates_scopes() -> None:
+    assert EmbeddingCache.key("m1", 8, "t") != EmbeddingCache.key("m2", 8, "t")
+    assert EmbeddingCache.key("m1", 8, "t") != EmbeddingCache.key("m1", 16, "t")
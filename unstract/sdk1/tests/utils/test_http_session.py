@@ -0,0 +1,97 @@
+"""Unit tests for the pooled platform-service HTTP session."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from unstract.sdk1.utils import http_session
+from unstract.sdk1.utils.http_session import (
+    close_platform_sessions,
+    get_platform_session,
+    platform_session_stats,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b'{"status": "OK"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sessions() -> Iterator[None]:
+    close_platform_sessions()
+    yield
+    close_platform_sessions()
+
+
+class TestPlatformSession:
+    def test_session_is_shared(self) -> None:
+        assert get_platform_session() is get_platform_session()
+
+    def test_session_recreated_after_fork(self, monkeypatch: MonkeyPatch) -> None:
+        parent = get_platform_session()
+        monkeypatch.setattr(http_session.os, "getpid", lambda: -1)
+        assert get_platform_session() is not parent
+
+    def test_pool_size_from_env(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("PLATFORM_SERVICE_POOL_SIZE", "3")
+        adapter = get_platform_session().get_adapter("http://platform")
+        assert adapter._pool_maxsize == 3
+
+    def test_keep_alive_connection_is_reused(self, server_url: str) -> None:
+        session = get_platform_session()
+        for _ in range(3):
+            assert session.get(f"{server_url}/ping").json() == {"status": "OK"}
+
+        pools = session.get_adapter(server_url).poolmanager.pools
+        (pool,) = [pools.get(key) for key in pools.keys()]
+        assert pool.num_requests == 3
+        assert pool.num_connections == 1
+
+    def test_stats_count_reused_connections(self, server_url: str) -> None:
+        session = get_platform_session()
+        assert platform_session_stats() == {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+        }
+        for _ in range(3):
+            session.get(f"{server_url}/ping")
+
+        assert platform_session_stats() == {
+            "requests": 3,
+            "new_connections": 1,
+            "reused_connections": 2,
+        }
+
+    def test_stats_reset_after_fork(
+        self, server_url: str, monkeypatch: MonkeyPatch
+    ) -> None:
+        get_platform_session().get(f"{server_url}/ping")
+        monkeypatch.setattr(http_session.os, "getpid", lambda: -1)
+
+        get_platform_session()
+
+        assert platform_session_stats()["requests"] == 0
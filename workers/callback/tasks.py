@@ -31,6 +31,7 @@ from shared.infrastructure.logging import (
     monitor_performance,
 )
 from shared.infrastructure.logging.workflow_logger import WorkerWorkflowLogger
+from shared.infrastructure.monitoring.pipeline_metrics import PipelineStage, time_stage
 from shared.patterns.notification.helper import handle_status_notifications
 from shared.patterns.retry.backoff import (
     initialize_backoff_managers,
@@ -923,6 +924,29 @@ def _cleanup_execution_cache_direct(context: CallbackContext) -> None:
         # Don't raise - cache cleanup is not critical for callback success
 
 
+def _release_active_file_claims(context: CallbackContext) -> None:
+    """Release any active-file markers the execution still holds.
+
+    Markers are normally released per file once its WorkflowFileExecution exists;
+    this drops the leftovers (files never reached) via the execution's index set.
+    """
+    if not context.workflow_id or not context.execution_id:
+        return
+    try:
+        from shared.workflow.execution.active_file_manager import (
+            cleanup_active_file_cache,
+        )
+
+        cleanup_active_file_cache(
+            workflow_id=context.workflow_id,
+            execution_id=context.execution_id,
+            logger_instance=logger,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to release active file claims: {e}")
+        # Don't raise - markers expire with their TTL anyway
+
+
 def _create_cleanup_result(cleanup_type: str, status: str, **kwargs) -> dict[str, Any]:
     """Create standardized cleanup result structure.
 
@@ -1231,6 +1255,7 @@ def _cleanup_backend_cache(context: CallbackContext) -> dict[str, Any]:
         # API deployments may need cache persistence for subsequent requests
         if not _is_api_deployment(context):
             _cleanup_execution_cache_direct(context)
+            _release_active_file_claims(context)
             logger.info(
                 "✅ Direct execution cache cleanup completed for non-API deployment"
             )
@@ -1604,7 +1629,8 @@ def process_batch_callback(self, results, *args, **kwargs) -> dict[str, Any]:
     Returns:
         Callback processing result
     """
-    return _process_batch_callback_core(self, results, *args, **kwargs)
+    with time_stage(PipelineStage.CALLBACK, org=kwargs.get("organization_id")):
+        return _process_batch_callback_core(self, results, *args, **kwargs)
 
 
 @worker_task(
@@ -2046,4 +2072,5 @@ def process_batch_callback_django_compat(
     )
 
     # Delegate to the core implementation (same as main task)
-    return _process_batch_callback_core(self, results, *args, **kwargs)
+    with time_stage(PipelineStage.CALLBACK, org=kwargs.get("organization_id")):
+        return _process_batch_callback_core(self, results, *args, **kwargs)
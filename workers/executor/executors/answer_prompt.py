@@ -10,18 +10,37 @@ method when the plugin is installed.  Challenge and evaluation plugins
 are integrated at the caller level (LegacyExecutor).
 """
 
+import datetime
 import ipaddress
 import logging
 import os
+import re
 import socket
 from typing import Any
 from urllib.parse import urlparse
 
 from executor.executors.constants import PromptServiceConstants as PSKeys
 from executor.executors.exceptions import LegacyExecutorError, RateLimitError
+from shared.infrastructure.monitoring.pipeline_metrics import PipelineStage, time_stage
 
 logger = logging.getLogger(__name__)
 
+# Largest number of prompts answered by one batched completion.
+MAX_PROMPTS_PER_BATCH = 20
+
+# Scalar output types a batched completion can answer, with the JSON value
+# each key must hold.
+_BATCH_VALUE_HINTS = {
+    PSKeys.TEXT: "a string",
+    PSKeys.NUMBER: (
+        "a JSON number, fully expanded (no commas, currency, units or percent signs)"
+    ),
+    PSKeys.EMAIL: "a string holding one email address",
+    PSKeys.DATE: 'an ISO 8601 date string such as "2024-01-31"',
+    PSKeys.BOOLEAN: "true or false",
+}
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 def _resolve_host_addresses(host: str) -> set[str]:
     """Resolve a hostname or IP string to a set of IP address strings."""
@@ -139,6 +158,238 @@ class AnswerPromptService:
             )
             return False
 
+    @staticmethod
+    def _prefix_group(output: dict[str, Any]) -> tuple[Any, ...] | None:
+        """Prompts sharing this key send the same cacheable context prefix.
+
+        Full-context (``chunk_size == 0``) prompts on one LLM profile all carry
+        the whole document as their prefix. RAG, table and line-item prompts
+        get per-prompt context, so they form no group (``None``).
+        """
+        if output.get(PSKeys.TYPE) in (PSKeys.TABLE, PSKeys.RECORD, PSKeys.LINE_ITEM):
+            return None
+        if output.get(PSKeys.CHUNK_SIZE) != 0:
+            return None
+        return (output.get(PSKeys.LLM), output.get(PSKeys.X2TEXT_ADAPTER))
+
+    @staticmethod
+    def order_for_prefix_cache(prompts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Order prompts so those sharing a context prefix run back to back.
+
+        A provider-side prompt cache only pays off while the prefix is warm, so
+        every full-context prompt on the same LLM profile is pulled up behind
+        the first one instead of being interleaved with RAG prompts or other
+        LLMs. The reorder is stable otherwise, and never moves a prompt across
+        another prompt it references (``{{name}}`` / ``%name%``) in either
+        direction, so variable replacement sees exactly what it did before.
+        """
+        names = [p.get(PSKeys.NAME, "") for p in prompts]
+        before: list[set[int]] = [set() for _ in prompts]
+        for i, output in enumerate(prompts):
+            text = str(output.get(PSKeys.PROMPT, ""))
+            for j, name in enumerate(names):
+                if i == j or not name:
+                    continue
+                if f"%{name}%" in text or any(
+                    name in var for var in re.findall(r"{{(.*?)}}", text)
+                ):
+                    # Keep the original relative order of the pair.
+                    before[max(i, j)].add(min(i, j))
+
+        ordered: list[int] = []
+        placed: set[int] = set()
+        group = None
+        while len(ordered) < len(prompts):
+            ready = [
+                i for i in range(len(prompts)) if i not in placed and before[i] <= placed
+            ]
+            pick = next(
+                (
+                    i
+                    for i in ready
+                    if group is not None
+                    and AnswerPromptService._prefix_group(prompts[i]) == group
+                ),
+                ready[0],
+            )
+            group = AnswerPromptService._prefix_group(prompts[pick])
+            ordered.append(pick)
+            placed.add(pick)
+        return [prompts[i] for i in ordered]
+
+    @staticmethod
+    def is_prompt_batching_enabled(tool_settings: dict[str, Any]) -> bool:
+        """Whether compatible prompts of a run may share one completion.
+
+        Opt-in per project (``enable_prompt_batching`` tool setting) or
+        platform-wide (``ENABLE_PROMPT_BATCHING=true``).
+        """
+        if tool_settings.get(PSKeys.ENABLE_PROMPT_BATCHING):
+            return True
+        return os.environ.get("ENABLE_PROMPT_BATCHING", "").strip().lower() == "true"
+
+    @staticmethod
+    def _batch_group(output: dict[str, Any], names: list[str]) -> tuple[Any, ...] | None:
+        """Prompts sharing this key can be answered by one completion.
+
+        Only scalar, full-context prompts qualify — they all see the same
+        document on the same LLM profile — and only when nothing about them
+        needs a per-prompt pass: no variable references (in or out of the
+        prompt text), lookups or evaluation.
+        """
+        from executor.executors.constants import RetrievalStrategy
+
+        if output.get(PSKeys.TYPE, PSKeys.TEXT) not in _BATCH_VALUE_HINTS:
+            return None
+        if output.get(PSKeys.RETRIEVAL_STRATEGY) not in {
+            s.value for s in RetrievalStrategy
+        }:
+            return None
+        if output.get("lookup_config"):
+            return None
+        if (output.get(PSKeys.EVAL_SETTINGS) or {}).get(PSKeys.EVAL_SETTINGS_EVALUATE):
+            return None
+        text = str(output.get(PSKeys.PROMPT, ""))
+        if re.search(r"{{.*?}}", text) or any(f"%{name}%" in text for name in names):
+            return None
+        return AnswerPromptService._prefix_group(output)
+
+    @staticmethod
+    def plan_prompt_batches(
+        prompts: list[dict[str, Any]],
+        tool_settings: dict[str, Any],
+        max_size: int = MAX_PROMPTS_PER_BATCH,
+    ) -> list[list[dict[str, Any]]]:
+        """Group the prompts that can share one structured-output completion.
+
+        Returns batches of two or more prompts in their original order;
+        everything else runs one prompt per completion. Highlighting and
+        challenge work per prompt on the raw completion, so a run with either
+        enabled is never batched.
+        """
+        if tool_settings.get(PSKeys.ENABLE_HIGHLIGHT) or tool_settings.get(
+            PSKeys.ENABLE_CHALLENGE
+        ):
+            return []
+        names = [p.get(PSKeys.NAME, "") for p in prompts]
+        groups: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+        for output in prompts:
+            key = AnswerPromptService._batch_group(output, names)
+            if key is not None:
+                groups.setdefault(key, []).append(output)
+        batches: list[list[dict[str, Any]]] = []
+        for group in groups.values():
+            for start in range(0, len(group), max_size):
+                batch = group[start : start + max_size]
+                if len(batch) > 1:
+                    batches.append(batch)
+        return batches
+
+    @staticmethod
+    def construct_batched_prompt(
+        tool_settings: dict[str, Any],
+        batch: list[dict[str, Any]],
+        context: str,
+        cached: bool = False,
+    ) -> tuple[str | None, str]:
+        """Build one prompt asking every question of ``batch`` as a JSON object.
+
+        Each prompt becomes a key of the expected object with its question and
+        the value type its output type requires. Returns ``(cache_prefix,
+        prompt)`` like :meth:`construct_and_run_prompt` builds them — with
+        ``cached`` the document context leads as a cacheable prefix.
+        """
+        questions = "\n".join(
+            f'- "{output[PSKeys.NAME]}" '
+            f"({_BATCH_VALUE_HINTS[output.get(PSKeys.TYPE, PSKeys.TEXT)]}): "
+            f"{output[PSKeys.PROMPTX]}"
+            for output in batch
+        )
+        instruction = (
+            "Answer each of the following questions from the context. Respond "
+            "with a single JSON object that has exactly one key per question, "
+            "holding the answer in the type given in brackets. Use null when "
+            f"the context doesn't answer a question.\n{questions}"
+        )
+        prompt_args = {
+            "preamble": tool_settings.get(PSKeys.PREAMBLE, ""),
+            "prompt": instruction,
+            "postamble": tool_settings.get(PSKeys.POSTAMBLE, ""),
+            "grammar_list": tool_settings.get(PSKeys.GRAMMAR, []),
+            "context": context,
+            "platform_postamble": "",
+            "word_confidence_postamble": "",
+            "prompt_type": PSKeys.JSON,
+        }
+        if cached:
+            return AnswerPromptService.construct_cached_prompt(**prompt_args)
+        return None, AnswerPromptService.construct_prompt(**prompt_args)
+
+    @staticmethod
+    def coerce_batched_answer(output_type: str, value: Any) -> Any:
+        """Validate one value of a batched answer against its output type.
+
+        Returns the value as the per-prompt path would store it (``None`` for
+        an unanswered non-text prompt, ``"NA"`` for text). Raises
+        ``ValueError`` when the value doesn't fit the type, so the prompt is
+        re-run on its own.
+        """
+        if value is None or (isinstance(value, str) and value.strip().lower() == "na"):
+            return "NA" if output_type == PSKeys.TEXT else None
+        if output_type == PSKeys.TEXT:
+            if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                raise ValueError(f"expected text, got {type(value).__name__}")
+            return str(value)
+        if output_type == PSKeys.NUMBER:
+            if isinstance(value, bool):
+                raise ValueError("expected a number, got a boolean")
+            if isinstance(value, str):
+                value = value.strip().replace(",", "")
+            return float(value)
+        if output_type == PSKeys.BOOLEAN:
+            if isinstance(value, bool):
+                return value
+            flag = str(value).strip().lower()
+            if flag in ("yes", "true"):
+                return True
+            if flag in ("no", "false"):
+                return False
+            raise ValueError(f"expected a boolean, got {value!r}")
+        if not isinstance(value, str):
+            raise ValueError(f"expected a string, got {type(value).__name__}")
+        value = value.strip()
+        if output_type == PSKeys.EMAIL and not _EMAIL_RE.match(value):
+            raise ValueError(f"not an email address: {value!r}")
+        if output_type == PSKeys.DATE:
+            datetime.datetime.fromisoformat(value)
+        return value
+
+    @staticmethod
+    def parse_batched_answers(answer: str, batch: list[dict[str, Any]]) -> dict[str, Any]:
+        """Split a batched completion into per-prompt values.
+
+        Prompts missing from the JSON object or failing
+        :meth:`coerce_batched_answer` are left out of the result.
+        """
+        from executor.executors.json_repair_helper import repair_json_with_best_structure
+
+        parsed = repair_json_with_best_structure(answer)
+        if not isinstance(parsed, dict):
+            logger.warning("Batched completion is not a JSON object")
+            return {}
+        answers: dict[str, Any] = {}
+        for output in batch:
+            name = output[PSKeys.NAME]
+            if name not in parsed:
+                continue
+            try:
+                answers[name] = AnswerPromptService.coerce_batched_answer(
+                    output.get(PSKeys.TYPE, PSKeys.TEXT), parsed[name]
+                )
+            except ValueError as e:
+                logger.info("Batched answer for %s rejected: %s", name, e)
+        return answers
+
     @staticmethod
     def construct_and_run_prompt(
         tool_settings: dict[str, Any],
@@ -349,12 +600,13 @@ class AnswerPromptService:
             _sdk_error = Exception
 
         try:
-            completion = llm.complete(
-                prompt=prompt,
-                cache_prefix=cache_prefix,
-                process_text=process_text,
-                extract_json=prompt_type.lower() != PSKeys.TEXT,
-            )
+            with time_stage(PipelineStage.LLM_CALL):
+                completion = llm.complete(
+                    prompt=prompt,
+                    cache_prefix=cache_prefix,
+                    process_text=process_text,
+                    extract_json=prompt_type.lower() != PSKeys.TEXT,
+                )
             answer: str = completion[PSKeys.RESPONSE].text
             highlight_data = completion.get(PSKeys.HIGHLIGHT_DATA, [])
             confidence_data = completion.get(PSKeys.CONFIDENCE_DATA)
@@ -442,3 +694,64 @@ class AnswerPromptService:
             return
 
         structured_output[prompt_key] = parsed_data
+
+
+class PromptContextRegistry:
+    """Run-scoped context sharing across the prompts of one document.
+
+    Keeps the context each prompt sends byte-identical whenever it covers the
+    same text, so the provider sees one stable cacheable prefix instead of a
+    slightly different one per prompt:
+
+    * the full document for ``chunk_size == 0`` prompts is read once per file
+      and handed to every such prompt;
+    * a RAG prompt whose retrieved chunks are the same set another prompt
+      already sent reuses that prompt's chunk order (retrievers rank the same
+      chunks differently per query, which would otherwise change the prefix).
+
+    It also totals the LLMs' prompt-cache token counts into a per-run hit rate.
+    """
+
+    def __init__(self) -> None:
+        self._complete_context: dict[str, list[str]] = {}
+        self._chunk_layouts: dict[frozenset[str], list[str]] = {}
+        self._cache_usage = {
+            "prompt_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+        }
+
+    def complete_context(self, file_path: str, load: Any) -> list[str]:
+        """Return the full-document context, calling ``load()`` once per file."""
+        if file_path not in self._complete_context:
+            self._complete_context[file_path] = load()
+        return self._complete_context[file_path]
+
+    def stable_layout(self, context_list: list[str]) -> list[str]:
+        """Return ``context_list`` in the order first sent for the same chunks."""
+        key = frozenset(context_list)
+        if len(key) != len(context_list):
+            return context_list  # duplicate chunks; leave as retrieved
+        return self._chunk_layouts.setdefault(key, context_list)
+
+    def record_cache_usage(self, llm: Any) -> None:
+        """Add one LLM's prompt-cache token totals to the run."""
+        getter = getattr(llm, "get_prompt_cache_usage", None)
+        usage = getter() if callable(getter) else None
+        if not isinstance(usage, dict):
+            return
+        for key in self._cache_usage:
+            value = usage.get(key, 0)
+            if isinstance(value, int):
+                self._cache_usage[key] += value
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Prompt-cache totals and hit rate for the run; empty if nothing ran."""
+        prompt_tokens = self._cache_usage["prompt_tokens"]
+        if not prompt_tokens:
+            return {}
+        cache_read = self._cache_usage["cache_read_input_tokens"]
+        return {
+            **self._cache_usage,
+            "cache_hit_rate": round(cache_read / prompt_tokens, 4),
+        }
@@ -84,6 +84,9 @@ class PromptServiceConstants:
     LINE_ITEM = "line-item"
     LINE_NUMBERS = "line_numbers"
     WHISPER_HASH = "whisper_hash"
+    PROMPT_CACHE = "prompt_cache"
+    ENABLE_PROMPT_BATCHING = "enable_prompt_batching"
+    PROMPT_BATCHING = "prompt_batching"
     PAID_FEATURE_MSG = (
         "It is a cloud / enterprise feature. If you have purchased a plan and still "
         "face this issue, please contact support"
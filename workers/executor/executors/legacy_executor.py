@@ -1445,6 +1445,23 @@ class LegacyExecutor(BaseExecutor):
                 PSKeys.REQUIRED, None
             )
 
+        # ---- Prefix-cache layout --------------------------------------------
+        # With prompt caching on, run prompts sharing a full-document prefix
+        # back to back; the registry keeps each prompt's context byte-identical
+        # to what earlier prompts sent for the same text.
+        from executor.executors.answer_prompt import PromptContextRegistry
+        from executor.executors.retrieval import RetrievalCache
+
+        from unstract.sdk1.llm import is_prompt_caching_enabled
+
+        context_registry = PromptContextRegistry()
+        # Repeated retrievals (same doc, strategy, top_k, prompt) within this
+        # run hit the vector DB and embedding model once.
+        retrieval_cache = RetrievalCache()
+        prompt_order = list(variable_names)
+        if is_prompt_caching_enabled():
+            prompts = answer_prompt_svc.order_for_prefix_cache(prompts)
+
         # ---- Process each prompt -------------------------------------------
         _deps = (
             answer_prompt_svc,
@@ -1455,8 +1472,32 @@ class LegacyExecutor(BaseExecutor):
             vector_db_cls,
         )
         usage_records: list[dict[str, Any]] = []
+        batched: set[str] = set()
+        batch_stats: list[dict[str, Any]] = []
         try:
+            # Scalar full-context prompts on one LLM can share a completion;
+            # whatever a batch leaves unanswered runs on its own below.
+            if answer_prompt_svc.is_prompt_batching_enabled(tool_settings):
+                for batch in answer_prompt_svc.plan_prompt_batches(
+                    prompts, tool_settings
+                ):
+                    records, answered, stats = self._execute_prompt_batch(
+                        batch=batch,
+                        context=context,
+                        structured_output=structured_output,
+                        metadata=metadata,
+                        metrics=metrics,
+                        context_retrieval_metrics=context_retrieval_metrics,
+                        deps=_deps,
+                        tool_settings=tool_settings,
+                        context_registry=context_registry,
+                    )
+                    usage_records.extend(records)
+                    batched |= answered
+                    batch_stats.append(stats)
             for output in prompts:
+                if output[PSKeys.NAME] in batched:
+                    continue
                 usage_records.extend(
                     self._execute_single_prompt(
                         output=output,
@@ -1469,12 +1510,38 @@ class LegacyExecutor(BaseExecutor):
                         deps=_deps,
                         tool_settings=tool_settings,
                         process_text_fn=process_text_fn,
+                        context_registry=context_registry,
+                        retrieval_cache=retrieval_cache,
                     )
                 )
         except LegacyExecutorError as e:
             e.partial_usage_records = usage_records + e.partial_usage_records
             raise
 
+        # Report answers in the project's prompt order, whatever ran first.
+        structured_output = {
+            **{k: structured_output[k] for k in prompt_order if k in structured_output},
+            **structured_output,
+        }
+        if batch_stats:
+            metadata[PSKeys.PROMPT_BATCHING] = {
+                "batches": batch_stats,
+                "batched_prompts": len(batched),
+                "individual_prompts": len(prompts) - len(batched),
+            }
+        cache_stats = context_registry.cache_stats()
+        if cache_stats:
+            metadata[PSKeys.PROMPT_CACHE] = cache_stats
+            logger.info(
+                "Prompt cache: file=%s prompt_tokens=%d cache_read=%d "
+                "cache_write=%d hit_rate=%.2f",
+                doc_name,
+                cache_stats["prompt_tokens"],
+                cache_stats["cache_read_input_tokens"],
+                cache_stats["cache_creation_input_tokens"],
+                cache_stats["cache_hit_rate"],
+            )
+
         pipeline_shim.stream_log(f"All {len(prompts)} prompts processed successfully")
         logger.info(
             "All prompts processed: tool_id=%s prompt_count=%d file=%s",
@@ -1638,8 +1705,16 @@ class LegacyExecutor(BaseExecutor):
         deps: tuple,
         tool_settings: dict[str, Any],
         process_text_fn: Any,
+        context_registry: Any = None,
+        retrieval_cache: Any = None,
     ) -> list[dict[str, Any]]:
-        """Run one prompt end-to-end; return its usage rows."""
+        """Run one prompt end-to-end; return its usage rows.
+
+        ``context_registry`` (a run-scoped ``PromptContextRegistry``) shares the
+        full-document read across prompts and keeps repeated context identical
+        so it stays a cacheable prefix. ``retrieval_cache`` (a run-scoped
+        ``RetrievalCache``) memoises RAG retrievals and query embeddings.
+        """
         from executor.executors.constants import PromptServiceConstants as PSKeys
         from executor.executors.constants import RetrievalStrategy
 
@@ -1764,6 +1839,8 @@ class LegacyExecutor(BaseExecutor):
             usage_kwargs=usage_kwargs,
             prompt_name=prompt_name,
         )
+        if retrieval_cache is not None and embedding is not None:
+            retrieval_cache.attach(embedding)
 
         context_list: list[str] = []
         records: list[dict[str, Any]] = []
@@ -1781,12 +1858,25 @@ class LegacyExecutor(BaseExecutor):
                     chunk_size,
                 )
                 if chunk_size == 0:
-                    context_list = retrieval_svc.retrieve_complete_context(
-                        execution_source=execution_source,
-                        file_path=file_path,
-                        context_retrieval_metrics=context_retrieval_metrics,
-                        prompt_key=prompt_name,
-                    )
+
+                    def _load_complete_context() -> list[str]:
+                        return retrieval_svc.retrieve_complete_context(
+                            execution_source=execution_source,
+                            file_path=file_path,
+                            context_retrieval_metrics=context_retrieval_metrics,
+                            prompt_key=prompt_name,
+                        )
+
+                    if context_registry is None:
+                        context_list = _load_complete_context()
+                    else:
+                        context_list = context_registry.complete_context(
+                            file_path, _load_complete_context
+                        )
+                        # Shared with an earlier prompt: no read this time.
+                        context_retrieval_metrics.setdefault(
+                            prompt_name, {"time_taken(s)": 0.0}
+                        )
                 else:
                     context_list = retrieval_svc.run_retrieval(
                         output=output,
@@ -1795,7 +1885,13 @@ class LegacyExecutor(BaseExecutor):
                         vector_db=vector_db,
                         retrieval_type=retrieval_strategy,
                         context_retrieval_metrics=context_retrieval_metrics,
+                        retrieval_cache=retrieval_cache,
                     )
+                    if (
+                        context_registry is not None
+                        and answer_prompt_svc._llm_caches_prompts(llm)
+                    ):
+                        context_list = context_registry.stable_layout(context_list)
                 metadata[PSKeys.CONTEXT][prompt_name] = context_list
                 if chunk_size > 0:
                     shim.stream_log(
@@ -1901,6 +1997,8 @@ class LegacyExecutor(BaseExecutor):
             )
             e.partial_usage_records = records + flushed + e.partial_usage_records
             raise
+        if context_registry is not None:
+            context_registry.record_cache_usage(llm)
         records.extend(
             self._flush_per_prompt_metrics(
                 metrics=metrics,
@@ -1914,6 +2012,154 @@ class LegacyExecutor(BaseExecutor):
         )
         return records
 
+    def _execute_prompt_batch(
+        self,
+        batch: list[dict[str, Any]],
+        context: ExecutionContext,
+        structured_output: dict[str, Any],
+        metadata: dict[str, Any],
+        metrics: dict[str, Any],
+        context_retrieval_metrics: dict[str, Any],
+        deps: tuple,
+        tool_settings: dict[str, Any],
+        context_registry: Any = None,
+    ) -> tuple[list[dict[str, Any]], set[str], dict[str, Any]]:
+        """Answer a batch of scalar full-context prompts with one completion.
+
+        The batch's questions go out as one structured-output request over
+        the shared document context and the JSON object that comes back is
+        split into per-prompt answers. Returns the usage rows, the names that
+        got a valid answer, and the batch's stats; prompts whose value is
+        missing or fails type validation are left for the caller to run
+        individually.
+        """
+        from executor.executors.constants import PromptServiceConstants as PSKeys
+
+        (
+            answer_prompt_svc,
+            retrieval_svc,
+            _variable_replacement_svc,
+            llm_cls,
+            embedding_compat_cls,
+            vector_db_cls,
+        ) = deps
+
+        params = context.executor_params
+        execution_id = params.get(PSKeys.EXECUTION_ID, "")
+        file_path = params.get(PSKeys.FILE_PATH)
+        execution_source = params.get(PSKeys.EXECUTION_SOURCE, context.execution_source)
+        platform_api_key = params.get(PSKeys.PLATFORM_SERVICE_API_KEY, "")
+
+        names = [output[PSKeys.NAME] for output in batch]
+        label = names[0]
+        shim = self._build_shim(
+            platform_api_key=platform_api_key,
+            component={**self._log_component, "prompt_key": label},
+        )
+        shim.stream_log(
+            f"Running {len(batch)} prompts in one completion: "
+            + ", ".join(f"`{name}`" for name in names)
+        )
+        logger.info(
+            "Executing prompt batch: size=%d prompts=%s run_id=%s",
+            len(batch),
+            names,
+            context.run_id,
+        )
+
+        usage_kwargs = {"run_id": context.run_id, "execution_id": execution_id}
+        llm, _embedding, _vector_db = self._init_llm_and_retrieval(
+            output=batch[0],
+            shim=shim,
+            chunk_size=0,
+            llm_cls=llm_cls,
+            embedding_compat_cls=embedding_compat_cls,
+            vector_db_cls=vector_db_cls,
+            usage_kwargs=usage_kwargs,
+            prompt_name=label,
+        )
+        for output in batch:
+            output[PSKeys.PROMPTX] = output[PSKeys.PROMPT]
+
+        start = time.monotonic()
+        try:
+
+            def _load_complete_context() -> list[str]:
+                return retrieval_svc.retrieve_complete_context(
+                    execution_source=execution_source,
+                    file_path=file_path,
+                    context_retrieval_metrics=context_retrieval_metrics,
+                    prompt_key=label,
+                )
+
+            if context_registry is None:
+                context_list = _load_complete_context()
+            else:
+                context_list = context_registry.complete_context(
+                    file_path, _load_complete_context
+                )
+            cache_prefix, prompt_str = answer_prompt_svc.construct_batched_prompt(
+                tool_settings=tool_settings,
+                batch=batch,
+                context="\n".join(context_list),
+                cached=answer_prompt_svc._llm_caches_prompts(llm),
+            )
+            answer = answer_prompt_svc.run_completion(
+                llm=llm,
+                prompt=prompt_str,
+                cache_prefix=cache_prefix,
+                prompt_type=PSKeys.JSON,
+                file_path=file_path,
+                execution_source=execution_source,
+            )
+        except LegacyExecutorError as e:
+            # Flush before bubbling so partial rows survive.
+            e.partial_usage_records = (
+                list(llm.flush_pending_usage()) + e.partial_usage_records
+            )
+            raise
+        elapsed = time.monotonic() - start
+
+        answers = answer_prompt_svc.parse_batched_answers(answer, batch)
+        combined_prompt = (cache_prefix or "") + prompt_str
+        for output in batch:
+            name = output[PSKeys.NAME]
+            if name not in answers:
+                continue
+            output[PSKeys.COMBINED_PROMPT] = combined_prompt
+            metadata[PSKeys.CONTEXT][name] = context_list
+            structured_output[name] = answers[name]
+            metrics.setdefault(name, {}).update(
+                {
+                    "context_retrieval": context_retrieval_metrics.get(name, {}),
+                    "prompt_batch": label,
+                }
+            )
+        fallback = [name for name in names if name not in answers]
+        if fallback:
+            shim.stream_log(
+                "Running individually after batch validation: "
+                + ", ".join(f"`{name}`" for name in fallback)
+            )
+        logger.info(
+            "Prompt batch done: size=%d answered=%d fallback=%s time=%.2fs",
+            len(batch),
+            len(answers),
+            fallback,
+            elapsed,
+        )
+
+        if context_registry is not None:
+            context_registry.record_cache_usage(llm)
+        stats = {
+            "prompts": names,
+            "answered": len(answers),
+            "fallback": fallback,
+            "time_taken(s)": round(elapsed, 3),
+            f"{llm.get_usage_reason()}_llm": llm.get_metrics(),
+        }
+        return list(llm.flush_pending_usage()), set(answers), stats
+
     def _init_llm_and_retrieval(
         self,
         output: dict[str, Any],
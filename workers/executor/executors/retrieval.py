@@ -12,6 +12,87 @@ from executor.executors.constants import RetrievalStrategy
 
 logger = logging.getLogger(__name__)
 
+# Strategies whose retrievers call the LLM, so their results depend on it too.
+_LLM_BACKED_STRATEGIES = frozenset(
+    {
+        RetrievalStrategy.SUBQUESTION.value,
+        RetrievalStrategy.FUSION.value,
+        RetrievalStrategy.ROUTER.value,
+        RetrievalStrategy.KEYWORD_TABLE.value,
+    }
+)
+
+
+class QueryEmbeddingCache(dict):
+    """Query-embedding store that counts lookups.
+
+    Handed to ``EmbeddingCompat.use_query_embedding_cache``, which keys it by
+    ``(embedding model, query text)`` and only reads it through ``get``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, default)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+
+class RetrievalCache:
+    """Run-scoped memo of retrieval results for the prompts of one document.
+
+    Prompts of a project often repeat the same (or near-identical) question
+    with the same ``top_k`` and strategy. Results are memoised by
+    ``(doc_id, strategy, top_k, normalised prompt)`` — plus the LLM profile for
+    strategies that call the LLM — and query embeddings by ``(embedding model,
+    text)``, so a repeat skips the vector DB query, the embedding call and any
+    retriever LLM calls. Empty results are not memoised, keeping the
+    retriever's retry for vector DBs that lag behind a fresh index.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[Any, ...], list[str]] = {}
+        self.query_embeddings = QueryEmbeddingCache()
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        return " ".join(prompt.split()).casefold()
+
+    @classmethod
+    def key(
+        cls,
+        doc_id: str,
+        retrieval_type: str,
+        top_k: int,
+        prompt: str,
+        llm_profile: Any = None,
+    ) -> tuple[Any, ...]:
+        if retrieval_type not in _LLM_BACKED_STRATEGIES:
+            llm_profile = None
+        return (doc_id, retrieval_type, top_k, cls.normalize_prompt(prompt), llm_profile)
+
+    def get(self, key: tuple[Any, ...]) -> list[str] | None:
+        return self._results.get(key)
+
+    def put(self, key: tuple[Any, ...], context: list[str]) -> None:
+        if context:
+            self._results[key] = list(context)
+
+    def attach(self, embedding: Any) -> None:
+        """Route ``embedding``'s query embeddings through this run's cache."""
+        use_cache = getattr(embedding, "use_query_embedding_cache", None)
+        if callable(use_cache):
+            use_cache(self.query_embeddings)
+
+    def embedding_counts(self) -> tuple[int, int]:
+        return self.query_embeddings.hits, self.query_embeddings.misses
+
 
 class RetrievalService:
     @staticmethod
@@ -47,8 +128,15 @@ class RetrievalService:
         vector_db: Any,
         retrieval_type: str,
         context_retrieval_metrics: dict[str, Any] | None = None,
+        retrieval_cache: RetrievalCache | None = None,
     ) -> list[str]:
-        """Factory: instantiate and execute the retriever for the given strategy."""
+        """Factory: instantiate and execute the retriever for the given strategy.
+
+        With a ``retrieval_cache`` a repeated retrieval is served from the
+        run's memo, and the prompt's ``context_retrieval_metrics`` entry gains
+        ``retrieval_cache`` (``hit``/``miss``) and ``query_embedding_cache``
+        (hits/misses during this retrieval).
+        """
         from executor.executors.constants import PromptServiceConstants as PSKeys
 
         prompt = output[PSKeys.PROMPTX]
@@ -56,6 +144,31 @@ class RetrievalService:
         prompt_key = output.get(PSKeys.NAME, "<unknown>")
         start = datetime.datetime.now()
 
+        cache_key = None
+        if retrieval_cache is not None:
+            cache_key = retrieval_cache.key(
+                doc_id, retrieval_type, top_k, prompt, output.get(PSKeys.LLM)
+            )
+            cached = retrieval_cache.get(cache_key)
+            if cached is not None:
+                elapsed = (datetime.datetime.now() - start).total_seconds()
+                if context_retrieval_metrics is not None:
+                    context_retrieval_metrics[prompt_key] = {
+                        "time_taken(s)": elapsed,
+                        "retrieval_cache": "hit",
+                    }
+                logger.info(
+                    "[Retrieval] prompt='%s' doc_id=%s strategy='%s' top_k=%d "
+                    "chunks=%d served from run cache",
+                    prompt_key,
+                    doc_id,
+                    retrieval_type,
+                    top_k,
+                    len(cached),
+                )
+                return list(cached)
+            embedding_hits, embedding_misses = retrieval_cache.embedding_counts()
+
         retriever_map = RetrievalService._get_retriever_map()
         retriever_class = retriever_map.get(retrieval_type)
         if not retriever_class:
@@ -73,6 +186,19 @@ class RetrievalService:
         elapsed = (datetime.datetime.now() - start).total_seconds()
         if context_retrieval_metrics is not None:
             context_retrieval_metrics[prompt_key] = {"time_taken(s)": elapsed}
+        if retrieval_cache is not None:
+            retrieval_cache.put(cache_key, list(context))
+            hits, misses = retrieval_cache.embedding_counts()
+            if context_retrieval_metrics is not None:
+                context_retrieval_metrics[prompt_key].update(
+                    {
+                        "retrieval_cache": "miss",
+                        "query_embedding_cache": {
+                            "hits": hits - embedding_hits,
+                            "misses": misses - embedding_misses,
+                        },
+                    }
+                )
 
         logger.info(
             "[Retrieval] prompt='%s' doc_id=%s strategy='%s' top_k=%d "
@@ -20,6 +20,12 @@ from shared.clients import UsageAPIClient
 from shared.enums.task_enums import TaskName
 from shared.infrastructure.config import WorkerConfig
 from shared.infrastructure.logging import WorkerLogger
+from shared.infrastructure.monitoring.pipeline_metrics import (
+    PipelineStage,
+    StageOutcome,
+    bind_stage_labels,
+    time_stage,
+)
 
 from unstract.sdk1.execution.context import ExecutionContext
 from unstract.sdk1.execution.orchestrator import ExecutionOrchestrator
@@ -116,7 +122,16 @@ def execute_extraction(self, execution_context_dict: dict) -> dict:
         context._log_component = {}
 
     orchestrator = ExecutionOrchestrator()
-    result = orchestrator.execute(context)
+    delivery_info = getattr(self.request, "delivery_info", None) or {}
+    with (
+        bind_stage_labels(
+            queue=delivery_info.get("routing_key"), org=context.organization_id
+        ),
+        time_stage(PipelineStage.EXECUTOR) as stage,
+    ):
+        result = orchestrator.execute(context)
+        if not result.success:
+            stage.outcome = StageOutcome.ERROR
 
     usage_records = result.metadata.get("usage_records", [])
     if usage_records:
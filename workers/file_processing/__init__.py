@@ -9,6 +9,8 @@ from .tasks import (
     process_file_batch,
     process_file_batch_api,
     process_file_batch_resilient,
+    resume_deferred_file,
+    resume_deferred_file_error,
 )
 from .worker import app as celery_app
 
@@ -18,4 +20,6 @@ __all__ = [
     "process_file_batch",
     "process_file_batch_api",
     "process_file_batch_resilient",
+    "resume_deferred_file",
+    "resume_deferred_file_error",
 ]
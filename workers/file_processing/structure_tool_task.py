@@ -15,21 +15,27 @@ After (Celery-based):
     → executor worker → LegacyExecutor
 """
 
+import copy
 import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 from file_processing.worker import app
 from queue_backend import FairnessKey, worker_task
 from queue_backend.fairness import WorkloadType
+from queue_backend.pg_barrier import extend_barrier
 from queue_backend.pg_queue.executor_rpc import (
     RoutingExecutionDispatcher,
     get_executor_dispatcher,
 )
+from shared.enums import QueueName
 from shared.enums.task_enums import TaskName
+from shared.exceptions import ExecutionDeferred
 from shared.infrastructure.context import StateStore
 
 from unstract.sdk1.constants import ToolEnv, UsageKwargs
@@ -42,6 +48,38 @@ logger = logging.getLogger(__name__)
 # Reads from EXECUTOR_RESULT_TIMEOUT env, defaults to 3600.
 EXECUTOR_TIMEOUT = int(os.environ.get("EXECUTOR_RESULT_TIMEOUT", 3600))
 
+# Cap on executor jobs (agentic_table prompts + structure_pipeline) fanned
+# out concurrently for one file. Each in-flight job holds a thread blocked
+# on its reply in this process.
+EXECUTOR_FANOUT_MAX_WORKERS = int(os.environ.get("EXECUTOR_FANOUT_MAX_WORKERS", 8))
+
+# When enabled, a file whose only executor job is the structure_pipeline is
+# handed to the executor with on_success/on_error continuations instead of
+# being awaited, freeing the file_processing slot for the executor's runtime.
+# Only applies on the PG barrier path (see process_file_batch).
+STRUCTURE_TOOL_CONTINUATIONS_ENABLED = (
+    os.environ.get("STRUCTURE_TOOL_CONTINUATIONS_ENABLED", "false").lower() == "true"
+)
+
+# StateStore keys shared with file_processing.tasks: the batch scope a file
+# can be deferred from, and the executor result a continuation resumes with.
+CONTINUATION_SCOPE_KEY = "STRUCTURE_TOOL_CONTINUATION_SCOPE"
+CONTINUATION_RESULT_KEY = "STRUCTURE_TOOL_CONTINUATION_RESULT"
+
+# Continuations claim their own pg_batch_dedup slot, offset past any real
+# batch index so they can never collide with one.
+CONTINUATION_BATCH_INDEX_OFFSET = 1_000_000
+
+# Resolved tool metadata (exported tool + LLM profile overrides) is cached
+# in-process per execution, so a batch makes one platform-service round trip
+# instead of one per file. Entries expire after this many seconds; 0 disables.
+TOOL_METADATA_CACHE_TTL = int(os.environ.get("STRUCTURE_TOOL_METADATA_CACHE_TTL", 300))
+_TOOL_METADATA_CACHE_MAX_ENTRIES = 256
+
+# key -> (expires_at, tool_metadata, is_agentic)
+_tool_metadata_cache: dict[tuple[str, ...], tuple[float, dict, bool]] = {}
+_tool_metadata_cache_lock = threading.Lock()
+
 
 def _fairness_headers(
     organization_id: str,
@@ -230,6 +268,8 @@ def execute_structure_tool(self, params: dict) -> dict:
     """
     try:
         return _execute_structure_tool_impl(params)
+    except ExecutionDeferred:
+        raise
     except Exception as e:
         logger.error("Structure tool task failed: %s", e, exc_info=True)
         return ExecutionResult.failure(error=f"Structure tool failed: {e}").to_dict()
@@ -284,11 +324,15 @@ def _execute_structure_tool_impl(params: dict) -> dict:
     dispatcher = get_executor_dispatcher(celery_app=app)
     fs = _get_file_storage()
 
-    # ---- Step 2: Fetch tool metadata ----
+    # ---- Step 2/3: Fetch tool metadata and apply profile overrides ----
     prompt_registry_id = tool_instance_metadata.get(_SK.PROMPT_REGISTRY_ID, "")
-    logger.info("Fetching exported tool with UUID '%s'", prompt_registry_id)
-
-    tool_metadata, is_agentic = _fetch_tool_metadata(platform_helper, prompt_registry_id)
+    tool_metadata, is_agentic = _resolve_tool_metadata(
+        platform_helper,
+        prompt_registry_id,
+        exec_metadata,
+        organization_id=organization_id,
+        execution_id=execution_id,
+    )
 
     # ---- Route agentic vs regular ----
     if is_agentic:
@@ -307,9 +351,6 @@ def _execute_structure_tool_impl(params: dict) -> dict:
             execution_data_dir=execution_data_dir,
         )
 
-    # ---- Step 3: Profile overrides ----
-    _handle_profile_overrides(exec_metadata, platform_helper, tool_metadata)
-
     # ---- Extract settings from tool_metadata ----
     settings = tool_instance_metadata
     is_challenge_enabled = settings.get(_SK.ENABLE_CHALLENGE, False)
@@ -443,7 +484,7 @@ def _execute_structure_tool_impl(params: dict) -> dict:
             "prompt_keys": prompt_keys,
         }
 
-    # ---- Step 6a: Dispatch agentic_table prompts ----
+    # ---- Step 6: Build executor jobs ----
     # Each agentic_table prompt runs in its own executor invocation.
     # The executor handles X2Text extraction internally; we just
     # forward the document path and the per-prompt settings unpacked
@@ -456,7 +497,7 @@ def _execute_structure_tool_impl(params: dict) -> dict:
     # ("PDFium: Data format error"). SOURCE is the immutable original
     # PDF written alongside INFILE by the source connector.
     agentic_source_path = str(execution_run_data_folder / "SOURCE")
-    agentic_results: dict[str, Any] = {}
+    contexts: list[ExecutionContext] = []
     for at_output in agentic_table_outputs:
         at_settings = at_output.get("agentic_table_settings") or {}
         json_structure = at_settings.get("json_structure")
@@ -483,32 +524,24 @@ def _execute_structure_tool_impl(params: dict) -> dict:
             # when a lookup is assigned; None otherwise.
             "lookup_config": at_output.get("lookup_config"),
         }
-        at_ctx = ExecutionContext(
-            executor_name="agentic_table",
-            operation="table_extract",
-            run_id=file_execution_id,
-            execution_source="tool",
-            organization_id=organization_id,
-            request_id=file_execution_id,
-            log_events_id=log_events_id,
-            execution_id=execution_id,
-            file_execution_id=file_execution_id,
-            executor_params=agentic_params,
-        )
-        at_result = dispatcher.dispatch(
-            at_ctx,
-            timeout=EXECUTOR_TIMEOUT,
-            headers=_fairness_headers(organization_id),
+        contexts.append(
+            ExecutionContext(
+                executor_name="agentic_table",
+                operation="table_extract",
+                run_id=file_execution_id,
+                execution_source="tool",
+                organization_id=organization_id,
+                request_id=file_execution_id,
+                log_events_id=log_events_id,
+                execution_id=execution_id,
+                file_execution_id=file_execution_id,
+                executor_params=agentic_params,
+            )
         )
-        if not at_result.success:
-            return at_result.to_dict()
-        at_output_data = at_result.data.get("output", {}) or {}
-        agentic_results[at_output[_SK.NAME]] = at_output_data.get("tables", [])
 
-    # ---- Step 6b: Dispatch legacy structure_pipeline ----
-    # Skipped entirely when every prompt is agentic_table — the legacy
-    # pipeline has no work to do and the agentic_table executor does
-    # its own X2Text inside the runner.
+    # The legacy structure_pipeline is skipped entirely when every prompt
+    # is agentic_table — it has no work to do and the agentic_table
+    # executor does its own X2Text inside the runner.
     if regular_outputs:
         logger.info(
             "Dispatching structure_pipeline: tool_id=%s "
@@ -518,37 +551,57 @@ def _execute_structure_tool_impl(params: dict) -> dict:
             is_summarization_enabled,
             is_single_pass_enabled,
         )
-
-        pipeline_ctx = ExecutionContext(
-            executor_name="legacy",
-            operation="structure_pipeline",
-            run_id=file_execution_id,
-            execution_source="tool",
-            organization_id=organization_id,
-            request_id=file_execution_id,
-            log_events_id=log_events_id,
-            execution_id=execution_id,
-            file_execution_id=file_execution_id,
-            executor_params={
-                "extract_params": extract_params,
-                "index_template": index_template,
-                "answer_params": answer_params,
-                "pipeline_options": pipeline_options,
-                "summarize_params": summarize_params,
-            },
+        contexts.append(
+            ExecutionContext(
+                executor_name="legacy",
+                operation="structure_pipeline",
+                run_id=file_execution_id,
+                execution_source="tool",
+                organization_id=organization_id,
+                request_id=file_execution_id,
+                log_events_id=log_events_id,
+                execution_id=execution_id,
+                file_execution_id=file_execution_id,
+                executor_params={
+                    "extract_params": extract_params,
+                    "index_template": index_template,
+                    "answer_params": answer_params,
+                    "pipeline_options": pipeline_options,
+                    "summarize_params": summarize_params,
+                },
+            )
         )
+
+    # ---- Step 6a: Fan out agentic_table + structure_pipeline jobs ----
+    # The jobs are independent executor invocations for the same file, so
+    # they run concurrently: the file waits max(jobs) instead of sum(jobs).
+    # A continuation resuming this file already holds the single job's
+    # result; a lone job may instead be deferred to a continuation.
+    resumed = _take_continuation_result(file_execution_id, len(contexts))
+    if resumed is not None:
+        results, failure, pipeline_elapsed = resumed
+    else:
+        if len(contexts) == 1 and _defer_to_continuation(
+            dispatcher, contexts[0], organization_id, source_file_name
+        ):
+            raise ExecutionDeferred(
+                f"structure_pipeline for file_execution_id={file_execution_id} "
+                "deferred to executor continuation"
+            )
         pipeline_start = time.monotonic()
-        pipeline_result = dispatcher.dispatch(
-            pipeline_ctx,
-            timeout=EXECUTOR_TIMEOUT,
-            headers=_fairness_headers(organization_id),
-        )
+        results, failure = _dispatch_concurrently(dispatcher, contexts, organization_id)
         pipeline_elapsed = time.monotonic() - pipeline_start
+    if failure is not None:
+        return failure.to_dict()
 
-        if not pipeline_result.success:
-            return pipeline_result.to_dict()
+    agentic_results: dict[str, Any] = {}
+    for at_output, at_result in zip(agentic_table_outputs, results, strict=False):
+        at_output_data = at_result.data.get("output", {}) or {}
+        agentic_results[at_output[_SK.NAME]] = at_output_data.get("tables", [])
 
-        structured_output = pipeline_result.data
+    # ---- Step 6b: Merge agentic tables into the pipeline output ----
+    if regular_outputs:
+        structured_output = results[-1].data
         if agentic_results:
             structured_output.setdefault("output", {}).update(agentic_results)
     else:
@@ -557,7 +610,6 @@ def _execute_structure_tool_impl(params: dict) -> dict:
             "output": agentic_results,
             "metadata": {"agentic_only": True},
         }
-        pipeline_elapsed = 0.0
 
     # ---- Step 7: Write output files ----
     # (metadata/metrics merging already done by executor pipeline)
@@ -587,6 +639,210 @@ def _execute_structure_tool_impl(params: dict) -> dict:
 # -----------------------------------------------------------------------
 
 
+def _dispatch_concurrently(
+    dispatcher: RoutingExecutionDispatcher,
+    contexts: list[ExecutionContext],
+    organization_id: str,
+) -> tuple[list[ExecutionResult], ExecutionResult | None]:
+    """Dispatch independent executor jobs concurrently and wait for all.
+
+    Each job is a blocking request-reply on its own pool thread, so this
+    works identically over the Celery and PG executor transports. A single
+    job is dispatched inline (no pool).
+
+    The first failure wins: jobs not yet started are cancelled and the
+    caller stops waiting on the rest. Jobs already in flight on the
+    executor cannot be revoked on either transport — they finish in the
+    background and their results are discarded.
+
+    Returns:
+        Tuple of (results in ``contexts`` order, first failure or ``None``).
+        The results list is empty when a failure is returned.
+    """
+    if len(contexts) <= 1:
+        results = [_dispatch_one(dispatcher, ctx, organization_id) for ctx in contexts]
+        failure = next((r for r in results if not r.success), None)
+        return ([], failure) if failure else (results, None)
+
+    pool = ThreadPoolExecutor(
+        max_workers=min(len(contexts), EXECUTOR_FANOUT_MAX_WORKERS),
+        thread_name_prefix="structure-fanout",
+    )
+    future_to_idx = {
+        pool.submit(_dispatch_one, dispatcher, ctx, organization_id): idx
+        for idx, ctx in enumerate(contexts)
+    }
+    results: list[ExecutionResult | None] = [None] * len(contexts)
+    try:
+        for future in as_completed(future_to_idx):
+            result = future.result()
+            if not result.success:
+                idx = future_to_idx[future]
+                logger.warning(
+                    "Executor job %d/%d (%s.%s) failed; abandoning remaining jobs "
+                    "for file_execution_id=%s",
+                    idx + 1,
+                    len(contexts),
+                    contexts[idx].executor_name,
+                    contexts[idx].operation,
+                    contexts[idx].file_execution_id,
+                )
+                return [], result
+            results[future_to_idx[future]] = result
+    finally:
+        # Never block on abandoned in-flight jobs after a failure.
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results, None
+
+
+def _dispatch_one(
+    dispatcher: RoutingExecutionDispatcher,
+    context: ExecutionContext,
+    organization_id: str,
+) -> ExecutionResult:
+    """Blocking dispatch of one executor job; never raises."""
+    try:
+        return dispatcher.dispatch(
+            context,
+            timeout=EXECUTOR_TIMEOUT,
+            headers=_fairness_headers(organization_id),
+        )
+    except Exception as e:
+        logger.error(
+            "Executor dispatch raised for %s.%s: %s",
+            context.executor_name,
+            context.operation,
+            e,
+            exc_info=True,
+        )
+        return ExecutionResult.failure(error=f"{type(e).__name__}: {e}")
+
+
+def _take_continuation_result(
+    file_execution_id: str, job_count: int
+) -> tuple[list[ExecutionResult], ExecutionResult | None, float] | None:
+    """Pop the executor result a continuation is resuming this file with.
+
+    Returns ``(results, failure, elapsed)`` shaped like a fresh dispatch, or
+    ``None`` when there is nothing to resume (the normal path). A stored
+    result for another file, or for a tool whose job count changed since the
+    hand-off, is discarded and the jobs are dispatched afresh.
+    """
+    stored = StateStore.get(CONTINUATION_RESULT_KEY)
+    if not stored:
+        return None
+    StateStore.clear(CONTINUATION_RESULT_KEY)
+    if stored.get("file_execution_id") != file_execution_id or job_count != 1:
+        logger.warning(
+            "Discarding continuation result for file_execution_id=%s "
+            "(resuming file_execution_id=%s with %d executor job(s))",
+            stored.get("file_execution_id"),
+            file_execution_id,
+            job_count,
+        )
+        return None
+    result = ExecutionResult.from_dict(stored.get("result") or {})
+    elapsed = max(time.time() - float(stored.get("dispatched_at") or time.time()), 0.0)
+    if not result.success:
+        return [], result, elapsed
+    return [result], None, elapsed
+
+
+def _find_file_item(files: list[Any], file_name: str) -> Any | None:
+    """Return the batch entry for ``file_name`` (list, tuple or dict format)."""
+    for item in files:
+        if isinstance(item, (list, tuple)) and len(item) == 2:
+            if item[0] == file_name:
+                return item
+        elif isinstance(item, dict) and item.get("file_name") == file_name:
+            return item
+    return None
+
+
+def _defer_to_continuation(
+    dispatcher: RoutingExecutionDispatcher,
+    context: ExecutionContext,
+    organization_id: str,
+    source_file_name: str,
+) -> bool:
+    """Hand the file's executor job off with on_success/on_error continuations.
+
+    Only possible inside a PG barrier batch (``CONTINUATION_SCOPE_KEY`` set by
+    ``process_file_batch``): the continuation re-enters the file as a
+    one-file batch and decrements the barrier itself, so the barrier is
+    extended by one *before* the dispatch. Returns ``True`` if the job was
+    handed off; ``False`` means the caller must dispatch and wait as usual.
+    """
+    if not STRUCTURE_TOOL_CONTINUATIONS_ENABLED:
+        return False
+    scope = StateStore.get(CONTINUATION_SCOPE_KEY)
+    if not scope:
+        return False
+
+    file_batch_data = scope["file_batch_data"]
+    barrier_context = scope["barrier_context"]
+    file_item = _find_file_item(file_batch_data.get("files") or [], source_file_name)
+    file_hash_dict = file_item[1] if isinstance(file_item, (list, tuple)) else file_item
+    file_number = (file_hash_dict or {}).get("file_number")
+    if file_number is None:
+        logger.info(
+            "No file_number for '%s' in the batch; awaiting executor in-process",
+            source_file_name,
+        )
+        return False
+
+    execution_id = str(barrier_context["execution_id"])
+    callback_kwargs = {
+        "file_batch_data": {**file_batch_data, "files": [file_item]},
+        "barrier_context": {
+            **barrier_context,
+            "batch_index": CONTINUATION_BATCH_INDEX_OFFSET + int(file_number),
+        },
+        "file_execution_id": context.file_execution_id,
+        "dispatched_at": time.time(),
+    }
+
+    if extend_barrier(execution_id) is None:
+        logger.warning(
+            "[exec:%s] Barrier gone; not deferring '%s'", execution_id, source_file_name
+        )
+        return False
+    try:
+        dispatcher.dispatch_with_callback(
+            context,
+            on_success=app.signature(
+                str(TaskName.RESUME_DEFERRED_FILE),
+                kwargs={"callback_kwargs": callback_kwargs},
+                queue=QueueName.FILE_PROCESSING.value,
+            ),
+            on_error=app.signature(
+                str(TaskName.RESUME_DEFERRED_FILE_ERROR),
+                kwargs={"callback_kwargs": callback_kwargs},
+                queue=QueueName.FILE_PROCESSING.value,
+            ),
+            headers=_fairness_headers(organization_id),
+        )
+    except Exception:
+        logger.exception(
+            "[exec:%s] Continuation dispatch failed for '%s'; awaiting executor "
+            "in-process instead",
+            execution_id,
+            source_file_name,
+        )
+        # Our own batch has not decremented yet, so this cannot reach 0.
+        extend_barrier(execution_id, -1)
+        return False
+
+    logger.info(
+        "[exec:%s] Deferred structure_pipeline for '%s' (file_execution_id=%s) "
+        "to executor continuation",
+        execution_id,
+        source_file_name,
+        context.file_execution_id,
+    )
+    return True
+
+
 def _create_platform_helper(shim, request_id: str):
     """Create PlatformHelper using env vars for host/port."""
     from unstract.sdk1.platform import PlatformHelper
@@ -606,6 +862,64 @@ def _get_file_storage():
     return FileSystem(FileStorageType.WORKFLOW_EXECUTION).get_file_storage()
 
 
+def _resolve_tool_metadata(
+    platform_helper,
+    prompt_registry_id: str,
+    exec_metadata: dict,
+    organization_id: str,
+    execution_id: str,
+) -> tuple[dict, bool]:
+    """Return tool metadata with profile overrides applied, cached per execution.
+
+    Every file of an execution runs the same exported tool and LLM profile, so
+    the first file resolves them and the rest reuse the result until
+    ``TOOL_METADATA_CACHE_TTL`` expires. Keying on the execution means a tool
+    re-exported mid-run is picked up by the next execution, not halfway
+    through this one. Callers get a private copy since the pipeline mutates it.
+    """
+    llm_profile_id = exec_metadata.get(_SK.LLM_PROFILE_ID) or ""
+    key = (organization_id, execution_id, prompt_registry_id, llm_profile_id)
+    use_cache = bool(execution_id) and TOOL_METADATA_CACHE_TTL > 0
+
+    if use_cache:
+        with _tool_metadata_cache_lock:
+            entry = _tool_metadata_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            logger.debug(
+                "Using cached tool metadata for '%s' (execution %s)",
+                prompt_registry_id,
+                execution_id,
+            )
+            return copy.deepcopy(entry[1]), entry[2]
+
+    logger.info("Fetching exported tool with UUID '%s'", prompt_registry_id)
+    tool_metadata, is_agentic = _fetch_tool_metadata(platform_helper, prompt_registry_id)
+    # Agentic projects carry no prompt-studio profile to override.
+    if not is_agentic:
+        _handle_profile_overrides(exec_metadata, platform_helper, tool_metadata)
+
+    if use_cache:
+        now = time.monotonic()
+        with _tool_metadata_cache_lock:
+            if len(_tool_metadata_cache) >= _TOOL_METADATA_CACHE_MAX_ENTRIES:
+                for stale in [k for k, v in _tool_metadata_cache.items() if v[0] <= now]:
+                    del _tool_metadata_cache[stale]
+                if len(_tool_metadata_cache) >= _TOOL_METADATA_CACHE_MAX_ENTRIES:
+                    _tool_metadata_cache.pop(next(iter(_tool_metadata_cache)))
+            _tool_metadata_cache[key] = (
+                now + TOOL_METADATA_CACHE_TTL,
+                copy.deepcopy(tool_metadata),
+                is_agentic,
+            )
+    return tool_metadata, is_agentic
+
+
+def clear_tool_metadata_cache() -> None:
+    """Drop all cached tool metadata (tests, or after a tool re-export)."""
+    with _tool_metadata_cache_lock:
+        _tool_metadata_cache.clear()
+
+
 def _fetch_tool_metadata(platform_helper, prompt_registry_id: str) -> tuple[dict, bool]:
     """Fetch tool metadata from platform, trying prompt studio then agentic.
 
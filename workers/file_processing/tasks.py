@@ -5,11 +5,17 @@ Uses WorkflowExecutionService pattern exactly like the Django backend.
 This replaces the heavy Django process_file_batch task with API-based coordination.
 """
 
+import contextvars
 import json
 import os
 import time
+from dataclasses import dataclass, replace
 from typing import Any
 
+from file_processing.structure_tool_task import (
+    CONTINUATION_RESULT_KEY,
+    CONTINUATION_SCOPE_KEY,
+)
 from queue_backend import worker_task
 from queue_backend.barrier import BarrierContext
 from queue_backend.pg_barrier import (
@@ -41,10 +47,14 @@ from shared.infrastructure.logging.helpers import (
     log_file_processing_start,
     log_file_processing_success,
 )
+from shared.infrastructure.logging.logger import LogContext
+from shared.infrastructure.monitoring.pipeline_metrics import bind_stage_labels
 from shared.models.execution_models import (
     WorkflowContextData,
     create_organization_context,
 )
+from shared.parallel_map import parallel_map
+from shared.processing.files import FileProcessingUtils
 from shared.processing.files.processor import FileProcessor
 
 from unstract.core.data_models import (
@@ -361,6 +371,22 @@ def _run_batch_stages(
     return _compile_batch_result(context)
 
 
+def _batch_stage_labels(task_instance, file_batch_data: dict[str, Any]):
+    """Bind the delivery queue and org for the pipeline stage metrics observed
+    while this batch runs (source fetch, tool run, destination write).
+
+    On the PG path the task runs eagerly (no ``routing_key``), so the queue
+    bound by the PG consumer around the task is kept.
+    """
+    request = getattr(task_instance, "request", None)
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    file_data = file_batch_data.get("file_data") or {}
+    return bind_stage_labels(
+        queue=delivery_info.get("routing_key"),
+        org=file_data.get("organization_id"),
+    )
+
+
 def _process_file_batch_core(
     task_instance,
     file_batch_data: dict[str, Any],
@@ -390,16 +416,108 @@ def _process_file_batch_core(
     if barrier_context is None:
         # Celery chord path — the chord's .link runs the decrement after this.
         # is_pg=False disables the terminal guard → Celery flow unchanged.
-        return _run_batch_stages(file_batch_data, celery_task_id, is_pg=False)
+        with _batch_stage_labels(task_instance, file_batch_data):
+            return _run_batch_stages(file_batch_data, celery_task_id, is_pg=False)
 
     # PG fire-and-forget path — claim the batch (idempotent on redelivery), run
     # the stages, then decrement the barrier in-body / self-chain the callback.
     # is_pg=True enables the terminal guard (skip a stale/redelivered batch for a
-    # reaper-recovered execution).
-    return run_batch_with_barrier(
-        barrier_context,
-        lambda: _run_batch_stages(file_batch_data, celery_task_id, is_pg=True),
+    # reaper-recovered execution). The continuation scope lets the structure tool
+    # hand a file off to an executor continuation that decrements on its own.
+    def _work() -> dict[str, Any]:
+        StateStore.set(
+            CONTINUATION_SCOPE_KEY,
+            {"file_batch_data": file_batch_data, "barrier_context": barrier_context},
+        )
+        try:
+            with _batch_stage_labels(task_instance, file_batch_data):
+                return _run_batch_stages(file_batch_data, celery_task_id, is_pg=True)
+        finally:
+            StateStore.clear(CONTINUATION_SCOPE_KEY)
+
+    return run_batch_with_barrier(barrier_context, _work)
+
+
+def _resume_deferred_file(
+    task_instance,
+    executor_result: dict[str, Any],
+    callback_kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Resume a file whose structure_pipeline was deferred to the executor.
+
+    Runs the file as a one-file batch under the continuation's own barrier
+    slot (claimed like any batch, so a redelivered continuation is skipped).
+    The executor result is parked in the StateStore for the structure tool to
+    pick up in place of a fresh dispatch; the rest of the file — output
+    writes, destination, status — runs exactly as in the original batch, and
+    the one-file batch result is what decrements the barrier.
+    """
+    celery_task_id = (
+        task_instance.request.id if hasattr(task_instance, "request") else "unknown"
+    )
+    file_batch_data = callback_kwargs["file_batch_data"]
+    file_execution_id = callback_kwargs["file_execution_id"]
+
+    def _work() -> dict[str, Any]:
+        StateStore.set(
+            CONTINUATION_RESULT_KEY,
+            {
+                "file_execution_id": file_execution_id,
+                "result": executor_result,
+                "dispatched_at": callback_kwargs.get("dispatched_at"),
+            },
+        )
+        try:
+            with _batch_stage_labels(task_instance, file_batch_data):
+                return _run_deferred_file_stages(
+                    file_batch_data, file_execution_id, celery_task_id
+                )
+        finally:
+            StateStore.clear(CONTINUATION_RESULT_KEY)
+
+    return run_batch_with_barrier(callback_kwargs["barrier_context"], _work)
+
+
+def _run_deferred_file_stages(
+    file_batch_data: dict[str, Any], file_execution_id: str, celery_task_id: str
+) -> dict[str, Any]:
+    """Batch stages for a resumed file.
+
+    Pre-create is replaced by a lookup of the file execution the original batch
+    already created.
+    """
+    batch_data = _validate_and_parse_batch_data(file_batch_data)
+    try:
+        context = _setup_execution_context(batch_data, celery_task_id, is_pg=True)
+    except _TerminalExecutionSkip as skip:
+        logger.warning(
+            f"[exec:{skip.execution_id}] Not resuming deferred file execution "
+            f"{file_execution_id}: execution already terminal ({skip.status})."
+        )
+        return _terminal_skip_result(batch_data)
+
+    file_item = batch_data.files[0]
+    if isinstance(file_item, dict):
+        file_name, file_hash_dict = file_item.get("file_name"), file_item
+    else:
+        file_name, file_hash_dict = file_item
+    file_hash = _create_file_hash_from_dict(
+        file_name=file_name, file_hash_dict=file_hash_dict, file_data=batch_data.file_data
     )
+    file_hash.use_file_history = context.get_setting("use_file_history", True)
+    api_client = context.organization_context.api_client
+    context.pre_created_file_executions = {
+        file_name: PreCreatedFileData(
+            id=str(file_execution_id),
+            object=api_client.get_workflow_file_execution(file_execution_id),
+            file_hash=file_hash,
+        )
+    }
+    context.metadata["skipped_already_completed"] = set()
+    context.metadata["skipped_active_duplicate"] = set()
+
+    context = _process_individual_files(context)
+    return _compile_batch_result(context)
 
 
 @worker_task(
@@ -436,6 +554,37 @@ def process_file_batch(
     return _process_file_batch_core(self, file_batch_data, _barrier_context)
 
 
+@worker_task(bind=True, name=TaskName.RESUME_DEFERRED_FILE, max_retries=0)
+def resume_deferred_file(
+    self,
+    result_dict: dict[str, Any],
+    callback_kwargs: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """on_success continuation of a deferred structure_pipeline dispatch.
+
+    ``result_dict`` is the executor's ``ExecutionResult`` dict — an
+    executor-reported failure (``success=False``) arrives here too and fails
+    the file through the normal path.
+    """
+    return _resume_deferred_file(self, result_dict, callback_kwargs or {})
+
+
+@worker_task(bind=True, name=TaskName.RESUME_DEFERRED_FILE_ERROR, max_retries=0)
+def resume_deferred_file_error(
+    self,
+    failed_task_id: str,
+    callback_kwargs: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """on_error continuation of a deferred structure_pipeline dispatch.
+
+    The executor task itself raised; the file is resumed with a failure
+    result so it is marked ERROR and still accounted for in the barrier.
+    """
+    cb = callback_kwargs or {}
+    error = cb.get("error") or f"Executor task {failed_task_id} failed"
+    return _resume_deferred_file(self, {"success": False, "data": {}, "error": error}, cb)
+
+
 def _validate_and_parse_batch_data(file_batch_data: dict[str, Any]) -> FileBatchData:
     """Validate and parse input data into typed dataclass.
 
@@ -685,9 +834,36 @@ def _refactored_pre_create_file_executions(
     return context
 
 
+@dataclass
+class _PreparedFile:
+    """A batch file that passed the skip checks and is ready to process."""
+
+    file_name: str
+    file_number: int
+    file_hash: FileHashData
+    file_execution_id: str
+    file_execution_object: Any
+
+
+@dataclass
+class _FileRunOutcome:
+    """What one file's run hands back for result aggregation."""
+
+    result: FileProcessingResult | None
+    started_at: float
+    finished_at: float
+
+
 def _process_individual_files(context: WorkflowContextData) -> WorkflowContextData:
     """Process each file individually through the workflow.
 
+    Files run sequentially by default. When the organization's
+    ``MAX_FILE_CONCURRENCY_PER_BATCH`` is above 1 (see
+    ``FileProcessingUtils.get_file_concurrency`` for connector caps), they run
+    on a bounded thread pool instead - most of a file's wall time is network
+    I/O (source download, executor/LLM calls, destination writes) - and their
+    results are aggregated afterwards in batch order on this thread.
+
     Args:
         context: Workflow context data
 
@@ -695,208 +871,108 @@ def _process_individual_files(context: WorkflowContextData) -> WorkflowContextDa
         Updated context with processing results
     """
     files = list(context.files.values())  # Convert dict back to list
-    file_data = context.metadata["file_data"]
-    # CRITICAL FIX: Use q_file_no_list from context metadata for manual review decisions
-    # q_file_no_list = context.metadata.get("q_file_no_list", set())
-    use_file_history = context.get_setting("use_file_history", True)
-    api_client = context.organization_context.api_client
-    workflow_execution = context.metadata["workflow_execution"]
     pre_created_file_executions = context.pre_created_file_executions
-    skipped_already_completed = context.metadata.get("skipped_already_completed", [])
-    skipped_active_duplicate = context.metadata.get("skipped_active_duplicate", [])
+    skipped_already_completed = context.metadata.get("skipped_already_completed", set())
+    skipped_active_duplicate = context.metadata.get("skipped_active_duplicate", set())
     result = context.metadata["result"]
     successful_files_for_manual_review = context.metadata[
         "successful_files_for_manual_review"
     ]
+    use_file_history = context.get_setting("use_file_history", True)
+    api_client = context.organization_context.api_client
     celery_task_id = context.get_setting("celery_task_id", "unknown")
-    total_files = context.metadata["total_files"]
+    workflow_logger = context.metadata.get("workflow_logger")
 
-    # Process each file - handle list, tuple, and dictionary formats
+    prepared_files: list[_PreparedFile] = []
     for file_number, file_item in enumerate(files, 1):
-        # Handle Django list format (from asdict serialization), tuple format, and dictionary format
-        if isinstance(file_item, list):
-            # Django backend format after asdict(): [file_name, file_hash_dict]
-            if len(file_item) != 2:
-                logger.error(
-                    f"Invalid file item list length: expected 2, got {len(file_item)}"
-                )
-                result.increment_failure()
-                continue
-            file_name, file_hash_dict = file_item
-        elif isinstance(file_item, tuple):
-            # Legacy tuple format: (file_name, file_hash_dict)
-            file_name, file_hash_dict = file_item
-        elif isinstance(file_item, dict):
-            # Dictionary format: {"file_name": "...", "file_path": "...", ...}
-            file_name = file_item.get("file_name")
-            file_hash_dict = file_item  # The entire dict is the file hash data
-        else:
-            logger.error(f"Unexpected file item format: {type(file_item)}")
-            result.increment_failure()
-            continue
-
-        pre_created_file_execution = pre_created_file_executions.get(file_name)
-
-        if not pre_created_file_execution:
-            # Check if this file was intentionally skipped as a duplicate
-            # Construct identifier from file_hash_dict to match skipped_files format
-            provider_uuid = file_hash_dict.get("provider_file_uuid")
-            file_path = file_hash_dict.get("file_path")
-            if provider_uuid and file_path:
-                file_identifier = f"{provider_uuid}:{file_path}"
-                # Check both skip lists and handle differently
-                if file_identifier in skipped_already_completed:
-                    # File already COMPLETED in this execution - duplicate prevention worked
-                    logger.info(
-                        f"File '{file_name}' already completed in this execution - skipping (not a failure)"
-                    )
-                    # Don't increment failure - file is done, duplicate prevention worked
-                    continue
-                elif file_identifier in skipped_active_duplicate:
-                    # File ACTIVE in different execution - user error (concurrent submission)
-                    logger.info(
-                        f"File '{file_name}' active in another execution - marked as ERROR (counted as failure)"
-                    )
-                    # Increment failure - this IS a user error (submitting same file to multiple executions)
-                    result.increment_failure()
-                    continue
-
-            # Truly missing - this is an error condition
-            logger.error(
-                f"No pre-created WorkflowFileExecution found for file '{file_name}' - unexpected error"
-            )
-            result.increment_failure()
-            continue
-
-        file_hash: FileHashData = pre_created_file_execution.file_hash
-        if not file_hash:
-            logger.error(f"File hash not found for file '{file_name}'")
-            result.increment_failure()
-            continue
-
-        logger.info(
-            f"[{celery_task_id}][{file_number}/{total_files}] Processing file '{file_name}'"
-        )
-
-        # Track individual file processing time
-        import time
-
-        file_start_time = time.time()
-        logger.info(
-            f"TIMING: File processing START for {file_name} at {file_start_time:.6f}"
-        )
-
-        # DEBUG: Log the file hash data being sent to ensure unique identification
-        logger.info(
-            f"File hash data for {file_name}: provider_file_uuid='{file_hash.provider_file_uuid}', file_path='{file_hash.file_path}'"
-        )
-
-        # CRITICAL FIX: Preserve original file_number from source, don't override with batch enumeration
-        original_file_number = (
-            file_hash_dict.get("file_number") if file_hash_dict else None
-        )
-        if original_file_number is not None:
-            # Use the original file number assigned in source connector (global numbering)
-            file_hash.file_number = original_file_number
-            logger.info(
-                f"Using original global file_number {original_file_number} for '{file_name}' (batch position {file_number})"
-            )
-        else:
-            # Fallback to batch enumeration if original file number not available
-            file_hash.file_number = file_number
-            logger.warning(
-                f"No original file_number found for '{file_name}', using batch position {file_number}"
-            )
-
-        # Set use_file_history flag based on workflow determination
-        file_hash.use_file_history = use_file_history
-
-        # Don't Remove These Comments
-        # CRITICAL FIX: Apply manual review decision using q_file_no_list with correct global file number
-        # Get WorkflowUtil via manual review service factory (handles plugin registry automatically)
-        # manual_review_service = get_manual_review_service(
-        #     api_client=api_client, organization_id=context.organization_context.organization_id
-        # )
-        # workflow_util = manual_review_service.get_workflow_util()
-        # file_hash = workflow_util.add_file_destination_filehash(
-        #     file_hash.file_number, q_file_no_list, file_hash
-        # )
-
-        # Log manual review decision
-        if file_hash.is_manualreview_required:
-            logger.info(
-                f"👥 File {file_name} (#{file_hash.file_number}) MARKED FOR MANUAL REVIEW - destination: {file_hash.file_destination}"
-            )
-        else:
-            logger.info(
-                f"File {file_name} (#{file_hash.file_number}) marked for destination processing - destination: {getattr(file_hash, 'file_destination', 'destination')}"
-            )
-
-        logger.debug(f"File hash for file {file_name}: {file_hash}")
-
-        # Get pre-created WorkflowFileExecution data
-
-        workflow_file_execution_id = pre_created_file_execution.id
-        workflow_file_execution_object = pre_created_file_execution.object
-
-        # Send file processing start log to UI with file_execution_id
-        workflow_logger = context.metadata.get("workflow_logger")
-        log_file_processing_start(
-            workflow_logger,
-            workflow_file_execution_id,
-            file_name,
+        prepared = _prepare_file(
+            file_item,
             file_number,
-            total_files,
+            pre_created_file_executions,
+            skipped_already_completed,
+            skipped_active_duplicate,
+            use_file_history,
+            result,
         )
+        if prepared is not None:
+            prepared_files.append(prepared)
 
-        # Send destination routing UI log now that we have workflow_logger and file_execution_id
-        if workflow_logger and workflow_file_execution_id:
-            if file_hash.is_manualreview_required:
-                log_file_info(
-                    workflow_logger,
-                    workflow_file_execution_id,
-                    f"🔄 File '{file_name}' marked for MANUAL REVIEW - sending to review queue",
-                )
-            else:
-                log_file_info(
-                    workflow_logger,
-                    workflow_file_execution_id,
-                    f"📤 File '{file_name}' marked for DESTINATION processing",
-                )
-
-        # Process single file using Django-like pattern but with API coordination
-        file_execution_result = _process_file(
-            current_file_idx=file_number,
-            total_files=total_files,
-            file_data=file_data,
-            file_hash=file_hash,
-            api_client=api_client,
-            workflow_execution=workflow_execution,
-            workflow_file_execution_id=workflow_file_execution_id,  # Pass pre-created ID
-            workflow_file_execution_object=workflow_file_execution_object,  # Pass pre-created object
-            workflow_logger=workflow_logger,  # Pass workflow logger for UI logging
-            transport=context.transport,  # Drives the PG-only destination guard
-        )
+    file_data = context.metadata["file_data"]
+    concurrency = FileProcessingUtils.get_file_concurrency(
+        file_count=len(prepared_files),
+        connector_ids=[
+            *(prepared.file_hash.connector_id for prepared in prepared_files),
+            file_data.destination_config.get("connector_id"),
+        ],
+        organization_id=context.organization_context.organization_id,
+        api_client=api_client,
+    )
 
-        # Handle file processing result
+    def _handle(prepared: _PreparedFile, outcome: _FileRunOutcome) -> None:
         _handle_file_processing_result(
-            file_execution_result,
-            file_name,
-            file_start_time,
+            outcome.result,
+            prepared.file_name,
+            outcome.started_at,
             result,
             successful_files_for_manual_review,
-            file_hash,
+            prepared.file_hash,
             api_client,
             context.workflow_id,
             context.execution_id,
             workflow_logger,
-            workflow_file_execution_id,
+            prepared.file_execution_id,
             celery_task_id,  # Pass celery task ID to detect API queue
             context.metadata.get(
                 "is_api_workflow", False
             ),  # Pass existing API workflow detection
-            skipped_already_completed,  # Pass list to track duplicate skips
+            skipped_already_completed,  # Pass set to track duplicate skips
+            file_end_time=outcome.finished_at,
+        )
+
+    if concurrency <= 1:
+        for prepared in prepared_files:
+            _handle(prepared, _run_prepared_file(prepared, context))
+    else:
+        logger.info(
+            f"[{celery_task_id}] Processing {len(prepared_files)} files "
+            f"with concurrency {concurrency}"
         )
+        # Each pool thread starts with empty thread-locals: seed it with this
+        # thread's StateStore values (org, LOG_EVENTS_ID, continuation scope),
+        # a copy of the bound metric labels and its own logging context.
+        state = StateStore.snapshot()
+        parent_context = contextvars.copy_context()
+        parent_log_context = WorkerLogger.get_context() or LogContext()
+
+        def _run_isolated(prepared: _PreparedFile) -> _FileRunOutcome:
+            StateStore.restore(state)
+            WorkerLogger.set_context(
+                replace(parent_log_context, correlation_id=prepared.file_execution_id)
+            )
+            try:
+                return parent_context.copy().run(_run_prepared_file, prepared, context)
+            finally:
+                WorkerLogger.clear_context()
+                StateStore.clear_all()
+
+        def _on_error(
+            _index: int, _prepared: _PreparedFile, _error: Exception
+        ) -> _FileRunOutcome:
+            # Counted as a failed file by the null-result handling
+            now = time.time()
+            return _FileRunOutcome(result=None, started_at=now, finished_at=now)
+
+        outcomes = parallel_map(
+            prepared_files,
+            _run_isolated,
+            max_workers=concurrency,
+            on_error=_on_error,
+            label=f"file batch {celery_task_id}",
+        )
+        # Aggregate in batch order so counters, manual-review lists and the
+        # batch callback see the same sequence as a sequential run
+        for prepared, outcome in zip(prepared_files, outcomes, strict=True):
+            _handle(prepared, outcome)
 
     # Update metadata with results
     context.metadata["result"] = result
@@ -907,6 +983,204 @@ def _process_individual_files(context: WorkflowContextData) -> WorkflowContextDa
     return context
 
 
+def _prepare_file(
+    file_item: Any,
+    file_number: int,
+    pre_created_file_executions: dict[str, PreCreatedFileData],
+    skipped_already_completed: set[str],
+    skipped_active_duplicate: set[str],
+    use_file_history: bool,
+    result: FileBatchResult,
+) -> _PreparedFile | None:
+    """Resolve a batch file item to its pre-created execution.
+
+    Returns ``None`` for files that must not be processed (after counting a
+    failure where that is one).
+    """
+    # Handle Django list format (from asdict serialization), tuple format, and dictionary format
+    if isinstance(file_item, list):
+        # Django backend format after asdict(): [file_name, file_hash_dict]
+        if len(file_item) != 2:
+            logger.error(
+                f"Invalid file item list length: expected 2, got {len(file_item)}"
+            )
+            result.increment_failure()
+            return None
+        file_name, file_hash_dict = file_item
+    elif isinstance(file_item, tuple):
+        # Legacy tuple format: (file_name, file_hash_dict)
+        file_name, file_hash_dict = file_item
+    elif isinstance(file_item, dict):
+        # Dictionary format: {"file_name": "...", "file_path": "...", ...}
+        file_name = file_item.get("file_name")
+        file_hash_dict = file_item  # The entire dict is the file hash data
+    else:
+        logger.error(f"Unexpected file item format: {type(file_item)}")
+        result.increment_failure()
+        return None
+
+    pre_created_file_execution = pre_created_file_executions.get(file_name)
+
+    if not pre_created_file_execution:
+        # Check if this file was intentionally skipped as a duplicate
+        # Construct identifier from file_hash_dict to match skipped_files format
+        provider_uuid = file_hash_dict.get("provider_file_uuid")
+        file_path = file_hash_dict.get("file_path")
+        if provider_uuid and file_path:
+            file_identifier = f"{provider_uuid}:{file_path}"
+            # Check both skip sets and handle differently
+            if file_identifier in skipped_already_completed:
+                # File already COMPLETED in this execution - duplicate prevention worked
+                logger.info(
+                    f"File '{file_name}' already completed in this execution - skipping (not a failure)"
+                )
+                # Don't increment failure - file is done, duplicate prevention worked
+                return None
+            elif file_identifier in skipped_active_duplicate:
+                # File ACTIVE in different execution - user error (concurrent submission)
+                logger.info(
+                    f"File '{file_name}' active in another execution - marked as ERROR (counted as failure)"
+                )
+                # Increment failure - this IS a user error (submitting same file to multiple executions)
+                result.increment_failure()
+                return None
+
+        # Truly missing - this is an error condition
+        logger.error(
+            f"No pre-created WorkflowFileExecution found for file '{file_name}' - unexpected error"
+        )
+        result.increment_failure()
+        return None
+
+    file_hash: FileHashData = pre_created_file_execution.file_hash
+    if not file_hash:
+        logger.error(f"File hash not found for file '{file_name}'")
+        result.increment_failure()
+        return None
+
+    # CRITICAL FIX: Preserve original file_number from source, don't override with batch enumeration
+    original_file_number = file_hash_dict.get("file_number") if file_hash_dict else None
+    if original_file_number is not None:
+        # Use the original file number assigned in source connector (global numbering)
+        file_hash.file_number = original_file_number
+        logger.info(
+            f"Using original global file_number {original_file_number} for '{file_name}' (batch position {file_number})"
+        )
+    else:
+        # Fallback to batch enumeration if original file number not available
+        file_hash.file_number = file_number
+        logger.warning(
+            f"No original file_number found for '{file_name}', using batch position {file_number}"
+        )
+
+    # Set use_file_history flag based on workflow determination
+    file_hash.use_file_history = use_file_history
+
+    # Don't Remove These Comments
+    # CRITICAL FIX: Apply manual review decision using q_file_no_list with correct global file number
+    # Get WorkflowUtil via manual review service factory (handles plugin registry automatically)
+    # manual_review_service = get_manual_review_service(
+    #     api_client=api_client, organization_id=context.organization_context.organization_id
+    # )
+    # workflow_util = manual_review_service.get_workflow_util()
+    # file_hash = workflow_util.add_file_destination_filehash(
+    #     file_hash.file_number, q_file_no_list, file_hash
+    # )
+
+    return _PreparedFile(
+        file_name=file_name,
+        file_number=file_number,
+        file_hash=file_hash,
+        file_execution_id=pre_created_file_execution.id,
+        file_execution_object=pre_created_file_execution.object,
+    )
+
+
+def _run_prepared_file(
+    prepared: _PreparedFile, context: WorkflowContextData
+) -> _FileRunOutcome:
+    """Process one prepared file; safe to run on a pool thread.
+
+    Only reads the shared context - every mutation of batch state happens in
+    ``_handle_file_processing_result`` on the batch thread.
+    """
+    file_name = prepared.file_name
+    file_hash = prepared.file_hash
+    workflow_file_execution_id = prepared.file_execution_id
+    celery_task_id = context.get_setting("celery_task_id", "unknown")
+    total_files = context.metadata["total_files"]
+
+    logger.info(
+        f"[{celery_task_id}][{prepared.file_number}/{total_files}] Processing file '{file_name}'"
+    )
+
+    # Track individual file processing time
+    file_start_time = time.time()
+    logger.info(f"TIMING: File processing START for {file_name} at {file_start_time:.6f}")
+
+    # DEBUG: Log the file hash data being sent to ensure unique identification
+    logger.info(
+        f"File hash data for {file_name}: provider_file_uuid='{file_hash.provider_file_uuid}', file_path='{file_hash.file_path}'"
+    )
+
+    # Log manual review decision
+    if file_hash.is_manualreview_required:
+        logger.info(
+            f"👥 File {file_name} (#{file_hash.file_number}) MARKED FOR MANUAL REVIEW - destination: {file_hash.file_destination}"
+        )
+    else:
+        logger.info(
+            f"File {file_name} (#{file_hash.file_number}) marked for destination processing - destination: {getattr(file_hash, 'file_destination', 'destination')}"
+        )
+
+    logger.debug(f"File hash for file {file_name}: {file_hash}")
+
+    # Send file processing start log to UI with file_execution_id
+    workflow_logger = context.metadata.get("workflow_logger")
+    log_file_processing_start(
+        workflow_logger,
+        workflow_file_execution_id,
+        file_name,
+        prepared.file_number,
+        total_files,
+    )
+
+    # Send destination routing UI log now that we have workflow_logger and file_execution_id
+    if workflow_logger and workflow_file_execution_id:
+        if file_hash.is_manualreview_required:
+            log_file_info(
+                workflow_logger,
+                workflow_file_execution_id,
+                f"🔄 File '{file_name}' marked for MANUAL REVIEW - sending to review queue",
+            )
+        else:
+            log_file_info(
+                workflow_logger,
+                workflow_file_execution_id,
+                f"📤 File '{file_name}' marked for DESTINATION processing",
+            )
+
+    # Process single file using Django-like pattern but with API coordination
+    file_execution_result = _process_file(
+        current_file_idx=prepared.file_number,
+        total_files=total_files,
+        file_data=context.metadata["file_data"],
+        file_hash=file_hash,
+        api_client=context.organization_context.api_client,
+        workflow_execution=context.metadata["workflow_execution"],
+        workflow_file_execution_id=workflow_file_execution_id,  # Pass pre-created ID
+        workflow_file_execution_object=prepared.file_execution_object,  # Pass pre-created object
+        workflow_logger=workflow_logger,  # Pass workflow logger for UI logging
+        transport=context.transport,  # Drives the PG-only destination guard
+    )
+
+    return _FileRunOutcome(
+        result=file_execution_result,
+        started_at=file_start_time,
+        finished_at=time.time(),
+    )
+
+
 def _handle_file_processing_result(
     file_execution_result: FileProcessingResult,
     file_name: str,
@@ -921,7 +1195,8 @@ def _handle_file_processing_result(
     file_execution_id: str,
     celery_task_id: str,
     is_api_workflow: bool,
-    skipped_already_completed: list,
+    skipped_already_completed: set[str],
+    file_end_time: float | None = None,
 ) -> None:
     """Handle the result of individual file processing.
 
@@ -939,7 +1214,9 @@ def _handle_file_processing_result(
         file_execution_id: File execution ID
         celery_task_id: Celery task ID for queue detection
         is_api_workflow: Whether this is an API workflow (from existing detection)
-        skipped_already_completed: List to track files skipped as already completed
+        skipped_already_completed: Set tracking files skipped as already completed
+        file_end_time: When processing finished, if not now (concurrent runs
+            are aggregated after the whole batch)
     """
     # Handle null execution result
     if file_execution_result is None:
@@ -963,15 +1240,26 @@ def _handle_file_processing_result(
         # Add to skipped_already_completed so it's counted in total_files
         file_identifier = f"{file_hash.provider_file_uuid}:{file_hash.file_path}"
         if file_identifier not in skipped_already_completed:
-            skipped_already_completed.append(file_identifier)
+            skipped_already_completed.add(file_identifier)
             logger.debug(
                 f"Added {file_name} to skipped_already_completed for total_files count"
             )
         # Exit early without any DB updates - the first worker will handle all updates
         return
 
+    # Deferred to an executor continuation - the continuation's one-file batch
+    # updates status and counts this file, so this batch must do neither.
+    if getattr(file_execution_result, "is_deferred", False):
+        logger.info(
+            f"DEFERRED: File '{file_name}' resumes in an executor continuation. "
+            f"execution_id={execution_id}, file_execution_id={file_execution_id}"
+        )
+        return
+
     # Calculate execution time
-    file_execution_time = _calculate_execution_time(file_name, file_start_time)
+    file_execution_time = _calculate_execution_time(
+        file_name, file_start_time, file_end_time
+    )
 
     # Update file execution status in database
     _update_file_execution_status(
@@ -1031,8 +1319,8 @@ def _compile_batch_result(context: WorkflowContextData) -> dict[str, Any]:
     """
     result = context.metadata["result"]
     workflow_logger = context.metadata.get("workflow_logger")
-    skipped_already_completed = context.metadata.get("skipped_already_completed", [])
-    skipped_active_duplicate = context.metadata.get("skipped_active_duplicate", [])
+    skipped_already_completed = context.metadata.get("skipped_already_completed", set())
+    skipped_active_duplicate = context.metadata.get("skipped_active_duplicate", set())
     total_skipped = len(skipped_already_completed) + len(skipped_active_duplicate)
 
     # Send execution completion summary to UI
@@ -1090,6 +1378,7 @@ def _compile_batch_result(context: WorkflowContextData) -> dict[str, Any]:
 def _cleanup_file_cache_entry(
     file_hash: FileHashData,
     workflow_id: str,
+    execution_id: str,
     file_name: str,
 ) -> None:
     """Helper to cleanup active file cache entry after DB record creation attempt.
@@ -1099,8 +1388,9 @@ def _cleanup_file_cache_entry(
     blocking future executions.
 
     Args:
-        file_hash: File hash data containing provider_file_uuid
+        file_hash: File hash data containing provider_file_uuid and file_path
         workflow_id: Workflow ID for cache key
+        execution_id: Execution that claimed the cache entry
         file_name: File name for logging
     """
     if not file_hash.provider_file_uuid:
@@ -1112,8 +1402,9 @@ def _cleanup_file_cache_entry(
         )
 
         cleanup_active_file_cache(
-            provider_file_uuids=[file_hash.provider_file_uuid],
             workflow_id=workflow_id,
+            execution_id=execution_id,
+            files=[(file_hash.provider_file_uuid, file_hash.file_path)],
             logger_instance=logger,
         )
         logger.debug(
@@ -1240,7 +1531,7 @@ def _pre_create_file_executions(
     is_api: bool = False,
     use_file_history: bool = True,
     workflow_logger: WorkerWorkflowLogger | None = None,
-) -> tuple[dict[str, Any], list[str], list[str]]:
+) -> tuple[dict[str, Any], set[str], set[str]]:
     """Pre-create WorkflowFileExecution records with PENDING status to prevent race conditions.
 
     This matches the backend's _pre_create_file_executions pattern for ALL workflow types
@@ -1260,14 +1551,15 @@ def _pre_create_file_executions(
         workflow_logger: Workflow logger for UI logging (optional)
 
     Returns:
-        Tuple of (pre_created_data dict, skipped_already_completed list, skipped_active_duplicate list)
+        Tuple of (pre_created_data dict, skipped_already_completed set, skipped_active_duplicate set)
         - pre_created_data: Dict mapping file names to PreCreatedFileData
         - skipped_already_completed: Files already COMPLETED in this execution (not a failure)
         - skipped_active_duplicate: Files ACTIVE in different execution (IS a failure - user error)
     """
     pre_created_data: dict[str, PreCreatedFileData] = {}
-    skipped_already_completed: list[str] = []  # Already done in this execution
-    skipped_active_duplicate: list[str] = []  # Active in different execution (user error)
+    skipped_already_completed: set[str] = set()  # Already done in this execution
+    # Active in different execution (user error)
+    skipped_active_duplicate: set[str] = set()
 
     # Use the file history flag passed from execution parameters
     logger.info(
@@ -1338,7 +1630,7 @@ def _pre_create_file_executions(
                     f"Skipping duplicate task creation."
                 )
                 file_identifier = f"{file_hash.provider_file_uuid}:{file_hash.file_path}"
-                skipped_already_completed.append(file_identifier)
+                skipped_already_completed.add(file_identifier)
                 continue  # Skip to next file
 
             # Handle duplicate files vs normal files differently
@@ -1377,7 +1669,7 @@ def _pre_create_file_executions(
                     file_identifier = (
                         f"{file_hash.provider_file_uuid}:{file_hash.file_path}"
                     )
-                    skipped_active_duplicate.append(file_identifier)
+                    skipped_active_duplicate.add(file_identifier)
 
                 except Exception as status_error:
                     logger.error(
@@ -1469,7 +1761,7 @@ def _pre_create_file_executions(
 
         finally:
             # Always cleanup cache (success or failure) to prevent stale entries
-            _cleanup_file_cache_entry(file_hash, workflow_id, file_name)
+            _cleanup_file_cache_entry(file_hash, workflow_id, execution_id, file_name)
 
     # File history deduplication now handled during individual file processing
 
@@ -2317,11 +2609,12 @@ def _handle_null_execution_result(
         logger.warning(f"Failed to increment failed files count: {increment_error}")
 
 
-def _calculate_execution_time(file_name: str, file_start_time: float) -> float:
+def _calculate_execution_time(
+    file_name: str, file_start_time: float, file_end_time: float | None = None
+) -> float:
     """Calculate and log file execution time."""
-    import time
-
-    file_end_time = time.time()
+    if file_end_time is None:
+        file_end_time = time.time()
     file_execution_time = file_end_time - file_start_time
 
     logger.info(f"TIMING: File processing END for {file_name} at {file_end_time:.6f}")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Continuously drain the log history queue into the backend.
+
+Long-running replacement for the per-tick ``process_log_history.py`` trigger:
+
+1. Calls the backend's process-log-history endpoint with a named consumer and a
+   large batch; the backend claims that many logs in one multi-element pop,
+   stores them with a single bulk insert and acknowledges the batch.
+2. While the backend reports logs still ``remaining``, calls again immediately,
+   so bursty multi-thousand-file runs are drained back-to-back.
+3. When the queue is empty, idles on a cheap ``LLEN`` poll instead of a backend
+   round trip.
+
+The consumer name defaults to the hostname. A replaced pod never reads its old
+processing list again; the backend periodically takes such abandoned lists
+over (once their lock has lapsed), so their logs are still delivered.
+
+Ingestion lag, queue depth and throughput are exported as Prometheus metrics
+when ``LOG_HISTORY_INGEST_METRICS_PORT`` is set.
+
+Usage:
+    python log_history_ingestor.py
+"""
+
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from unstract.core.cache.redis_queue_client import RedisQueueClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_LIMIT = 500
+DEFAULT_IDLE_SLEEP_SECONDS = 1.0
+MAX_ERROR_BACKOFF_SECONDS = 30.0
+
+
+class IngestorMetrics:
+    """Prometheus metrics for the ingestor, on an instance-owned registry."""
+
+    def __init__(self) -> None:
+        from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+        self.registry = CollectorRegistry()
+        self.ingested = Counter(
+            "log_history_ingested_logs_total",
+            "Execution logs stored by the backend (rate() gives throughput)",
+            registry=self.registry,
+        )
+        self.skipped = Counter(
+            "log_history_skipped_logs_total",
+            "Execution logs dropped for unknown execution references",
+            registry=self.registry,
+        )
+        self.redelivered = Counter(
+            "log_history_redelivered_logs_total",
+            "Execution logs re-read from an unacknowledged batch",
+            registry=self.registry,
+        )
+        self.dead_lettered = Counter(
+            "log_history_dead_lettered_logs_total",
+            "Execution logs moved to the dead-letter list after repeated failures",
+            registry=self.registry,
+        )
+        self.errors = Counter(
+            "log_history_drain_errors_total",
+            "Failed drain calls to the backend",
+            registry=self.registry,
+        )
+        self.lag = Gauge(
+            "log_history_ingest_lag_seconds",
+            "Age of the oldest log in the last stored batch",
+            registry=self.registry,
+        )
+        self.queue_depth = Gauge(
+            "log_history_queue_depth",
+            "Logs waiting in the log history queue",
+            registry=self.registry,
+        )
+        self.drain_duration = Histogram(
+            "log_history_drain_duration_seconds",
+            "Wall time of one backend drain call",
+            buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+            registry=self.registry,
+        )
+
+    def observe(self, result: dict[str, Any], duration: float) -> None:
+        self.drain_duration.observe(duration)
+        self.ingested.inc(result.get("processed_count", 0))
+        self.skipped.inc(result.get("skipped_count", 0))
+        self.redelivered.inc(result.get("redelivered_count", 0))
+        self.dead_lettered.inc(result.get("dead_lettered_count", 0))
+        self.queue_depth.set(result.get("remaining", 0))
+        if result.get("processed_count"):
+            self.lag.set(result.get("lag_seconds", 0.0))
+
+    def serve(self, port: int) -> None:
+        from prometheus_client import start_http_server
+
+        start_http_server(port, registry=self.registry)
+
+
+class LogHistoryIngestor:
+    """Drain loop calling the backend until stopped."""
+
+    def __init__(
+        self,
+        *,
+        api_base_url: str,
+        api_key: str,
+        queue_name: str,
+        redis_client: Any,
+        batch_limit: int = DEFAULT_BATCH_LIMIT,
+        consumer: str | None = None,
+        idle_sleep: float = DEFAULT_IDLE_SLEEP_SECONDS,
+        metrics: IngestorMetrics | None = None,
+        http_client: httpx.Client | None = None,
+    ) -> None:
+        self.url = f"{api_base_url.rstrip('/')}/v1/execution-logs/process-log-history/"
+        self.api_key = api_key
+        self.queue_name = queue_name
+        self.redis_client = redis_client
+        self.batch_limit = batch_limit
+        self.consumer = consumer or socket.gethostname()
+        self.idle_sleep = idle_sleep
+        self.metrics = metrics
+        self.http_client = http_client or httpx.Client(
+            transport=httpx.HTTPTransport(retries=3), timeout=60.0
+        )
+        self.stop_event = threading.Event()
+
+    def drain_once(self) -> dict[str, Any]:
+        """Ask the backend to store one batch; return its processing result."""
+        started = time.monotonic()
+        response = self.http_client.post(
+            self.url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"batch_limit": self.batch_limit, "consumer": self.consumer},
+        )
+        response.raise_for_status()
+        result = response.json()
+        if self.metrics:
+            self.metrics.observe(result, time.monotonic() - started)
+        return result
+
+    def _queue_length(self) -> int:
+        queue_length = self.redis_client.llen(self.queue_name)
+        if self.metrics:
+            self.metrics.queue_depth.set(queue_length)
+        return queue_length
+
+    def run(self) -> None:
+        """Drain until ``stop_event`` is set."""
+        logger.info(
+            f"Log history ingestor '{self.consumer}' draining '{self.queue_name}' "
+            f"in batches of {self.batch_limit}"
+        )
+        backoff = self.idle_sleep
+        # First pass always hits the backend so an unacknowledged batch left by
+        # a previous run of this consumer is redelivered.
+        pending = True
+        while not self.stop_event.is_set():
+            try:
+                if not pending and self._queue_length() == 0:
+                    self.stop_event.wait(self.idle_sleep)
+                    continue
+                result = self.drain_once()
+                backoff = self.idle_sleep
+                pending = bool(result.get("remaining")) and bool(
+                    result.get("total_logs")
+                    or result.get("redelivered_count")
+                    or result.get("dead_lettered_count")
+                )
+                if result.get("dead_lettered_count"):
+                    logger.error(
+                        f"Backend dead-lettered {result['dead_lettered_count']} "
+                        "logs that repeatedly failed to store"
+                    )
+                if result.get("processed_count"):
+                    logger.info(
+                        f"Stored {result['processed_count']} logs "
+                        f"(skipped: {result.get('skipped_count', 0)}, "
+                        f"remaining: {result.get('remaining', 0)}, "
+                        f"lag: {result.get('lag_seconds', 0)}s)"
+                    )
+                if not pending:
+                    self.stop_event.wait(self.idle_sleep)
+            except Exception as e:
+                if self.metrics:
+                    self.metrics.errors.inc()
+                logger.error(f"Log history drain failed, retrying in {backoff}s: {e}")
+                pending = True
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, MAX_ERROR_BACKOFF_SECONDS)
+
+    def stop(self, *_: Any) -> None:
+        self.stop_event.set()
+
+
+def main() -> int:
+    internal_api_base_url = os.getenv("INTERNAL_API_BASE_URL")
+    internal_api_key = os.getenv("INTERNAL_SERVICE_API_KEY")
+    log_queue_name = os.getenv("LOG_HISTORY_QUEUE_NAME")
+    for name, value in (
+        ("INTERNAL_API_BASE_URL", internal_api_base_url),
+        ("INTERNAL_SERVICE_API_KEY", internal_api_key),
+        ("LOG_HISTORY_QUEUE_NAME", log_queue_name),
+    ):
+        if not value:
+            logger.error(f"{name} environment variable not set")
+            return 1
+
+    metrics = IngestorMetrics()
+    metrics_port = int(os.getenv("LOG_HISTORY_INGEST_METRICS_PORT", "0"))
+    if metrics_port:
+        metrics.serve(metrics_port)
+
+    ingestor = LogHistoryIngestor(
+        api_base_url=internal_api_base_url,
+        api_key=internal_api_key,
+        queue_name=log_queue_name,
+        redis_client=RedisQueueClient.from_env(),
+        batch_limit=int(
+            os.getenv("LOG_HISTORY_INGEST_BATCH_LIMIT", str(DEFAULT_BATCH_LIMIT))
+        ),
+        consumer=os.getenv("LOG_HISTORY_INGEST_CONSUMER"),
+        idle_sleep=float(
+            os.getenv("LOG_HISTORY_INGEST_IDLE_SLEEP", str(DEFAULT_IDLE_SLEEP_SECONDS))
+        ),
+        metrics=metrics,
+    )
+    signal.signal(signal.SIGTERM, ingestor.stop)
+    signal.signal(signal.SIGINT, ingestor.stop)
+    ingestor.run()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Trigger backend maintenance of the partitioned execution_log table.
+
+Mirrors process_notification_buffer.py: a thin wrapper around an internal API
+call that the log_consumer scheduler.sh fires on its own (slow) cadence. The
+backend creates upcoming partitions and drops those past the retention window.
+Idempotent — safe to run under multiple replicas.
+
+Usage:
+    python process_log_partitions.py
+"""
+
+import logging
+import os
+import sys
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Endpoint must match the URL registered in
+# backend/workflow_manager/workflow_v2/execution_log_internal_urls.py
+MAINTAIN_PARTITIONS_ENDPOINT = "v1/execution-logs/maintain-partitions/"
+
+
+def process_log_partitions() -> bool:
+    """Hit the backend's maintain-partitions endpoint; return True on success.
+
+    Never raises — the scheduler is supposed to keep ticking.
+    """
+    internal_api_base_url = os.getenv("INTERNAL_API_BASE_URL")
+    internal_api_key = os.getenv("INTERNAL_SERVICE_API_KEY")
+
+    if not internal_api_base_url:
+        logger.error("INTERNAL_API_BASE_URL environment variable not set")
+        return False
+    if not internal_api_key:
+        logger.error("INTERNAL_SERVICE_API_KEY environment variable not set")
+        return False
+
+    url = f"{internal_api_base_url.rstrip('/')}/{MAINTAIN_PARTITIONS_ENDPOINT}"
+    transport = httpx.HTTPTransport(retries=3)
+    try:
+        with httpx.Client(transport=transport) as client:
+            response = client.post(
+                url,
+                headers={"Authorization": f"Bearer {internal_api_key}"},
+                # Moving rows out of the DEFAULT partition can take a while.
+                timeout=120.0,
+            )
+    except Exception:
+        logger.exception("Error calling maintain-partitions")
+        return False
+
+    if response.status_code != 200:
+        logger.error(
+            "Backend returned status %s on maintain-partitions: %s",
+            response.status_code,
+            response.text[:500],
+        )
+        return False
+
+    try:
+        result = response.json()
+    except ValueError:
+        logger.error(
+            "Non-JSON 200 response from maintain-partitions: %s", response.text[:500]
+        )
+        return False
+
+    if result.get("created") or result.get("expired"):
+        logger.info(
+            "Execution log partitions: created=%s expired=%s",
+            result.get("created"),
+            result.get("expired"),
+        )
+    return True
+
+
+if __name__ == "__main__":
+    success = process_log_partitions()
+    sys.exit(0 if success else 1)
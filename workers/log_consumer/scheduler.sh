@@ -6,6 +6,11 @@ set -uo pipefail
 LOG_HISTORY_INTERVAL="${LOG_HISTORY_CONSUMER_INTERVAL:-5}"
 DEFAULT_LOG_HISTORY_CMD="/app/.venv/bin/python /app/log_consumer/process_log_history.py"
 LOG_HISTORY_CMD="${TASK_TRIGGER_COMMAND:-$DEFAULT_LOG_HISTORY_CMD}"
+# "stream" runs a long-lived ingestor that drains the queue back-to-back while
+# it has a backlog; "cron" keeps the legacy per-interval trigger above.
+LOG_HISTORY_INGEST_MODE="${LOG_HISTORY_INGEST_MODE:-stream}"
+DEFAULT_INGESTOR_CMD="/app/.venv/bin/python /app/log_consumer/log_history_ingestor.py"
+INGESTOR_CMD="${LOG_HISTORY_INGESTOR_COMMAND:-$DEFAULT_INGESTOR_CMD}"
 
 # Task 2: notification buffer flush (clubbed dispatch).
 # Polls on its OWN cadence (NOTIFICATION_BUFFER_POLL_INTERVAL), decoupled from
@@ -18,6 +23,13 @@ NOTIFICATION_BUFFER_INTERVAL="${NOTIFICATION_BUFFER_POLL_INTERVAL:-10}"
 DEFAULT_BUFFER_FLUSH_CMD="/app/.venv/bin/python /app/log_consumer/process_notification_buffer.py"
 BUFFER_FLUSH_CMD="${NOTIFICATION_BUFFER_TASK_COMMAND:-$DEFAULT_BUFFER_FLUSH_CMD}"
 
+# Task 3: execution_log partition maintenance (create upcoming partitions, drop
+# expired ones). Partitions are pre-created days ahead, so an hourly cadence is
+# plenty; the endpoint is idempotent.
+LOG_PARTITION_INTERVAL="${LOG_PARTITION_MAINTENANCE_INTERVAL:-3600}"
+DEFAULT_PARTITION_CMD="/app/.venv/bin/python /app/log_consumer/process_log_partitions.py"
+PARTITION_CMD="${LOG_PARTITION_TASK_COMMAND:-$DEFAULT_PARTITION_CMD}"
+
 # Loop wakes at the finer of the two cadences (min, floored at 1s); each task
 # fires independently once its own interval has elapsed.
 if [[ "${LOG_HISTORY_INTERVAL}" -lt "${NOTIFICATION_BUFFER_INTERVAL}" ]]; then
@@ -31,11 +43,22 @@ echo "=========================================="
 echo "Log Consumer Scheduler Starting"
 echo "=========================================="
 echo "Log history interval: ${LOG_HISTORY_INTERVAL}s  |  Buffer flush interval: ${NOTIFICATION_BUFFER_INTERVAL}s"
-echo "Task 1 (log history): ${LOG_HISTORY_CMD}"
+if [[ "${LOG_HISTORY_INGEST_MODE}" == "stream" ]]; then
+    echo "Task 1 (log history, stream): ${INGESTOR_CMD}"
+else
+    echo "Task 1 (log history): ${LOG_HISTORY_CMD}"
+fi
 echo "Task 2 (notification buffer flush): ${BUFFER_FLUSH_CMD}"
+echo "Task 3 (log partition maintenance, every ${LOG_PARTITION_INTERVAL}s): ${PARTITION_CMD}"
 echo "=========================================="
 
+ingestor_pid=""
+
 cleanup() {
+    if [[ -n "${ingestor_pid}" ]]; then
+        kill -TERM "${ingestor_pid}" 2>/dev/null
+        wait "${ingestor_pid}" 2>/dev/null
+    fi
     echo ""
     echo "=========================================="
     echo "Scheduler received shutdown signal"
@@ -65,15 +88,32 @@ run_task() {
     return "${exit_code}"
 }
 
+ensure_ingestor() {
+    # (Re)start the stream-mode ingestor if it is not running; it handles its
+    # own pacing, so the scheduler only supervises it.
+    if [[ -n "${ingestor_pid}" ]] && kill -0 "${ingestor_pid}" 2>/dev/null; then
+        return 0
+    fi
+    if [[ -n "${ingestor_pid}" ]]; then
+        echo "[$(date '+%Y-%m-%d %H:%M:%S')] ✗ log history ingestor exited, restarting..."
+    fi
+    eval "${INGESTOR_CMD}" 2>&1 &
+    ingestor_pid=$!
+    echo "[$(date '+%Y-%m-%d %H:%M:%S')] Started log history ingestor (pid ${ingestor_pid})"
+}
+
 run_count=0
-# Seed both at 0 so each task fires on the first loop iteration (now ≫ interval).
+# Seed all at 0 so each task fires on the first loop iteration (now ≫ interval).
 last_log_run=0
 last_buffer_run=0
+last_partition_run=0
 
 while true; do
     now=$(date '+%s')
 
-    if [[ $((now - last_log_run)) -ge "${LOG_HISTORY_INTERVAL}" ]]; then
+    if [[ "${LOG_HISTORY_INGEST_MODE}" == "stream" ]]; then
+        ensure_ingestor
+    elif [[ $((now - last_log_run)) -ge "${LOG_HISTORY_INTERVAL}" ]]; then
         run_count=$((run_count + 1))
         run_task "process_log_history" "${LOG_HISTORY_CMD}" "${run_count}"
         last_log_run="${now}"
@@ -85,6 +125,12 @@ while true; do
         last_buffer_run="${now}"
     fi
 
+    if [[ $((now - last_partition_run)) -ge "${LOG_PARTITION_INTERVAL}" ]]; then
+        run_count=$((run_count + 1))
+        run_task "process_log_partitions" "${PARTITION_CMD}" "${run_count}"
+        last_partition_run="${now}"
+    fi
+
     # Background sleep + wait so a SIGTERM/SIGINT interrupts promptly (the trap
     # fires, cleanup runs, the script exits) instead of blocking the full tick.
     sleep "${BASE_INTERVAL}" &
@@ -15,6 +15,7 @@ from notification.providers.base_provider import (
 from shared.infrastructure.logging import WorkerLogger
 
 from unstract.core.notification_utils import (
+    WebhookDelivery,
     build_webhook_headers,
     send_webhook_request,
     serialize_notification_data,
@@ -110,24 +111,13 @@ class WebhookProvider(BaseNotificationProvider):
             DeliveryError: If delivery fails after all retries
         """
         try:
-            # Validate notification data
-            self.validate(notification_data)
-
-            # Prepare data (serialize UUIDs, etc.)
-            prepared_data = self.prepare_data(notification_data)
-
-            # Extract parameters with defaults (matching backend implementation)
-            url = prepared_data["url"]
-            payload = prepared_data["payload"]
-            timeout = prepared_data.get("timeout", 10)
-            max_retries = prepared_data.get("max_retries")
-            retry_delay = prepared_data.get("retry_delay", 10)
-
-            # Build headers - either use provided headers or build from auth config
-            if "headers" in prepared_data and prepared_data["headers"]:
-                headers = prepared_data["headers"]
-            else:
-                headers = self._build_headers(prepared_data)
+            delivery = self.build_delivery(notification_data)
+            url = delivery.url
+            payload = delivery.payload
+            headers = delivery.headers
+            timeout = delivery.timeout
+            max_retries = notification_data.get("max_retries")
+            retry_delay = notification_data.get("retry_delay", 10)
 
             logger.debug(f"Sending webhook to {url} with {len(headers)} headers")
 
@@ -182,6 +172,33 @@ class WebhookProvider(BaseNotificationProvider):
                 destination=notification_data.get("url", "unknown"),
             )
 
+    def build_delivery(self, notification_data: dict[str, Any]) -> WebhookDelivery:
+        """Validate and prepare ``notification_data`` into one outgoing request.
+
+        Shared by the single-send path and the concurrent batch engine so both
+        apply the same platform formatting and headers.
+
+        Raises:
+            ValidationError: If data validation fails
+        """
+        self.validate(notification_data)
+
+        # Prepare data (serialize UUIDs, platform formatting, etc.)
+        prepared_data = self.prepare_data(notification_data)
+
+        # Build headers - either use provided headers or build from auth config
+        if prepared_data.get("headers"):
+            headers = prepared_data["headers"]
+        else:
+            headers = self._build_headers(prepared_data)
+
+        return WebhookDelivery(
+            url=prepared_data["url"],
+            payload=prepared_data["payload"],
+            headers=headers,
+            timeout=prepared_data.get("timeout", 10),
+        )
+
     def _build_headers(self, notification_data: dict[str, Any]) -> dict[str, str]:
         """Build webhook headers based on authorization configuration.
 
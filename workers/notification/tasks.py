@@ -22,11 +22,13 @@ from notification.utils import (
     log_notification_failure,
     log_notification_success,
 )
-from queue_backend import worker_task
+from queue_backend import QueueBackend, dispatch, worker_task
+from queue_backend.routing import select_backend
 from shared.infrastructure.config import WorkerConfig
 from shared.infrastructure.logging import WorkerLogger
 
 from unstract.core.notification_enums import NotificationType
+from unstract.core.notification_utils import WebhookDelivery, WebhookDeliveryEngine
 
 logger = WorkerLogger.get_logger(__name__)
 
@@ -367,6 +369,65 @@ def send_webhook_notification(
             return None
 
 
+def _webhook_provider_for(notification: dict[str, Any]) -> WebhookProvider:
+    """Platform-specific provider for a webhook notification (API by default)."""
+    platform = notification.get("platform")
+    if not platform:
+        return _get_webhook_provider_for_url(notification.get("url", ""))
+    return create_provider_from_config(
+        {"notification_type": NotificationType.WEBHOOK.value, "platform": platform}
+    )
+
+
+def _can_schedule_webhook() -> bool:
+    """Whether ``send_webhook_notification`` can be dispatched with a delay.
+
+    Only the Celery transport supports a countdown; PG-routed webhooks are
+    delivered in the batch and not retried later (the PG dispatch path
+    already runs them with ``max_retries=0``).
+    """
+    return select_backend("send_webhook_notification") is not QueueBackend.PG
+
+
+def _reenqueue_webhook(
+    delivery: WebhookDelivery,
+    notification: dict[str, Any],
+    countdown: float,
+    attempts_used: int = 1,
+) -> bool:
+    """Schedule a webhook for a later attempt instead of waiting in-process.
+
+    Dispatches ``send_webhook_notification`` with a countdown, charging the
+    attempts already spent against ``max_retries``. The headers are the ones
+    already built for ``delivery`` (auth and custom headers included), since
+    ``send_webhook_notification`` takes no authorization fields of its own.
+    Returns False when the notification has no retries left or cannot be delayed.
+    """
+    max_retries = notification.get("max_retries")
+    if attempts_used and (max_retries is None or max_retries < attempts_used):
+        return False
+    if not _can_schedule_webhook():
+        return False
+    dispatch(
+        "send_webhook_notification",
+        kwargs={
+            "url": notification.get("url"),
+            "payload": notification.get("payload"),
+            "headers": delivery.headers,
+            "timeout": delivery.timeout,
+            "max_retries": (
+                max_retries - attempts_used if max_retries is not None else None
+            ),
+            "retry_delay": notification.get("retry_delay", 10),
+            "platform": notification.get("platform"),
+        },
+        # Worker-internal retry, not a workflow-execution dispatch.
+        fairness=None,
+        countdown=max(int(countdown), 0),
+    )
+    return True
+
+
 @worker_task(name="send_batch_notifications")
 def send_batch_notifications(
     notifications: list[dict[str, Any]],
@@ -375,13 +436,18 @@ def send_batch_notifications(
 ) -> dict[str, Any]:
     """Send multiple notifications in batch.
 
-    This task processes multiple notifications with optional delays between them.
-    It's designed for future enhancement of the notification system.
+    Webhooks are delivered concurrently through one pooled async client
+    (``WebhookDeliveryEngine``) with per-host concurrency limits and circuit
+    breakers, so a slow endpoint does not hold the worker slot for the rest of
+    the batch. Nothing is slept in-process: retryable failures are re-enqueued
+    as ``send_webhook_notification`` with a countdown (``Retry-After``, the open
+    circuit's wait, or ``retry_delay``), and a non-zero ``delay_between`` spaces
+    the batch out as scheduled sends rather than sleeps.
 
     Args:
         notifications: List of notification configurations
         batch_id: Optional batch identifier
-        delay_between: Delay between notifications in seconds
+        delay_between: Spacing between notifications in seconds
 
     Returns:
         Dictionary with batch processing results
@@ -398,56 +464,75 @@ def send_batch_notifications(
         "total_notifications": len(notifications),
         "successful": [],
         "failed": [],
+        "retrying": [],
         "started_at": datetime.now().isoformat(),
     }
 
+    def _entry(index: int, notification: dict[str, Any], **extra: Any) -> dict:
+        return {
+            "index": index,
+            "destination": notification.get("url", "unknown"),
+            "type": notification.get("type", NotificationType.WEBHOOK.value),
+            **extra,
+        }
+
+    deliveries: list[WebhookDelivery] = []
     for i, notification in enumerate(notifications):
+        notification_type = notification.get("type", NotificationType.WEBHOOK.value)
         try:
-            notification_type = notification.get("type", NotificationType.WEBHOOK.value)
-
-            # Add delay between notifications if specified
-            if delay_between > 0 and i > 0:
-                import time
-
-                time.sleep(delay_between)
-
-            # Process notification
-            result = process_notification(notification_type, **notification)
-
-            if result.get("success"):
-                results["successful"].append(
-                    {
-                        "index": i,
-                        "destination": result.get("destination"),
-                        "type": notification_type,
-                    }
-                )
+            if notification_type != NotificationType.WEBHOOK.value:
+                result = process_notification(notification_type, **notification)
+                bucket = "successful" if result.get("success") else "failed"
+                extra = {} if result.get("success") else {"error": result.get("message")}
+                results[bucket].append(_entry(i, notification, **extra))
             else:
-                results["failed"].append(
-                    {
-                        "index": i,
-                        "destination": result.get("destination"),
-                        "type": notification_type,
-                        "error": result.get("message"),
-                    }
+                delivery = _webhook_provider_for(notification).build_delivery(
+                    notification
                 )
-
+                if (
+                    delay_between > 0
+                    and i > 0
+                    and _reenqueue_webhook(
+                        delivery, notification, i * delay_between, attempts_used=0
+                    )
+                ):
+                    results["retrying"].append(
+                        _entry(i, notification, countdown=i * delay_between)
+                    )
+                else:
+                    delivery.context = (i, notification)
+                    deliveries.append(delivery)
         except Exception as e:
             logger.error(f"Batch notification {i} failed: {str(e)}")
-            results["failed"].append(
-                {
-                    "index": i,
-                    "destination": notification.get("url", "unknown"),
-                    "type": notification.get("type", "unknown"),
-                    "error": str(e),
-                }
+            results["failed"].append(_entry(i, notification, error=str(e)))
+
+    for outcome in WebhookDeliveryEngine().deliver(deliveries):
+        i, notification = outcome.delivery.context
+        if outcome.success:
+            results["successful"].append(_entry(i, notification))
+            continue
+        countdown = (
+            outcome.retry_after
+            if outcome.retry_after is not None
+            else notification.get("retry_delay", 10)
+        )
+        try:
+            rescheduled = outcome.retryable and _reenqueue_webhook(
+                outcome.delivery, notification, countdown
             )
+        except Exception as e:
+            logger.error(f"Failed to re-enqueue batch notification {i}: {e}")
+            rescheduled = False
+        if rescheduled:
+            results["retrying"].append(_entry(i, notification, countdown=countdown))
+        else:
+            results["failed"].append(_entry(i, notification, error=outcome.error))
 
     results["completed_at"] = datetime.now().isoformat()
 
     logger.info(
         f"Batch {batch_id} completed: {len(results['successful'])} successful, "
-        f"{len(results['failed'])} failed"
+        f"{len(results['failed'])} failed, {len(results['retrying'])} re-enqueued"
     )
 
     return results
@@ -507,7 +507,7 @@ def _maybe_start_supervisor_health(fleet: _Fleet) -> LivenessServer | None:
             "liveness_probe_bound": True,
         }
 
-    from queue_backend.pg_queue.metrics import ConsumerMetrics
+    from queue_backend.pg_queue.metrics import ConsumerMetrics, render_multiprocess
 
     metrics = ConsumerMetrics(
         freshness_fn=fleet.freshness,
@@ -521,7 +521,12 @@ def _maybe_start_supervisor_health(fleet: _Fleet) -> LivenessServer | None:
         check_name="pg_queue_fleet",
         age_key="oldest_child_seconds_since_poll",
         extra_status_fn=_extra_status,
-        metrics_fn=metrics.render,
+        # The children's per-stage pipeline series, when they write to a shared
+        # PROMETHEUS_MULTIPROC_DIR (prefix of shared/.../pipeline_metrics.py,
+        # spelled out so this parent never imports the worker tree).
+        metrics_fn=lambda: (
+            metrics.render() + render_multiprocess("worker_pipeline_stage")
+        ),
         thread_name="pg-supervisor-liveness",
         log_label="pg-queue supervisor",
     )
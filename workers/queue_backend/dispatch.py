@@ -79,6 +79,7 @@ def dispatch(
     queue: str | None = None,
     fairness: FairnessKey | None = None,
     backend: QueueBackend | None = None,
+    countdown: float | None = None,
 ) -> DispatchHandle:
     """Enqueue a task by name onto its selected transport.
 
@@ -98,17 +99,30 @@ def dispatch(
     resolved once at creation and travels on the execution's task kwargs onto
     ``WorkflowContextData.transport``.) The override only forces the *transport*; it does not
     bypass ``_enqueue_pg``'s no-silent-fallback contract.
+
+    ``countdown`` delays delivery by that many seconds (Celery ETA). PG queue
+    messages are visible as soon as they are sent, so a countdown on a
+    PG-routed dispatch raises ``ValueError`` rather than silently running the
+    task early; callers check :func:`~queue_backend.routing.resolve_backend`
+    first when they need to fall back.
     """
     if resolve_backend(task_name, backend) is QueueBackend.PG:
+        if countdown:
+            raise ValueError(
+                f"Cannot delay {task_name!r}: the PG queue transport has no "
+                "delayed delivery"
+            )
         return _enqueue_pg(task_name, args, kwargs, queue, fairness)
 
     headers = fairness.as_header() if fairness is not None else None
+    options = {"countdown": countdown} if countdown else {}
     return current_app.send_task(
         task_name,
         args=args,
         kwargs=kwargs,
         queue=queue,
         headers=headers,
+        **options,
     )
 
 
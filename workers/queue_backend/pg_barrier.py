@@ -17,21 +17,29 @@ for the fan-in. The transport for the header tasks themselves is unchanged
 **Wire model.**
 
 1. ``enqueue``: UPSERT one ``pg_barrier_state`` row (``remaining = N``,
-   ``results = []``, ``expires_at = now() + ttl``, ``last_progress_at = now()``)
-   — the UPSERT clears any stale
+   ``completed = 0``, ``expires_at = now() + ttl``, ``last_progress_at = now()``)
+   — the UPSERT (plus a ``DELETE`` of the prior run's ``pg_barrier_result``
+   rows) clears any stale
    state from a prior run reusing the same ``execution_id``. Each header task is
    dispatched with
    ``.link(barrier_pg_decr_and_check)`` (success) and
    ``.link_error(barrier_pg_abort)`` (failure).
 2. Per-task success: ``barrier_pg_decr_and_check`` runs ONE atomic statement —
-   ``UPDATE … SET remaining = remaining - 1, results = results ||
-   jsonb_build_array(result) … RETURNING remaining, results``. The row lock
-   serialises concurrent decrements, so exactly one task observes ``remaining =
-   0``; that task dispatches the callback with the aggregated results, then
-   deletes the row. (No Lua — a single ``UPDATE … RETURNING`` is atomic in
-   Postgres. The guarantee relies on each decrement committing in its own
-   transaction — do NOT batch decrements into a shared transaction, or the row
-   lock would hold and the serialisation that makes exactly one see 0 breaks.)
+   ``UPDATE … SET remaining = remaining - 1, completed = completed + 1 …
+   RETURNING`` feeding an ``INSERT`` of the task's result as its own
+   ``pg_barrier_result`` row, keyed ``(execution_id, child_index)`` in completion
+   order. Nothing aggregated is returned, so a decrement no longer ships every
+   prior result back on every call (the previous release's ``RETURNING
+   results``); once the transitional legacy-array append is dropped (see
+   *Mixed-release window*) the barrier row is a fixed-size counter and a
+   decrement costs the same for the 5,000th child as for the first. The row
+   lock serialises concurrent decrements, so exactly one task observes
+   ``remaining = 0``; that task reads the results back with one ordered
+   ``SELECT``, dispatches the callback with them, then deletes the rows. (No Lua
+   — a single ``UPDATE … RETURNING`` is atomic in Postgres. The guarantee relies
+   on each decrement committing in its own transaction — do NOT batch decrements
+   into a shared transaction, or the row lock would hold and the serialisation
+   that makes exactly one see 0 breaks.)
 3. Per-task failure: ``barrier_pg_abort`` runs as a ``link_error``. It tears the
    barrier down with ONE atomic statement (``DELETE … RETURNING`` in a single
    transaction): the row's existence is the dedup token, so N concurrent
@@ -51,6 +59,21 @@ for the fan-in. The transport for the header tasks themselves is unchanged
    ``WORKER_BARRIER_KEY_TTL_SECONDS``, default 6h) is the absolute last-resort cap
    the reaper also sweeps.
 
+**Mixed-release window.** ``pg_barrier_state.results`` (the JSONB array the
+previous release appended every child's result to, and read back when the
+count hit 0) is deprecated but still written: a decrement appends to it AND
+inserts its ``pg_barrier_result`` row. During a rolling deploy either release
+may run the final decrement — a previous-release finaliser reads only the
+array, so the array must stay complete — and a finaliser of this release reads
+whichever of the two holds more children (:func:`_barrier_results`): the array
+while previous-release workers are still decrementing, the rows once a later
+release stops appending. A previous-release finaliser deletes only the barrier
+row, leaving this release's ``pg_barrier_result`` rows behind; the reaper's
+:func:`~queue_backend.pg_queue.reaper.sweep_orphan_barrier_results` collects
+them. The follow-up release drops the append (and then the column); releases
+must not skip it, or a finaliser on one side of the window misses the other's
+results.
+
 **Failure-masking guards.** The callback can only fire when ``remaining`` hits
 exactly 0, which requires ALL N header tasks to have decremented — i.e. all
 succeeded. A failed task runs the abort (which deletes the row) instead of a
@@ -217,11 +240,12 @@ def _run_idempotent_pre_dispatch_write(
     The name spells out the contract because it can't be type-enforced: only call
     with an **idempotent** statement run **before** any task dispatch — the
     barrier UPSERT (``ON CONFLICT … DO UPDATE`` → same row, ``remaining``/
-    ``results`` reset identically; timestamps refresh, harmlessly) + the
-    per-execution dedup reset (``DELETE WHERE execution_id``). Re-running them
-    after an ambiguous commit is a no-op, so a retry can neither duplicate a row
-    nor double-dispatch work (no header has been enqueued yet). The ``-> None``
-    op signature also blocks passing a ``RETURNING``-reading op by construction.
+    ``completed`` reset identically; timestamps refresh, harmlessly) + the
+    per-execution dedup/result reset (``DELETE WHERE execution_id``). Re-running
+    them after an ambiguous commit is a no-op, so a retry can neither duplicate a
+    row nor double-dispatch work (no header has been enqueued yet). The
+    ``-> None`` op signature also blocks passing a ``RETURNING``-reading op by
+    construction.
 
     Deliberately NOT used for the barrier **decrement** (``remaining =
     remaining - 1``): it is not idempotent — a re-applied decrement can fire the
@@ -261,11 +285,16 @@ def _run_idempotent_pre_dispatch_write(
 
 
 def _delete_barrier(execution_id: str) -> None:
+    # One transaction: the result rows never outlive their barrier row.
     with _cursor() as cur:
         cur.execute(
             f"DELETE FROM {qualified('pg_barrier_state')} WHERE execution_id = %s",
             (execution_id,),
         )
+        cur.execute(
+            f"DELETE FROM {qualified('pg_barrier_result')} WHERE execution_id = %s",
+            (execution_id,),
+        )
 
 
 def _run_returning_claim_with_reconnect(
@@ -403,6 +432,35 @@ def clear_execution_batches(execution_id: str) -> int:
         return cur.rowcount
 
 
+def extend_barrier(execution_id: str, by: int = 1) -> int | None:
+    """Add ``by`` expected decrements to a live barrier; returns the new
+    ``remaining`` or ``None`` if the barrier row is gone.
+
+    Used when a batch hands one of its files to an executor continuation: the
+    continuation decrements the barrier on its own once the file is resumed, so
+    the barrier must wait for one more result than it was armed with. The
+    caller MUST extend *before* its own batch decrements — while the batch still
+    holds its count, ``remaining`` cannot reach 0 in between, so the callback
+    can never fire before the continuation lands. A negative ``by`` releases an
+    extension the caller added (e.g. the continuation dispatch failed) and is
+    safe under the same rule.
+
+    A single ``UPDATE … RETURNING`` (row-locked like the decrement) that also
+    refreshes ``last_progress_at`` — handing off work IS progress for the
+    reaper's stall detection.
+    """
+    with _cursor() as cur:
+        cur.execute(
+            f"UPDATE {qualified('pg_barrier_state')} "
+            "SET remaining = remaining + %s, last_progress_at = now() "
+            "WHERE execution_id = %s "
+            "RETURNING remaining",
+            (by, execution_id),
+        )
+        row = cur.fetchone()
+    return None if row is None else int(row[0])
+
+
 def try_claim_orchestration(execution_id: str, organization_id: str) -> bool:
     """Try to claim the orchestration slot for ``execution_id`` — the
     execution-level idempotency gate mirroring :func:`claim_batch`, one level up.
@@ -642,13 +700,14 @@ class PgBarrier:
                 # periodic sweep keyed on pg_barrier_expires_idx.
                 cur.execute(
                     f"INSERT INTO {qualified('pg_barrier_state')} "
-                    "(execution_id, organization_id, remaining, results, "
+                    "(execution_id, organization_id, remaining, completed, "
                     " created_at, expires_at, last_progress_at) "
-                    "VALUES (%s, %s, %s, '[]'::jsonb, now(), "
+                    "VALUES (%s, %s, %s, 0, now(), "
                     "        now() + make_interval(secs => %s), now()) "
                     "ON CONFLICT (execution_id) DO UPDATE SET "
                     "  organization_id = EXCLUDED.organization_id, "
-                    "  remaining = EXCLUDED.remaining, results = '[]'::jsonb, "
+                    "  remaining = EXCLUDED.remaining, completed = 0, "
+                    "  results = DEFAULT, "
                     "  created_at = now(), expires_at = EXCLUDED.expires_at, "
                     "  last_progress_at = now()",
                     (
@@ -667,6 +726,14 @@ class PgBarrier:
                     f"DELETE FROM {qualified('pg_batch_dedup')} WHERE execution_id = %s",
                     (execution_id,),
                 )
+                # Same for a prior run's child results: with completed reset to
+                # 0 they would collide with (or be aggregated alongside) this
+                # run's.
+                cur.execute(
+                    f"DELETE FROM {qualified('pg_barrier_result')} "
+                    "WHERE execution_id = %s",
+                    (execution_id,),
+                )
 
             # Idempotent + pre-dispatch → safe to retry; see
             # _run_idempotent_pre_dispatch_write.
@@ -871,19 +938,21 @@ def _fire_barrier_callback(
 
 class _DecrementRow(NamedTuple):
     """The decrement ``UPDATE … RETURNING`` row, named so the caller reads
-    ``row.remaining`` / ``row.results`` instead of positional ``row[0]`` / ``row[1]``
-    and the ``results`` list-shape is documented in the type.
+    ``row.remaining`` / ``row.child_index`` instead of positional ``row[0]`` /
+    ``row[1]``. ``child_index`` is the ``pg_barrier_result`` slot this decrement's
+    result was written to (its 0-based completion order).
     """
 
     remaining: int
-    results: list[Any]
+    child_index: int
 
 
 def _apply_decrement(
     execution_id: str, result_json: str, *, reused: bool
 ) -> _DecrementRow | None:
-    """Apply the barrier decrement ``UPDATE`` and return its ``(remaining,
-    results)`` row (``None`` if the barrier row is already gone).
+    """Apply the barrier decrement ``UPDATE`` (plus its ``pg_barrier_result``
+    insert) and return its ``(remaining, child_index)`` row (``None`` if the
+    barrier row is already gone — then no result row is written either).
 
     The decrement is NON-idempotent — re-applying it double-counts (premature
     callback fire with incomplete results, or a strand past 0) — so it is split
@@ -923,22 +992,42 @@ def _apply_decrement(
     # ``last_progress_at = now()`` records that a batch just completed — the
     # reaper's stuck signal (it marks the execution ERROR only once no decrement
     # has landed for stuck_timeout; see barrier.py / reaper.py). last_progress_at
-    # is UNINDEXED, so — like remaining/results — this stays a heap-only-tuple (HOT)
-    # update: no index churn on the decrement hot path. (expires_at, the indexed
-    # absolute cap, is deliberately NOT touched here, to preserve HOT.)
+    # is UNINDEXED, so — like remaining/completed — this stays a heap-only-tuple
+    # (HOT) update: no index churn on the decrement hot path. (expires_at, the
+    # indexed absolute cap, is deliberately NOT touched here, to preserve HOT.)
+    #
+    # The result row is written by the SAME statement, so it commits (or rolls
+    # back) with the decrement and the phase split below covers both. The INSERT
+    # reads the UPDATE's RETURNING, so it lands only while the barrier row exists
+    # and takes the slot the row lock just serialised — no two decrements share a
+    # child_index. Only the counter and slot come back; the final decrementer
+    # reads the results once (see _barrier_results).
+    #
+    # Transitional: the result is ALSO appended to the deprecated
+    # pg_barrier_state.results array, so a previous-release worker that runs the
+    # final decrement still aggregates every child (see "Mixed-release window"
+    # in the module docstring). The append is not returned; drop it next release.
     sql = (
-        f"UPDATE {qualified('pg_barrier_state')} "
-        "   SET remaining = remaining - 1, "
-        "       results = results || jsonb_build_array(%s::jsonb), "
-        "       last_progress_at = now() "
-        " WHERE execution_id = %s "
-        "RETURNING remaining, results"
+        "WITH payload AS (SELECT %s::jsonb AS result), dec AS ("
+        f"    UPDATE {qualified('pg_barrier_state')} "
+        "       SET remaining = remaining - 1, "
+        "           completed = completed + 1, "
+        "           results = results || jsonb_build_array(payload.result), "
+        "           last_progress_at = now() "
+        "      FROM payload "
+        "     WHERE execution_id = %s "
+        "    RETURNING remaining, completed - 1 AS child_index, payload.result"
+        "), stored AS ("
+        f"    INSERT INTO {qualified('pg_barrier_result')} "
+        "    (execution_id, child_index, result, created_at) "
+        "    SELECT %s, child_index, result, now() FROM dec"
+        ") SELECT remaining, child_index FROM dec"
     )
     for attempt in range(1, _BARRIER_DECREMENT_ATTEMPTS + 1):
         conn = _get_conn()
         try:
             with conn.cursor() as cur:
-                cur.execute(sql, (result_json, execution_id))
+                cur.execute(sql, (result_json, execution_id, execution_id))
                 fetched = cur.fetchone()
         except Exception as exc:
             conn_dead = _recover_after_error(conn, exc)
@@ -996,13 +1085,54 @@ def _apply_decrement(
                 exc_info=True,
             )
             raise
-        return None if fetched is None else _DecrementRow(int(fetched[0]), fetched[1])
+        return (
+            None if fetched is None else _DecrementRow(int(fetched[0]), int(fetched[1]))
+        )
     # Defensive: the loop always returns or raises before here. The annotation
     # permits None, so a type checker would NOT catch a stray fall-through — this
     # guards a future edit that breaks the always-return/raise invariant.
     raise AssertionError("unreachable: _apply_decrement loop exited without return")
 
 
+def _barrier_results(execution_id: str) -> list[Any]:
+    """Return the barrier's child results in completion order.
+
+    Called once, by the decrement that drove ``remaining`` to 0: every other
+    decrement committed its result row before releasing the barrier row lock that
+    one waited on, so a single ordered ``SELECT`` sees them all. Read-only, so
+    unlike the decrement a failure here is safe to surface — the barrier row is
+    left at ``remaining = 0`` and the reaper recovers it as a stall. psycopg2
+    decodes each jsonb value, so no per-row ``json.loads`` is needed.
+
+    Transitional: every decrement of this release writes its result to both the
+    deprecated ``pg_barrier_state.results`` array and a ``pg_barrier_result``
+    row, but a previous-release worker appends only to the array and the
+    follow-up release will insert only the row. Whichever holds more children is
+    therefore the complete set (the rows on a tie); drop the legacy half of the
+    query together with the column.
+    """
+    with _cursor() as cur:
+        cur.execute(
+            "SELECT src, result FROM ("
+            "    SELECT 0 AS src, legacy.ord AS ord, legacy.value AS result "
+            f"     FROM {qualified('pg_barrier_state')} s "
+            "     CROSS JOIN LATERAL jsonb_array_elements(s.results) "
+            "          WITH ORDINALITY AS legacy(value, ord) "
+            "    WHERE s.execution_id = %s "
+            "    UNION ALL "
+            "    SELECT 1, child_index, result "
+            f"     FROM {qualified('pg_barrier_result')} "
+            "    WHERE execution_id = %s"
+            ") AS children ORDER BY src, ord",
+            (execution_id, execution_id),
+        )
+        legacy: list[Any] = []
+        rows: list[Any] = []
+        for src, result in cur.fetchall():
+            (rows if src else legacy).append(result)
+        return legacy if len(legacy) > len(rows) else rows
+
+
 def _barrier_pg_decrement(
     result: Any,
     *,
@@ -1011,10 +1141,10 @@ def _barrier_pg_decrement(
 ) -> dict[str, Any]:
     """Atomic barrier decrement + last-task callback fire (substrate core).
 
-    Appends this task's result and decrements ``remaining`` in one atomic
-    statement; the single caller that drives ``remaining`` to 0 dispatches the
-    aggregating callback (then deletes the row). This is the plain, in-body-
-    callable core shared by two entry points:
+    Stores this task's result and decrements ``remaining`` in one atomic
+    statement; the single caller that drives ``remaining`` to 0 collects the
+    stored results, dispatches the aggregating callback (then deletes the rows).
+    This is the plain, in-body-callable core shared by two entry points:
 
     - the Celery ``link`` callback :func:`barrier_pg_decr_and_check` (today's
       only caller, behaviour unchanged); and
@@ -1075,8 +1205,8 @@ def _barrier_pg_decrement(
         )
         raise
 
-    # jsonb_build_array(...) appends exactly one element regardless of the
-    # result's shape (``||`` would concatenate if the result were itself a list).
+    # The result is stored as one pg_barrier_result row whatever its shape, so a
+    # list result stays a single element of the aggregated list.
     try:
         row = _apply_decrement(execution_id, result_json, reused=conn_was_cached)
     except psycopg2.DataError:
@@ -1102,7 +1232,7 @@ def _barrier_pg_decrement(
         )
         return {"status": "abandoned", "remaining": None}
 
-    remaining, all_results = row.remaining, row.results
+    remaining = row.remaining
     logger.info(f"[exec:{execution_id}] PgBarrier decrement → remaining={remaining}")
 
     if remaining > 0:
@@ -1118,8 +1248,8 @@ def _barrier_pg_decrement(
         )
         return {"status": "abandoned", "remaining": remaining}
 
-    # remaining == 0: we are the last task. psycopg2 decodes the jsonb array to
-    # a Python list already — no per-element json.loads needed.
+    # remaining == 0: we are the last task — collect every child's result.
+    all_results = _barrier_results(execution_id)
     #
     # Dispatch the callback FIRST; delete the row only after dispatch succeeds, so
     # a callback dispatch failure leaves the row (and its expiry) in place rather
@@ -1195,7 +1325,8 @@ def barrier_pg_abort(
 
     Mirrors chord's default error semantic (callback not invoked on header
     failure). The claim and the teardown are a SINGLE atomic statement — a
-    ``DELETE … RETURNING`` in one transaction. The row's existence is the dedup
+    ``DELETE … RETURNING`` in one transaction (which also drops the children's
+    ``pg_barrier_result`` rows). The row's existence is the dedup
     token: the first abort deletes it (and so "wins"); every concurrent sibling
     finds nothing to delete and short-circuits. Because it's one transaction, a
     crash/failure mid-abort rolls the whole thing back (the row survives) so a
@@ -1228,6 +1359,14 @@ def barrier_pg_abort(
             (execution_id,),
         )
         claimed = cur.fetchone() is not None
+        if claimed:
+            # A separate statement (fresh snapshot) so it also sees a result a
+            # sibling's decrement committed while the claim waited on the row
+            # lock; no later decrement can add one — the barrier row is gone.
+            cur.execute(
+                f"DELETE FROM {qualified('pg_barrier_result')} WHERE execution_id = %s",
+                (execution_id,),
+            )
 
     if not claimed:
         # Another failure already aborted this execution (or it's already gone).
@@ -1382,8 +1521,8 @@ def run_batch_with_barrier(
     it must be live before PR 3 flips ``pg_queue_execution_enabled``.
 
     ``work_fn`` must return the JSON-serialisable batch result (the same dict the
-    Celery chord path returns), since the decrement appends it to the barrier's
-    aggregated results that the callback receives.
+    Celery chord path returns), since the decrement stores it as one of the
+    barrier's aggregated results that the callback receives.
     """
     execution_id = str(barrier_context["execution_id"])
     batch_index = int(barrier_context["batch_index"])
@@ -35,7 +35,7 @@ import json
 import logging
 import time
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Final, Self
 
 from unstract.core.data_models import QueueMessageState
@@ -102,6 +102,9 @@ _CLAIMED = QueueMessageState.CLAIMED.value
 # ``ready`` (reaper.rearm_expired_claims); vt remains unindexed so lease renewal
 # (set_vt) stays HOT-eligible (actual HOT also needs heap-page free space —
 # fillfactor < 100; see migration 0014's tuning note).
+#
+# The same statement moves the claimed rows from their queue's ``ready`` to its
+# ``claimed`` depth counter (``moved`` / ``counted``; see queue_stat_delta_sql).
 def _dequeue_sql() -> str:
     """Build the atomic-claim SQL, schema-qualifying ``pg_queue_message``.
 
@@ -128,9 +131,15 @@ WITH locked AS (
            read_ct = read_ct + 1
       FROM locked
      WHERE q.msg_id = locked.msg_id
-    RETURNING q.msg_id, q.message, q.read_ct, q.priority
+    RETURNING q.msg_id, q.message, q.read_ct, q.priority, q.queue_name, q.org_id,
+              q.enqueued_at,
+              EXTRACT(EPOCH FROM now() - q.enqueued_at) AS queue_wait_seconds
+), moved AS (
+    {queue_stat_transition_sql("claimed", _READY, _CLAIMED)}
+), counted AS (
+    {queue_stat_delta_sql("moved")}
 )
-SELECT msg_id, message, read_ct
+SELECT msg_id, message, read_ct, queue_wait_seconds
   FROM claimed
  ORDER BY priority DESC, msg_id
 """
@@ -147,29 +156,144 @@ class QueueMessage:
     from the dequeue (``read_ct = read_ct + 1 RETURNING``), so consumers can
     cap redelivery of a poison message. No default: a ``0`` ("never claimed")
     can't come from the dequeue and would silently bypass the poison guard.
+
+    ``queue_wait_seconds`` is enqueue-to-claim time measured on the DB clock
+    (so worker clock skew can't distort it); it is observational only and
+    excluded from equality.
     """
 
     msg_id: int
     message: dict[str, Any]
     read_ct: int
+    queue_wait_seconds: float = field(default=0.0, compare=False)
 
 
-# The whole enqueue contract (columns + their defaults) in one place. `send()`
-# appends ``RETURNING msg_id``; the PG scheduler (pg_scheduler.py) executes this
-# verbatim inside its own transaction so the enqueue + next_run advance commit
-# atomically (it can't call send(), which commits internally). Keep callers in
-# sync by calling this helper rather than copying the SQL. Built per call so
-# ``pg_queue_message`` is schema-qualified from the live ``DB_SCHEMA`` (resolves
-# through PgBouncer txn pooling without ``search_path`` — see
-# :mod:`queue_backend.pg_queue.schema`).
-def insert_message_sql() -> str:
+# Depth bookkeeping (``pg_queue_stat``). Every statement that adds, moves or
+# removes queue rows also applies its per-(queue, org, state) delta to the stat
+# table, as a data-modifying CTE of the SAME statement — so the counter commits
+# or rolls back with the rows it counts, and the reaper's gauges / an autoscaler
+# read a few stat rows instead of aggregating the backlog (the reaper reconciles
+# it against pg_queue_message on the retention-sweep cadence). Writer-maintained
+# rather than a trigger: the schema stays a plain Django migration with no
+# DB-side function.
+#
+# Each counter is split over ``_STAT_SHARDS`` rows and a writer applies its delta
+# to the shard picked by its backend pid, so concurrent sends / claims / acks on
+# one busy queue land on different rows instead of queueing behind a single hot
+# row lock. A key's depth is the SUM over its shards; one shard can go negative
+# (rows enqueued through one connection, claimed through another), so readers
+# clamp the sum, never a shard.
+#
+# The delta source is grouped to one row per key (an ON CONFLICT upsert may not
+# touch the same row twice) and ORDERED by key, so every writer locks stat rows
+# in the same order — two statements moving rows between the same counters can
+# block each other but never deadlock. All queue-row locks are taken before the
+# grouped upsert runs, so no writer holds a stat row while waiting on a message.
+# The stat row is held only until the writer's (short) transaction commits.
+#
+# ``oldest_enqueued_at`` only moves EARLIER (on an increment) and is cleared when
+# the shard's depth reaches zero: a decrement can't know the next-oldest row, so
+# between reconciliations it is an upper bound (see PgQueueStat).
+_STAT_SHARDS: Final = 16
+
+# The shard a statement's deltas land on — stable for the statement (and the
+# server connection behind PgBouncer), spread across concurrent writers.
+_STAT_SHARD_SQL: Final = f"pg_backend_pid() % {_STAT_SHARDS}"
+
+
+def queue_stat_delta_sql(source: str) -> str:
+    """Upsert the depth deltas in ``source`` into ``pg_queue_stat``.
+
+    ``source`` is a relation (typically a CTE name) with ``queue_name``,
+    ``org_id``, ``state``, ``delta`` (signed row count) and ``enqueued_at``
+    columns, one row per queue row added or removed. Returns a bare
+    ``INSERT … ON CONFLICT`` meant to run as a ``WITH`` member of the statement
+    that produced the rows. No params.
+    """
+    stat = qualified("pg_queue_stat")
+    return f"""INSERT INTO {stat} AS s
+        (queue_name, org_id, state, shard, depth, oldest_enqueued_at, updated_at)
+    SELECT queue_name, org_id, state, {_STAT_SHARD_SQL}, sum(delta),
+           min(enqueued_at) FILTER (WHERE delta > 0), now()
+      FROM {source}
+     GROUP BY queue_name, org_id, state
+     ORDER BY queue_name, org_id, state
+    ON CONFLICT (queue_name, org_id, state, shard) DO UPDATE
+       SET depth = s.depth + EXCLUDED.depth,
+           oldest_enqueued_at = CASE
+               WHEN s.depth + EXCLUDED.depth <= 0 THEN NULL
+               ELSE LEAST(s.oldest_enqueued_at, EXCLUDED.oldest_enqueued_at)
+           END,
+           updated_at = now()"""
+
+
+def queue_stat_transition_sql(source: str, from_state: str, to_state: str) -> str:
+    """Delta rows for moving every row of ``source`` (``queue_name``, ``org_id``,
+    ``enqueued_at``) from ``from_state`` to ``to_state``: a ``-1`` and a ``+1``
+    each, ready for :func:`queue_stat_delta_sql`. The states are trusted
+    :class:`QueueMessageState` values, interpolated as literals.
+    """
+    return (
+        f"SELECT queue_name, org_id, '{from_state}'::text AS state, -1 AS delta, "
+        f"enqueued_at FROM {source} "
+        f"UNION ALL SELECT queue_name, org_id, '{to_state}'::text, 1, "
+        f"enqueued_at FROM {source}"
+    )
+
+
+def _counted_insert_sql(insert: str, select: str = "SELECT msg_id FROM enqueued") -> str:
+    """``insert`` (a queue-row ``INSERT``) as CTE members that also count the
+    new rows, followed by ``select`` — by default ``SELECT msg_id`` of each (so
+    ``rowcount`` is the number enqueued). The caller supplies the leading
+    ``WITH``.
+    """
     return (
+        f"enqueued AS ({insert} RETURNING msg_id, queue_name, org_id, state, "
+        "1 AS delta, enqueued_at), "
+        f"counted AS ({queue_stat_delta_sql('enqueued')}) "
+        f"{select}"
+    )
+
+
+# The whole enqueue contract (columns + their defaults + the depth count) in one
+# place. The statement returns the new ``msg_id``; ``send()`` reads it, and the
+# PG scheduler (pg_scheduler.py) executes this verbatim inside its own
+# transaction so the enqueue + next_run advance commit atomically (it can't call
+# send(), which commits internally). Keep callers in sync by calling this helper
+# rather than copying the SQL. Built per call so ``pg_queue_message`` is
+# schema-qualified from the live ``DB_SCHEMA`` (resolves through PgBouncer txn
+# pooling without ``search_path`` — see :mod:`queue_backend.pg_queue.schema`).
+def insert_message_sql() -> str:
+    return "WITH " + _counted_insert_sql(
         f"INSERT INTO {qualified('pg_queue_message')} "
         "(queue_name, message, org_id, priority, enqueued_at, vt, read_ct, state) "
         f"VALUES (%s, %s::jsonb, %s, %s, now(), now(), 0, '{_READY}')"
     )
 
 
+def insert_messages_select_sql(
+    source: str, select: str = "SELECT msg_id FROM enqueued"
+) -> str:
+    """Set-based form of :func:`insert_message_sql`: one message per row of
+    ``source`` (a relation — a CTE name — with ``message`` and ``org_id``
+    columns), all onto one queue at one priority. Params: queue name, priority.
+    The PG scheduler fires a whole tick's batch with this.
+
+    Returns the tail of a ``WITH`` query — the caller writes
+    ``WITH <source> AS (…), `` and appends this — ending in ``select``. By
+    default that yields one ``msg_id`` per message enqueued; a caller may
+    instead select from one of its own CTEs (the scheduler reads back which
+    schedules it advanced).
+    """
+    return _counted_insert_sql(
+        f"INSERT INTO {qualified('pg_queue_message')} "
+        "(queue_name, message, org_id, priority, enqueued_at, vt, read_ct, state) "
+        "SELECT %s, src.message::jsonb, src.org_id, %s, now(), now(), 0, "
+        f"'{_READY}' FROM {source} AS src",
+        select,
+    )
+
+
 # Pause duration before send()'s single reconnect-retry (see send()). This is
 # the length of the pause, NOT the retry count — the one-shot bound is enforced
 # structurally by send()'s single ``except`` + single retry call, not by this
@@ -341,7 +465,7 @@ class PgQueueClient:
         """One INSERT of a queue row, returning its ``msg_id`` (see :meth:`send`)."""
         with self._cursor() as cur:
             cur.execute(
-                insert_message_sql() + " RETURNING msg_id",
+                insert_message_sql(),
                 # "" rather than NULL for "no org" — the column is non-null
                 # (string fields shouldn't have two empty values; Django S6553).
                 (
@@ -377,7 +501,13 @@ class PgQueueClient:
             cur.execute(_dequeue_sql(), (queue_name, qty, vt_seconds))
             rows = cur.fetchall()
         return [
-            QueueMessage(msg_id=int(r[0]), message=r[1], read_ct=int(r[2])) for r in rows
+            QueueMessage(
+                msg_id=int(r[0]),
+                message=r[1],
+                read_ct=int(r[2]),
+                queue_wait_seconds=float(r[3] or 0.0),
+            )
+            for r in rows
         ]
 
     def set_vt(self, msg_id: int, vt_seconds: int) -> bool:
@@ -446,10 +576,16 @@ class PgQueueClient:
             return self._delete_row(msg_id)
 
     def _delete_row(self, msg_id: int) -> bool:
-        """One DELETE of a queue row by ``msg_id`` (see :meth:`delete`)."""
+        """One DELETE of a queue row by ``msg_id`` (see :meth:`delete`), counted
+        off its ``pg_queue_stat`` row in the same statement.
+        """
         with self._cursor() as cur:
             cur.execute(
-                f"DELETE FROM {qualified('pg_queue_message')} WHERE msg_id = %s",
+                f"WITH acked AS (DELETE FROM {qualified('pg_queue_message')} "
+                "WHERE msg_id = %s RETURNING msg_id, queue_name, org_id, state, "
+                "-1 AS delta, enqueued_at), "
+                f"counted AS ({queue_stat_delta_sql('acked')}) "
+                "SELECT msg_id FROM acked",
                 (msg_id,),
             )
             deleted = cur.rowcount
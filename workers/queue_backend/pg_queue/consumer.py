@@ -371,6 +371,10 @@ class PgQueueConsumer:
         cycle still counts (so run() doesn't take the empty-queue backoff path
         after a partial failure).
         """
+        from shared.infrastructure.monitoring.pipeline_metrics import (
+            bind_stage_labels,
+        )
+
         self._last_poll_monotonic = time.monotonic()
         total = 0
         for queue_name in self.queue_names:
@@ -378,8 +382,9 @@ class PgQueueConsumer:
                 messages = self._client.read(
                     queue_name, vt_seconds=self.lease_seconds, qty=self.batch_size
                 )
-                for message in messages:
-                    self._handle(message)
+                with bind_stage_labels(queue=queue_name):
+                    for message in messages:
+                        self._handle(message)
                 total += len(messages)
             except Exception:
                 logger.exception(
@@ -571,7 +576,10 @@ class PgQueueConsumer:
             # pass it through so redelivery re-runs with the SAME request id, matching
             # Celery's own redelivery semantics. Falls back to Celery's uuid() when
             # absent (never None, which apply() would reject).
-            with self._lease_renewal(message.msg_id):
+            with (
+                self._lease_renewal(message.msg_id),
+                self._pipeline_stage_scope(message, payload),
+            ):
                 eager = task.apply(
                     args=payload.get("args") or [],
                     kwargs=payload.get("kwargs") or {},
@@ -660,6 +668,26 @@ class PgQueueConsumer:
                 message.msg_id,
             )
 
+    def _pipeline_stage_scope(
+        self, message: QueueMessage, payload: TaskPayload
+    ) -> contextlib.AbstractContextManager[None]:
+        """Record the message's queue wait (enqueue → claim) and bind its org
+        for the pipeline stage metrics the task body observes; the queue label
+        is bound per queue in :meth:`poll_once`.
+        """
+        from shared.infrastructure.monitoring.pipeline_metrics import (
+            PipelineStage,
+            bind_stage_labels,
+            observe_stage,
+        )
+
+        fairness = payload.get("fairness")
+        org = (
+            fairness.get("org_id") if isinstance(fairness, dict) else None
+        ) or self._continuation_org(payload)
+        observe_stage(PipelineStage.QUEUE_WAIT, message.queue_wait_seconds, org=org)
+        return bind_stage_labels(org=org)
+
     def _store_reply(
         self, reply_key: str, *, result: dict | None = None, error: str | None = None
     ) -> None:
@@ -1209,6 +1237,10 @@ class LivenessServer(_BaseLivenessServer):
     def __init__(
         self, consumer: PgQueueConsumer, *, port: int, stale_after: float
     ) -> None:
+        from shared.infrastructure.monitoring.pipeline_metrics import (
+            render_pipeline_metrics,
+        )
+
         from .metrics import ConsumerMetrics
 
         metrics = ConsumerMetrics(freshness_fn=consumer.seconds_since_last_poll)
@@ -1218,7 +1250,9 @@ class LivenessServer(_BaseLivenessServer):
             port=port,
             check_name="pg_queue_poll",
             age_key="seconds_since_last_poll",
-            metrics_fn=metrics.render,
+            # Heartbeat gauge + the per-stage pipeline series (queue wait, and
+            # the stages of the tasks this consumer runs in-process).
+            metrics_fn=lambda: metrics.render() + render_pipeline_metrics(),
             thread_name="pg-consumer-liveness",
             log_label="pg-queue consumer",
         )
@@ -33,6 +33,7 @@ double-register on the second import. An instance per process cannot.
 from __future__ import annotations
 
 import logging
+import os
 import time
 from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
@@ -47,6 +48,10 @@ logger = logging.getLogger(__name__)
 # Prometheus text exposition format (the /metrics Content-Type).
 METRICS_CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
 
+# Seconds a periodic schedule fired past its intended time: a healthy tick is
+# within one reaper interval; a budget-throttled burst drains over minutes.
+SCHEDULER_LAG_BUCKETS: Final = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
 
 def _new_registry() -> CollectorRegistry:
     from prometheus_client import CollectorRegistry
@@ -71,6 +76,36 @@ class _Exporter:
         return generate_latest(self.registry)
 
 
+class _PrefixFilter:
+    """Collector view keeping only the families whose name starts with a prefix."""
+
+    def __init__(self, source: object, prefix: str) -> None:
+        self._source = source
+        self._prefix = prefix
+
+    def collect(self) -> Iterable[Metric]:
+        return [m for m in self._source.collect() if m.name.startswith(self._prefix)]
+
+
+def render_multiprocess(name_prefix: str) -> bytes:
+    """Prometheus text for the ``name_prefix`` families summed over every
+    process writing to ``PROMETHEUS_MULTIPROC_DIR``; empty when it's unset.
+
+    The prefork supervisor serves ``/metrics`` while its children do the work,
+    so this is the only way their samples reach a scrape. The filter keeps
+    per-pid copies of function gauges (ours included) out of the output.
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return b""
+    from prometheus_client import generate_latest, multiprocess
+
+    registry = _new_registry()
+    registry.register(
+        _PrefixFilter(multiprocess.MultiProcessCollector(None), name_prefix)
+    )
+    return generate_latest(registry)
+
+
 class ConsumerMetrics(_Exporter):
     """Per-pod metrics for a PG-queue consumer (or the fleet supervisor).
 
@@ -121,6 +156,7 @@ class _QueueSnapshot:
     """
 
     depths: Mapping[str, tuple[int, float]] = field(default_factory=dict)
+    ready_depths: Mapping[str, int] = field(default_factory=dict)
     barriers_live: int = 0
     barriers_stranded: int = 0
     reference_monotonic: float = field(default_factory=time.monotonic)
@@ -142,7 +178,7 @@ class _QueueSnapshotCollector:
 
     @staticmethod
     def _families() -> tuple[Metric, ...]:
-        """The five empty metric families — one builder so ``describe`` (names
+        """The six empty metric families — one builder so ``describe`` (names
         only) and ``collect`` (names + samples) can never drift.
         """
         from prometheus_client.core import GaugeMetricFamily
@@ -154,9 +190,16 @@ class _QueueSnapshotCollector:
                 "snapshot; a drained queue's series is absent, not 0)",
                 labels=["queue"],
             ),
+            GaugeMetricFamily(
+                "pg_queue_ready_depth",
+                "Claimable ('ready') messages by queue — the backlog consumers "
+                "have not picked up yet, the autoscaling signal (cached snapshot)",
+                labels=["queue"],
+            ),
             GaugeMetricFamily(
                 "pg_queue_oldest_message_age_seconds",
-                "Age of the oldest message in the queue (cached snapshot)",
+                "Age of the oldest message in the queue (cached snapshot; an "
+                "upper bound between depth-counter reconciliations)",
                 labels=["queue"],
             ),
             GaugeMetricFamily(
@@ -185,14 +228,15 @@ class _QueueSnapshotCollector:
 
     def collect(self) -> Iterable[Metric]:
         snapshot = self._snapshot  # single read — the consistency point
-        depth, oldest, live, stranded, age = self._families()
+        depth, ready, oldest, live, stranded, age = self._families()
         for queue, (msg_count, oldest_age) in snapshot.depths.items():
             depth.add_metric([queue], msg_count)
+            ready.add_metric([queue], snapshot.ready_depths.get(queue, 0))
             oldest.add_metric([queue], oldest_age)
         live.add_metric([], snapshot.barriers_live)
         stranded.add_metric([], snapshot.barriers_stranded)
         age.add_metric([], time.monotonic() - snapshot.reference_monotonic)
-        return (depth, oldest, live, stranded, age)
+        return (depth, ready, oldest, live, stranded, age)
 
 
 class ReaperMetrics(_Exporter):
@@ -214,7 +258,7 @@ class ReaperMetrics(_Exporter):
         heartbeat_fn: Callable[[], float],
         is_leader_fn: Callable[[], bool],
     ) -> None:
-        from prometheus_client import Counter
+        from prometheus_client import Counter, Gauge, Histogram
 
         super().__init__()
         self._function_gauge(
@@ -254,8 +298,7 @@ class ReaperMetrics(_Exporter):
         )
         self.claim_recovered = Counter(
             "pg_reaper_claim_recovered_total",
-            "Orphan orchestration claims recovered (crash-window execution "
-            "marked ERROR)",
+            "Orphan orchestration claims recovered (crash-window execution marked ERROR)",
             registry=self.registry,
         )
         self.claim_gc = Counter(
@@ -286,6 +329,36 @@ class ReaperMetrics(_Exporter):
             registry=self.registry,
         )
 
+        # PG scheduler tick (pg_scheduler.dispatch_due_schedules), leader only.
+        self.scheduler_fired = Counter(
+            "pg_scheduler_fired_total",
+            "Periodic schedules fired onto the PG queue",
+            registry=self.registry,
+        )
+        self.scheduler_fire_failures = Counter(
+            "pg_scheduler_fire_failures_total",
+            "Schedule fires that raised (row left due for the next tick)",
+            registry=self.registry,
+        )
+        self.scheduler_fire_lag = Histogram(
+            "pg_scheduler_fire_lag_seconds",
+            "Seconds between a schedule's intended fire time (cron match + spread "
+            "offset) and the tick that fired it",
+            buckets=SCHEDULER_LAG_BUCKETS,
+            registry=self.registry,
+        )
+        self.scheduler_lag = Gauge(
+            "pg_scheduler_lag_seconds",
+            "How far past its intended fire time the oldest due schedule was at "
+            "the last tick (0 when nothing was due)",
+            registry=self.registry,
+        )
+        self.scheduler_held_back = Gauge(
+            "pg_scheduler_held_back",
+            "Due schedules the fire budget deferred to a later tick at the last tick",
+            registry=self.registry,
+        )
+
         self._queue_collector = _QueueSnapshotCollector()
         self.registry.register(self._queue_collector)
 
@@ -295,25 +368,31 @@ class ReaperMetrics(_Exporter):
         depths: dict[str, tuple[int, float]],
         barriers_live: int,
         barriers_stranded: int,
+        ready_depths: dict[str, int] | None = None,
     ) -> None:
         """Publish a fresh queue-wide snapshot (atomic swap; see collector).
 
         ``depths`` maps queue name -> (message count, oldest-message age in
         seconds). A queue that drained to zero rows simply drops out of the
         series rather than freezing at its last non-zero value.
+        ``ready_depths`` maps the same queues to their claimable-message count
+        (a queue missing from it exports 0).
         """
         self._queue_collector.replace(
             _QueueSnapshot(
                 depths=dict(depths),
+                ready_depths=dict(ready_depths or {}),
                 barriers_live=barriers_live,
                 barriers_stranded=barriers_stranded,
             )
         )
 
     def clear_queue_snapshot(self) -> None:
-        """Drop the per-queue series and zero the barrier gauges (called on
-        losing leadership — a standby must not export a frozen stale snapshot
-        as if it were live; its ``pg_queue_gauges_age_seconds`` restarts from
-        the step-down and keeps growing).
+        """Drop the per-queue series and zero the barrier and scheduler gauges
+        (called on losing leadership — a standby must not export a frozen stale
+        snapshot as if it were live; its ``pg_queue_gauges_age_seconds``
+        restarts from the step-down and keeps growing).
         """
         self._queue_collector.replace(_QueueSnapshot())
+        self.scheduler_lag.set(0)
+        self.scheduler_held_back.set(0)
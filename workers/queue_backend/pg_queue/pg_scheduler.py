@@ -22,16 +22,37 @@ Correctness properties:
   first tick records its baseline next time and does **not** fire (matches Beat:
   a new schedule fires at its next cron match, not immediately).
 
-Per-row isolation (mirrors :func:`recover_expired_barriers`): a bad cron or a DB
-error on one row is rolled back, logged, and skipped without poisoning the
-connection or blocking the other rows.
+Batched, load-smoothed firing. Thousands of pipelines on ``0 * * * *`` all
+come due in the same tick, so the tick is set-based rather than per-row:
+
+- **Batches.** Due rows are fired :data:`FIRE_BATCH_SIZE` at a time, each batch
+  one transaction and one statement: an ``UPDATE … FROM unnest(…)`` advancing
+  ``next_run_at`` feeds an ``INSERT … SELECT`` that enqueues a trigger for each
+  row it actually advanced (compare-and-set on the scanned ``next_run_at``), so
+  the no-re-fire property holds per batch.
+- **Spread window** (``spread_seconds``). Each schedule is held back by a
+  deterministic offset in ``[0, spread)`` derived from its ``pipeline_id``
+  (:func:`spread_offset_seconds`), so a cron minute shared by many pipelines
+  fans out over the window instead of landing as one burst on
+  ``file_processing`` and the source connectors. Same pipeline, same offset,
+  every run. Keep it well under the shortest cron period.
+- **Fire budget** (``max_fires``). At most this many schedules fire per tick
+  (:func:`fire_budget` turns a fires/second cap into a per-tick count); the
+  rest stay due and go first next tick, oldest first.
+
+Isolation (mirrors :func:`recover_expired_barriers`): a bad cron is quiesced
+and skipped before the batch is built, and a batch whose transaction fails is
+rolled back and retried one row per transaction, so one poison row is logged
+and left for the next tick without blocking the others.
 """
 
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
 import logging
+import math
 import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, NamedTuple
@@ -41,19 +62,34 @@ from croniter import croniter
 from unstract.core.data_models import TaskPayload
 
 from ..fairness import DEFAULT_PRIORITY
-from .client import insert_message_sql
+from .client import insert_message_sql, insert_messages_select_sql
 from .schema import qualified
 from .task_payload import to_payload
 
 if TYPE_CHECKING:
     from psycopg2.extensions import connection as PgConnection
 
+    from .metrics import ReaperMetrics
+
 logger = logging.getLogger(__name__)
 
 # The fired task + the queue a `scheduler` PG consumer polls (QueueName.SCHEDULER).
 PIPELINE_TRIGGER_TASK = "scheduler.tasks.execute_pipeline_task"
 SCHEDULER_QUEUE_NAME = "scheduler"
 
+# Schedules fired per transaction: bounds one statement's row locks and WAL
+# when a popular cron minute makes thousands of rows due at once.
+FIRE_BATCH_SIZE = 500
+
+# The spread offset maps the first 32 bits of md5(pipeline_id) onto [0, spread).
+_HASH_SPACE = float(2**32)
+# SQL twin of spread_offset_seconds(), evaluated by the due scan (param: spread
+# seconds). md5 over the canonical uuid text, so Python and Postgres agree.
+_SPREAD_OFFSET_SQL = (
+    "(('x' || left(md5(pipeline_id::text), 8))::bit(32)::bigint::float8 "
+    f"* %s::float8 / {_HASH_SPACE}) * interval '1 second'"
+)
+
 
 class _DueSchedule(NamedTuple):
     """One row from the due-schedules scan — names bound to columns at one site
@@ -73,6 +109,31 @@ def compute_next_run(cron_string: str, base: datetime) -> datetime:
     return croniter(cron_string, base).get_next(datetime)
 
 
+def spread_offset_seconds(pipeline_id: str | uuid.UUID, spread_seconds: float) -> float:
+    """Deterministic per-schedule delay in ``[0, spread_seconds)``.
+
+    Stable across ticks and reaper replicas, so a schedule fires at a fixed
+    point inside the window rather than jittering run to run.
+    """
+    if spread_seconds <= 0:
+        return 0.0
+    digest = hashlib.md5(str(pipeline_id).encode(), usedforsecurity=False)
+    return int(digest.hexdigest()[:8], 16) * spread_seconds / _HASH_SPACE
+
+
+def fire_budget(
+    max_fires_per_second: float | None, interval_seconds: float
+) -> int | None:
+    """Schedules one tick may fire under a fires/second cap; ``None`` = no cap.
+
+    Never rounds down to zero — a tiny rate still fires one schedule per tick
+    rather than stalling every schedule forever.
+    """
+    if not max_fires_per_second:
+        return None
+    return max(1, math.floor(max_fires_per_second * interval_seconds))
+
+
 def _build_trigger_payload(
     *,
     workflow_id: str | uuid.UUID | None,
@@ -127,15 +188,16 @@ def _quiesce_invalid_cron(conn: PgConnection, schedule: _DueSchedule) -> None:
             conn.rollback()
 
 
-def dispatch_due_schedules(conn: PgConnection) -> int:
-    """Fire PG-owned, enabled, due schedules; return the count actually fired.
+def _scan(
+    conn: PgConnection, *, max_fires: int | None, spread_seconds: float
+) -> tuple[datetime, list[_DueSchedule], list[_DueSchedule], int]:
+    """Read step: ``(now, rows to baseline, rows to fire, total due)``.
 
-    The caller (reaper tick) gates this on leadership. All time comparisons use
-    the DB clock (``now()``). Each row is handled in its own transaction; a bad
-    cron or a DB error on one row is rolled back + logged + skipped (the others
-    still fire). The read step rolls back + re-raises on error so the connection
-    is never handed back in an aborted-transaction state (mirrors
-    :func:`recover_expired_barriers`).
+    Rows to fire are the due ones (``next_run_at`` plus the spread offset has
+    passed), oldest first, capped at ``max_fires`` (``LIMIT NULL`` = no cap);
+    the total counts every due row, so the difference is what the budget held
+    back. Rolls back + re-raises on error so the connection is never handed
+    back in an aborted-transaction state.
     """
     try:
         with conn.cursor() as cur:
@@ -146,87 +208,260 @@ def dispatch_due_schedules(conn: PgConnection) -> int:
                 SELECT pipeline_id, organization_id, workflow_id, pipeline_name,
                        cron_string, next_run_at
                 FROM {qualified('pg_periodic_schedule')}
-                WHERE pg_owned AND enabled
-                  AND (next_run_at IS NULL OR next_run_at <= %s)
+                WHERE pg_owned AND enabled AND next_run_at IS NULL
+                """
+            )
+            unbaselined = [_DueSchedule(*row) for row in cur.fetchall()]
+            # The offset is never negative, so `next_run_at <= now` is a valid
+            # (index-friendly) pre-filter for `fire_at <= now`.
+            cur.execute(
+                f"""
+                SELECT pipeline_id, organization_id, workflow_id, pipeline_name,
+                       cron_string, next_run_at, count(*) OVER ()
+                FROM (
+                    SELECT *, next_run_at + {_SPREAD_OFFSET_SQL} AS fire_at
+                    FROM {qualified('pg_periodic_schedule')}
+                    WHERE pg_owned AND enabled AND next_run_at <= %s
+                ) AS due
+                WHERE fire_at <= %s
+                ORDER BY fire_at, pipeline_id
+                LIMIT %s
                 """,
-                (base,),
+                (spread_seconds, base, base, max_fires),
             )
-            due = [_DueSchedule(*row) for row in cur.fetchall()]
+            rows = cur.fetchall()
         conn.commit()
     except Exception:
         with contextlib.suppress(Exception):
             conn.rollback()
         raise
+    due = [_DueSchedule(*row[:-1]) for row in rows]
+    return base, unbaselined, due, rows[0][-1] if rows else 0
+
+
+def _baseline(conn: PgConnection, schedules: list[_DueSchedule], base: datetime) -> None:
+    """Record the first ``next_run_at`` of freshly-owned rows, without firing
+    (no burst on hand-over). One set-based UPDATE; on failure the rows stay NULL
+    and are retried next tick.
+    """
+    pending: list[tuple[_DueSchedule, datetime]] = []
+    for schedule in schedules:
+        try:
+            pending.append((schedule, compute_next_run(schedule.cron_string, base)))
+        except Exception:
+            _quiesce_invalid_cron(conn, schedule)
+    if not pending:
+        return
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE {qualified('pg_periodic_schedule')} AS s
+                SET next_run_at = b.next_run_at
+                FROM unnest(%s::uuid[], %s::timestamptz[])
+                    AS b(pipeline_id, next_run_at)
+                WHERE s.pipeline_id = b.pipeline_id AND s.next_run_at IS NULL
+                """,
+                (
+                    [str(schedule.pipeline_id) for schedule, _ in pending],
+                    [nxt for _, nxt in pending],
+                ),
+            )
+        conn.commit()
+    except Exception:
+        with contextlib.suppress(Exception):
+            conn.rollback()
+        logger.exception(
+            "PG scheduler: failed to baseline %d pipeline(s) — retrying next tick",
+            len(pending),
+        )
+        return
+    logger.info(
+        "PG scheduler: baselined %d pipeline(s) (not fired): %s",
+        len(pending),
+        ", ".join(str(schedule.pipeline_id) for schedule, _ in pending),
+    )
+
+
+def _payload_json(schedule: _DueSchedule) -> str:
+    return json.dumps(
+        _build_trigger_payload(
+            workflow_id=schedule.workflow_id,
+            organization_id=schedule.organization_id,
+            pipeline_id=schedule.pipeline_id,
+            pipeline_name=schedule.pipeline_name,
+        )
+    )
+
+
+def _fire_batch(
+    conn: PgConnection, batch: list[tuple[_DueSchedule, datetime]], base: datetime
+) -> set[str]:
+    """Fire ``batch`` in ONE transaction; return the pipeline ids it fired.
+
+    The UPDATE advances only rows still at their scanned ``next_run_at`` (and
+    still owned + enabled), and the INSERT enqueues only for rows it advanced,
+    so a row that changed since the scan (e.g. another scheduler's CAS won) is
+    neither advanced nor fired — nor in the returned ids.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""
+            WITH fire AS (
+                SELECT * FROM unnest(
+                    %s::uuid[], %s::timestamptz[], %s::timestamptz[],
+                    %s::text[], %s::text[]
+                ) AS f(pipeline_id, scanned_next_run_at, next_run_at, org_id, message)
+            ), advanced AS (
+                UPDATE {qualified('pg_periodic_schedule')} AS s
+                SET last_run_at = %s, next_run_at = fire.next_run_at
+                FROM fire
+                WHERE s.pipeline_id = fire.pipeline_id
+                  AND s.next_run_at = fire.scanned_next_run_at
+                  AND s.pg_owned AND s.enabled
+                RETURNING s.pipeline_id
+            ), fired AS (
+                SELECT fire.message, fire.org_id
+                FROM fire JOIN advanced USING (pipeline_id)
+            ),
+            """
+            + insert_messages_select_sql(
+                "fired", select="SELECT pipeline_id::text FROM advanced"
+            ),
+            (
+                [str(schedule.pipeline_id) for schedule, _ in batch],
+                [schedule.next_run_at for schedule, _ in batch],
+                [nxt for _, nxt in batch],
+                [schedule.organization_id or "" for schedule, _ in batch],
+                [_payload_json(schedule) for schedule, _ in batch],
+                base,
+                SCHEDULER_QUEUE_NAME,
+                DEFAULT_PRIORITY,
+            ),
+        )
+        fired = {pipeline_id for (pipeline_id,) in cur.fetchall()}
+    conn.commit()
+    return fired
+
+
+def _fire_one(
+    conn: PgConnection, schedule: _DueSchedule, nxt: datetime, base: datetime
+) -> bool:
+    """Fire one row in its own transaction (the fallback when its batch
+    failed); ``False`` if it failed and was left for the next tick.
+    """
+    try:
+        # Enqueue + advance in ONE transaction so a crash between them can't
+        # re-fire next cycle. insert_message_sql() is the shared enqueue
+        # contract from client.py (send() uses the same helper).
+        with conn.cursor() as cur:
+            cur.execute(
+                insert_message_sql(),
+                (
+                    SCHEDULER_QUEUE_NAME,
+                    _payload_json(schedule),
+                    schedule.organization_id or "",
+                    DEFAULT_PRIORITY,
+                ),
+            )
+            cur.execute(
+                f"UPDATE {qualified('pg_periodic_schedule')} "
+                "SET last_run_at = %s, next_run_at = %s WHERE pipeline_id = %s",
+                (base, nxt, schedule.pipeline_id),
+            )
+        conn.commit()
+    except Exception:
+        # A row-level failure (constraint, serialization, socket) must not
+        # poison the connection or drop the rest of the batch — roll back +
+        # leave the row for the next tick (next_run_at unchanged → re-fires).
+        with contextlib.suppress(Exception):
+            conn.rollback()
+        logger.exception(
+            "PG scheduler: failed to fire pipeline %s — leaving for next tick",
+            schedule.pipeline_id,
+        )
+        return False
+    return True
+
+
+def dispatch_due_schedules(
+    conn: PgConnection,
+    *,
+    max_fires: int | None = None,
+    spread_seconds: float = 0.0,
+    metrics: ReaperMetrics | None = None,
+) -> int:
+    """Fire PG-owned, enabled, due schedules; return the count actually fired.
+
+    The caller (reaper tick) gates this on leadership and supplies the load
+    smoothing: at most ``max_fires`` schedules this tick (``None`` = all due),
+    each held back by its :func:`spread_offset_seconds` within
+    ``spread_seconds``. All time comparisons use the DB clock (``now()``).
 
-    fired = 0
+    Lag — how long after its intended fire time (cron match + spread offset) a
+    schedule actually fires — is observed per fired row into ``metrics``, with
+    the oldest due row's lag and the count held back by the budget as gauges.
+    """
+    base, unbaselined, due, due_total = _scan(
+        conn, max_fires=max_fires, spread_seconds=spread_seconds
+    )
+    _baseline(conn, unbaselined, base)
+
+    ready: list[tuple[_DueSchedule, datetime]] = []
     for schedule in due:
         try:
-            nxt = compute_next_run(schedule.cron_string, base)
+            ready.append((schedule, compute_next_run(schedule.cron_string, base)))
         except Exception:
             _quiesce_invalid_cron(conn, schedule)
-            continue
 
+    def lag(schedule: _DueSchedule) -> float:
+        offset = spread_offset_seconds(schedule.pipeline_id, spread_seconds)
+        return max((base - schedule.next_run_at).total_seconds() - offset, 0.0)
+
+    fired = failed = 0
+    fired_lags: list[float] = []
+    for start in range(0, len(ready), FIRE_BATCH_SIZE):
+        batch = ready[start : start + FIRE_BATCH_SIZE]
         try:
-            if schedule.next_run_at is None:
-                # First observation of a freshly-owned row: record the baseline
-                # next time and do NOT fire (no burst when handed over).
-                with conn.cursor() as cur:
-                    cur.execute(
-                        f"UPDATE {qualified('pg_periodic_schedule')} "
-                        "SET next_run_at = %s WHERE pipeline_id = %s",
-                        (nxt, schedule.pipeline_id),
-                    )
-                conn.commit()
-                logger.info(
-                    "PG scheduler: baselined pipeline %s (next_run_at=%s, not fired)",
-                    schedule.pipeline_id,
-                    nxt,
-                )
-                continue
-
-            payload = _build_trigger_payload(
-                workflow_id=schedule.workflow_id,
-                organization_id=schedule.organization_id,
-                pipeline_id=schedule.pipeline_id,
-                pipeline_name=schedule.pipeline_name,
+            advanced = _fire_batch(conn, batch, base)
+            fired += len(advanced)
+            fired_lags.extend(
+                lag(schedule)
+                for schedule, _ in batch
+                if str(schedule.pipeline_id) in advanced
             )
-            # Enqueue + advance in ONE transaction so a crash between them can't
-            # re-fire next cycle. insert_message_sql() is the shared enqueue
-            # contract from client.py (send() uses the same helper).
-            with conn.cursor() as cur:
-                cur.execute(
-                    insert_message_sql(),
-                    (
-                        SCHEDULER_QUEUE_NAME,
-                        json.dumps(payload),
-                        schedule.organization_id or "",
-                        DEFAULT_PRIORITY,
-                    ),
-                )
-                cur.execute(
-                    f"UPDATE {qualified('pg_periodic_schedule')} "
-                    "SET last_run_at = %s, next_run_at = %s WHERE pipeline_id = %s",
-                    (base, nxt, schedule.pipeline_id),
-                )
-            conn.commit()
+            continue
         except Exception:
-            # A row-level failure (constraint, serialization, socket) must not
-            # poison the connection or drop the rest of the batch — roll back +
-            # leave the row for the next tick (next_run_at unchanged → re-fires).
             with contextlib.suppress(Exception):
                 conn.rollback()
-            logger.exception(
-                "PG scheduler: failed to fire pipeline %s — leaving for next tick",
-                schedule.pipeline_id,
+            logger.warning(
+                "PG scheduler: batched fire of %d pipeline(s) failed — retrying "
+                "one per transaction",
+                len(batch),
+                exc_info=True,
             )
-            continue
+        for schedule, nxt in batch:
+            if _fire_one(conn, schedule, nxt, base):
+                fired += 1
+                fired_lags.append(lag(schedule))
+            else:
+                failed += 1
 
-        fired += 1
+    held_back = due_total - len(due)
+    if metrics is not None:
+        metrics.scheduler_fired.inc(fired)
+        metrics.scheduler_fire_failures.inc(failed)
+        for seconds in fired_lags:
+            metrics.scheduler_fire_lag.observe(seconds)
+        metrics.scheduler_lag.set(max(map(lag, due), default=0.0))
+        metrics.scheduler_held_back.set(held_back)
+    if fired or held_back:
         logger.info(
-            "PG scheduler: fired pipeline %s → %s (next_run_at=%s)",
-            schedule.pipeline_id,
+            "PG scheduler: fired %d pipeline(s) → %s (%d held back by the fire "
+            "budget, %d failed)",
+            fired,
             SCHEDULER_QUEUE_NAME,
-            nxt,
+            held_back,
+            failed,
         )
-
     return fired
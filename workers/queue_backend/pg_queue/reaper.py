@@ -16,8 +16,8 @@ graceful shutdown) plus the **barrier-orphan recovery** job.
    mark if the execution is already terminal** (a ``remaining==0`` row can belong
    to a COMPLETED execution whose best-effort row-delete merely failed, and the
    backend status update has no terminal guard) or if the row carries no org.
-2. **Reclaims the queue-infra rows** (``pg_batch_dedup`` + ``pg_barrier_state``)
-   directly in PG — same boundary as the rest of ``queue_backend``.
+2. **Reclaims the queue-infra rows** (``pg_batch_dedup`` + ``pg_barrier_state``
+   + its ``pg_barrier_result`` rows) directly in PG — same boundary as the rest of ``queue_backend``.
 
 Recovery is best-effort and per-execution: a failure (e.g. the API is
 unreachable) leaves that barrier row for the next sweep to retry, and never
@@ -64,14 +64,17 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Final, Literal, NamedTuple, Protocol, TypeVar
 
 from unstract.core.data_models import ExecutionStatus, QueueMessageState
+from unstract.core.pg_result_payload import delete_offloaded
 
 from ..barrier import barrier_stuck_timeout_seconds
+from .client import queue_stat_delta_sql, queue_stat_transition_sql
 from .connection import create_pg_connection
 from .leader_election import LeaderLease, default_worker_id
 from .liveness import LivenessServer as _BaseLivenessServer
 from .metrics import ReaperMetrics
-from .pg_scheduler import dispatch_due_schedules
+from .pg_scheduler import dispatch_due_schedules, fire_budget
 from .recovery import mark_execution_error
+from .result_backend import OFFLOAD_PATH_EXPR, result_storage
 from .schema import qualified
 
 if TYPE_CHECKING:
@@ -213,6 +216,30 @@ def dedup_retention_from_env() -> int:
     )
 
 
+def scheduler_max_fires_per_second_from_env() -> float | None:
+    """PG scheduler fire-rate cap from ``WORKER_PG_SCHEDULER_MAX_FIRES_PER_SECOND``.
+
+    Unset or blank (compose's ``${VAR:-}``) → no cap: every due schedule fires
+    the tick it comes due. Set, it must be positive; the reaper turns it into a
+    per-tick budget (see :func:`~queue_backend.pg_queue.pg_scheduler.fire_budget`).
+    """
+    name = "WORKER_PG_SCHEDULER_MAX_FIRES_PER_SECOND"
+    if not os.getenv(name, "").strip():
+        return None
+    return _positive_duration_from_env(name, 0.0, float)
+
+
+def scheduler_spread_seconds_from_env() -> float:
+    """PG scheduler spread window from ``WORKER_PG_SCHEDULER_SPREAD_SECONDS``.
+
+    Unset or blank → 0 (fire at the cron match). Set, it must be positive.
+    """
+    name = "WORKER_PG_SCHEDULER_SPREAD_SECONDS"
+    if not os.getenv(name, "").strip():
+        return 0.0
+    return _positive_duration_from_env(name, 0.0, float)
+
+
 def stuck_recovery_enabled_from_env() -> bool:
     """Whether the reaper's stranded-execution recovery sweep runs — ON by default.
 
@@ -263,18 +290,25 @@ def sweep_expired_results(conn: PgConnection) -> int:
     thing keeping it from growing unbounded with each RPC. Idempotent
     (``DELETE … WHERE``) and uses the ``pg_task_result_expires_idx`` index. Rolls
     back on error so the manual-commit connection isn't left in an aborted-txn state.
+
+    Results that were offloaded to file storage and never consumed (caller crash /
+    timeout) have their files deleted once the row delete is committed —
+    best-effort, so a storage outage leaves logged orphans, not a failed sweep.
     """
     try:
         with conn.cursor() as cur:
             cur.execute(
-                f"DELETE FROM {qualified('pg_task_result')} WHERE expires_at <= now()"
+                f"DELETE FROM {qualified('pg_task_result')} WHERE expires_at <= now() "
+                f"RETURNING {OFFLOAD_PATH_EXPR}"
             )
             deleted = cur.rowcount
+            offloaded = [path for (path,) in cur.fetchall() if path]
         conn.commit()
-        return deleted
     except Exception:
         _rollback_after_sweep_failure(conn, "pg_task_result")
         raise
+    delete_offloaded(offloaded, result_storage)
+    return deleted
 
 
 def sweep_orphan_dedup(conn: PgConnection, retention_seconds: int) -> int:
@@ -304,6 +338,34 @@ def sweep_orphan_dedup(conn: PgConnection, retention_seconds: int) -> int:
         raise
 
 
+def sweep_orphan_barrier_results(conn: PgConnection) -> int:
+    """Delete ``pg_barrier_result`` rows whose ``pg_barrier_state`` row is gone.
+
+    Every teardown path of this release deletes a barrier's result rows with its
+    state row, but during a rolling deploy a previous-release worker that runs
+    the final decrement (or an abort) deletes only the state row — it predates
+    the result table (see *Mixed-release window* in
+    :mod:`queue_backend.pg_barrier`). A result row is only written by the same
+    statement that decrements its live state row, and a re-enqueue deletes the
+    prior run's rows, so one with no state row is a safe-to-drop orphan; no age
+    guard is needed. Idempotent; rolls back on error.
+    """
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"DELETE FROM {qualified('pg_barrier_result')} AS r "
+                "WHERE NOT EXISTS ("
+                f"    SELECT 1 FROM {qualified('pg_barrier_state')} AS s "
+                "    WHERE s.execution_id = r.execution_id)"
+            )
+            deleted = cur.rowcount
+        conn.commit()
+        return deleted
+    except Exception:
+        _rollback_after_sweep_failure(conn, "pg_barrier_result")
+        raise
+
+
 def rearm_expired_claims(conn: PgConnection) -> int:
     """Re-arm crashed-worker queue messages: ``claimed`` + expired vt -> ``ready``.
 
@@ -327,9 +389,15 @@ def rearm_expired_claims(conn: PgConnection) -> int:
     ready, claimed = QueueMessageState.READY.value, QueueMessageState.CLAIMED.value
     try:
         with conn.cursor() as cur:
+            # Same statement moves the rows between their depth counters.
             cur.execute(
-                f"UPDATE {qualified('pg_queue_message')} "
-                f"SET state = '{ready}' WHERE state = '{claimed}' AND vt <= now()"
+                f"WITH rearmed AS (UPDATE {qualified('pg_queue_message')} "
+                f"SET state = '{ready}' WHERE state = '{claimed}' AND vt <= now() "
+                "RETURNING msg_id, queue_name, org_id, enqueued_at), "
+                "moved AS ("
+                f"{queue_stat_transition_sql('rearmed', claimed, ready)}), "
+                f"counted AS ({queue_stat_delta_sql('moved')}) "
+                "SELECT msg_id FROM rearmed"
             )
             rearmed = cur.rowcount
         conn.commit()
@@ -339,6 +407,72 @@ def rearm_expired_claims(conn: PgConnection) -> int:
         raise
 
 
+def reconcile_queue_stats(conn: PgConnection) -> int:
+    """Reset ``pg_queue_stat`` to exact values recomputed from ``pg_queue_message``.
+
+    The stat rows are maintained incrementally by every queue writer (see
+    ``client.queue_stat_delta_sql``); this is the periodic correction for what
+    that can't get exactly right — ``oldest_enqueued_at`` held back by decrements,
+    a row written before the table existed (rolling deploy), a counter that drifted
+    below zero. One upsert over every known shard row (the stat table's plus
+    shard 0 of each live aggregate key), sorted like the writers' upserts so it
+    can't deadlock with them: a key's exact depth goes to its shard 0 and its
+    other shards are zeroed, not deleted, so a concurrent writer's
+    ``ON CONFLICT`` always finds its row. Returns the number of rows corrected.
+
+    The aggregate is the full ``GROUP BY`` the gauges no longer run per refresh,
+    so this rides the retention-sweep cadence (``WORKER_PG_REAPER_SWEEP_SECONDS``)
+    rather than every tick. Not a stop-the-world recount: a writer that commits
+    between the aggregate's snapshot and the upsert reaching its row is
+    overwritten, leaving that counter off by the racing rows until the next
+    reconciliation — bounded, never cumulative. Rolls back on error.
+    """
+    msg, stat = qualified("pg_queue_message"), qualified("pg_queue_stat")
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                WITH live AS (
+                    SELECT queue_name, org_id, state, count(*) AS depth,
+                           min(enqueued_at) AS oldest_enqueued_at
+                      FROM {msg}
+                     GROUP BY queue_name, org_id, state
+                ), target AS (
+                    SELECT k.queue_name, k.org_id, k.state, k.shard,
+                           CASE WHEN k.shard = 0
+                                THEN COALESCE(live.depth, 0) ELSE 0 END AS depth,
+                           CASE WHEN k.shard = 0
+                                THEN live.oldest_enqueued_at END
+                               AS oldest_enqueued_at
+                      FROM (SELECT queue_name, org_id, state, shard FROM {stat}
+                            UNION
+                            SELECT queue_name, org_id, state, 0 FROM live) AS k
+                      LEFT JOIN live USING (queue_name, org_id, state)
+                )
+                INSERT INTO {stat} AS s
+                    (queue_name, org_id, state, shard, depth, oldest_enqueued_at,
+                     updated_at)
+                SELECT queue_name, org_id, state, shard, depth, oldest_enqueued_at,
+                       now()
+                  FROM target
+                 ORDER BY queue_name, org_id, state, shard
+                ON CONFLICT (queue_name, org_id, state, shard) DO UPDATE
+                   SET depth = EXCLUDED.depth,
+                       oldest_enqueued_at = EXCLUDED.oldest_enqueued_at,
+                       updated_at = now()
+                 WHERE s.depth IS DISTINCT FROM EXCLUDED.depth
+                    OR s.oldest_enqueued_at IS DISTINCT FROM
+                       EXCLUDED.oldest_enqueued_at
+                """
+            )
+            corrected = cur.rowcount
+        conn.commit()
+        return corrected
+    except Exception:
+        _rollback_after_sweep_failure(conn, "pg_queue_stat")
+        raise
+
+
 def _execution_status(
     api_client: InternalAPIClient, execution_id: str, organization_id: str
 ) -> str | object | None:
@@ -466,14 +600,14 @@ def _recover_one_barrier(
     a COMPLETED execution whose best-effort row-delete merely failed, and the
     backend status update has no terminal guard, so the read-first skip prevents
     overwriting a finished execution. Queue-infra cleanup (``pg_batch_dedup`` /
-    ``pg_barrier_state``) stays direct-PG.
+    ``pg_barrier_state`` / ``pg_barrier_result``) stays direct-PG.
 
     The barrier ``DELETE`` is re-guarded on ``expires_at < now()``: between the
     sweep's SELECT and here the same ``execution_id`` could be re-enqueued
     (UPSERT resets ``expires_at`` to the future), and we must not tear down a
     freshly re-armed barrier. If the row was re-armed (``rowcount == 0``) we leave
-    it and its dedup markers (the new run owns them); the dedup delete only runs
-    when the barrier row was actually reclaimed.
+    it, its dedup markers and its child results (the new run owns them); those
+    deletes only run when the barrier row was actually reclaimed.
 
     Returns False (no mark, no delete) when the row can't be safely recovered:
     org unknown (can't call the org-scoped API → the row is LEFT, not erased, so
@@ -547,6 +681,10 @@ def _recover_one_barrier(
                 f"DELETE FROM {qualified('pg_batch_dedup')} WHERE execution_id = %s",
                 (execution_id,),
             )
+            cur.execute(
+                f"DELETE FROM {qualified('pg_barrier_result')} WHERE execution_id = %s",
+                (execution_id,),
+            )
         else:
             logger.warning(
                 "Reaper: barrier for execution %s was re-armed during recovery "
@@ -576,10 +714,10 @@ def recover_expired_barriers(
     SELECT the stranded rows (the reaper is leader-elected → a single active
     sweeper, so a read-then-act is safe from double-claim), then recover each one
     best-effort: mark the execution ERROR if it isn't already terminal, then
-    delete its ``pg_batch_dedup`` + ``pg_barrier_state`` rows. One execution
-    failing (e.g. the API is unreachable, or a status read that can't be
-    confirmed) is logged and skipped — its row is left for the next sweep to
-    retry — so it never blocks the others. A non-empty sweep that recovers
+    delete its ``pg_batch_dedup`` + ``pg_barrier_result`` + ``pg_barrier_state``
+    rows. One execution failing (e.g. the API is unreachable, or a status read
+    that can't be confirmed) is logged and skipped — its row is left for the next
+    sweep to retry — so it never blocks the others. A non-empty sweep that recovers
     *nothing* is escalated as a systemic failure (API down / bad migration).
 
     ``conn`` runs in manual-commit mode; on any error we roll back before
@@ -938,23 +1076,35 @@ def refresh_queue_gauges(
 ) -> None:
     """Take one queue-wide snapshot into ``metrics`` (leader-only caller).
 
-    Two aggregate reads: per-queue depth + oldest-message age over
-    ``pg_queue_message`` (all rows — ready and in-flight — since a backlog is a
-    backlog either way), and live/stranded counts over ``pg_barrier_state``
-    (live = ``remaining > 0`` in-flight fan-outs; stranded = what the next
-    recovery pass would pick up — same predicate, unfiltered by ``remaining``,
-    so it includes ``remaining==0`` delete-failure lingerers).
+    Two aggregate reads: per-queue depth, ready depth and oldest-message age from
+    the incrementally maintained ``pg_queue_stat`` counters (a few rows per
+    queue/org, so the read doesn't grow with the backlog; depth covers ready and
+    in-flight rows — a backlog is a backlog either way), and live/stranded counts
+    over ``pg_barrier_state`` (live = ``remaining > 0`` in-flight fan-outs;
+    stranded = what the next recovery pass would pick up — same predicate,
+    unfiltered by ``remaining``, so it includes ``remaining==0`` delete-failure
+    lingerers). A counter's shards are summed first and a sum that drifted below
+    zero reads as zero; the oldest age is an upper bound between reconciliations
+    (see :func:`reconcile_queue_stats`).
 
     ``conn`` runs in manual-commit mode; on any error we roll back before
     re-raising so the connection isn't left in an aborted-txn state (the caller
     counts the failure and discards an owned connection).
     """
+    ready = QueueMessageState.READY.value
     try:
         with conn.cursor() as cur:
             cur.execute(
-                "SELECT queue_name, count(*), "
-                "COALESCE(EXTRACT(EPOCH FROM now() - min(enqueued_at)), 0) "
-                f"FROM {qualified('pg_queue_message')} GROUP BY queue_name"
+                "WITH counters AS ("
+                "SELECT queue_name, state, GREATEST(sum(depth), 0) AS depth, "
+                "min(oldest_enqueued_at) AS oldest_enqueued_at "
+                f"FROM {qualified('pg_queue_stat')} "
+                "GROUP BY queue_name, org_id, state) "
+                "SELECT queue_name, sum(depth), "
+                "COALESCE(EXTRACT(EPOCH FROM now() - "
+                "min(oldest_enqueued_at) FILTER (WHERE depth > 0)), 0), "
+                f"COALESCE(sum(depth) FILTER (WHERE state = '{ready}'), 0) "
+                "FROM counters GROUP BY queue_name HAVING sum(depth) > 0"
             )
             depth_rows = cur.fetchall()
             cur.execute(
@@ -972,8 +1122,9 @@ def refresh_queue_gauges(
     metrics.set_queue_snapshot(
         depths={
             queue: (int(depth), float(oldest_age))
-            for queue, depth, oldest_age in depth_rows
+            for queue, depth, oldest_age, _ in depth_rows
         },
+        ready_depths={queue: int(ready_depth) for queue, _, _, ready_depth in depth_rows},
         barriers_live=int(barriers_live),
         barriers_stranded=int(barriers_stranded),
     )
@@ -1044,6 +1195,13 @@ class PgReaper:
         # window (below) defaults to the barrier stuck-timeout so it never races a
         # legitimately long execution.
         self._stuck_recovery_enabled = stuck_recovery_enabled_from_env()
+        # Scheduler load smoothing, resolved at construction so a garbled knob
+        # fails at boot. The fires/second cap becomes a per-tick budget over this
+        # reaper's interval.
+        self._schedule_fire_budget = fire_budget(
+            scheduler_max_fires_per_second_from_env(), self._interval
+        )
+        self._schedule_spread_seconds = scheduler_spread_seconds_from_env()
         self._stuck_recovery_seconds = _positive_duration_from_env(
             "WORKER_PG_STUCK_EXECUTION_RECOVERY_SECONDS",
             self._stuck_timeout_seconds,
@@ -1192,7 +1350,12 @@ class PgReaper:
         # below still re-raises + discards the conn). Dark by default — fires
         # nothing until rows are pg_owned.
         try:
-            dispatch_due_schedules(self._get_sweep_conn())
+            dispatch_due_schedules(
+                self._get_sweep_conn(),
+                max_fires=self._schedule_fire_budget,
+                spread_seconds=self._schedule_spread_seconds,
+                metrics=self._metrics,
+            )
         except Exception:
             self._discard_owned_sweep_conn()
             raise
@@ -1227,6 +1390,9 @@ class PgReaper:
             "pg_batch_dedup",
             lambda conn: sweep_orphan_dedup(conn, self._dedup_retention),
         )
+        barrier_results = self._run_sweep(
+            "pg_barrier_result", sweep_orphan_barrier_results
+        )
         # Orphan orchestration-claim GC + crash-window recovery. Runs
         # here (cadence-gated) rather than every tick: orphan claims are rare and
         # already older than the stuck-timeout, and this does a per-row status API
@@ -1241,12 +1407,22 @@ class PgReaper:
                 metrics=self._metrics,
             ),
         )
-        if results or dedup or claims:
+        # Queue-depth counter reconciliation: the one full GROUP BY over
+        # pg_queue_message, here rather than in the per-minute gauge refresh.
+        corrected = self._run_sweep("pg_queue_stat", reconcile_queue_stats)
+        if corrected:
+            logger.info(
+                "Reaper: reconciled %s pg_queue_stat counter(s) against pg_queue_message",
+                corrected,
+            )
+        if results or dedup or barrier_results or claims:
             logger.info(
                 "Reaper: retention sweep deleted %s pg_task_result + "
-                "%s pg_batch_dedup + %s pg_orchestration_claim row(s)",
+                "%s pg_batch_dedup + %s pg_barrier_result + "
+                "%s pg_orchestration_claim row(s)",
                 results,
                 dedup,
+                barrier_results,
                 claims,
             )
         self._maybe_recover_stuck_executions()
@@ -39,6 +39,13 @@ Two deliberate properties:
   TTL lease rather than ``pg_advisory_lock``). With ``PG_RESULT_SIGNAL_BACKEND=poll``
   (the default) the behaviour is exactly the historical backoff poll.
 
+Large results are compressed or offloaded to file storage on write and restored
+on read (see :mod:`unstract.core.pg_result_payload`, off by default): the row
+keeps only a small envelope, so megabyte-sized executor results don't bloat the
+hot table's WAL/TOAST. An offloaded file is deleted with its payload — by
+:meth:`PgResultBackend.forget` once consumed, else by the reaper's
+``sweep_expired_results`` at ``expires_at``.
+
 Connection discipline mirrors :class:`~queue_backend.pg_queue.client.PgQueueClient`:
 an injected connection is the caller's (tests); otherwise one is created lazily
 from the backend ``DB_*`` env and owned here (rolled back on error, discarded +
@@ -52,7 +59,6 @@ result is still written (and the blocking caller unblocked) rather than dropped
 from __future__ import annotations
 
 import contextlib
-import json
 import logging
 import os
 import time
@@ -63,6 +69,14 @@ import redis
 
 from unstract.core.cache.redis_client import create_redis_client
 from unstract.core.data_models import PgTaskStatus
+from unstract.core.pg_result_payload import (
+    ENVELOPE_KEY,
+    ResultPayloadLimits,
+    ResultStorage,
+    decode_result,
+    delete_offloaded,
+    encode_result,
+)
 from unstract.core.polling import poll_for_row
 
 from .connection import CONN_DEAD_ERRORS as _CONN_DEAD_ERRORS
@@ -105,6 +119,18 @@ def _get_sql() -> str:
     )
 
 
+# The offloaded file an encoded ``result`` points at (NULL for inline results),
+# for the statements that drop a payload and must delete its file with it.
+OFFLOAD_PATH_EXPR: Final = f"result #>> '{{{ENVELOPE_KEY},path}}'"
+
+
+def _offload_path_sql() -> str:
+    return (
+        f"SELECT {OFFLOAD_PATH_EXPR} FROM {qualified('pg_task_result')} "
+        "WHERE task_id = %s"
+    )
+
+
 def _forget_sql() -> str:
     # Null BOTH payload channels but KEEP the row: ``result`` (success payload) and
     # ``error`` (failure text — an extraction error can embed document content too),
@@ -112,10 +138,14 @@ def _forget_sql() -> str:
     # tombstone makes a redelivered ``store_result`` a ``ON CONFLICT DO NOTHING``
     # no-op (can't re-insert the payload); ``status`` still distinguishes the outcome
     # and ``expires_at`` is left untouched so the reaper still deletes the row at
-    # retention.
+    # retention. RETURNING yields the pre-update offload path (UPDATE's own
+    # RETURNING sees the new, nulled row) so forget() can delete the file too.
+    table = qualified("pg_task_result")
     return (
-        f"UPDATE {qualified('pg_task_result')} "
-        "SET result = NULL, error = '' WHERE task_id = %s"
+        f"UPDATE {table} AS r SET result = NULL, error = '' "
+        f"FROM (SELECT task_id, {OFFLOAD_PATH_EXPR} AS offload_path FROM {table} "
+        "WHERE task_id = %s FOR UPDATE) AS old "
+        "WHERE r.task_id = old.task_id RETURNING old.offload_path"
     )
 
 
@@ -166,6 +196,16 @@ _READY_TOKEN_TTL_SECONDS: Final = 300
 _REDIS_CLIENT_RETRY_COOLDOWN_SECONDS: Final = 30.0
 
 
+def result_storage() -> ResultStorage:
+    """File storage for offloaded results — the workflow-execution storage, which
+    the backend reader is configured for as well. Imported lazily: only a result
+    that was actually offloaded needs it.
+    """
+    from unstract.filesystem import FileStorageType, FileSystem
+
+    return FileSystem(FileStorageType.WORKFLOW_EXECUTION).get_file_storage()
+
+
 def _signal_backend() -> str:
     """``redis`` or ``poll`` (default), read per call so a flag flip needs no
     redeploy and producer/consumer roll independently.
@@ -368,17 +408,41 @@ class PgResultBackend:
         polling. Best-effort: a signal failure only slows the waiter (its fallback
         poll still delivers). A redelivery re-signals harmlessly — a stale token
         just expires.
+
+        A large ``result`` is stored compressed or offloaded per
+        :class:`~unstract.core.pg_result_payload.ResultPayloadLimits`; a
+        redelivery that loses the first-write-wins race deletes the file it
+        offloaded, since no row points at it.
         """
+        offloaded: str | None = None
         if result is not None:
-            status, result_json, error_text = STATUS_COMPLETED, json.dumps(result), ""
+            encoded = encode_result(
+                str(task_id), result, ResultPayloadLimits.from_env(), result_storage
+            )
+            status, result_json, error_text = STATUS_COMPLETED, encoded.json_text, ""
+            offloaded = encoded.offload_path
         else:
             status, result_json, error_text = STATUS_FAILED, None, error or ""
-        self._store_with_reconnect(
-            lambda cur: cur.execute(
+        orphaned = False
+
+        def _insert(cur: Any) -> None:
+            nonlocal orphaned
+            cur.execute(
                 _store_sql(),
                 (str(task_id), status, result_json, error_text, retention_seconds),
             )
-        )
+            if offloaded and cur.rowcount == 0:
+                # Lost to an earlier write — unless that write was this call's own
+                # first attempt (committed, then reported as a dead connection)
+                cur.execute(_offload_path_sql(), (str(task_id),))
+                row = cur.fetchone()
+                orphaned = row is None or row[0] != offloaded
+
+        # If the write raises, the file is left alone: an ambiguous commit may
+        # still have stored a row that points at it.
+        self._store_with_reconnect(_insert)
+        if orphaned:
+            delete_offloaded([offloaded], result_storage)
         # Row is committed above → wake any blocking waiter (redis mode only).
         if _signal_backend() == _SIGNAL_REDIS:
             _signal_ready(str(task_id))
@@ -403,6 +467,8 @@ class PgResultBackend:
         Either way a failure here is a genuine error, not a stale reap. If a
         long-lived backend ever gains a one-shot ``get_result`` lookup that can sit
         idle, revisit this.
+
+        A compressed/offloaded ``result`` is restored before it is returned.
         """
         with self._cursor() as cur:
             cur.execute(_get_sql(), (str(task_id),))
@@ -410,6 +476,7 @@ class PgResultBackend:
         if row is None:
             return None
         status, result, error = row
+        result = decode_result(result, result_storage)
         return {"status": status, "result": result, "error": error}
 
     def wait_for_result(
@@ -473,11 +540,19 @@ class PgResultBackend:
         UPDATE privilege, recurring errors) is therefore observable only as a stream
         of this WARNING — alert on the ``"could not clear result"`` string until a
         ``forget_failures`` metric is wired (deferred to the pg_queue metrics work).
+
+        An offloaded result's file is deleted once the row is cleared (also
+        best-effort: a storage failure leaves a logged orphan).
         """
+        offloaded: list[str] = []
+
+        def _clear(cur: Any) -> None:
+            cur.execute(_forget_sql(), (str(task_id),))
+            offloaded[:] = [path for (path,) in cur.fetchall() if path]
+
         try:
-            self._store_with_reconnect(
-                lambda cur: cur.execute(_forget_sql(), (str(task_id),))
-            )
+            self._store_with_reconnect(_clear)
+            delete_offloaded(offloaded, result_storage)
         except Exception:
             logger.warning(
                 "PgResultBackend.forget: could not clear result for task_id=%s "
@@ -146,20 +146,35 @@ class RedisCacheBackend(BaseCacheBackend):
             logger.error(f"Error getting cache key {key}: {e}")
             return None
 
+    @staticmethod
+    def serialize(value: dict[str, Any], ttl: int) -> str:
+        """Wrap a value in the cache metadata envelope read back by get()/mget()."""
+        return json.dumps(
+            {
+                "data": value,
+                "cached_at": datetime.now(UTC).isoformat(),
+                "ttl": ttl,
+            }
+        )
+
+    def register_script(self, script: str) -> Any | None:
+        """Register a Lua script on the underlying Redis connection.
+
+        Returns:
+            Callable script object (``redis.commands.core.Script``), or None
+            when the cache is unavailable.
+        """
+        if not self.available:
+            return None
+        return self.redis_client.redis_client.register_script(script)
+
     def set(self, key: str, value: dict[str, Any], ttl: int) -> bool:
         """Set value in Redis cache with TTL."""
         if not self.available:
             return False
 
         try:
-            # Add metadata to cached data
-            cache_data = {
-                "data": value,
-                "cached_at": datetime.now(UTC).isoformat(),
-                "ttl": ttl,
-            }
-
-            self.redis_client.setex(key, ttl, json.dumps(cache_data))
+            self.redis_client.setex(key, ttl, self.serialize(value, ttl))
             logger.debug(f"Cached key {key} with TTL {ttl}s")
             return True
         except Exception as e:
@@ -328,15 +343,8 @@ class RedisCacheBackend(BaseCacheBackend):
 
             for key, (value, ttl) in data.items():
                 try:
-                    # Add metadata to cached data
-                    cache_data = {
-                        "data": value,
-                        "cached_at": datetime.now(UTC).isoformat(),
-                        "ttl": ttl,
-                    }
-
                     # Use pipeline to batch the setex operations
-                    pipe.setex(key, ttl, json.dumps(cache_data))
+                    pipe.setex(key, ttl, self.serialize(value, ttl))
                     successful_keys += 1
 
                 except Exception as key_error:
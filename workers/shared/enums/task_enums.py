@@ -35,6 +35,9 @@ class TaskName(str, Enum):
 
     # Structure tool task (runs in file_processing worker)
     EXECUTE_STRUCTURE_TOOL = "execute_structure_tool"
+    # Executor continuations resuming a deferred structure-tool file
+    RESUME_DEFERRED_FILE = "resume_deferred_file"
+    RESUME_DEFERRED_FILE_ERROR = "resume_deferred_file_error"
 
     # Executor worker tasks
     EXECUTE_EXTRACTION = "execute_extraction"
@@ -4,6 +4,7 @@ Common exceptions used across worker implementations.
 """
 
 from .execution_exceptions import (
+    ExecutionDeferred,
     ExecutionException,
     NotFoundDestinationConfiguration,
     NotFoundSourceConfiguration,
@@ -14,6 +15,7 @@ __all__ = [
     "NotFoundDestinationConfiguration",
     "NotFoundSourceConfiguration",
     "ExecutionException",
+    "ExecutionDeferred",
     "UnsupportedMimeTypeError",
     "FileProcessingError",
     "EmptyFileError",
@@ -20,3 +20,17 @@ class ExecutionException(Exception):
     def __init__(self, message="Execution failed"):
         self.message = message
         super().__init__(self.message)
+
+
+class ExecutionDeferred(Exception):
+    """Raised when a file's tool execution was handed off to an executor
+    continuation instead of being awaited in-process.
+
+    Not a failure: the continuation task resumes the file (output writes,
+    destination, status) once the executor replies. Callers between the tool
+    and ``FileProcessor.process_file`` must let it propagate.
+    """
+
+    def __init__(self, message="Execution deferred to executor continuation"):
+        self.message = message
+        super().__init__(self.message)
@@ -69,6 +69,20 @@ class StateStore:
         else:
             raise RuntimeError(Exceptions.UNKNOWN_MODE)
 
+    @classmethod
+    def snapshot(cls) -> dict[str, Any]:
+        """Copy of the calling thread's values, to seed a helper thread."""
+        if cls.mode == ConcurrencyMode.THREAD:
+            return dict(vars(cls.thread_local))
+        else:
+            raise RuntimeError(Exceptions.UNKNOWN_MODE)
+
+    @classmethod
+    def restore(cls, values: dict[str, Any]) -> None:
+        """Set ``values`` (from :meth:`snapshot`) on the calling thread."""
+        for key, val in values.items():
+            cls.set(key, val)
+
     @classmethod
     def clear_all(cls) -> None:
         """Clear ALL values from context storage (critical for preventing data leaks).
@@ -5,8 +5,20 @@ functionality for workers.
 """
 
 from .health import HealthChecker, HealthServer
+from .pipeline_metrics import (
+    PipelineStage,
+    StageOutcome,
+    bind_stage_labels,
+    observe_stage,
+    time_stage,
+)
 
 __all__ = [
     "HealthChecker",
     "HealthServer",
+    "PipelineStage",
+    "StageOutcome",
+    "bind_stage_labels",
+    "observe_stage",
+    "time_stage",
 ]
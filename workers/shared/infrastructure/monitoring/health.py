@@ -18,6 +18,7 @@ import psutil
 from ...core.exceptions.api_exceptions import APIRequestError
 from ..config.worker_config import WorkerConfig
 from ..logging import WorkerLogger
+from .pipeline_metrics import METRICS_CONTENT_TYPE, render_pipeline_metrics
 
 logger = WorkerLogger.get_logger(__name__)
 
@@ -421,6 +422,10 @@ class HealthHTTPHandler(BaseHTTPRequestHandler):
                 history = self.health_checker.get_health_history()
                 self._send_json_response({"history": history}, 200)
 
+            elif self.path == "/metrics":
+                # Per-stage pipeline metrics (Prometheus text format)
+                self._send_metrics_response()
+
             else:
                 self._send_json_response({"error": "Not found"}, 404)
 
@@ -438,6 +443,15 @@ class HealthHTTPHandler(BaseHTTPRequestHandler):
         response_data = json.dumps(data, default=str, indent=2)
         self.wfile.write(response_data.encode("utf-8"))
 
+    def _send_metrics_response(self):
+        """Send the Prometheus text exposition of the pipeline metrics."""
+        body = render_pipeline_metrics()
+        self.send_response(200)
+        self.send_header("Content-Type", METRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, format, *args):
         """Override to suppress routine health check request logs."""
         # Only log errors, not routine health check requests
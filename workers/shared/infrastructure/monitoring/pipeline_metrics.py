@@ -0,0 +1,227 @@
+"""Per-stage pipeline latency and throughput metrics.
+
+Answers "where does a file's time go?" for capacity tuning: every stage of a
+file's journey — PG queue wait, source fetch, tool run, executor run, LLM call,
+destination write, callback — is observed into two series sharing the labels
+``stage`` / ``queue`` / ``org`` / ``connector_type``:
+
+- ``worker_pipeline_stage_duration_seconds`` — latency histogram.
+- ``worker_pipeline_stage_total`` — completions by ``outcome`` (throughput is
+  its ``rate()``).
+
+Call sites name only their stage (and a connector type where they know it).
+``queue`` and ``org`` come from the ambient scope bound once at the task entry
+point with :func:`bind_stage_labels`, so deep call sites (the destination
+connector, the LLM call) don't need the routing context threaded through.
+
+Prefork: Celery's health server runs in the parent while tasks run in forked
+children, so in-memory samples would never reach a scrape. When
+``PROMETHEUS_MULTIPROC_DIR`` is set (an empty per-container directory, set
+before the worker starts), ``prometheus_client`` writes each process's samples
+to files there and :meth:`PipelineMetrics.render` aggregates them across all
+children. Only counters and histograms are used, and both sum correctly over
+live and exited children. Without the directory, a scrape sees the serving
+process's own samples (enough for the solo/threads pools and a single PG
+consumer).
+
+The registry is instance-owned, for the same double-import reason as
+:mod:`queue_backend.pg_queue.metrics`. Recording never raises into the
+pipeline: a failed observation is logged at debug and dropped.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Final
+
+logger = logging.getLogger(__name__)
+
+# Prometheus text exposition format (the /metrics Content-Type).
+METRICS_CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+
+# Shared by both series; the PG supervisor filters the multiprocess dir on it.
+METRIC_PREFIX: Final = "worker_pipeline_stage"
+
+# Labels besides ``stage``; bound ambiently or passed per observation.
+STAGE_LABELS: Final = ("queue", "org", "connector_type")
+
+# Seconds; spans sub-second metadata calls through multi-minute tool runs.
+DURATION_BUCKETS: Final = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+)
+
+
+class PipelineStage(str, Enum):
+    """Stages of a file's journey through the workers."""
+
+    QUEUE_WAIT = "queue_wait"
+    SOURCE_FETCH = "source_fetch"
+    TOOL_RUN = "tool_run"
+    EXECUTOR = "executor"
+    LLM_CALL = "llm_call"
+    DESTINATION_WRITE = "destination_write"
+    CALLBACK = "callback"
+
+
+class StageOutcome(str, Enum):
+    SUCCESS = "success"
+    ERROR = "error"
+    DEFERRED = "deferred"
+
+
+_bound_labels: contextvars.ContextVar[dict[str, str] | None] = contextvars.ContextVar(
+    "pipeline_stage_labels", default=None
+)
+
+
+def _clean_labels(labels: dict[str, object]) -> dict[str, str]:
+    unknown = set(labels) - set(STAGE_LABELS)
+    if unknown:
+        raise ValueError(f"Unknown pipeline stage label(s): {sorted(unknown)}")
+    return {name: str(value) for name, value in labels.items() if value}
+
+
+@contextmanager
+def bind_stage_labels(**labels: object) -> Iterator[None]:
+    """Bind ``queue`` / ``org`` / ``connector_type`` for stages observed within.
+
+    Nested scopes merge; empty values leave the outer binding in place, so an
+    inner scope that doesn't know the queue never erases it.
+    """
+    merged = {**(_bound_labels.get() or {}), **_clean_labels(labels)}
+    token = _bound_labels.set(merged)
+    try:
+        yield
+    finally:
+        _bound_labels.reset(token)
+
+
+def multiprocess_dir() -> str | None:
+    """The ``prometheus_client`` multiprocess directory, if configured."""
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+class PipelineMetrics:
+    """Stage histogram + counter on an instance-owned registry."""
+
+    def __init__(self) -> None:
+        from prometheus_client import CollectorRegistry, Counter, Histogram
+
+        self.registry = CollectorRegistry()
+        self.stage_duration = Histogram(
+            f"{METRIC_PREFIX}_duration_seconds",
+            "Wall-clock seconds spent in a pipeline stage",
+            ["stage", *STAGE_LABELS],
+            buckets=DURATION_BUCKETS,
+            registry=self.registry,
+        )
+        self.stage_total = Counter(
+            METRIC_PREFIX,
+            "Pipeline stage completions, by outcome",
+            ["stage", *STAGE_LABELS, "outcome"],
+            registry=self.registry,
+        )
+
+    def observe(
+        self,
+        stage: PipelineStage,
+        seconds: float,
+        *,
+        outcome: StageOutcome = StageOutcome.SUCCESS,
+        **labels: object,
+    ) -> None:
+        values = {**(_bound_labels.get() or {}), **_clean_labels(labels)}
+        label_values = [
+            PipelineStage(stage).value,
+            *(values.get(name, "") for name in STAGE_LABELS),
+        ]
+        self.stage_duration.labels(*label_values).observe(max(seconds, 0.0))
+        self.stage_total.labels(*label_values, StageOutcome(outcome).value).inc()
+
+    def render(self) -> bytes:
+        """Prometheus text for this process, or for every process sharing the
+        multiprocess directory when one is configured.
+        """
+        from prometheus_client import generate_latest
+
+        if multiprocess_dir():
+            from queue_backend.pg_queue.metrics import render_multiprocess
+
+            return render_multiprocess(METRIC_PREFIX)
+        return generate_latest(self.registry)
+
+
+_metrics: PipelineMetrics | None = None
+_metrics_lock = threading.Lock()
+
+
+def get_pipeline_metrics() -> PipelineMetrics:
+    """The process's :class:`PipelineMetrics`, created on first use."""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = PipelineMetrics()
+    return _metrics
+
+
+def observe_stage(
+    stage: PipelineStage,
+    seconds: float,
+    *,
+    outcome: StageOutcome = StageOutcome.SUCCESS,
+    **labels: object,
+) -> None:
+    """Record one stage completion; never raises."""
+    try:
+        get_pipeline_metrics().observe(stage, seconds, outcome=outcome, **labels)
+    except Exception as e:
+        logger.debug(f"Dropped pipeline metric for stage {stage}: {e}")
+
+
+class StageTimer:
+    """Handle yielded by :func:`time_stage`; set ``outcome`` to override the
+    default (success, or error when the block raises).
+    """
+
+    def __init__(self) -> None:
+        self.outcome = StageOutcome.SUCCESS
+
+
+@contextmanager
+def time_stage(stage: PipelineStage, **labels: object) -> Iterator[StageTimer]:
+    """Time the enclosed block as ``stage``; an escaping exception records
+    ``error`` unless the block already set a different outcome.
+    """
+    timer = StageTimer()
+    start = time.monotonic()
+    try:
+        yield timer
+    except BaseException:
+        if timer.outcome == StageOutcome.SUCCESS:
+            timer.outcome = StageOutcome.ERROR
+        raise
+    finally:
+        observe_stage(stage, time.monotonic() - start, outcome=timer.outcome, **labels)
+
+
+def render_pipeline_metrics() -> bytes:
+    return get_pipeline_metrics().render()
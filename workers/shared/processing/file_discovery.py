@@ -4,8 +4,11 @@ This module provides the StreamingFileDiscovery service, moved to shared/process
 to avoid circular imports and provide clean separation of concerns.
 """
 
+import heapq
 import time
-from collections.abc import Collection
+from collections.abc import Callable, Collection, Iterator
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
 from unstract.connectors.filesystems.unstract_file_system import UnstractFileSystem
@@ -264,7 +267,11 @@ class StreamingFileDiscovery:
                     f"for race condition prevention"
                 )
 
-                # Return original matched_files since FilterPipeline already applied all filtering
+                # Drop files another execution claimed after FilterPipeline checked them
+                for file_key in cache_stats.get("cache_active", []):
+                    if matched_files.pop(file_key, None) is not None:
+                        final_count -= 1
+
                 return matched_files, final_count
 
             except Exception as cache_error:
@@ -507,15 +514,19 @@ class StreamingFileDiscovery:
 
 
 class OrderedFileDiscovery:
-    """Ordered file discovery with sorting and chunked filtering.
+    """Ordered file discovery with bounded top-K selection and chunked filtering.
 
     This class handles ORDERED file processing (FIFO/LIFO) by:
-    1. Loading all file metadata into memory (up to MAX_FILES_FOR_SORTING)
-    2. Sorting by modification time (oldest/newest first)
-    3. Filtering in chunks using FilterPipeline to avoid overwhelming backend APIs
-
-    This provides the same memory behavior as backend source.py while maintaining
-    clean architecture separation.
+    1. Streaming the listing (up to MAX_FILES_FOR_SORTING files) through the
+       pattern filter into a bounded heap that keeps only the first K files by
+       modification time (oldest/newest first, path as tie-breaker)
+    2. Filtering those candidates in chunks using FilterPipeline to avoid
+       overwhelming backend APIs
+    3. Selecting the next K files after the last candidate when the filters
+       leave the result short of the limit
+
+    Memory stays O(K) instead of O(listing); K starts at the hard limit times
+    ORDERED_CANDIDATE_FACTOR and grows by that factor on each refill pass.
     """
 
     def __init__(
@@ -559,8 +570,9 @@ class OrderedFileDiscovery:
     ) -> tuple[dict[str, FileHashData], int]:
         """Discover files with ordering (OLDEST_FIRST/NEWEST_FIRST).
 
-        Memory behavior: Load all files → Sort → Filter in chunks
-        This mirrors the backend logic exactly.
+        Memory behavior: Stream listing → Keep top K → Filter in chunks
+        The candidate set matches the backend logic (first MAX_FILES_FOR_SORTING
+        listed files) without holding the whole listing in memory.
 
         Args:
             directories: List of directories to search
@@ -582,6 +594,7 @@ class OrderedFileDiscovery:
             "files_matching_patterns": 0,
             "files_after_filtering": 0,
             "batches_processed": 0,
+            "selection_passes": 0,
             "collection_time": 0.0,
             "filtering_time": 0.0,
         }
@@ -593,41 +606,60 @@ class OrderedFileDiscovery:
         )
 
         try:
-            # Step 1: Collect and sort all files (load into memory)
-            collection_start = time.time()
-            sorted_files = self._collect_and_sort_files(
-                directories, recursive, file_processing_order, metrics
-            )
-            metrics["collection_time"] = time.time() - collection_start
-
-            logger.info(
-                f"[OrderedDiscovery] Collected {len(sorted_files)} files for ordered processing "
-                f"in {metrics['collection_time']:.2f}s"
+            order_key = self._get_order_key(file_processing_order)
+            max_files_for_sorting = FileOperationConstants.MAX_FILES_FOR_SORTING
+            candidate_factor = FileOperationConstants.ORDERED_CANDIDATE_FACTOR
+            capacity = min(
+                max(file_hard_limit * candidate_factor, batch_size),
+                max_files_for_sorting,
             )
+            matched_files: dict[str, FileHashData] = {}
+            after_key: tuple[float, str] | None = None
+
+            while len(matched_files) < file_hard_limit:
+                # Step 1: Select the next K files in order (bounded memory)
+                collection_start = time.time()
+                candidates, exhausted = self._select_ordered_candidates(
+                    directories,
+                    patterns,
+                    recursive,
+                    file_processing_order,
+                    order_key,
+                    capacity,
+                    after_key,
+                    metrics,
+                )
+                pass_time = time.time() - collection_start
+                metrics["collection_time"] += pass_time
+                metrics["selection_passes"] += 1
 
-            if not sorted_files:
-                # Log comprehensive metrics even for empty results
-                elapsed_time = time.time() - start_time
                 logger.info(
-                    f"[OrderedDiscovery] 🎯 Discovery complete in {elapsed_time:.2f}s:\n"
-                    f"  • Directories processed: {metrics['directories_processed']}\n"
-                    f"  • Total files collected: {metrics['total_files_collected']}\n"
-                    f"  • Files matching patterns: 0\n"
-                    f"  • Files after all filters: 0\n"
-                    f"  • Batches processed: 0\n"
-                    f"  • Hard limit: {file_hard_limit}\n"
-                    f"  • Processing order: {file_processing_order}\n"
-                    f"  • Early termination: No"
+                    f"[OrderedDiscovery] Pass {metrics['selection_passes']}: selected "
+                    f"{len(candidates)} candidates (capacity={capacity}) in {pass_time:.2f}s"
                 )
-                return {}, 0
 
-            # Step 2: Process in chunks with FilterPipeline
-            filtering_start = time.time()
-            matched_files, total_processed = self._process_sorted_files_in_chunks(
-                sorted_files, patterns, file_hard_limit, batch_size, metrics
-            )
-            metrics["filtering_time"] = time.time() - filtering_start
-            final_count = total_processed
+                if not candidates:
+                    break
+
+                # Step 2: Process candidates in chunks with FilterPipeline
+                filtering_start = time.time()
+                pass_files, _ = self._process_sorted_files_in_chunks(
+                    candidates,
+                    file_hard_limit - len(matched_files),
+                    batch_size,
+                    metrics,
+                )
+                metrics["filtering_time"] += time.time() - filtering_start
+                matched_files.update(pass_files)
+
+                if exhausted:
+                    break
+                # Filters left us short: continue strictly after the last
+                # candidate with a larger K so refill passes stay few
+                after_key = order_key(candidates[-1])
+                capacity = min(capacity * candidate_factor, max_files_for_sorting)
+
+            final_count = len(matched_files)
 
             # Update final metrics
             elapsed_time = time.time() - start_time
@@ -640,6 +672,7 @@ class OrderedFileDiscovery:
                 f"  • Total files collected: {metrics['total_files_collected']}\n"
                 f"  • Files matching patterns: {metrics['files_matching_patterns']}\n"
                 f"  • Files after all filters: {metrics['files_after_filtering']}\n"
+                f"  • Selection passes: {metrics['selection_passes']}\n"
                 f"  • Batches processed: {metrics['batches_processed']}\n"
                 f"  • Hard limit: {file_hard_limit}\n"
                 f"  • Processing order: {file_processing_order}\n"
@@ -669,7 +702,7 @@ class OrderedFileDiscovery:
                     f"Filtering: {metrics['filtering_time']:.1f}s"
                 )
 
-            return matched_files, total_processed
+            return matched_files, final_count
 
         except Exception as e:
             elapsed_time = time.time() - start_time
@@ -680,97 +713,128 @@ class OrderedFileDiscovery:
             # Return partial results if available
             return {}, 0
 
-    def _collect_and_sort_files(
+    def _get_order_key(
+        self, file_processing_order: str
+    ) -> Callable[[dict[str, Any]], tuple[float, str]]:
+        """Build the ascending sort key for a processing order.
+
+        Newest-first negates the timestamp so both orders select the K smallest
+        keys. The path breaks ties, giving a total order that stays stable
+        across the re-listing of a refill pass.
+
+        Args:
+            file_processing_order: Order to sort files
+
+        Returns:
+            Function mapping file metadata to its sort key
+        """
+        sign = 1 if file_processing_order == "oldest_first" else -1
+
+        def order_key(file_metadata: dict[str, Any]) -> tuple[float, str]:
+            modified = self.source_fs.get_modified_date_utc(file_metadata)
+            return sign * modified.timestamp(), file_metadata["name"]
+
+        return order_key
+
+    def _select_ordered_candidates(
         self,
         directories: list[str],
+        patterns: list[str],
         recursive: bool,
         file_processing_order: str,
+        order_key: Callable[[dict[str, Any]], tuple[float, str]],
+        capacity: int,
+        after_key: tuple[float, str] | None,
         metrics: dict[str, Any],
-    ) -> list[dict[str, Any]]:
-        """Collect files from all directories and sort globally.
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Select the first ``capacity`` pattern-matched files after ``after_key``.
 
-        This matches the backend logic from source.py:282-370 exactly.
+        Streams the listing of all directories (up to MAX_FILES_FOR_SORTING
+        files, matching backend source.py) through the pattern filter into a
+        bounded heap, so memory is O(capacity) rather than O(listing). When the
+        connector already lists in the requested order, stops reading as soon as
+        ``capacity`` files are selected.
 
         Args:
             directories: List of directories to search
+            patterns: File patterns for filtering
             recursive: Whether to search recursively
             file_processing_order: Order to sort files
+            order_key: Sort key from _get_order_key
+            capacity: Maximum candidates to select (K)
+            after_key: Only consider files whose key sorts after this one
             metrics: Metrics dictionary to populate
 
         Returns:
-            List of file metadata dictionaries sorted by modified date
+            Tuple of (candidates in processing order, True if no further
+            matching files exist beyond them)
         """
-        all_files_metadata = []
         max_depth = FileOperationConstants.MAX_RECURSIVE_DEPTH if recursive else 1
         max_files_for_sorting = FileOperationConstants.MAX_FILES_FOR_SORTING
-        total_collected = 0
-
-        # Collect files from all directories (matching backend logic)
-        for directory in directories:
-            logger.debug(f"[OrderedDiscovery] Collecting files from: {directory}")
-            metrics["directories_processed"] += 1
-
-            # Calculate remaining limit for this directory
-            remaining_limit = max_files_for_sorting - total_collected
-            if remaining_limit <= 0:
-                logger.debug(
-                    "[OrderedDiscovery] Reached collection limit, stopping directory processing"
-                )
-                break
+        native_order = self.source_fs.get_native_listing_order() == file_processing_order
+        counts = {"directories": 0, "scanned": 0, "matched": 0, "eligible": 0}
 
-            try:
-                files_metadata = self.source_fs.list_files(
-                    directory=directory,
-                    max_depth=max_depth,
-                    include_dirs=False,
-                    limit=remaining_limit,
-                )
-                all_files_metadata.extend(files_metadata)
-                total_collected += len(files_metadata)
-
-                logger.debug(
-                    f"[OrderedDiscovery] Collected {len(files_metadata)} files from {directory} "
-                    f"(total: {total_collected}/{max_files_for_sorting})"
-                )
-
-                # Check if we've hit the limit
-                if total_collected >= max_files_for_sorting:
-                    logger.warning(
-                        f"[OrderedDiscovery] File collection limit of '{max_files_for_sorting}' reached. "
-                        "Ordering may not reflect all available files."
-                    )
-                    break
-
-            except Exception as e:
-                error_msg = f"Failed to collect files from {directory}"
-                logger.error(f"[OrderedDiscovery] {error_msg}: {e}")
-                continue
-
-        # Update metrics with collection results
-        metrics["total_files_collected"] = total_collected
+        def iter_eligible() -> Iterator[tuple[tuple[float, str], dict[str, Any]]]:
+            for directory in directories:
+                logger.debug(f"[OrderedDiscovery] Collecting files from: {directory}")
+                counts["directories"] += 1
+                try:
+                    for file_metadata in self.source_fs.iter_files(
+                        directory=directory, max_depth=max_depth, include_dirs=False
+                    ):
+                        if counts["scanned"] >= max_files_for_sorting:
+                            logger.warning(
+                                f"[OrderedDiscovery] File collection limit of '{max_files_for_sorting}' reached. "
+                                "Ordering may not reflect all available files."
+                            )
+                            return
+                        counts["scanned"] += 1
+                        file_path = file_metadata.get("name")
+                        if not file_path or not self._should_process_file(
+                            file_path, patterns
+                        ):
+                            continue
+                        counts["matched"] += 1
+                        key = order_key(file_metadata)
+                        if after_key is not None and key <= after_key:
+                            continue
+                        counts["eligible"] += 1
+                        yield key, file_metadata
+                except Exception as e:
+                    error_msg = f"Failed to collect files from {directory}"
+                    logger.error(f"[OrderedDiscovery] {error_msg}: {e}")
+                    continue
 
-        # Apply sorting (matching backend logic)
-        if file_processing_order == "oldest_first":
-            sorted_files = self.source_fs.sort_files_by_modified_date(
-                all_files_metadata, ascending=True
-            )
-            order_desc = "FIFO (oldest first)"
-        else:  # newest_first
-            sorted_files = self.source_fs.sort_files_by_modified_date(
-                all_files_metadata, ascending=False
-            )
-            order_desc = "LIFO (newest first)"
+        if native_order:
+            # Listing is already ordered: take the first K plus one look-ahead
+            # to learn whether anything lies beyond them
+            selected = list(islice(iter_eligible(), capacity + 1))
+            exhausted = len(selected) <= capacity
+            selected = selected[:capacity]
+        else:
+            selected = heapq.nsmallest(capacity, iter_eligible(), key=itemgetter(0))
+            exhausted = counts["eligible"] <= capacity
+
+        # Refill passes re-list the same files, so keep one listing's counts
+        metrics["directories_processed"] = counts["directories"]
+        metrics["total_files_collected"] = max(
+            metrics["total_files_collected"], counts["scanned"]
+        )
+        metrics["files_matching_patterns"] = max(
+            metrics["files_matching_patterns"], counts["matched"]
+        )
 
         logger.info(
-            f"[OrderedDiscovery] Collected {len(all_files_metadata)} files, processing in {order_desc} order"
+            f"[OrderedDiscovery] Scanned {counts['scanned']} files, {counts['eligible']} "
+            f"eligible, kept {len(selected)} in {file_processing_order} order"
+            f"{' (native listing order)' if native_order else ''}"
         )
 
-        return sorted_files
+        return [file_metadata for _, file_metadata in selected], exhausted
 
     def _process_sorted_files_in_chunks(
         self,
         sorted_files: list[dict[str, Any]],
-        patterns: list[str],
         file_hard_limit: int,
         batch_size: int,
         metrics: dict[str, Any],
@@ -778,11 +842,11 @@ class OrderedFileDiscovery:
         """Process sorted files in chunks using FilterPipeline.
 
         This avoids sending 40K files to backend APIs at once by processing
-        in manageable chunks of ~100 files each.
+        in manageable chunks of ~100 files each. Pattern matching already
+        happened during candidate selection.
 
         Args:
-            sorted_files: Pre-sorted list of file metadata
-            patterns: File patterns for filtering
+            sorted_files: Pre-sorted list of pattern-matched file metadata
             file_hard_limit: Maximum files to return
             batch_size: Size of each processing chunk
             metrics: Metrics dictionary to populate
@@ -794,7 +858,6 @@ class OrderedFileDiscovery:
 
         matched_files = {}
         total_processed = 0
-        files_pattern_matched = 0
 
         # Create FilterPipeline for chunked processing
         filter_pipeline = create_standard_pipeline(
@@ -823,38 +886,14 @@ class OrderedFileDiscovery:
                 f"[OrderedDiscovery] Processing chunk {chunk_num}: files {i + 1}-{min(i + batch_size, len(sorted_files))}"
             )
 
-            # Convert metadata to FileHashData for this chunk (with pattern filtering)
+            # Convert metadata to FileHashData for this chunk
             chunk_file_dict = {}
-            chunk_pattern_matched = 0
-
             for file_metadata in chunk_files:
-                file_path = file_metadata.get("name")
-                if not file_path:
-                    continue
-
-                # Create FileHashData from metadata
-                file_hash_data = self._create_file_hash_from_metadata(
+                file_path = file_metadata["name"]
+                chunk_file_dict[file_path] = self._create_file_hash_from_metadata(
                     file_path, file_metadata
                 )
 
-                # Apply pattern matching (same as backend logic)
-                if not self._should_process_file(file_hash_data.file_name, patterns):
-                    logger.debug(
-                        f"[OrderedDiscovery] File failed pattern match: {file_path} (patterns: {patterns})"
-                    )
-                    continue
-
-                chunk_file_dict[file_path] = file_hash_data
-                chunk_pattern_matched += 1
-
-            files_pattern_matched += chunk_pattern_matched
-
-            if not chunk_file_dict:
-                logger.debug(
-                    f"[OrderedDiscovery] Chunk {chunk_num}: No files passed pattern matching"
-                )
-                continue
-
             # Apply FilterPipeline to this chunk (DeduplicationFilter, FileHistoryFilter, ActiveFileFilter)
             filtered_chunk = filter_pipeline.apply_filters(
                 files=chunk_file_dict,
@@ -874,15 +913,12 @@ class OrderedFileDiscovery:
                 chunk_accepted += 1
 
             logger.debug(
-                f"[OrderedDiscovery] Chunk {chunk_num}: {len(chunk_files)} → {chunk_pattern_matched} → {len(filtered_chunk)} → {chunk_accepted} files "
+                f"[OrderedDiscovery] Chunk {chunk_num}: {len(chunk_files)} → {len(filtered_chunk)} → {chunk_accepted} files "
                 f"(total: {total_processed})"
             )
 
-        # Update metrics
-        metrics["files_matching_patterns"] = files_pattern_matched
-
         logger.info(
-            f"[OrderedDiscovery] Ordered processing complete: {len(sorted_files)} → {files_pattern_matched} → {total_processed} files matched"
+            f"[OrderedDiscovery] Ordered processing complete: {len(sorted_files)} → {total_processed} files matched"
         )
 
         # Create cache entries for files that will be processed to prevent race conditions
@@ -901,7 +937,11 @@ class OrderedFileDiscovery:
                 f"for race condition prevention"
             )
 
-            # Return original matched_files since FilterPipeline already applied all filtering
+            # Drop files another execution claimed after FilterPipeline checked them
+            for file_key in cache_stats.get("cache_active", []):
+                if matched_files.pop(file_key, None) is not None:
+                    total_processed -= 1
+
             return matched_files, total_processed
 
         except Exception as cache_error:
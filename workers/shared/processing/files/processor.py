@@ -23,6 +23,7 @@ import ast
 import json
 from typing import Any
 
+from shared.exceptions import ExecutionDeferred
 from shared.models.file_processing import FileProcessingContext
 
 from unstract.core.data_models import ExecutionStatus, FileHashData, WorkerFileData
@@ -433,6 +434,8 @@ class WorkflowExecutionProcessor:
                 is_duplicate_skip=is_duplicate,
             )
 
+        except ExecutionDeferred:
+            raise
         except Exception as execution_error:
             logger.error(
                 f"File processing failed for {context.file_name}: {execution_error}",
@@ -691,6 +694,25 @@ class FileProcessor:
             # Return workflow results - destination processing will handle API caching and manual review routing
             return workflow_result
 
+        except ExecutionDeferred:
+            # Executor continuation resumes this file (outputs, destination,
+            # status); this batch neither counts nor updates it.
+            logger.info(f"File {context.file_name} deferred to executor continuation")
+            log_file_info(
+                workflow_logger,
+                workflow_file_execution_id,
+                f"⏳ '{context.file_name}' handed off to executor - resuming when it completes",
+            )
+            return FileProcessingResult(
+                file_name=context.file_name,
+                file_execution_id=context.workflow_file_execution_id,
+                success=True,
+                error=None,
+                result=None,
+                execution_time=context.get_processing_duration(),
+                is_deferred=True,
+            )
+
         except Exception as e:
             logger.exception(f"File processing failed for {context.file_name}")
 
@@ -4,6 +4,8 @@ This module provides standardized file processing operations, batching,
 validation, and conversion utilities used across worker implementations.
 """
 
+import json
+import os
 import time
 from typing import Any
 
@@ -315,8 +317,6 @@ class FileProcessingUtils:
                 logger.warning(f"Failed to get organization config, falling back: {e}")
 
         # Fall back to environment variable
-        import os
-
         try:
             env_value = int(os.getenv(env_var_name, str(default_value)))
             if env_value >= 1:
@@ -335,6 +335,62 @@ class FileProcessingUtils:
             logger.info(f"Using absolute fallback: {default_value}")
             return 1
 
+    @staticmethod
+    def get_file_concurrency(
+        file_count: int,
+        connector_ids: list[str | None],
+        organization_id: str | None = None,
+        api_client=None,
+    ) -> int:
+        """How many files of one batch may be processed at once.
+
+        The organization's ``MAX_FILE_CONCURRENCY_PER_BATCH`` (env fallback,
+        default 1 = sequential), lowered to the tightest per-connector cap in
+        ``FILE_CONCURRENCY_CONNECTOR_CAPS`` among the batch's connectors and
+        never above the number of files.
+
+        Args:
+            file_count: Number of files in the batch
+            connector_ids: Registry connector ids involved (source/destination),
+                e.g. "google_drive|<uuid>"; ``None`` entries are ignored
+            organization_id: Organization ID for configuration lookup
+            api_client: Internal API client for configuration access
+
+        Returns:
+            Concurrency limit (guaranteed to be >= 1)
+        """
+        if file_count <= 1:
+            return 1
+
+        concurrency = FileProcessingUtils._get_batch_size_via_api(
+            organization_id=organization_id,
+            api_client=api_client,
+            env_var_name="MAX_FILE_CONCURRENCY_PER_BATCH",
+            default_value=1,
+        )
+        if concurrency <= 1:
+            return 1
+
+        # e.g. {"google_drive": 2, "sharepoint": 1} - keyed by connector type,
+        # the registry id before "|"
+        raw_caps = os.getenv("FILE_CONCURRENCY_CONNECTOR_CAPS", "")
+        try:
+            parsed_caps = json.loads(raw_caps) if raw_caps else {}
+            connector_caps = {str(k): int(v) for k, v in parsed_caps.items()}
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring invalid FILE_CONCURRENCY_CONNECTOR_CAPS: {e}")
+            connector_caps = {}
+
+        for connector_id in {cid for cid in connector_ids if cid}:
+            cap = connector_caps.get(connector_id.split("|", 1)[0])
+            if cap is not None and cap < concurrency:
+                logger.info(
+                    f"Connector cap for {connector_id}: file concurrency {concurrency} -> {cap}"
+                )
+                concurrency = cap
+
+        return max(1, min(concurrency, file_count))
+
     @staticmethod
     def create_file_processing_summary(
         total_files: int,
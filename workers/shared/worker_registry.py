@@ -89,6 +89,8 @@ class WorkerRegistry:
             routes=[
                 TaskRoute("process_file_batch", QueueName.FILE_PROCESSING),
                 TaskRoute("process_file_batch_api", QueueName.FILE_PROCESSING_API),
+                TaskRoute("resume_deferred_file", QueueName.FILE_PROCESSING),
+                TaskRoute("resume_deferred_file_error", QueueName.FILE_PROCESSING),
             ],
         ),
         WorkerType.CALLBACK: WorkerTaskRouting(
@@ -26,6 +26,7 @@ from shared.enums import DestinationConfigKey, QueueResultStatus
 from shared.infrastructure.database.utils import WorkerDatabaseUtils
 from shared.infrastructure.logging import WorkerLogger
 from shared.infrastructure.logging.helpers import log_file_error, log_file_info
+from shared.infrastructure.monitoring.pipeline_metrics import PipelineStage, time_stage
 from shared.models.result_models import QueueResult
 from shared.utils.api_result_cache import get_api_cache_manager
 from shared.utils.manual_review_factory import (
@@ -871,7 +872,12 @@ class WorkerDestinationConnector:
 
         # Process through appropriate destination
         try:
-            self._process_destination(exec_ctx, file_ctx, result)
+            with time_stage(
+                PipelineStage.DESTINATION_WRITE,
+                org=exec_ctx.organization_id,
+                connector_type=self.connection_type,
+            ):
+                self._process_destination(exec_ctx, file_ctx, result)
         except Exception as e:
             self._handle_destination_error(exec_ctx, file_ctx, e)
             raise
@@ -5,7 +5,8 @@ race conditions in concurrent workflow executions.
 
 Key Features:
 - Filter files that are already being processed by other executions
-- Create cache entries to prevent race conditions
+- Atomically claim files (Lua SET NX) so two executions never both win a file
+- Track each execution's claims in an index set so cleanup never SCANs
 - Provide detailed statistics for monitoring and debugging
 - Graceful error handling that never fails the entire execution
 """
@@ -28,6 +29,78 @@ DEFAULT_ACTIVE_FILE_CACHE_TTL = 300  # 5 minutes
 # too or that window reopens. Default marker TTL stays 300s; operators opt in to
 # longer.
 MAX_ACTIVE_FILE_CACHE_TTL = 9000  # 2.5 hours maximum
+# Markers claimed per script invocation; bounds how long one EVALSHA blocks Redis.
+ACTIVE_FILE_CLAIM_BATCH_SIZE = 500
+
+# Owner of a marker written via RedisCacheBackend.serialize(): {"data": {...}}.
+_MARKER_OWNER_LUA = """
+local function marker_owner(raw)
+    if not raw then
+        return nil
+    end
+    local ok, decoded = pcall(cjson.decode, raw)
+    if ok and type(decoded) == "table" and type(decoded.data) == "table" then
+        return decoded.data.execution_id
+    end
+    return nil
+end
+"""
+
+# KEYS[1] = per-execution index set, KEYS[2..] = marker keys to claim.
+# ARGV[1] = TTL, ARGV[2] = execution_id, ARGV[3..] = marker payloads.
+# Returns 1-based positions (among the markers) held by another execution.
+_CLAIM_ACTIVE_FILES_LUA = (
+    _MARKER_OWNER_LUA
+    + """
+local index_key = KEYS[1]
+local ttl = tonumber(ARGV[1])
+local execution_id = ARGV[2]
+local held = {}
+for i = 2, #KEYS do
+    local key = KEYS[i]
+    if redis.call("SET", key, ARGV[i + 1], "NX", "EX", ttl) then
+        redis.call("SADD", index_key, key)
+    elseif marker_owner(redis.call("GET", key)) == execution_id then
+        -- Re-claim by the same execution (discovery retry) keeps the marker.
+        redis.call("SADD", index_key, key)
+    else
+        table.insert(held, i - 1)
+    end
+end
+if redis.call("EXISTS", index_key) == 1 then
+    redis.call("EXPIRE", index_key, ttl)
+end
+return held
+"""
+)
+
+# KEYS[1] = per-execution index set, KEYS[2..] = marker keys to release; with
+# no marker keys, every marker recorded in the index is released.
+# ARGV[1] = execution_id. Markers now owned by another execution are kept.
+# Returns the number of markers deleted.
+_RELEASE_ACTIVE_FILES_LUA = (
+    _MARKER_OWNER_LUA
+    + """
+local index_key = KEYS[1]
+local execution_id = ARGV[1]
+local keys = {}
+if #KEYS > 1 then
+    for i = 2, #KEYS do
+        keys[#keys + 1] = KEYS[i]
+    end
+else
+    keys = redis.call("SMEMBERS", index_key)
+end
+local released = 0
+for _, key in ipairs(keys) do
+    if marker_owner(redis.call("GET", key)) == execution_id then
+        released = released + redis.call("DEL", key)
+    end
+    redis.call("SREM", index_key, key)
+end
+return released
+"""
+)
 
 
 def get_active_file_cache_ttl() -> int:
@@ -90,12 +163,17 @@ class ActiveFileManager:
         execution_id: str,
         logger_instance: LoggerProtocol | None = None,
     ) -> dict[str, Any]:
-        """Create cache entries for files to prevent race conditions (cache-only, no filtering).
+        """Claim cache entries for files to prevent race conditions (cache-only, no filtering).
 
-        This method ONLY creates cache entries for race condition prevention. It does NOT
+        This method ONLY claims cache entries for race condition prevention. It does NOT
         filter files or modify the source_files dictionary. Use this after FilterPipeline
         has already applied all necessary filtering including ActiveFileFilter.
 
+        Claims are atomic: a file whose marker is already held by another execution
+        is not claimed and is reported under ``cache_active`` so the caller can drop
+        it — the check-then-set window between ActiveFileFilter and this call is
+        closed here.
+
         Args:
             source_files: Dictionary of all source files (used for file_tracking_data)
             files_to_cache: Dictionary of specific files to create cache entries for
@@ -104,7 +182,8 @@ class ActiveFileManager:
             logger_instance: Optional logger override (uses module logger if None)
 
         Returns:
-            Cache statistics dictionary with creation results
+            Cache statistics dictionary with creation results; ``cache_active`` lists
+            the file keys held by another execution
 
         Example:
             >>> # After FilterPipeline has filtered files
@@ -123,12 +202,14 @@ class ActiveFileManager:
                 "cache_created": 0,
                 "cache_errors": 0,
                 "processing_files": [],
+                "cache_active": [],
             }
 
         cache_stats = {
             "cache_created": 0,
             "cache_errors": 0,
             "processing_files": [],
+            "cache_active": [],
         }
 
         try:
@@ -169,6 +250,7 @@ class ActiveFileManager:
 
             log.info(
                 f"✅ Cache creation complete: {cache_stats['cache_created']} entries created, "
+                f"{len(cache_stats['cache_active'])} held by other executions, "
                 f"{cache_stats['cache_errors']} errors"
             )
 
@@ -256,133 +338,46 @@ class ActiveFileManager:
         return f"file_active:{workflow_id}:{provider_uuid}:{file_path_hash}"
 
     @staticmethod
-    def _handle_cache_check(
-        file_tracking_data: dict[str, dict],
-        workflow_id: str,
-        execution_id: str,
-        log: LoggerProtocol,
-    ) -> dict[str, Any]:
-        """Handle cache checking operations using batch Redis operations for performance."""
-        cache = RedisCacheBackend()
-        active_files_to_skip = set()  # Set of file_keys to skip
-        stats = {
-            "cache_active": [],
-            "processing_files": [],
-            "cache_created": 0,
-            "cache_errors": 0,
-        }
+    def _create_execution_index_key(workflow_id: str, execution_id: str) -> str:
+        """Create the key of the set recording every marker an execution claimed.
 
-        if not file_tracking_data:
-            return {"active_files": active_files_to_skip, "stats": stats}
-
-        try:
-            # BATCH OPTIMIZATION: Pre-compute all cache keys and fetch in single operation
-            cache_key_to_file_key = {}  # cache_key -> file_key mapping
-            file_key_to_tracking = {}  # file_key -> tracking_info mapping
-
-            # Pre-compute all cache keys
-            for file_key, tracking_info in file_tracking_data.items():
-                provider_uuid = tracking_info["provider_uuid"]
-                file_path = tracking_info["file_path"]
-
-                cache_key = ActiveFileManager._create_cache_key(
-                    workflow_id, provider_uuid, file_path
-                )
-                cache_key_to_file_key[cache_key] = file_key
-                file_key_to_tracking[file_key] = tracking_info
-
-            # Single batch Redis call instead of N individual calls
-            cache_keys = list(cache_key_to_file_key.keys())
-            log.debug(f"Batch checking {len(cache_keys)} cache keys for active files")
-
-            cached_results = cache.mget(cache_keys)
-
-            # Process batch results
-            for cache_key, cached_data in cached_results.items():
-                file_key = cache_key_to_file_key[cache_key]
-                tracking_info = file_key_to_tracking[file_key]
-
-                if cached_data and isinstance(cached_data, dict):
-                    # Extract data from cache wrapper
-                    cached_active = cached_data.get("data", {})
-
-                    if isinstance(cached_active, dict):
-                        cached_execution_id = cached_active.get("execution_id")
-                        cached_file_path = cached_active.get("file_path", "unknown")
-                        current_file_path = tracking_info["file_path"]
-
-                        log.debug(
-                            f"File {file_key}: cached_execution_id={cached_execution_id}, current_execution_id={execution_id}"
-                        )
-                        log.debug(
-                            f"  Cache path: {cached_file_path}, Current path: {current_file_path}"
-                        )
-
-                        if cached_execution_id != execution_id:
-                            active_files_to_skip.add(file_key)
-                            stats["cache_active"].append(file_key)
-                            log.debug(
-                                f"File {file_key} already active by execution {cached_execution_id}, will skip"
-                            )
-                        else:
-                            log.debug(
-                                f"File {file_key} cached by same execution {execution_id}, will process"
-                            )
-
-            if active_files_to_skip:
-                log.info(
-                    f"⚡ Found {len(active_files_to_skip)} files already active in cache (batch check)"
-                )
-
-        except Exception as batch_error:
-            log.warning(
-                f"Batch cache check failed, falling back to individual checks: {batch_error}"
-            )
-            # Fallback to individual checks if batch fails
-            return ActiveFileManager._handle_cache_check_fallback(
-                file_tracking_data, workflow_id, execution_id, log
-            )
-
-        return {"active_files": active_files_to_skip, "stats": stats}
+        Cleanup reads this set instead of SCANning the keyspace for markers.
+        """
+        return f"file_active_index:{workflow_id}:{execution_id}"
 
     @staticmethod
-    def _handle_cache_check_fallback(
-        file_tracking_data: dict[str, dict],
+    def _claim_cache_keys(
+        cache: RedisCacheBackend,
         workflow_id: str,
         execution_id: str,
-        log: LoggerProtocol,
-    ) -> dict[str, Any]:
-        """Fallback method using individual Redis operations if batch fails."""
-        cache = RedisCacheBackend()
-        active_files_to_skip = set()
-        stats = {
-            "cache_active": [],
-            "processing_files": [],
-            "cache_created": 0,
-            "cache_errors": 0,
-        }
-
-        # Fallback to individual cache checks
-        for file_key, tracking_info in file_tracking_data.items():
-            provider_uuid = tracking_info["provider_uuid"]
-            file_path = tracking_info["file_path"]
-
-            try:
-                cache_key = ActiveFileManager._create_cache_key(
-                    workflow_id, provider_uuid, file_path
-                )
-                cached_active = cache.get(cache_key)
+        payloads: dict[str, str],
+        ttl: int,
+    ) -> set[str]:
+        """Atomically claim marker keys; return the ones held by another execution.
 
-                if cached_active and isinstance(cached_active, dict):
-                    cached_execution_id = cached_active.get("execution_id")
-                    if cached_execution_id != execution_id:
-                        active_files_to_skip.add(file_key)
-                        stats["cache_active"].append(file_key)
+        Each key is SET NX with the TTL and recorded in the execution's index set
+        inside one Lua script per ``ACTIVE_FILE_CLAIM_BATCH_SIZE`` keys.
 
-            except Exception as key_error:
-                log.debug(f"Individual cache check failed for {file_key}: {key_error}")
+        Raises:
+            Exception: Any Redis/script error, so the caller can fall back.
+        """
+        script = cache.register_script(_CLAIM_ACTIVE_FILES_LUA)
+        if script is None:
+            return set()
 
-        return {"active_files": active_files_to_skip, "stats": stats}
+        index_key = ActiveFileManager._create_execution_index_key(
+            workflow_id, execution_id
+        )
+        items = list(payloads.items())
+        held_keys: set[str] = set()
+        for start in range(0, len(items), ACTIVE_FILE_CLAIM_BATCH_SIZE):
+            chunk = items[start : start + ACTIVE_FILE_CLAIM_BATCH_SIZE]
+            held_positions = script(
+                keys=[index_key, *(cache_key for cache_key, _ in chunk)],
+                args=[ttl, execution_id, *(payload for _, payload in chunk)],
+            )
+            held_keys.update(chunk[int(pos) - 1][0] for pos in held_positions)
+        return held_keys
 
     @staticmethod
     def _create_cache_entries_for_selected_files(
@@ -393,11 +388,11 @@ class ActiveFileManager:
         log: LoggerProtocol,
         filtering_stats: dict[str, Any],
     ) -> None:
-        """Create cache entries only for files that will actually be processed.
+        """Claim cache entries only for files that will actually be processed.
 
-        OPTIMIZED: Uses batch Redis operations for better performance with large file sets.
-        Uses file-path-aware cache keys to differentiate files with the same content
-        but different paths.
+        OPTIMIZED: Claims markers with a batched Lua script (SET NX + index set), so
+        the check and the claim are one atomic step per file. Uses file-path-aware
+        cache keys to differentiate files with the same content but different paths.
         """
         if not final_files_to_process:
             return
@@ -410,9 +405,9 @@ class ActiveFileManager:
         )
 
         try:
-            # BATCH OPTIMIZATION: Prepare all cache entries for batch creation
-            batch_cache_data = {}  # cache_key -> (cache_data, ttl)
-            processing_files = []
+            # BATCH OPTIMIZATION: Prepare all cache entries for batch claiming
+            batch_payloads = {}  # cache_key -> serialized marker
+            cache_key_to_file_key = {}
             cache_errors = 0
 
             for file_key, file_data in final_files_to_process.items():
@@ -444,8 +439,8 @@ class ActiveFileManager:
                         "created_at": time.time(),
                     }
 
-                    batch_cache_data[cache_key] = (cache_data, ttl)
-                    processing_files.append(file_key)
+                    batch_payloads[cache_key] = cache.serialize(cache_data, ttl)
+                    cache_key_to_file_key[cache_key] = file_key
                     log.debug(f"Prepared cache entry for: {file_key} ({provider_uuid})")
 
                 except Exception as prep_error:
@@ -454,22 +449,44 @@ class ActiveFileManager:
                     )
                     cache_errors += 1
 
-            # Single batch Redis operation instead of N individual operations
-            if batch_cache_data:
-                cache_created = cache.mset(batch_cache_data)
+            # Atomic batch claim instead of a separate check and overwrite
+            held_keys = ActiveFileManager._claim_cache_keys(
+                cache=cache,
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                payloads=batch_payloads,
+                ttl=ttl,
+            )
+            processing_files = []
+            cache_active = []
+            for cache_key, file_key in cache_key_to_file_key.items():
+                if cache_key in held_keys:
+                    cache_active.append(file_key)
+                else:
+                    processing_files.append(file_key)
+
+            if not batch_payloads:
+                cache_created = 0
+                log.warning("No valid cache entries prepared for batch creation")
+            elif cache.available:
+                cache_created = len(processing_files)
                 log.info(
-                    f"🔒 Batch created {cache_created}/{len(batch_cache_data)} cache entries "
+                    f"🔒 Batch claimed {cache_created}/{len(batch_payloads)} cache entries "
                     f"for race condition prevention"
                 )
+                if cache_active:
+                    log.info(
+                        f"⚡ {len(cache_active)} files already claimed by another execution"
+                    )
             else:
                 cache_created = 0
-                log.warning("No valid cache entries prepared for batch creation")
 
         except Exception as batch_error:
             log.warning(
                 f"Batch cache creation failed, falling back to individual operations: {batch_error}"
             )
-            # Fallback to individual cache creation
+            # Fallback to individual (non-atomic) cache creation
+            cache_active = []
             cache_created, cache_errors, processing_files = (
                 ActiveFileManager._create_cache_entries_fallback(
                     final_files_to_process=final_files_to_process,
@@ -485,6 +502,7 @@ class ActiveFileManager:
         filtering_stats["cache_created"] = cache_created
         filtering_stats["cache_errors"] = cache_errors
         filtering_stats["processing_files"] = processing_files
+        filtering_stats["cache_active"] = cache_active
 
     @staticmethod
     def _create_cache_entries_fallback(
@@ -607,19 +625,23 @@ class ActiveFileManager:
 
     @staticmethod
     def cleanup_cache_entries(
-        provider_file_uuids: list[str],
         workflow_id: str,
+        execution_id: str,
+        files: list[tuple[str, str]] | None = None,
         log: LoggerProtocol | None = None,
     ) -> int:
-        """Clean up file-path-aware cache entries for completed file processing.
+        """Release cache entries claimed by an execution.
 
-        OPTIMIZED: Uses non-blocking SCAN instead of blocking KEYS for production safety.
-        Uses pattern matching to find all cache entries for the given provider UUIDs
-        since we don't have the file paths available during cleanup.
+        Deletes exactly the execution's own markers — no keyspace SCAN. Markers
+        are addressed directly from ``(provider_file_uuid, file_path)`` pairs, or
+        read from the execution's index set when ``files`` is None. A marker that
+        has since been claimed by another execution is left in place.
 
         Args:
-            provider_file_uuids: List of provider file UUIDs to clean up
             workflow_id: Workflow ID
+            execution_id: Execution that claimed the markers
+            files: ``(provider_file_uuid, file_path)`` pairs to release; None
+                releases every marker the execution claimed
             log: Optional logger instance
 
         Returns:
@@ -627,54 +649,30 @@ class ActiveFileManager:
         """
         logger_instance = log or logger
 
-        if not provider_file_uuids:
+        if files is not None and not files:
             return 0
 
         try:
             cache = RedisCacheBackend()
-            cleaned_count = 0
+            script = cache.register_script(_RELEASE_ACTIVE_FILES_LUA)
+            if script is None:
+                return 0
 
-            for provider_uuid in provider_file_uuids:
-                # Find all file-path-aware cache entries for this provider_uuid
-                pattern = f"file_active:{workflow_id}:{provider_uuid}:*"
-                try:
-                    # Use non-blocking SCAN instead of blocking KEYS
-                    matching_keys = cache.scan_keys(
-                        pattern, count=50
-                    )  # Small batches for safety
-
-                    if matching_keys:
-                        # Delete in batches to avoid large delete operations
-                        batch_size = 100
-                        for i in range(0, len(matching_keys), batch_size):
-                            batch_keys = matching_keys[i : i + batch_size]
-                            try:
-                                # Batch delete for efficiency
-                                deleted_count = cache.redis_client.delete(*batch_keys)
-                                cleaned_count += deleted_count
-                                logger_instance.debug(
-                                    f"Cleaned up {deleted_count} cache entries for {provider_uuid} (batch {i//batch_size + 1})"
-                                )
-                            except Exception as batch_error:
-                                logger_instance.warning(
-                                    f"Failed to delete batch for {provider_uuid}: {batch_error}"
-                                )
-                                # Fallback to individual deletion
-                                for key in batch_keys:
-                                    try:
-                                        if cache.delete(key):
-                                            cleaned_count += 1
-                                    except Exception:
-                                        pass  # Continue with other keys
-
-                except Exception as pattern_error:
-                    logger_instance.warning(
-                        f"Failed to cleanup entries for {provider_uuid}: {pattern_error}"
-                    )
+            index_key = ActiveFileManager._create_execution_index_key(
+                workflow_id, execution_id
+            )
+            marker_keys = [
+                ActiveFileManager._create_cache_key(workflow_id, provider_uuid, file_path)
+                for provider_uuid, file_path in files or []
+            ]
+            cleaned_count = int(
+                script(keys=[index_key, *marker_keys], args=[execution_id])
+            )
 
             if cleaned_count > 0:
                 logger_instance.info(
-                    f"🧹 Cleaned up {cleaned_count} active file cache entries (non-blocking SCAN)"
+                    f"🧹 Cleaned up {cleaned_count} active file cache entries "
+                    f"for execution {execution_id}"
                 )
 
             return cleaned_count
@@ -685,13 +683,15 @@ class ActiveFileManager:
 
 
 def cleanup_active_file_cache(
-    provider_file_uuids: list[str],
     workflow_id: str,
+    execution_id: str,
+    files: list[tuple[str, str]] | None = None,
     logger_instance: LoggerProtocol | None = None,
 ) -> int:
     """Convenience function that delegates to ActiveFileManager.cleanup_cache_entries()."""
     return ActiveFileManager.cleanup_cache_entries(
-        provider_file_uuids=provider_file_uuids,
         workflow_id=workflow_id,
+        execution_id=execution_id,
+        files=files,
         log=logger_instance,
     )
@@ -12,10 +12,16 @@ from typing import Any
 import magic
 from shared.enums.file_types import AllowedFileTypes
 from shared.exceptions.execution_exceptions import (
+    ExecutionDeferred,
     NotFoundDestinationConfiguration,
     NotFoundSourceConfiguration,
 )
 from shared.exceptions.file_exceptions import EmptyFileError, UnsupportedMimeTypeError
+from shared.infrastructure.monitoring.pipeline_metrics import (
+    PipelineStage,
+    StageOutcome,
+    time_stage,
+)
 from shared.models.file_processing import FileProcessingContext
 
 # Import shared dataclasses for type safety and consistency
@@ -203,6 +209,9 @@ class WorkerWorkflowExecutionService:
                 execution_error = (
                     self._last_execution_error or "Workflow execution failed"
                 )
+        except ExecutionDeferred:
+            logger.info(f"Tool execution for {file_name} deferred to continuation")
+            raise
         except Exception as e:
             logger.error(f"Workflow setup failed for {file_name}: {e}", exc_info=True)
             execution_error = str(e)
@@ -784,13 +793,19 @@ class WorkerWorkflowExecutionService:
                 return False
 
             # Step 2: Prepare input file and metadata
-            computed_hash = self._prepare_workflow_input_file(
-                execution_service=execution_service,
-                file_processing_context=file_processing_context,
-                workflow_id=workflow_id,
-                execution_id=execution_id,
-                workflow_file_execution_id=workflow_file_execution_id,
+            source_connection_type = (
+                file_processing_context.file_hash.source_connection_type
             )
+            with time_stage(
+                PipelineStage.SOURCE_FETCH, connector_type=source_connection_type
+            ):
+                computed_hash = self._prepare_workflow_input_file(
+                    execution_service=execution_service,
+                    file_processing_context=file_processing_context,
+                    workflow_id=workflow_id,
+                    execution_id=execution_id,
+                    workflow_file_execution_id=workflow_file_execution_id,
+                )
 
             # Update file_hash object with computed hash if empty
             # This handles the race condition where Worker 2 retrieves the hash from
@@ -848,10 +863,20 @@ class WorkerWorkflowExecutionService:
                     # Continue with normal execution if check fails
 
             # Step 3: Build and execute workflow
-            self._build_and_execute_workflow(execution_service, file_name)
+            with time_stage(
+                PipelineStage.TOOL_RUN, connector_type=source_connection_type
+            ) as stage:
+                try:
+                    self._build_and_execute_workflow(execution_service, file_name)
+                except ExecutionDeferred:
+                    stage.outcome = StageOutcome.DEFERRED
+                    raise
 
             return True
 
+        except ExecutionDeferred:
+            # Tool handed off to an executor continuation — not a failure.
+            raise
         except Exception as e:
             logger.error(
                 f"Tool execution failed for file {file_name}: {str(e)}", exc_info=True
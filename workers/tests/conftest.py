@@ -401,6 +401,20 @@ def _reset_queue_backend_state():
             _pg_barrier._local.conn = None
 
 
+@pytest.fixture(autouse=True)
+def _reset_tool_metadata_cache():
+    """Drop the structure tool's per-execution metadata cache after every test.
+
+    Tests reuse execution and registry IDs with differently-mocked platform
+    helpers; a cached entry would otherwise answer for a later test.
+    """
+    yield
+    with contextlib.suppress(ImportError):
+        from file_processing.structure_tool_task import clear_tool_metadata_cache
+
+        clear_tool_metadata_cache()
+
+
 @pytest.fixture(autouse=True)
 def _restore_current_celery_app():
     """Pin celery's default app as current_app around each test. Worker modules
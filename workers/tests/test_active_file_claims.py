@@ -0,0 +1,128 @@
+"""Atomic active-file claims and index-set cleanup in ``ActiveFileManager``.
+
+The claim is one Lua script (SET NX + SADD to the execution's index set) so
+two executions can no longer both see a file as free and both claim it;
+cleanup deletes exactly the execution's own markers without a keyspace SCAN.
+
+Redis is mocked via ``MagicMock`` — the contract under test is the keys and
+args handed to the scripts and how their results are mapped back to files.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.workflow.execution import active_file_manager as afm
+from shared.workflow.execution.active_file_manager import (
+    ActiveFileManager,
+    cleanup_active_file_cache,
+)
+
+_INDEX_KEY = "file_active_index:wf-1:exec-1"
+
+
+def _files(count: int) -> dict[str, dict[str, str]]:
+    return {
+        f"/in/f{i}.pdf": {"provider_file_uuid": f"uuid-{i}", "file_path": f"/in/f{i}.pdf"}
+        for i in range(count)
+    }
+
+
+def _marker_key(index: int) -> str:
+    return ActiveFileManager._create_cache_key(
+        "wf-1", f"uuid-{index}", f"/in/f{index}.pdf"
+    )
+
+
+@pytest.fixture
+def script():
+    """The registered Lua script; returns no held positions by default."""
+    script = MagicMock(name="script", return_value=[])
+    cache = MagicMock(name="cache", available=True)
+    cache.register_script.return_value = script
+    cache.serialize.side_effect = lambda value, ttl: json.dumps({"data": value})
+    with patch.object(afm, "RedisCacheBackend", return_value=cache):
+        yield script
+
+
+class TestClaim:
+    def test_claims_every_file_in_one_script_call(self, script):
+        stats = ActiveFileManager.create_cache_entries_simple(_files(3), "wf-1", "exec-1")
+
+        script.assert_called_once()
+        keys = script.call_args.kwargs["keys"]
+        args = script.call_args.kwargs["args"]
+        assert keys == [_INDEX_KEY, _marker_key(0), _marker_key(1), _marker_key(2)]
+        assert args[1] == "exec-1"
+        assert json.loads(args[2])["data"]["execution_id"] == "exec-1"
+        assert stats["cache_created"] == 3
+        assert stats["cache_active"] == []
+
+    def test_files_held_elsewhere_are_reported_not_claimed(self, script):
+        # 1-based positions among the marker keys
+        script.return_value = [1, 3]
+
+        stats = ActiveFileManager.create_cache_entries_simple(_files(3), "wf-1", "exec-1")
+
+        assert stats["cache_active"] == ["/in/f0.pdf", "/in/f2.pdf"]
+        assert stats["processing_files"] == ["/in/f1.pdf"]
+        assert stats["cache_created"] == 1
+
+    def test_large_claims_are_split_into_bounded_scripts(self, script):
+        script.side_effect = [[2], [1]]
+        with patch.object(afm, "ACTIVE_FILE_CLAIM_BATCH_SIZE", 2):
+            stats = ActiveFileManager.create_cache_entries_simple(
+                _files(3), "wf-1", "exec-1"
+            )
+
+        assert script.call_count == 2
+        second_keys = script.call_args_list[1].kwargs["keys"]
+        assert second_keys == [_INDEX_KEY, _marker_key(2)]
+        assert stats["cache_active"] == ["/in/f1.pdf", "/in/f2.pdf"]
+
+    def test_script_failure_falls_back_to_individual_sets(self, script):
+        script.side_effect = ConnectionError("NOSCRIPT")
+        with patch.object(
+            ActiveFileManager, "_create_cache_entry", return_value=True
+        ) as create_entry:
+            stats = ActiveFileManager.create_cache_entries_simple(
+                _files(2), "wf-1", "exec-1"
+            )
+
+        assert create_entry.call_count == 2
+        assert stats["cache_created"] == 2
+        assert stats["cache_active"] == []
+
+
+class TestCleanup:
+    def test_releases_exact_keys_without_scan(self, script):
+        script.return_value = 1
+        cache = afm.RedisCacheBackend.return_value
+
+        cleaned = cleanup_active_file_cache(
+            "wf-1", "exec-1", files=[("uuid-0", "/in/f0.pdf")]
+        )
+
+        assert cleaned == 1
+        script.assert_called_once_with(keys=[_INDEX_KEY, _marker_key(0)], args=["exec-1"])
+        cache.scan_keys.assert_not_called()
+
+    def test_release_all_reads_the_index_set(self, script):
+        script.return_value = 4
+
+        cleaned = cleanup_active_file_cache("wf-1", "exec-1")
+
+        assert cleaned == 4
+        script.assert_called_once_with(keys=[_INDEX_KEY], args=["exec-1"])
+
+    def test_empty_file_list_is_a_no_op(self, script):
+        assert cleanup_active_file_cache("wf-1", "exec-1", files=[]) == 0
+        script.assert_not_called()
+
+    def test_unavailable_cache_is_a_no_op(self, script):
+        afm.RedisCacheBackend.return_value.register_script.return_value = None
+
+        assert cleanup_active_file_cache("wf-1", "exec-1") == 0
@@ -0,0 +1,177 @@
+"""Structure-tool files deferred to an executor continuation.
+
+The original batch hands the file off and neither counts nor updates it; the
+continuation resumes it as a one-file batch under its own barrier slot. These
+tests pin:
+  * the PG batch exposes the continuation scope only while its stages run,
+  * a deferred file result is a silent no-op for the original batch,
+  * both continuation tasks resume under the continuation barrier context,
+  * the resumed one-file batch reuses the existing file execution (no pre-create).
+"""
+
+from __future__ import annotations
+
+import types
+from unittest import mock
+
+from shared.infrastructure.context import StateStore
+from unstract.core.data_models import FileBatchResult, FileHashData
+from unstract.core.worker_models import FileProcessingResult
+
+from file_processing import tasks
+from file_processing.structure_tool_task import (
+    CONTINUATION_RESULT_KEY,
+    CONTINUATION_SCOPE_KEY,
+)
+
+_BARRIER = {"execution_id": "exec-1", "batch_index": 1_000_003}
+_CB = {
+    "file_batch_data": {"files": [["a.pdf", {"file_number": 3}]]},
+    "barrier_context": _BARRIER,
+    "file_execution_id": "fe-1",
+    "dispatched_at": 100.0,
+}
+
+
+def _run_barrier_inline(barrier_context, work_fn):
+    return {"barrier_context": barrier_context, "result": work_fn()}
+
+
+def test_pg_batch_exposes_scope_only_during_stages():
+    seen = {}
+
+    def _stages(file_batch_data, celery_task_id, *, is_pg):
+        seen["scope"] = StateStore.get(CONTINUATION_SCOPE_KEY)
+        return {"ok": True}
+
+    task = types.SimpleNamespace(request=types.SimpleNamespace(id="t-1"))
+    with (
+        mock.patch.object(tasks, "_run_batch_stages", side_effect=_stages),
+        mock.patch.object(
+            tasks, "run_batch_with_barrier", side_effect=_run_barrier_inline
+        ),
+    ):
+        tasks._process_file_batch_core(task, {"files": []}, _BARRIER)
+
+    assert seen["scope"] == {
+        "file_batch_data": {"files": []},
+        "barrier_context": _BARRIER,
+    }
+    assert StateStore.get(CONTINUATION_SCOPE_KEY) is None
+
+
+def test_celery_batch_has_no_scope():
+    seen = {}
+
+    def _stages(file_batch_data, celery_task_id, *, is_pg):
+        seen["scope"] = StateStore.get(CONTINUATION_SCOPE_KEY)
+        return {}
+
+    with mock.patch.object(tasks, "_run_batch_stages", side_effect=_stages):
+        tasks._process_file_batch_core(object(), {"files": []}, None)
+
+    assert seen["scope"] is None
+
+
+def test_deferred_result_is_not_counted_or_updated():
+    result = FileBatchResult()
+    api_client = mock.MagicMock()
+    with mock.patch.object(tasks, "_update_file_execution_status") as update_status:
+        tasks._handle_file_processing_result(
+            FileProcessingResult(
+                file_name="a.pdf",
+                file_execution_id="fe-1",
+                success=True,
+                is_deferred=True,
+            ),
+            "a.pdf",
+            0.0,
+            result,
+            [],
+            FileHashData(file_name="a.pdf", file_path="/a.pdf"),
+            api_client,
+            "wf-1",
+            "exec-1",
+            None,
+            "fe-1",
+            "t-1",
+            False,
+            [],
+        )
+
+    update_status.assert_not_called()
+    assert result.successful_files == 0
+    assert result.failed_files == 0
+
+
+def test_resume_parks_executor_result_for_the_structure_tool():
+    seen = {}
+
+    def _stages(file_batch_data, file_execution_id, celery_task_id):
+        seen["stored"] = StateStore.get(CONTINUATION_RESULT_KEY)
+        seen["file_execution_id"] = file_execution_id
+        return {"total_files": 1}
+
+    with (
+        mock.patch.object(tasks, "_run_deferred_file_stages", side_effect=_stages),
+        mock.patch.object(
+            tasks, "run_batch_with_barrier", side_effect=_run_barrier_inline
+        ),
+    ):
+        out = tasks.resume_deferred_file.run({"success": True, "data": {}}, _CB)
+
+    assert out["barrier_context"] == _BARRIER
+    assert seen["file_execution_id"] == "fe-1"
+    assert seen["stored"] == {
+        "file_execution_id": "fe-1",
+        "result": {"success": True, "data": {}},
+        "dispatched_at": 100.0,
+    }
+    assert StateStore.get(CONTINUATION_RESULT_KEY) is None
+
+
+def test_resume_error_uses_the_surfaced_error_text():
+    with mock.patch.object(tasks, "_resume_deferred_file") as resume:
+        tasks.resume_deferred_file_error.run("exec-task-1", {**_CB, "error": "OOM"})
+    executor_result = resume.call_args.args[1]
+    assert executor_result["success"] is False
+    assert executor_result["error"] == "OOM"
+
+
+def test_resume_error_falls_back_to_failed_task_id():
+    with mock.patch.object(tasks, "_resume_deferred_file") as resume:
+        tasks.resume_deferred_file_error.run("exec-task-1", _CB)
+    assert "exec-task-1" in resume.call_args.args[1]["error"]
+
+
+def test_deferred_stages_reuse_existing_file_execution():
+    batch_data = types.SimpleNamespace(
+        files=[["a.pdf", {"file_name": "a.pdf", "file_path": "/a.pdf"}]],
+        file_data=None,
+    )
+    api_client = mock.MagicMock()
+    context = mock.MagicMock()
+    context.metadata = {}
+    context.get_setting.return_value = False
+    context.organization_context.api_client = api_client
+
+    with (
+        mock.patch.object(
+            tasks, "_validate_and_parse_batch_data", return_value=batch_data
+        ),
+        mock.patch.object(tasks, "_setup_execution_context", return_value=context),
+        mock.patch.object(tasks, "_pre_create_file_executions") as pre_create,
+        mock.patch.object(
+            tasks, "_process_individual_files", side_effect=lambda c: c
+        ) as process,
+        mock.patch.object(tasks, "_compile_batch_result", return_value={"ok": 1}),
+    ):
+        out = tasks._run_deferred_file_stages({}, "fe-1", "t-1")
+
+    assert out == {"ok": 1}
+    pre_create.assert_not_called()
+    process.assert_called_once()
+    api_client.get_workflow_file_execution.assert_called_once_with("fe-1")
+    pre_created = context.pre_created_file_executions["a.pdf"]
+    assert pre_created.id == "fe-1"
+    assert pre_created.file_hash.use_file_history is False
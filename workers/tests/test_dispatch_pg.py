@@ -142,9 +142,7 @@ class TestDispatchBackendOverride:
 
         monkeypatch.setattr(dispatch_mod, "_get_pg_client", lambda: _Client())
         with patch("queue_backend.dispatch.current_app") as mock_app:
-            handle = dispatch(
-                "pipeline_header", queue="general", backend=QueueBackend.PG
-            )
+            handle = dispatch("pipeline_header", queue="general", backend=QueueBackend.PG)
         mock_app.send_task.assert_not_called()
         assert handle.id == "11"
         assert captured["payload"]["task_name"] == "pipeline_header"
@@ -238,5 +236,26 @@ class TestDispatchPriorityWiring:
         assert captured["org_id"] is None
 
 
+class TestDispatchCountdown:
+    """``countdown=`` delays Celery dispatches; PG has no delayed delivery."""
+
+    def test_celery_countdown_forwarded(self):
+        with patch("queue_backend.dispatch.current_app") as mock_app:
+            dispatch("some_task", kwargs={"k": 1}, countdown=30)
+        assert mock_app.send_task.call_args.kwargs["countdown"] == 30
+
+    def test_no_countdown_keeps_send_task_call_shape(self):
+        with patch("queue_backend.dispatch.current_app") as mock_app:
+            dispatch("some_task")
+        assert "countdown" not in mock_app.send_task.call_args.kwargs
+
+    def test_pg_countdown_raises_instead_of_running_early(self, monkeypatch):
+        monkeypatch.setenv(ENABLED_TASKS_ENV, "leaf_task")
+        with patch("queue_backend.dispatch._get_pg_client") as mock_get:
+            with pytest.raises(ValueError, match="delayed delivery"):
+                dispatch("leaf_task", countdown=5)
+        mock_get.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
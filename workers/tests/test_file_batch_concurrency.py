@@ -0,0 +1,301 @@
+"""Bounded concurrent file processing within one file batch.
+
+``_process_individual_files`` runs a batch's files on a ``parallel_map`` pool
+when the resolved concurrency is above 1. These tests pin:
+  * the concurrency limit (org config, per-connector caps, file count),
+  * files actually overlap, and each pool thread sees the batch's StateStore
+    values under its own logging context,
+  * results are aggregated in batch order on the calling thread, with each
+    file's own end time,
+  * a file whose run raises is counted as failed without sinking the batch,
+  * skip bookkeeping uses sets.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import types
+from unittest import mock
+
+import pytest
+from shared.infrastructure.context import StateStore
+from shared.infrastructure.logging import WorkerLogger
+from shared.processing.files import FileProcessingUtils
+from unstract.core.data_models import (
+    FileBatchResult,
+    FileHashData,
+    PreCreatedFileData,
+    WorkerFileData,
+)
+from unstract.core.worker_models import FileProcessingResult
+
+from file_processing import tasks
+
+
+def _config_client(value):
+    api_client = mock.MagicMock()
+    api_client.get_configuration.return_value = {
+        "success": True,
+        "data": {"value": value},
+    }
+    return api_client
+
+
+class TestGetFileConcurrency:
+    def test_defaults_to_sequential(self, monkeypatch):
+        monkeypatch.delenv("MAX_FILE_CONCURRENCY_PER_BATCH", raising=False)
+
+        assert FileProcessingUtils.get_file_concurrency(10, []) == 1
+
+    def test_org_config_wins_over_env(self, monkeypatch):
+        monkeypatch.setenv("MAX_FILE_CONCURRENCY_PER_BATCH", "2")
+
+        concurrency = FileProcessingUtils.get_file_concurrency(
+            10, [], organization_id="org-1", api_client=_config_client(4)
+        )
+
+        assert concurrency == 4
+
+    def test_never_exceeds_file_count(self, monkeypatch):
+        monkeypatch.setenv("MAX_FILE_CONCURRENCY_PER_BATCH", "8")
+
+        assert FileProcessingUtils.get_file_concurrency(3, []) == 3
+        assert FileProcessingUtils.get_file_concurrency(1, []) == 1
+
+    def test_tightest_connector_cap_applies(self, monkeypatch):
+        monkeypatch.setenv("MAX_FILE_CONCURRENCY_PER_BATCH", "8")
+        monkeypatch.setenv(
+            "FILE_CONCURRENCY_CONNECTOR_CAPS", '{"google_drive": 3, "sharepoint": 2}'
+        )
+
+        concurrency = FileProcessingUtils.get_file_concurrency(
+            10, ["google_drive|abc", "sharepoint|def", "minio|ghi", None]
+        )
+
+        assert concurrency == 2
+
+    def test_invalid_connector_caps_are_ignored(self, monkeypatch):
+        monkeypatch.setenv("MAX_FILE_CONCURRENCY_PER_BATCH", "4")
+        monkeypatch.setenv("FILE_CONCURRENCY_CONNECTOR_CAPS", '["google_drive"]')
+
+        assert FileProcessingUtils.get_file_concurrency(10, ["google_drive|x"]) == 4
+
+
+def _context(file_names, *, skipped_completed=(), skipped_active=()):
+    pre_created = {
+        name: PreCreatedFileData(
+            id=f"fe-{name}",
+            object=None,
+            file_hash=FileHashData(
+                file_name=name,
+                file_path=f"/in/{name}",
+                provider_file_uuid=f"uuid-{name}",
+                connector_id="minio|1",
+            ),
+        )
+        for name in file_names
+    }
+    file_data = WorkerFileData(
+        workflow_id="wf-1",
+        execution_id="exec-1",
+        single_step=False,
+        organization_id="org-1",
+        pipeline_id="p-1",
+        scheduled=False,
+        execution_mode="QUEUE",
+        use_file_history=False,
+        q_file_no_list=[],
+    )
+    settings = {"use_file_history": False, "celery_task_id": "t-1"}
+    return types.SimpleNamespace(
+        files={
+            name: [name, {"file_path": f"/in/{name}", "file_number": i}]
+            for i, name in enumerate(file_names, 1)
+        },
+        pre_created_file_executions=pre_created,
+        metadata={
+            "file_data": file_data,
+            "workflow_execution": {},
+            "skipped_already_completed": set(skipped_completed),
+            "skipped_active_duplicate": set(skipped_active),
+            "result": FileBatchResult(),
+            "successful_files_for_manual_review": [],
+            "total_files": len(file_names),
+            "workflow_logger": None,
+        },
+        get_setting=lambda key, default=None: settings.get(key, default),
+        organization_context=types.SimpleNamespace(
+            api_client=mock.MagicMock(), organization_id="org-1"
+        ),
+        workflow_id="wf-1",
+        execution_id="exec-1",
+        transport=None,
+    )
+
+
+@pytest.fixture
+def handled():
+    """Records (file_name, result, file_end_time) per handled file."""
+    calls = []
+
+    def _record(file_execution_result, file_name, *args, file_end_time=None):
+        calls.append((file_name, file_execution_result, file_end_time))
+
+    with mock.patch.object(tasks, "_handle_file_processing_result", side_effect=_record):
+        yield calls
+
+
+def _concurrency(value):
+    return mock.patch.object(
+        FileProcessingUtils, "get_file_concurrency", return_value=value
+    )
+
+
+class TestConcurrentBatch:
+    def test_files_overlap_and_aggregate_in_batch_order(self, handled):
+        names = ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+        delays = {"a.pdf": 0.2, "b.pdf": 0.05, "c.pdf": 0.1, "d.pdf": 0.0}
+
+        def _process_file(file_hash, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(delays[file_hash.file_name])
+            with lock:
+                in_flight["now"] -= 1
+            return FileProcessingResult(
+                file_name=file_hash.file_name,
+                file_execution_id=kwargs["workflow_file_execution_id"],
+                success=True,
+            )
+
+        with (
+            _concurrency(4),
+            mock.patch.object(tasks, "_process_file", side_effect=_process_file),
+        ):
+            tasks._process_individual_files(_context(names))
+
+        assert in_flight["peak"] > 1
+        assert [name for name, _, _ in handled] == names
+        assert [result.file_name for _, result, _ in handled] == names
+        assert all(end is not None for _, _, end in handled)
+
+    def test_pool_threads_see_batch_state_and_own_log_context(self, handled):
+        seen = {}
+
+        def _process_file(file_hash, **kwargs):
+            seen[file_hash.file_name] = (
+                StateStore.get("LOG_EVENTS_ID"),
+                WorkerLogger.get_context().correlation_id,
+            )
+            return None
+
+        StateStore.set("LOG_EVENTS_ID", "log-1")
+        try:
+            with (
+                _concurrency(2),
+                mock.patch.object(tasks, "_process_file", side_effect=_process_file),
+            ):
+                tasks._process_individual_files(_context(["a.pdf", "b.pdf"]))
+        finally:
+            StateStore.clear("LOG_EVENTS_ID")
+
+        assert seen == {
+            "a.pdf": ("log-1", "fe-a.pdf"),
+            "b.pdf": ("log-1", "fe-b.pdf"),
+        }
+
+    def test_a_raising_file_is_handled_as_a_null_result(self, handled):
+        def _process_file(file_hash, **kwargs):
+            if file_hash.file_name == "b.pdf":
+                raise RuntimeError("boom")
+            return FileProcessingResult(
+                file_name=file_hash.file_name, file_execution_id="x", success=True
+            )
+
+        with (
+            _concurrency(2),
+            mock.patch.object(tasks, "_process_file", side_effect=_process_file),
+        ):
+            tasks._process_individual_files(_context(["a.pdf", "b.pdf", "c.pdf"]))
+
+        results = {name: result for name, result, _ in handled}
+        assert results["b.pdf"] is None
+        assert results["a.pdf"].success and results["c.pdf"].success
+
+    def test_sequential_mode_handles_each_file_before_the_next(self, handled):
+        order = []
+
+        def _process_file(file_hash, **kwargs):
+            order.append(("run", file_hash.file_name, len(handled)))
+            return None
+
+        with (
+            _concurrency(1),
+            mock.patch.object(tasks, "_process_file", side_effect=_process_file),
+        ):
+            tasks._process_individual_files(_context(["a.pdf", "b.pdf"]))
+
+        assert order == [("run", "a.pdf", 0), ("run", "b.pdf", 1)]
+
+
+class TestSkipBookkeeping:
+    def test_skipped_files_are_looked_up_in_sets(self, handled):
+        context = _context(
+            ["a.pdf"],
+            skipped_completed={"uuid-done:/in/done.pdf"},
+            skipped_active={"uuid-busy:/in/busy.pdf"},
+        )
+        context.files["done.pdf"] = {
+            "file_name": "done.pdf",
+            "file_path": "/in/done.pdf",
+            "provider_file_uuid": "uuid-done",
+        }
+        context.files["busy.pdf"] = {
+            "file_name": "busy.pdf",
+            "file_path": "/in/busy.pdf",
+            "provider_file_uuid": "uuid-busy",
+        }
+
+        with (
+            _concurrency(1),
+            mock.patch.object(tasks, "_process_file", return_value=None),
+        ):
+            tasks._process_individual_files(context)
+
+        # Only the active duplicate is a failure; the completed one is skipped
+        assert [name for name, _, _ in handled] == ["a.pdf"]
+        assert context.metadata["result"].failed_files == 1
+
+    def test_duplicate_skip_records_the_file_once(self):
+        skipped = set()
+        file_hash = FileHashData(
+            file_name="a.pdf", file_path="/in/a.pdf", provider_file_uuid="uuid-a"
+        )
+        duplicate = FileProcessingResult(
+            file_name="a.pdf", file_execution_id="fe-1", success=True
+        )
+        duplicate.is_duplicate_skip = True
+
+        for _ in range(2):
+            tasks._handle_file_processing_result(
+                duplicate,
+                "a.pdf",
+                0.0,
+                FileBatchResult(),
+                [],
+                file_hash,
+                mock.MagicMock(),
+                "wf-1",
+                "exec-1",
+                None,
+                "fe-1",
+                "t-1",
+                False,
+                skipped,
+            )
+
+        assert skipped == {"uuid-a:/in/a.pdf"}
@@ -0,0 +1,161 @@
+"""Streaming log history ingestor drain loop.
+
+Pins that the ingestor:
+  * sends its batch size and consumer name to the backend,
+  * keeps draining back-to-back while the backend reports a backlog,
+  * idles on LLEN (no backend call) once the queue is empty,
+  * backs off and retries after a failed drain,
+  * exports throughput / lag / depth on its own registry.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import httpx
+import pytest
+
+from log_consumer.log_history_ingestor import IngestorMetrics, LogHistoryIngestor
+
+
+def _response(payload: dict, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        json=payload,
+        request=httpx.Request("POST", "http://backend/internal"),
+    )
+
+
+def _drained(processed: int, remaining: int, **extra) -> dict:
+    return {
+        "processed_count": processed,
+        "skipped_count": 0,
+        "total_logs": processed,
+        "redelivered_count": 0,
+        "remaining": remaining,
+        "lag_seconds": 2.5,
+        **extra,
+    }
+
+
+def _ingestor(responses, metrics=None):
+    """Build an ingestor whose backend replays ``responses`` then stops it."""
+    http_client = mock.MagicMock()
+    redis_client = mock.MagicMock()
+    ingestor = LogHistoryIngestor(
+        api_base_url="http://backend/internal/",
+        api_key="secret",
+        queue_name="log_history_queue",
+        redis_client=redis_client,
+        batch_limit=250,
+        consumer="worker-a",
+        idle_sleep=0.0,
+        metrics=metrics,
+        http_client=http_client,
+    )
+    calls = iter(responses)
+
+    def _post(*args, **kwargs):
+        try:
+            item = next(calls)
+        except StopIteration:
+            ingestor.stop()
+            return _response(_drained(0, 0))
+        if isinstance(item, Exception):
+            raise item
+        return _response(item)
+
+    http_client.post.side_effect = _post
+    # Stop as soon as the loop falls back to idling on an empty queue.
+    redis_client.llen.side_effect = lambda _name: ingestor.stop() or 0
+    return ingestor, http_client, redis_client
+
+
+def test_drain_once_posts_batch_limit_and_consumer():
+    ingestor, http_client, _ = _ingestor([_drained(3, 0)])
+
+    assert ingestor.drain_once()["processed_count"] == 3
+    http_client.post.assert_called_once_with(
+        "http://backend/internal/v1/execution-logs/process-log-history/",
+        headers={"Authorization": "Bearer secret"},
+        json={"batch_limit": 250, "consumer": "worker-a"},
+    )
+
+
+def test_backlog_is_drained_back_to_back():
+    ingestor, http_client, redis_client = _ingestor(
+        [_drained(250, 500), _drained(250, 250), _drained(250, 0)]
+    )
+    ingestor.run()
+
+    # Three back-to-back drains, then a single LLEN idle check ends the loop.
+    assert http_client.post.call_count == 3
+    assert redis_client.llen.call_count == 1
+
+
+def test_empty_queue_idles_on_llen_without_backend_calls():
+    ingestor, http_client, redis_client = _ingestor([_drained(0, 0)])
+    seen = []
+
+    def _llen(_name):
+        seen.append(1)
+        if len(seen) == 3:
+            ingestor.stop()
+        return 0
+
+    redis_client.llen.side_effect = _llen
+    ingestor.run()
+
+    # Only the startup redelivery pass reaches the backend.
+    assert http_client.post.call_count == 1
+    assert len(seen) == 3
+
+
+def test_failed_drain_is_retried():
+    ingestor, http_client, _ = _ingestor([httpx.ConnectError("down"), _drained(10, 0)])
+    ingestor.run()
+
+    assert http_client.post.call_count == 2
+
+
+def test_http_error_status_raises():
+    ingestor, http_client, _ = _ingestor([])
+    http_client.post.side_effect = None
+    http_client.post.return_value = _response({"error": "boom"}, status_code=500)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ingestor.drain_once()
+
+
+def test_metrics_record_throughput_lag_and_depth():
+    pytest.importorskip("prometheus_client")
+    metrics = IngestorMetrics()
+    ingestor, _, _ = _ingestor(
+        [_drained(40, 10, skipped_count=2), httpx.ConnectError("down")],
+        metrics=metrics,
+    )
+    ingestor.run()
+
+    def value(name):
+        return metrics.registry.get_sample_value(name)
+
+    assert value("log_history_ingested_logs_total") == 40
+    assert value("log_history_skipped_logs_total") == 2
+    assert value("log_history_drain_errors_total") == 1
+    assert value("log_history_ingest_lag_seconds") == 2.5
+    assert value("log_history_drain_duration_seconds_count") == 2
+
+
+def test_dead_lettered_batch_keeps_the_backlog_draining():
+    pytest.importorskip("prometheus_client")
+    metrics = IngestorMetrics()
+    dead_lettered = {**_drained(0, 100, total_logs=0), "dead_lettered_count": 250}
+    ingestor, http_client, _ = _ingestor(
+        [dead_lettered, _drained(100, 0)], metrics=metrics
+    )
+    ingestor.run()
+
+    assert http_client.post.call_count == 2
+    assert (
+        metrics.registry.get_sample_value("log_history_dead_lettered_logs_total") == 250
+    )
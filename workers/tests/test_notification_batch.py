@@ -0,0 +1,124 @@
+"""``send_batch_notifications`` delivers concurrently and never sleeps.
+
+The engine is replaced with a stub returning canned outcomes; the assertions pin
+how the task buckets them and that retries (and ``delay_between`` spacing) are
+handed back to the queue as countdown-scheduled ``send_webhook_notification``
+dispatches instead of ``time.sleep`` in the worker slot.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from notification.tasks import send_batch_notifications
+
+from unstract.core.notification_utils import WebhookDeliveryResult
+
+
+class _StubEngine:
+    """Fails deliveries whose URL contains a marker, succeeds the rest."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def deliver(self, deliveries):
+        results = []
+        for delivery in deliveries:
+            if "retry" in delivery.url:
+                results.append(
+                    WebhookDeliveryResult(
+                        delivery, False, status_code=503, retryable=True, retry_after=7
+                    )
+                )
+            elif "bad" in delivery.url:
+                results.append(
+                    WebhookDeliveryResult(delivery, False, status_code=400, error="no")
+                )
+            else:
+                results.append(WebhookDeliveryResult(delivery, True, status_code=200))
+        return results
+
+
+def _hook(path: str, **extra) -> dict:
+    return {"url": f"https://hooks.test/{path}", "payload": {"p": path}, **extra}
+
+
+@pytest.fixture
+def scheduled():
+    with (
+        patch("notification.tasks.WebhookDeliveryEngine", _StubEngine),
+        patch("notification.tasks.dispatch") as dispatch,
+        patch("time.sleep", side_effect=AssertionError("batch must not sleep")),
+    ):
+        yield dispatch
+
+
+def test_outcomes_are_bucketed_and_retries_reenqueued(scheduled):
+    result = send_batch_notifications(
+        [_hook("ok"), _hook("retry", max_retries=3), _hook("bad", max_retries=3)]
+    )
+
+    assert [e["index"] for e in result["successful"]] == [0]
+    assert [e["index"] for e in result["retrying"]] == [1]
+    assert [e["index"] for e in result["failed"]] == [2]
+
+    scheduled.assert_called_once()
+    kwargs = scheduled.call_args.kwargs
+    assert kwargs["countdown"] == 7
+    assert scheduled.call_args.args == ("send_webhook_notification",)
+    assert kwargs["kwargs"]["url"] == "https://hooks.test/retry"
+    assert kwargs["kwargs"]["max_retries"] == 2
+
+
+def test_retryable_failure_without_budget_fails(scheduled):
+    result = send_batch_notifications([_hook("retry")])
+
+    assert [e["index"] for e in result["failed"]] == [0]
+    scheduled.assert_not_called()
+
+
+def test_delay_between_schedules_instead_of_sleeping(scheduled):
+    result = send_batch_notifications(
+        [_hook("ok"), _hook("ok2"), _hook("ok3")], delay_between=5
+    )
+
+    assert [e["index"] for e in result["successful"]] == [0]
+    assert [e["countdown"] for e in result["retrying"]] == [5, 10]
+    assert [c.kwargs["countdown"] for c in scheduled.call_args_list] == [5, 10]
+
+
+@pytest.mark.parametrize(
+    ("hooks", "delay_between"),
+    [
+        pytest.param([_hook("retry", max_retries=3)], 0, id="circuit-retry"),
+        pytest.param([_hook("ok"), _hook("ok2")], 5, id="delay-between"),
+    ],
+)
+def test_reenqueued_webhook_keeps_its_auth_headers(scheduled, hooks, delay_between):
+    auth = {
+        "authorization_type": "BEARER",
+        "authorization_key": "s3cret",
+        "custom_headers": {"X-Tenant": "acme"},
+    }
+    send_batch_notifications(
+        [{**hook, **auth} for hook in hooks], delay_between=delay_between
+    )
+
+    scheduled.assert_called_once()
+    headers = scheduled.call_args.kwargs["kwargs"]["headers"]
+    assert headers["Authorization"] == "Bearer s3cret"
+    assert headers["X-Tenant"] == "acme"
+
+
+def test_pg_routed_webhooks_are_not_delayed(scheduled, monkeypatch):
+    # The PG queue cannot delay a message: spacing is dropped and retryable
+    # failures are reported as failed rather than retried immediately.
+    monkeypatch.setenv("WORKER_PG_QUEUE_ENABLED_TASKS", "send_webhook_notification")
+    result = send_batch_notifications(
+        [_hook("ok"), _hook("retry", max_retries=3)], delay_between=5
+    )
+
+    assert [e["index"] for e in result["successful"]] == [0]
+    assert [e["index"] for e in result["failed"]] == [1]
+    scheduled.assert_not_called()
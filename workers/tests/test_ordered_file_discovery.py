@@ -0,0 +1,217 @@
+"""Bounded top-K selection in ``OrderedFileDiscovery``.
+
+The listing is streamed through the pattern filter into a heap of K candidates
+instead of being collected and sorted whole; when the FilterPipeline (history /
+active files) drops candidates, a refill pass selects the next K strictly after
+the last one. The result must equal the old collect → sort → filter → truncate.
+
+The connector and FilterPipeline are faked — the contract under test is which
+files reach the pipeline, in what order, and how many are held at once.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from shared.processing import file_discovery
+from shared.processing.file_discovery import OrderedFileDiscovery
+
+
+class _FakeFs:
+    """Lists ``files`` per directory in the given order; counts what was read."""
+
+    def __init__(self, files: dict[str, list[tuple[str, int]]], native_order=None):
+        self.files = files
+        self.native_order = native_order
+        self.yielded = 0
+
+    def get_fsspec_fs(self):
+        return None
+
+    def get_native_listing_order(self):
+        return self.native_order
+
+    def iter_files(self, directory: str, max_depth: int, include_dirs: bool):
+        for name, mtime in self.files[directory]:
+            self.yielded += 1
+            yield {"name": name, "size": 1, "mtime": mtime}
+
+    def get_modified_date_utc(self, metadata: dict[str, Any]) -> datetime:
+        return datetime.fromtimestamp(metadata["mtime"], tz=UTC)
+
+    def get_file_system_uuid(self, file_path: str, metadata: dict[str, Any]) -> str:
+        return f"uuid-{file_path}"
+
+    def serialize_metadata_value(self, value: Any) -> Any:
+        return value
+
+
+class _FakePipeline:
+    """Drops ``rejected`` paths; records every file it was asked to filter."""
+
+    def __init__(self, rejected: set[str]):
+        self.rejected = rejected
+        self.seen: list[str] = []
+
+    def apply_filters(self, files, **kwargs):
+        self.seen.extend(files)
+        return {path: data for path, data in files.items() if path not in self.rejected}
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = _FakePipeline(rejected=set())
+    with (
+        patch(
+            "shared.processing.filter_pipeline.create_standard_pipeline",
+            return_value=pipeline,
+        ),
+        patch(
+            "shared.workflow.execution.active_file_manager.ActiveFileManager"
+            ".create_cache_entries_simple",
+            return_value={},
+        ),
+    ):
+        yield pipeline
+
+
+def _discover(fs: _FakeFs, limit: int, order: str = "oldest_first", **kwargs):
+    discovery = OrderedFileDiscovery(
+        source_fs=fs,
+        api_client=None,
+        workflow_id="wf-1",
+        execution_id="exec-1",
+        organization_id="org-1",
+    )
+    chunks = []
+    process = discovery._process_sorted_files_in_chunks
+
+    def record(sorted_files, *args):
+        chunks.append([metadata["name"] for metadata in sorted_files])
+        return process(sorted_files, *args)
+
+    with patch.object(discovery, "_process_sorted_files_in_chunks", side_effect=record):
+        matched, count = discovery.discover_files_ordered(
+            directories=list(fs.files),
+            patterns=kwargs.pop("patterns", ["*"]),
+            recursive=True,
+            file_hard_limit=limit,
+            file_processing_order=order,
+            batch_size=kwargs.pop("batch_size", 10),
+        )
+    return list(matched), count, chunks
+
+
+def _listing(count: int, prefix: str = "/in/f") -> list[tuple[str, int]]:
+    # Deliberately not in mtime order
+    return [(f"{prefix}{i:03d}.pdf", (i * 37) % count) for i in range(count)]
+
+
+def _reference(fs: _FakeFs, limit: int, newest: bool = False) -> list[str]:
+    everything = [entry for files in fs.files.values() for entry in files]
+    ordered = sorted(everything, key=lambda e: ((-e[1] if newest else e[1]), e[0]))
+    return [name for name, _ in ordered[:limit]]
+
+
+class TestSelection:
+    def test_oldest_first_matches_full_sort(self, pipeline):
+        fs = _FakeFs({"/a": _listing(100, "/a/f"), "/b": _listing(50, "/b/f")})
+
+        matched, count, _ = _discover(fs, limit=7)
+
+        assert matched == _reference(fs, 7)
+        assert count == 7
+
+    def test_newest_first_matches_full_sort(self, pipeline):
+        fs = _FakeFs({"/a": _listing(100)})
+
+        matched, _, _ = _discover(fs, limit=5, order="newest_first")
+
+        assert matched == _reference(fs, 5, newest=True)
+
+    def test_equal_mtimes_are_ordered_by_path(self, pipeline):
+        fs = _FakeFs({"/a": [("/a/c.pdf", 1), ("/a/a.pdf", 1), ("/a/b.pdf", 1)]})
+
+        matched, _, _ = _discover(fs, limit=3)
+
+        assert matched == ["/a/a.pdf", "/a/b.pdf", "/a/c.pdf"]
+
+    def test_only_k_candidates_reach_the_pipeline(self, pipeline):
+        fs = _FakeFs({"/a": _listing(1000)})
+
+        _, _, chunks = _discover(fs, limit=5, batch_size=4)
+
+        # K = limit × ORDERED_CANDIDATE_FACTOR; the rest never leave the heap
+        assert [len(chunk) for chunk in chunks] == [20]
+        assert len(pipeline.seen) == 8  # two chunks of 4 fill the limit
+
+    def test_patterns_apply_before_selection(self, pipeline):
+        listing = [(f"/a/f{i}.{'pdf' if i % 2 else 'txt'}", i) for i in range(40)]
+        fs = _FakeFs({"/a": listing})
+
+        matched, _, chunks = _discover(fs, limit=3, patterns=["*.pdf"])
+
+        assert matched == ["/a/f1.pdf", "/a/f3.pdf", "/a/f5.pdf"]
+        assert all(name.endswith(".pdf") for name in chunks[0])
+
+    def test_collection_limit_bounds_the_scan(self, pipeline):
+        fs = _FakeFs({"/a": [("/a/new.pdf", 9), ("/a/newer.pdf", 10), ("/a/old.pdf", 1)]})
+
+        with patch.object(
+            file_discovery.FileOperationConstants, "MAX_FILES_FOR_SORTING", 2
+        ):
+            matched, _, _ = _discover(fs, limit=1)
+
+        # Same as the old list-then-sort: only the first two listed are ranked
+        assert matched == ["/a/new.pdf"]
+
+
+class TestRefill:
+    def test_filtered_candidates_are_replaced_by_the_next_k(self, pipeline):
+        fs = _FakeFs({"/a": _listing(200)})
+        oldest = _reference(fs, 200)
+        pipeline.rejected = set(oldest[:30])
+
+        matched, count, chunks = _discover(fs, limit=5)
+
+        assert matched == oldest[30:35]
+        assert count == 5
+        # Second pass starts strictly after the first pass's last candidate
+        assert chunks[0] == oldest[:20]
+        assert chunks[1][0] == oldest[20]
+        assert len(pipeline.seen) == len(set(pipeline.seen))
+
+    def test_stops_when_listing_is_exhausted(self, pipeline):
+        fs = _FakeFs({"/a": _listing(30)})
+        pipeline.rejected = {name for name, _ in fs.files["/a"]}
+
+        matched, count, chunks = _discover(fs, limit=5)
+
+        assert matched == []
+        assert count == 0
+        assert len(pipeline.seen) == 30
+        assert len(chunks) == 2  # 20 candidates, then the remaining 10
+
+
+class TestNativeOrder:
+    def test_stops_reading_after_k_when_listing_is_ordered(self, pipeline):
+        listing = [(f"/a/f{i:03d}.pdf", i) for i in range(1000)]
+        fs = _FakeFs({"/a": listing}, native_order="oldest_first")
+
+        matched, _, _ = _discover(fs, limit=5)
+
+        assert matched == [name for name, _ in listing[:5]]
+        assert fs.yielded == 21  # K plus one look-ahead
+
+    def test_other_order_still_scans_everything(self, pipeline):
+        listing = [(f"/a/f{i:03d}.pdf", i) for i in range(100)]
+        fs = _FakeFs({"/a": listing}, native_order="oldest_first")
+
+        matched, _, _ = _discover(fs, limit=2, order="newest_first")
+
+        assert matched == ["/a/f099.pdf", "/a/f098.pdf"]
+        assert fs.yielded == 100
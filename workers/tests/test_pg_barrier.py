@@ -29,6 +29,7 @@ from queue_backend.pg_barrier import (
     barrier_pg_abort,
     barrier_pg_decr_and_check,
     claim_batch,
+    extend_barrier,
     run_batch_with_barrier,
     try_claim_orchestration,
 )
@@ -429,6 +430,13 @@ class TestDecrementPhaseSplitRetry:
         assert len(reconnects) == 1  # exactly one reconnect, then gave up
         assert sleeps == [pg_barrier._BARRIER_RETRY_BACKOFF_SECONDS]  # one backoff
 
+    def test_returns_remaining_and_child_slot(self, _clean_local):
+        # The decrement returns its counter + result slot, not the aggregated
+        # results — those are read once, by the final decrementer.
+        pg_barrier._local.conn = _FakeConn(fetchone_result=(0, 4))
+        row = pg_barrier._apply_decrement("exec-6", '{"ok": true}', reused=False)
+        assert row == pg_barrier._DecrementRow(remaining=0, child_index=4)
+
     def test_wrapper_fresh_conn_not_retried_end_to_end(
         self, _clean_local, monkeypatch, sleeps
     ):
@@ -695,21 +703,39 @@ def barrier_db():
             conn.close()
             pytest.skip("pg_barrier_state migration not applied (run backend migrate)")
         cur.execute("DELETE FROM pg_barrier_state")
+        cur.execute("DELETE FROM pg_barrier_result")
     pg_barrier._local.conn = conn
     yield conn
     with conn.cursor() as cur:
         cur.execute("DELETE FROM pg_barrier_state")
+        cur.execute("DELETE FROM pg_barrier_result")
     conn.close()
     pg_barrier._local.conn = None
 
 
 def _row(conn, execution_id):
+    """``(remaining, results)`` for a live barrier (results read back from its
+    ``pg_barrier_result`` rows in child order), or ``None`` once it is gone.
+    """
     with conn.cursor() as cur:
         cur.execute(
-            "SELECT remaining, results FROM pg_barrier_state WHERE execution_id = %s",
+            "SELECT remaining FROM pg_barrier_state WHERE execution_id = %s",
             (execution_id,),
         )
-        return cur.fetchone()
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return row[0], _child_results(conn, execution_id)
+
+
+def _child_results(conn, execution_id):
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT result FROM pg_barrier_result WHERE execution_id = %s "
+            "ORDER BY child_index",
+            (execution_id,),
+        )
+        return [r[0] for r in cur.fetchall()]
 
 
 def _org(conn, execution_id):
@@ -829,14 +855,7 @@ class TestPgBarrierEnqueue:
     def test_upsert_overwrites_stale_state(self, barrier_db):
         # A prior run left a row at remaining=1 with results; the new enqueue
         # resets it.
-        with barrier_db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO pg_barrier_state "
-                "(execution_id, organization_id, remaining, results, "
-                " created_at, expires_at, last_progress_at) "
-                "VALUES ('exec-R', '', 1, '[1,2]'::jsonb, now(), "
-                "        now() + interval '1h', now())"
-            )
+        _seed(barrier_db, "exec-R", 1, results="[1, 2]")
         task, _ = _mock_header_task()
         PgBarrier().enqueue(
             [task, _mock_header_task()[0]],
@@ -873,9 +892,9 @@ class TestPgBarrierEnqueue:
         with barrier_db.cursor() as cur:
             cur.execute(
                 "INSERT INTO pg_barrier_state "
-                "(execution_id, organization_id, remaining, results, "
+                "(execution_id, organization_id, remaining, "
                 " created_at, expires_at, last_progress_at) "
-                "VALUES ('exec-REORG', 'old-org', 1, '[]'::jsonb, now(), "
+                "VALUES ('exec-REORG', 'old-org', 1, now(), "
                 "        now() + interval '1h', now())"
             )
         PgBarrier().enqueue(
@@ -904,13 +923,24 @@ class TestPgBarrierEnqueue:
 
 
 def _seed(conn, execution_id, remaining, *, results="[]"):
+    """Seed a live barrier whose earlier children already stored ``results``
+    (a JSON array, one ``pg_barrier_result`` row per element, in order — and,
+    as this release's decrements do, the legacy ``results`` array too).
+    """
     with conn.cursor() as cur:
         cur.execute(
             "INSERT INTO pg_barrier_state "
-            "(execution_id, organization_id, remaining, results, "
+            "(execution_id, organization_id, remaining, completed, results, "
             " created_at, expires_at, last_progress_at) "
-            "VALUES (%s, '', %s, %s::jsonb, now(), now() + interval '1h', now())",
-            (execution_id, remaining, results),
+            "VALUES (%s, '', %s, jsonb_array_length(%s::jsonb), %s::jsonb, now(), "
+            "        now() + interval '1h', now())",
+            (execution_id, remaining, results, results),
+        )
+        cur.execute(
+            "INSERT INTO pg_barrier_result (execution_id, child_index, result) "
+            "SELECT %s, ordinality - 1, value "
+            "FROM jsonb_array_elements(%s::jsonb) WITH ORDINALITY",
+            (execution_id, results),
         )
 
 
@@ -933,9 +963,9 @@ class TestDecrAndCheck:
         with barrier_db.cursor() as cur:
             cur.execute(
                 "INSERT INTO pg_barrier_state "
-                "(execution_id, organization_id, remaining, results, "
+                "(execution_id, organization_id, remaining, "
                 " created_at, expires_at, last_progress_at) "
-                "VALUES ('exec-SL', '', 2, '[]'::jsonb, "
+                "VALUES ('exec-SL', '', 2, "
                 " now() - interval '1 hour', now() + interval '5 hours', "
                 " now() - interval '1 hour')"
             )
@@ -1028,6 +1058,60 @@ class TestDecrAndCheck:
         # Callback got the full aggregated list as its first positional arg.
         assert sig.call_args.kwargs["args"] == [[{"f": "a"}, {"f": "b"}]]
         assert _row(barrier_db, "exec-C") is None  # row deleted after dispatch
+        assert _child_results(barrier_db, "exec-C") == []  # …with its results
+
+    def test_decrement_keeps_the_legacy_results_array_complete(self, barrier_db):
+        # A previous-release worker running the final decrement reads only the
+        # deprecated pg_barrier_state.results array, so this release appends too.
+        _seed(barrier_db, "exec-LA", 2, results='[{"f": "a"}]')
+        barrier_pg_decr_and_check(
+            {"f": "b"}, execution_id="exec-LA", callback_descriptor=_CALLBACK
+        )
+        with barrier_db.cursor() as cur:
+            cur.execute(
+                "SELECT results FROM pg_barrier_state WHERE execution_id = %s",
+                ("exec-LA",),
+            )
+            assert cur.fetchone()[0] == [{"f": "a"}, {"f": "b"}]
+
+    def test_complete_reads_the_legacy_array_when_a_previous_release_appended(
+        self, barrier_db
+    ):
+        # Rolling deploy: an old worker appended its child's result to the
+        # deprecated array only (and didn't bump ``completed``), so the array is
+        # the complete set and the rows are missing that child.
+        _seed(barrier_db, "exec-RD", 1, results='[{"f": "new"}]')
+        with barrier_db.cursor() as cur:
+            cur.execute(
+                "UPDATE pg_barrier_state "
+                'SET results = results || \'[{"f": "old"}]\'::jsonb '
+                "WHERE execution_id = %s",
+                ("exec-RD",),
+            )
+        with patch("celery.current_app.signature") as sig:
+            sig.return_value.apply_async.return_value = MagicMock(id="cb")
+            barrier_pg_decr_and_check(
+                {"f": "last"}, execution_id="exec-RD", callback_descriptor=_CALLBACK
+            )
+        assert sig.call_args.kwargs["args"] == [
+            [{"f": "new"}, {"f": "old"}, {"f": "last"}]
+        ]
+
+    def test_complete_reads_the_rows_when_the_legacy_array_is_behind(self, barrier_db):
+        # The follow-up release stops appending to the array, so there the rows
+        # are the complete set.
+        _seed(barrier_db, "exec-NR", 1, results='[{"f": "a"}, {"f": "b"}]')
+        with barrier_db.cursor() as cur:
+            cur.execute(
+                "UPDATE pg_barrier_state SET results = '[]' WHERE execution_id = %s",
+                ("exec-NR",),
+            )
+        with patch("celery.current_app.signature") as sig:
+            sig.return_value.apply_async.return_value = MagicMock(id="cb")
+            barrier_pg_decr_and_check(
+                {"f": "c"}, execution_id="exec-NR", callback_descriptor=_CALLBACK
+            )
+        assert sig.call_args.kwargs["args"] == [[{"f": "a"}, {"f": "b"}, {"f": "c"}]]
 
     def test_complete_path_passes_fairness_header(self, barrier_db):
         _seed(barrier_db, "exec-FH", 1)
@@ -1053,8 +1137,8 @@ class TestDecrAndCheck:
         assert _row(barrier_db, "exec-CF") is not None  # row survives for TTL reclaim
 
     def test_list_result_appended_as_single_element(self, barrier_db):
-        # jsonb_build_array() must append a list-shaped result as ONE element
-        # (plain `||` would concatenate it). Guards that choice.
+        # A list-shaped result is stored as ONE child row, so it stays one
+        # element of the aggregated list rather than being spliced into it.
         _seed(barrier_db, "exec-L", 2)
         barrier_pg_decr_and_check(
             [1, 2], execution_id="exec-L", callback_descriptor=_CALLBACK
@@ -1118,6 +1202,55 @@ class TestDecrAndCheck:
         assert barrier_pg_decr_and_check.name == "barrier_pg_decr_and_check"
 
 
+class TestExtendBarrier:
+    def test_extend_adds_to_remaining(self, barrier_db):
+        _seed(barrier_db, "exec-X", 2)
+        assert extend_barrier("exec-X") == 3
+        assert _row(barrier_db, "exec-X")[0] == 3
+
+    def test_negative_extend_releases(self, barrier_db):
+        _seed(barrier_db, "exec-XR", 3)
+        assert extend_barrier("exec-XR", -1) == 2
+
+    def test_missing_row_returns_none(self, barrier_db):
+        assert extend_barrier("exec-gone") is None
+
+    def test_extended_barrier_waits_for_continuation(self, barrier_db):
+        # One batch left + one continuation: the batch's decrement must not fire.
+        _seed(barrier_db, "exec-XC", 1)
+        extend_barrier("exec-XC")
+        with patch.object(pg_barrier, "_fire_barrier_callback") as fire:
+            out = _barrier_pg_decrement(
+                {"f": 1}, execution_id="exec-XC", callback_descriptor=_CALLBACK
+            )
+            assert out["status"] == "pending"
+            fire.assert_not_called()
+            out = _barrier_pg_decrement(
+                {"f": 2}, execution_id="exec-XC", callback_descriptor=_CALLBACK
+            )
+        assert out["status"] == "complete"
+        fire.assert_called_once_with(_CALLBACK, [{"f": 1}, {"f": 2}])
+
+    def test_extend_after_a_decrement_keeps_child_order(self, barrier_db):
+        # An extension lands between decrements, so ``remaining`` revisits a value
+        # it already had; the result slots come from the monotonic ``completed``
+        # counter, so no child overwrites another and the callback still gets
+        # every result in completion order.
+        _seed(barrier_db, "exec-XO", 2)
+        with patch.object(pg_barrier, "_fire_barrier_callback") as fire:
+            _barrier_pg_decrement(
+                {"f": 1}, execution_id="exec-XO", callback_descriptor=_CALLBACK
+            )
+            extend_barrier("exec-XO")
+            for n in (2, 3):
+                out = _barrier_pg_decrement(
+                    {"f": n}, execution_id="exec-XO", callback_descriptor=_CALLBACK
+                )
+        assert out["status"] == "complete"
+        fire.assert_called_once_with(_CALLBACK, [{"f": 1}, {"f": 2}, {"f": 3}])
+        assert _child_results(barrier_db, "exec-XO") == []
+
+
 class TestDecrementCoreExtraction:
     """The decrement logic lives in a plain ``_barrier_pg_decrement`` core so the
     9e PR 2c PG-consumed path can call it in-body (a PG-consumed task fires no
@@ -1194,10 +1327,11 @@ class TestDecrementCoreExtraction:
 
 class TestAbort:
     def test_claims_and_deletes(self, barrier_db):
-        _seed(barrier_db, "exec-X", 2)
+        _seed(barrier_db, "exec-X", 2, results='[{"f": 1}]')
         out = barrier_pg_abort(execution_id="exec-X")
         assert out["status"] == "aborted"
         assert _row(barrier_db, "exec-X") is None
+        assert _child_results(barrier_db, "exec-X") == []  # partial results dropped
 
     def test_concurrent_aborts_deduplicate(self, barrier_db):
         _seed(barrier_db, "exec-Y", 2)
@@ -1253,6 +1387,9 @@ class TestDecrementAtomicityThroughTask:
             assert all(not t.is_alive() for t in threads)
             assert sorted(statuses.values()) == ["complete", "pending"]
             assert sig.return_value.apply_async.call_count == 1  # single fire
+            # …with both children's results, whichever finished last.
+            (fired,) = sig.call_args.kwargs["args"]
+            assert sorted(r["t"] for r in fired) == ["a", "b"]
         for c in conns:
             c.close()
 
@@ -1264,9 +1401,9 @@ class TestDbConstraint:
             with pytest.raises(psycopg2.errors.CheckViolation):
                 cur.execute(
                     "INSERT INTO pg_barrier_state "
-                    "(execution_id, organization_id, remaining, results, "
+                    "(execution_id, organization_id, remaining, "
                     " created_at, expires_at, last_progress_at) "
-                    "VALUES ('bad', '', 1, '[]'::jsonb, now(), now(), now())"  # expires==created
+                    "VALUES ('bad', '', 1, now(), now(), now())"  # expires==created
                 )
 
 
@@ -36,6 +36,7 @@ from queue_backend.pg_queue.reaper import (
     refresh_queue_gauges,
     sweep_orphan_claims,
 )
+from queue_backend.pg_queue.schema import qualified
 
 from .test_pg_reaper import _FakeLease
 
@@ -172,10 +173,18 @@ class TestReaperMetrics:
         metrics = _reaper_metrics()
         metrics.set_queue_snapshot(
             depths={"q1": (5, 120.0), "q2": (1, 3.0)},
+            ready_depths={"q1": 4},
             barriers_live=2,
             barriers_stranded=1,
         )
         assert _sample(metrics, "pg_queue_depth", {"queue": "q1"}) == pytest.approx(5.0)
+        assert _sample(
+            metrics, "pg_queue_ready_depth", {"queue": "q1"}
+        ) == pytest.approx(4.0)
+        # A queue with only in-flight rows exports ready depth 0, not absent.
+        assert _sample(
+            metrics, "pg_queue_ready_depth", {"queue": "q2"}
+        ) == pytest.approx(0.0)
         assert _sample(
             metrics, "pg_queue_oldest_message_age_seconds", {"queue": "q1"}
         ) == pytest.approx(120.0)
@@ -187,6 +196,7 @@ class TestReaperMetrics:
             depths={"q2": (0, 0.0)}, barriers_live=0, barriers_stranded=0
         )
         assert _sample(metrics, "pg_queue_depth", {"queue": "q1"}) is None
+        assert _sample(metrics, "pg_queue_ready_depth", {"queue": "q1"}) is None
         assert _sample(metrics, "pg_queue_depth", {"queue": "q2"}) == pytest.approx(0.0)
 
     def test_clear_drops_series_and_zeroes_barriers(self):
@@ -302,7 +312,7 @@ class TestRefreshQueueGauges:
         metrics = _reaper_metrics()
         conn = _FakeConn(
             [
-                [("file_processing", 7, 33.0), ("celery", 0, 0.0)],  # depth rows
+                [("file_processing", 7, 33.0, 5), ("celery", 1, 0.0, 0)],  # depth rows
                 (4, 2),  # barriers live, stranded
             ]
         )
@@ -311,21 +321,33 @@ class TestRefreshQueueGauges:
         assert _sample(
             metrics, "pg_queue_depth", {"queue": "file_processing"}
         ) == pytest.approx(7.0)
+        assert _sample(
+            metrics, "pg_queue_ready_depth", {"queue": "file_processing"}
+        ) == pytest.approx(5.0)
+        assert _sample(
+            metrics, "pg_queue_oldest_message_age_seconds", {"queue": "file_processing"}
+        ) == pytest.approx(33.0)
         assert _sample(metrics, "pg_barrier_live") == pytest.approx(4.0)
         assert _sample(metrics, "pg_barrier_stranded") == pytest.approx(2.0)
 
     def test_sql_contract(self):
         # Pin the queries: wrong table, dropped GROUP BY, a missing stranded
         # predicate or unbound stuck-timeout would silently diverge the metric
-        # from what the reaper actually recovers.
+        # from what the reaper actually recovers. Depth comes from the counter
+        # table — never an aggregate over the backlog itself.
         metrics = _reaper_metrics()
         conn = _FakeConn([[], (0, 0)])
         refresh_queue_gauges(conn, metrics, stuck_timeout_seconds=9000)
         (depth_sql, depth_params), (barrier_sql, barrier_params) = (
             conn.cursor_obj.executed
         )
-        assert "pg_queue_message" in depth_sql
+        assert qualified("pg_queue_stat") in depth_sql
+        assert "pg_queue_message" not in depth_sql
         assert "GROUP BY queue_name" in depth_sql
+        # Shards are summed per counter before clamping: one shard may be
+        # negative while the counter is not.
+        assert "GROUP BY queue_name, org_id, state" in depth_sql
+        assert "GREATEST(sum(depth), 0)" in depth_sql
         assert depth_params is None
         assert "pg_barrier_state" in barrier_sql
         assert "remaining > 0" in barrier_sql
@@ -26,7 +26,7 @@ from queue_backend.fairness import DEFAULT_PRIORITY, MAX_PRIORITY, MIN_PRIORITY
 from queue_backend.pg_queue import PgQueueClient, QueueMessage
 from queue_backend.pg_queue.client import _SEND_RETRY_BACKOFF_SECONDS
 from queue_backend.pg_queue.connection import create_pg_connection
-from queue_backend.pg_queue.reaper import rearm_expired_claims
+from queue_backend.pg_queue.reaper import rearm_expired_claims, reconcile_queue_stats
 from queue_backend.pg_queue.schema import qualified
 
 # --- Unit: SQL shape against a mocked connection ---
@@ -97,7 +97,7 @@ class TestPgQueueClientUnit:
             client.send("q1", {"a": 1}, priority=bad)
 
     def test_read_runs_skip_locked_dequeue(self):
-        conn, cur = _mock_conn(fetchall=[(7, {"k": "v"}, 1)])
+        conn, cur = _mock_conn(fetchall=[(7, {"k": "v"}, 1, 2.5)])
         msgs = PgQueueClient(conn=conn).read("q1", vt_seconds=15, qty=3)
         sql, params = cur.execute.call_args.args
         assert "FOR UPDATE SKIP LOCKED" in sql
@@ -106,6 +106,7 @@ class TestPgQueueClientUnit:
         # Param order follows the %s positions: queue_name, qty, vt_seconds.
         assert params == ("q1", 3, 15)
         assert msgs == [QueueMessage(msg_id=7, message={"k": "v"}, read_ct=1)]
+        assert msgs[0].queue_wait_seconds == 2.5  # enqueue→claim, DB clock
         conn.commit.assert_called_once()
 
     def test_delete_returns_true_when_row_removed(self):
@@ -120,6 +121,29 @@ class TestPgQueueClientUnit:
         conn, _ = _mock_conn(rowcount=0)
         assert PgQueueClient(conn=conn).delete(999) is False
 
+    def test_writers_count_their_rows_in_the_same_statement(self):
+        # Every send / claim / ack carries its pg_queue_stat upsert as a CTE of
+        # the one statement, so the counter commits with the rows it counts.
+        stat = f"INSERT INTO {qualified('pg_queue_stat')}"
+        conn, cur = _mock_conn(fetchone=(1,), fetchall=[], rowcount=1)
+        client = PgQueueClient(conn=conn)
+        client.send("q1", {"a": 1})
+        client.read("q1")
+        client.delete(1)
+        send_sql, read_sql, delete_sql = (c.args[0] for c in cur.execute.call_args_list)
+        for sql in (send_sql, read_sql, delete_sql):
+            assert stat in sql
+            # …on the writer's own shard, not one hot row per counter.
+            assert "pg_backend_pid() % 16" in sql
+            assert "ON CONFLICT (queue_name, org_id, state, shard)" in sql
+            assert "ORDER BY queue_name, org_id, state" in sql  # fixed lock order
+        assert send_sql.rstrip().endswith("SELECT msg_id FROM enqueued")
+        # The claim moves its rows from ready to claimed: -1 and +1.
+        assert "'ready'::text AS state, -1 AS delta" in read_sql
+        assert "'claimed'::text, 1" in read_sql
+        assert "-1 AS delta" in delete_sql
+        assert conn.commit.call_count == 3
+
     def test_set_vt_reparks_message(self):
         conn, cur = _mock_conn(rowcount=1)
         assert PgQueueClient(conn=conn).set_vt(42, 300) is True
@@ -510,6 +534,7 @@ def queue_name(pg_conn):
     pg_conn.rollback()
     with pg_conn.cursor() as cur:
         cur.execute("DELETE FROM pg_queue_message WHERE queue_name = %s", (name,))
+        cur.execute("DELETE FROM pg_queue_stat WHERE queue_name = %s", (name,))
     pg_conn.commit()
 
 
@@ -742,6 +767,76 @@ class TestPgQueueClientIntegration:
             expected = "claimed" if mid in claimed_ids else "ready"
             assert state_by_id[mid] == expected
 
+    def _stats(self, pg_conn, queue_name):
+        with pg_conn.cursor() as cur:
+            cur.execute(
+                "SELECT org_id, state, sum(depth), "
+                "bool_or(oldest_enqueued_at IS NOT NULL) "
+                f"FROM {qualified('pg_queue_stat')} WHERE queue_name = %s "
+                "GROUP BY org_id, state",
+                (queue_name,),
+            )
+            rows = cur.fetchall()
+        pg_conn.commit()
+        return {
+            (org, state): (depth, has_oldest) for org, state, depth, has_oldest in rows
+        }
+
+    def test_depth_counters_track_send_claim_ack_and_rearm(self, pg_conn, queue_name):
+        client = PgQueueClient(conn=pg_conn)
+        client.send(queue_name, {"n": 1}, org_id="org-a")
+        client.send(queue_name, {"n": 2}, org_id="org-a")
+        client.send(queue_name, {"n": 3}, org_id="org-b")
+        assert self._stats(pg_conn, queue_name) == {
+            ("org-a", "ready"): (2, True),
+            ("org-b", "ready"): (1, True),
+        }
+
+        claimed = client.read(queue_name, vt_seconds=1, qty=2)
+        assert len(claimed) == 2
+        stats = self._stats(pg_conn, queue_name)
+        assert sum(d for (_, state), (d, _) in stats.items() if state == "ready") == 1
+        assert sum(d for (_, state), (d, _) in stats.items() if state == "claimed") == 2
+
+        client.delete(claimed[0].msg_id)
+        time.sleep(1.3)  # the other claim's lease lapses
+        assert rearm_expired_claims(pg_conn) == 1
+        stats = self._stats(pg_conn, queue_name)
+        assert sum(d for (_, state), (d, _) in stats.items() if state == "ready") == 2
+        # Drained counters read zero with no oldest timestamp, not a stale one.
+        assert all(
+            has_oldest is False
+            for (_, state), (depth, has_oldest) in stats.items()
+            if state == "claimed" and depth == 0
+        )
+        # Depths were already exact; reconciliation leaves them be.
+        reconcile_queue_stats(pg_conn)
+        assert self._stats(pg_conn, queue_name) == stats
+
+    def test_reconcile_repairs_drifted_counters(self, pg_conn, queue_name):
+        client = PgQueueClient(conn=pg_conn)
+        client.send(queue_name, {"n": 1}, org_id="org-a")
+        stat = qualified("pg_queue_stat")
+        with pg_conn.cursor() as cur:
+            # A row enqueued before the table existed, and a counter gone stray.
+            cur.execute(
+                f"UPDATE {stat} SET depth = 7, oldest_enqueued_at = now() - "
+                "interval '1 day' WHERE queue_name = %s",
+                (queue_name,),
+            )
+            cur.execute(
+                f"INSERT INTO {stat} "
+                "(queue_name, org_id, state, shard, depth, updated_at) "
+                "VALUES (%s, 'org-gone', 'claimed', 3, -3, now())",
+                (queue_name,),
+            )
+        pg_conn.commit()
+        assert reconcile_queue_stats(pg_conn) >= 2
+        assert self._stats(pg_conn, queue_name) == {
+            ("org-a", "ready"): (1, True),
+            ("org-gone", "claimed"): (0, False),  # zeroed, kept for ON CONFLICT
+        }
+
     def test_no_double_delivery_across_readers(self, pg_conn, queue_name):
         """Two readers never claim the same message (SKIP LOCKED + vt)."""
         client_a = PgQueueClient(conn=pg_conn)
@@ -31,9 +31,13 @@ from queue_backend.pg_queue.reaper import (
     dedup_retention_from_env,
     reaper_interval_from_env,
     reaper_sweep_interval_from_env,
+    scheduler_max_fires_per_second_from_env,
+    scheduler_spread_seconds_from_env,
     rearm_expired_claims,
+    reconcile_queue_stats,
     recover_expired_barriers,
     sweep_expired_results,
+    sweep_orphan_barrier_results,
     sweep_orphan_claims,
     sweep_orphan_dedup,
 )
@@ -72,11 +76,21 @@ def stub_queue_rearm(monkeypatch):
 def stub_retention_sweep(monkeypatch):
     results = MagicMock(return_value=0)
     dedup = MagicMock(return_value=0)
+    barrier_results = MagicMock(return_value=0)
     claims = MagicMock(return_value=0)
+    stats = MagicMock(return_value=0)
     monkeypatch.setattr(reaper_mod, "sweep_expired_results", results)
     monkeypatch.setattr(reaper_mod, "sweep_orphan_dedup", dedup)
+    monkeypatch.setattr(reaper_mod, "sweep_orphan_barrier_results", barrier_results)
     monkeypatch.setattr(reaper_mod, "sweep_orphan_claims", claims)
-    return SimpleNamespace(results=results, dedup=dedup, claims=claims)
+    monkeypatch.setattr(reaper_mod, "reconcile_queue_stats", stats)
+    return SimpleNamespace(
+        results=results,
+        dedup=dedup,
+        barrier_results=barrier_results,
+        claims=claims,
+        stats=stats,
+    )
 
 
 # --- Layer 1: env + construction (no DB) ---
@@ -131,6 +145,29 @@ class TestSweepEnv:
             dedup_retention_from_env()
 
 
+class TestSchedulerEnv:
+    def test_unset_or_blank_means_no_smoothing(self, monkeypatch):
+        monkeypatch.delenv("WORKER_PG_SCHEDULER_MAX_FIRES_PER_SECOND", raising=False)
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_SPREAD_SECONDS", "")
+        assert scheduler_max_fires_per_second_from_env() is None
+        assert scheduler_spread_seconds_from_env() == 0.0
+
+    def test_override(self, monkeypatch):
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_MAX_FIRES_PER_SECOND", "2.5")
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_SPREAD_SECONDS", "300")
+        assert scheduler_max_fires_per_second_from_env() == pytest.approx(2.5)
+        assert scheduler_spread_seconds_from_env() == pytest.approx(300.0)
+
+    @pytest.mark.parametrize("bad", ["0", "-1", "fast"])
+    def test_invalid_raises(self, monkeypatch, bad):
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_MAX_FIRES_PER_SECOND", bad)
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_SPREAD_SECONDS", bad)
+        with pytest.raises(ValueError):
+            scheduler_max_fires_per_second_from_env()
+        with pytest.raises(ValueError):
+            scheduler_spread_seconds_from_env()
+
+
 class _FakeLease:
     """Duck-typed LeaderLease. ``acquires``/``renews`` accept a bool (constant)
     or a list (one outcome popped per call, then ``False``).
@@ -306,6 +343,25 @@ class TestSchedulerTick:
             reaper.tick()
         stub_scheduler_tick.assert_called_once()
 
+    def test_scheduler_gets_budget_spread_and_metrics(
+        self, stub_scheduler_tick, monkeypatch
+    ):
+        # 4 fires/s over a 0.5s interval → a budget of 2 schedules per tick.
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_MAX_FIRES_PER_SECOND", "4")
+        monkeypatch.setenv("WORKER_PG_SCHEDULER_SPREAD_SECONDS", "120")
+        reaper = PgReaper(
+            _FakeLease(acquires=True, renews=True, lease_seconds=60),
+            interval_seconds=0.5,
+            sweep_conn=object(),
+            api_client=object(),
+        )
+        with patch.object(reaper_mod, "recover_expired_barriers", return_value=[]):
+            reaper.tick()
+        kwargs = stub_scheduler_tick.call_args.kwargs
+        assert kwargs["max_fires"] == 2
+        assert kwargs["spread_seconds"] == pytest.approx(120.0)
+        assert kwargs["metrics"] is reaper.metrics
+
     def test_standby_does_not_run_scheduler(self, stub_scheduler_tick):
         reaper = self._reaper(_FakeLease(acquires=False))
         with patch.object(reaper_mod, "recover_expired_barriers"):
@@ -317,7 +373,7 @@ class TestSchedulerTick:
         # scheduler error can't starve it. Assert ordering via a shared call log.
         order = []
         reaper = self._reaper(_FakeLease(acquires=True, renews=True))
-        stub_scheduler_tick.side_effect = lambda *_: order.append("schedule")
+        stub_scheduler_tick.side_effect = lambda *_, **__: order.append("schedule")
         with patch.object(
             reaper_mod,
             "recover_expired_barriers",
@@ -377,7 +433,7 @@ class TestQueueRearmTick:
         order = []
         reaper = self._reaper(_FakeLease(acquires=True, renews=True))
         stub_queue_rearm.side_effect = lambda *_: order.append("rearm") or 0
-        stub_scheduler_tick.side_effect = lambda *_: order.append("schedule")
+        stub_scheduler_tick.side_effect = lambda *_, **__: order.append("schedule")
         with patch.object(
             reaper_mod,
             "recover_expired_barriers",
@@ -441,6 +497,18 @@ class TestRetentionSweepSql:
         )
         conn.commit.assert_called_once()
 
+    def test_sweep_expired_results_deletes_offloaded_files(self, monkeypatch):
+        conn, cur = self._conn_cur(3)
+        cur.fetchall.return_value = [("results/a.json.gz",), (None,), (None,)]
+        deleted = MagicMock()
+        monkeypatch.setattr(reaper_mod, "delete_offloaded", deleted)
+
+        assert sweep_expired_results(conn) == 3
+
+        assert "RETURNING" in cur.execute.call_args[0][0]
+        assert deleted.call_args[0][0] == ["results/a.json.gz"]
+        conn.commit.assert_called_once()
+
     def test_sweep_orphan_dedup_sql(self):
         conn, cur = self._conn_cur(2)
         assert sweep_orphan_dedup(conn, 999) == 2
@@ -450,6 +518,14 @@ class TestRetentionSweepSql:
         assert args[1] == (999,)  # the retention param is bound, not interpolated
         conn.commit.assert_called_once()
 
+    def test_sweep_orphan_barrier_results_sql(self):
+        conn, cur = self._conn_cur(5)
+        assert sweep_orphan_barrier_results(conn) == 5
+        sql = cur.execute.call_args[0][0]
+        assert f"DELETE FROM {qualified('pg_barrier_result')}" in sql
+        assert f"NOT EXISTS (    SELECT 1 FROM {qualified('pg_barrier_state')}" in sql
+        conn.commit.assert_called_once()
+
     def test_rearm_expired_claims_sql(self):
         # UN-3445 crash-redelivery helper — same SQL-contract coverage as the
         # sibling sweeps (its integration test is Postgres-gated).
@@ -460,6 +536,24 @@ class TestRetentionSweepSql:
         # sources the state literals from the shared enum, not bare strings
         assert "SET state = 'ready'" in sql
         assert "WHERE state = 'claimed' AND vt <= now()" in sql
+        # ...and moves the re-armed rows from the claimed to the ready counter
+        assert f"INSERT INTO {qualified('pg_queue_stat')}" in sql
+        assert "'claimed'::text AS state, -1 AS delta" in sql
+        assert "'ready'::text, 1" in sql
+        conn.commit.assert_called_once()
+
+    def test_reconcile_queue_stats_sql(self):
+        conn, cur = self._conn_cur(3)
+        assert reconcile_queue_stats(conn) == 3
+        sql = cur.execute.call_args[0][0]
+        assert f"FROM {qualified('pg_queue_message')}" in sql
+        assert f"INSERT INTO {qualified('pg_queue_stat')}" in sql
+        # Keys with no live rows are zeroed (not deleted), the exact depth goes
+        # to shard 0, and the upsert locks in the writers' key order.
+        assert "COALESCE(live.depth, 0)" in sql
+        assert "CASE WHEN k.shard = 0" in sql
+        assert "ORDER BY queue_name, org_id, state, shard" in sql
+        assert "IS DISTINCT FROM" in sql  # unchanged counters aren't rewritten
         conn.commit.assert_called_once()
 
     @pytest.mark.parametrize(
@@ -467,9 +561,17 @@ class TestRetentionSweepSql:
         [
             lambda conn: sweep_expired_results(conn),
             lambda conn: sweep_orphan_dedup(conn, 60),
+            lambda conn: sweep_orphan_barrier_results(conn),
             lambda conn: rearm_expired_claims(conn),
+            lambda conn: reconcile_queue_stats(conn),
+        ],
+        ids=[
+            "expired_results",
+            "orphan_dedup",
+            "orphan_barrier_results",
+            "rearm_claims",
+            "queue_stats",
         ],
-        ids=["expired_results", "orphan_dedup", "rearm_claims"],
     )
     def test_sweep_rolls_back_on_error(self, sweep):
         # Both helpers have their own try/except/rollback — exercise each.
@@ -513,6 +615,7 @@ class TestRetentionSweepTick:
             reaper.tick()
         stub_retention_sweep.results.assert_called_once_with(conn)
         stub_retention_sweep.dedup.assert_called_once_with(conn, 86400)
+        stub_retention_sweep.barrier_results.assert_called_once_with(conn)
         # Orphan-claim sweep (UN-3679) is wired with the api client + stuck-timeout
         # (+ the metrics exporter, so claim outcomes surface as counters).
         stub_retention_sweep.claims.assert_called_once_with(
@@ -521,6 +624,8 @@ class TestRetentionSweepTick:
             reaper._stuck_timeout_seconds,
             metrics=reaper.metrics,
         )
+        # The depth counters are reconciled on the same cadence.
+        stub_retention_sweep.stats.assert_called_once_with(conn)
 
     def test_standby_does_not_sweep(self, stub_retention_sweep):
         reaper = self._reaper(_FakeLease(acquires=False))
@@ -543,7 +648,7 @@ class TestRetentionSweepTick:
     ):
         order = []
         reaper = self._reaper(_FakeLease(acquires=True, renews=True))
-        stub_scheduler_tick.side_effect = lambda *_: order.append("schedule")
+        stub_scheduler_tick.side_effect = lambda *_, **__: order.append("schedule")
         stub_retention_sweep.results.side_effect = lambda *_: order.append("sweep") or 0
         with patch.object(
             reaper_mod,
@@ -601,8 +706,8 @@ class TestRetentionSweepTick:
         ):
             reaper.tick()
         assert (
-            "deleted 0 pg_task_result + 4 pg_batch_dedup + 0 pg_orchestration_claim "
-            "row(s)" in caplog.text
+            "deleted 0 pg_task_result + 4 pg_batch_dedup + 0 pg_barrier_result + "
+            "0 pg_orchestration_claim row(s)" in caplog.text
         )
 
     def test_no_log_when_nothing_deleted(self, stub_retention_sweep, caplog):
@@ -762,11 +867,13 @@ def barrier_conn():
             conn.close()
             pytest.skip("pg_barrier_state migration not applied (run backend migrate)")
         cur.execute("DELETE FROM pg_barrier_state")
+        cur.execute("DELETE FROM pg_barrier_result")
         cur.execute("DELETE FROM pg_batch_dedup")
     conn.commit()
     yield conn
     with conn.cursor() as cur:
         cur.execute("DELETE FROM pg_barrier_state")
+        cur.execute("DELETE FROM pg_barrier_result")
         cur.execute("DELETE FROM pg_batch_dedup")
     conn.commit()
     conn.close()
@@ -796,10 +903,9 @@ def _seed(
     with conn.cursor() as cur:
         cur.execute(
             "INSERT INTO pg_barrier_state "
-            "(execution_id, organization_id, remaining, results, "
+            "(execution_id, organization_id, remaining, "
             " created_at, expires_at, last_progress_at) "
-            f"VALUES (%s, %s, %s, '[]'::jsonb, {created_sql}, {expires_sql}, "
-            f"{last_progress})",
+            f"VALUES (%s, %s, %s, {created_sql}, {expires_sql}, {last_progress})",
             (execution_id, organization_id, remaining),
         )
     conn.commit()
@@ -824,6 +930,28 @@ def _dedup_count(conn, execution_id):
     return n
 
 
+def _seed_child_results(conn, execution_id, count):
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO pg_barrier_result (execution_id, child_index, result, created_at) "
+            "SELECT %s, i, jsonb_build_object('i', i), now() "
+            "FROM generate_series(0, %s - 1) AS i",
+            (execution_id, count),
+        )
+    conn.commit()
+
+
+def _child_result_count(conn, execution_id):
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT count(*) FROM pg_barrier_result WHERE execution_id = %s",
+            (execution_id,),
+        )
+        n = cur.fetchone()[0]
+    conn.commit()
+    return n
+
+
 class TestRecoverExpiredBarriers:
     def test_recovers_only_expired_marks_error_and_cleans_up(self, barrier_conn):
         _seed(barrier_conn, "exp-1", expired=True, remaining=2)
@@ -1021,6 +1149,29 @@ class TestRecoverExpiredBarriers:
         recover_expired_barriers(barrier_conn, _FakeApiClient(status="EXECUTING"))
         assert _dedup_count(barrier_conn, "exp-d") == 0
 
+    def test_reclaims_child_results_only_for_recovered_barriers(self, barrier_conn):
+        # The stranded barrier's partial results go with it; a live barrier's
+        # results (same table) are untouched.
+        _seed(barrier_conn, "exp-r", expired=True, remaining=2)
+        _seed(barrier_conn, "fresh-r", expired=False)
+        _seed_child_results(barrier_conn, "exp-r", 3)
+        _seed_child_results(barrier_conn, "fresh-r", 2)
+        recover_expired_barriers(barrier_conn, _FakeApiClient(status="EXECUTING"))
+        assert _child_result_count(barrier_conn, "exp-r") == 0
+        assert _child_result_count(barrier_conn, "fresh-r") == 2
+
+    def test_sweeps_child_results_left_by_a_previous_release_finaliser(
+        self, barrier_conn
+    ):
+        # A previous-release worker fired the callback and deleted only the
+        # state row; the orphaned result rows go, a live barrier's stay.
+        _seed(barrier_conn, "live-r", expired=False)
+        _seed_child_results(barrier_conn, "live-r", 2)
+        _seed_child_results(barrier_conn, "gone-r", 3)
+        assert sweep_orphan_barrier_results(barrier_conn) == 3
+        assert _child_result_count(barrier_conn, "gone-r") == 0
+        assert _child_result_count(barrier_conn, "live-r") == 2
+
     def test_noop_when_nothing_expired(self, barrier_conn):
         _seed(barrier_conn, "fresh-1", expired=False)
         assert recover_expired_barriers(barrier_conn, _FakeApiClient()) == []
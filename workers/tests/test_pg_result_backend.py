@@ -7,6 +7,7 @@ wait returns when present, wait times out, and wait picks up a late write from
 *another* connection (the cross-process request-reply path).
 """
 
+import json
 import logging
 import os
 import threading
@@ -24,6 +25,8 @@ from queue_backend.pg_queue.result_backend import (
     PgResultBackend,
 )
 
+from unstract.core.pg_result_payload import ResultPayloadLimits, encode_result
+
 _MARK = "pgtaskresult-test"
 
 
@@ -437,3 +440,104 @@ class TestRedisDownFallbackBudget:
         assert out == {"ok": True}
         # Remaining budget, not the full 5.0 (buggy version passed exactly 5.0).
         assert 0 < captured["timeout"] < 5.0 - 0.05
+
+
+class TestLargeResultPayloads:
+    """Compressed / offloaded results (``unstract.core.pg_result_payload``): the
+    row carries an envelope, readers get the original dict back, and an offloaded
+    file never outlives the payload that points at it. Mocked connection — pins
+    the wiring, not the SQL round-trip.
+    """
+
+    @staticmethod
+    def _backend(monkeypatch, *, rowcount=1, fetchone=None, fetchall=()):
+        import queue_backend.pg_queue.result_backend as rbmod
+
+        cur = MagicMock(rowcount=rowcount)
+        cur.fetchone.return_value = fetchone
+        cur.fetchall.return_value = list(fetchall)
+        conn = MagicMock(closed=0)
+        conn.cursor.return_value = _CursorCtx(cur)
+        storage = MagicMock()
+        monkeypatch.setattr(rbmod, "result_storage", lambda: storage)
+        return PgResultBackend(conn=conn), cur, storage
+
+    def test_large_result_is_stored_as_an_offload_reference(self, monkeypatch):
+        monkeypatch.setenv("PG_RESULT_OFFLOAD_THRESHOLD_BYTES", "100")
+        rb, cur, storage = self._backend(monkeypatch)
+
+        rb.store_result("k", result={"output": "x" * 500})
+
+        stored = json.loads(cur.execute.call_args[0][1][2])
+        path = stored["__pg_result__"]["path"]
+        storage.write.assert_called_once()
+        assert storage.write.call_args.kwargs["path"] == path
+        storage.rm.assert_not_called()
+
+    def test_redelivery_that_loses_the_insert_deletes_its_file(self, monkeypatch):
+        monkeypatch.setenv("PG_RESULT_OFFLOAD_THRESHOLD_BYTES", "100")
+        # ON CONFLICT: the stored row points at the first delivery's file
+        rb, _, storage = self._backend(
+            monkeypatch, rowcount=0, fetchone=("unstract/pg-task-result/k-first",)
+        )
+
+        rb.store_result("k", result={"output": "x" * 500})
+
+        written = storage.write.call_args.kwargs["path"]
+        storage.rm.assert_called_once_with(path=written, recursive=False)
+
+    def test_conflict_with_its_own_committed_retry_keeps_the_file(self, monkeypatch):
+        # First attempt committed but reported a dead connection; the retry then
+        # conflicts with that very row, which must keep its file
+        monkeypatch.setenv("PG_RESULT_OFFLOAD_THRESHOLD_BYTES", "100")
+        rb, cur, storage = self._backend(monkeypatch, rowcount=0)
+        cur.fetchone.side_effect = lambda: (storage.write.call_args.kwargs["path"],)
+
+        rb.store_result("k", result={"output": "x" * 500})
+
+        storage.rm.assert_not_called()
+
+    def test_small_result_is_stored_inline_unchanged(self, monkeypatch):
+        monkeypatch.setenv("PG_RESULT_OFFLOAD_THRESHOLD_BYTES", "100")
+        rb, cur, storage = self._backend(monkeypatch)
+
+        rb.store_result("k", result={"ok": True})
+
+        assert json.loads(cur.execute.call_args[0][1][2]) == {"ok": True}
+        storage.write.assert_not_called()
+
+    def test_get_result_restores_a_compressed_result(self, monkeypatch):
+        envelope = json.loads(
+            encode_result(
+                "k",
+                {"output": "x" * 500},
+                ResultPayloadLimits(compress_threshold=100),
+                MagicMock(),
+            ).json_text
+        )
+        rb, _, _ = self._backend(
+            monkeypatch, fetchone=(STATUS_COMPLETED, envelope, "")
+        )
+
+        row = rb.get_result("k")
+
+        assert row["result"] == {"output": "x" * 500}
+
+    def test_forget_deletes_the_offloaded_file(self, monkeypatch):
+        rb, cur, storage = self._backend(
+            monkeypatch, fetchall=[("unstract/pg-task-result/k-1.json.gz",)]
+        )
+
+        rb.forget("k")
+
+        assert "RETURNING old.offload_path" in cur.execute.call_args[0][0]
+        storage.rm.assert_called_once_with(
+            path="unstract/pg-task-result/k-1.json.gz", recursive=False
+        )
+
+    def test_forget_of_an_inline_result_touches_no_storage(self, monkeypatch):
+        rb, _, storage = self._backend(monkeypatch, fetchall=[(None,)])
+
+        rb.forget("k")
+
+        storage.rm.assert_not_called()
@@ -11,12 +11,15 @@ import uuid
 
 import psycopg2
 import pytest
-
+from queue_backend.pg_queue.metrics import ReaperMetrics
 from queue_backend.pg_queue.pg_scheduler import (
+    _SPREAD_OFFSET_SQL,
     SCHEDULER_QUEUE_NAME,
     _build_trigger_payload,
     compute_next_run,
     dispatch_due_schedules,
+    fire_budget,
+    spread_offset_seconds,
 )
 
 
@@ -62,15 +65,34 @@ class TestPureHelpers:
         assert p["kwargs"] == {}
         assert p["fairness"] is None
 
+    def test_spread_offset_is_deterministic_and_within_window(self):
+        pid = uuid.uuid4()
+        offset = spread_offset_seconds(pid, 600)
+        assert 0 <= offset < 600
+        assert spread_offset_seconds(str(pid), 600) == offset  # uuid or its text
+        assert spread_offset_seconds(pid, 1200) == pytest.approx(2 * offset)
+        assert spread_offset_seconds(pid, 0) == 0.0
+
+    def test_spread_offsets_fan_out(self):
+        # A shared cron minute must land across the window, not in one corner.
+        offsets = [spread_offset_seconds(uuid.uuid4(), 100) for _ in range(400)]
+        assert min(offsets) < 10
+        assert max(offsets) > 90
+
+    def test_fire_budget(self):
+        assert fire_budget(None, 5.0) is None
+        assert fire_budget(10, 5.0) == 50
+        assert fire_budget(0.01, 5.0) == 1  # never zero — would stall forever
+
 
 # --- real-PG dispatch behaviour ---
 
 _MARKER = f"test_pgsched_{uuid.uuid4().hex[:8]}"
 
 
-def _seed(conn, *, pg_owned, enabled, next_run_at, cron="0 9 * * *"):
+def _seed(conn, *, pg_owned, enabled, next_run_at, cron="0 9 * * *", pid=None):
     """Insert one pg_periodic_schedule row; returns its pipeline_id (str)."""
-    pid = str(uuid.uuid4())
+    pid = pid or str(uuid.uuid4())
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -239,6 +261,133 @@ class TestDispatchDueSchedules:
         assert msgs[0]["args"][4] == good
 
 
+class TestLoadSmoothing:
+    def test_budget_holds_back_the_newest_due_rows(self, clean):
+        conn = clean
+        older = _seed(
+            conn,
+            pg_owned=True,
+            enabled=True,
+            next_run_at=datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC),
+        )
+        newer = _seed(
+            conn,
+            pg_owned=True,
+            enabled=True,
+            next_run_at=datetime.datetime(2021, 1, 1, tzinfo=datetime.UTC),
+        )
+
+        assert dispatch_due_schedules(conn, max_fires=1) == 1
+        assert [m["args"][4] for m in _queued_messages(conn)] == [older]
+        # The held-back row is still due and goes next tick.
+        assert dispatch_due_schedules(conn, max_fires=1) == 1
+        assert {m["args"][4] for m in _queued_messages(conn)} == {older, newer}
+
+    def test_spread_delays_by_the_pipeline_offset(self, clean):
+        conn = clean
+        spread = 86400.0
+        # A pipeline whose offset is hours: due by cron seconds ago, not by spread.
+        late = next(
+            p
+            for p in (str(uuid.uuid4()) for _ in range(1000))
+            if spread_offset_seconds(p, spread) > 3600
+        )
+        now = datetime.datetime.now(datetime.UTC)
+        _seed(
+            conn,
+            pg_owned=True,
+            enabled=True,
+            next_run_at=now - datetime.timedelta(seconds=5),
+            pid=late,
+        )
+        # Another whose cron match plus its offset has already passed.
+        ready = str(uuid.uuid4())
+        offset = spread_offset_seconds(ready, spread)
+        _seed(
+            conn,
+            pg_owned=True,
+            enabled=True,
+            next_run_at=now - datetime.timedelta(seconds=offset + 60),
+            pid=ready,
+        )
+
+        assert dispatch_due_schedules(conn, spread_seconds=spread) == 1
+        assert [m["args"][4] for m in _queued_messages(conn)] == [ready]
+
+    def test_sql_offset_matches_python(self, clean):
+        pid = str(uuid.uuid4())
+        with clean.cursor() as cur:
+            cur.execute(
+                f"SELECT extract(epoch FROM {_SPREAD_OFFSET_SQL}) "
+                "FROM (SELECT %s::uuid AS pipeline_id) AS t",
+                (3600.0, pid),
+            )
+            sql_offset = float(cur.fetchone()[0])
+        assert sql_offset == pytest.approx(spread_offset_seconds(pid, 3600.0), abs=1e-3)
+
+    def test_batch_fires_many_rows_in_one_transaction(self, clean):
+        conn = clean
+        past = datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC)
+        pids = {
+            _seed(conn, pg_owned=True, enabled=True, next_run_at=past) for _ in range(25)
+        }
+
+        # Only the batch statement advances rows; the per-row fallback would
+        # issue one "WHERE pipeline_id = %s" UPDATE per row instead.
+        proxy = _FailingConn(conn, lambda sql: "WHERE pipeline_id = %s" in sql)
+        assert dispatch_due_schedules(proxy) == 25
+        assert {m["args"][4] for m in _queued_messages(conn)} == pids
+        assert all(_row(conn, pid)[1] > past for pid in pids)
+
+    def test_metrics_record_fires_lag_and_backlog(self, clean):
+        conn = clean
+        past = datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC)
+        for _ in range(3):
+            _seed(conn, pg_owned=True, enabled=True, next_run_at=past)
+        metrics = ReaperMetrics(heartbeat_fn=lambda: 0.0, is_leader_fn=lambda: True)
+
+        dispatch_due_schedules(conn, max_fires=2, metrics=metrics)
+
+        def sample(name):
+            return metrics.registry.get_sample_value(name)
+
+        assert sample("pg_scheduler_fired_total") == 2
+        assert sample("pg_scheduler_fire_lag_seconds_count") == 2
+        assert sample("pg_scheduler_held_back") == 1
+        # Due since 2020: years of lag, measured on the DB clock.
+        assert sample("pg_scheduler_lag_seconds") > 86400 * 365
+
+        metrics.clear_queue_snapshot()  # step-down zeroes the leader-only gauges
+        assert sample("pg_scheduler_held_back") == 0
+        assert sample("pg_scheduler_lag_seconds") == 0
+
+    def test_lag_counts_only_rows_whose_advance_won(self, clean):
+        conn = clean
+        past = datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC)
+        pids = [
+            _seed(conn, pg_owned=True, enabled=True, next_run_at=past) for _ in range(3)
+        ]
+
+        def race(sql):
+            # Another scheduler advances one row between our scan and fire,
+            # so the batch's CAS on next_run_at loses for it.
+            if "FROM advanced" in sql:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "UPDATE pg_periodic_schedule SET next_run_at = now() "
+                        "+ interval '1 day' WHERE pipeline_id = %s",
+                        (pids[0],),
+                    )
+            return False
+
+        metrics = ReaperMetrics(heartbeat_fn=lambda: 0.0, is_leader_fn=lambda: True)
+        assert dispatch_due_schedules(_FailingConn(conn, race), metrics=metrics) == 2
+        assert {m["args"][4] for m in _queued_messages(conn)} == set(pids[1:])
+        sample = metrics.registry.get_sample_value
+        assert sample("pg_scheduler_fired_total") == 2
+        assert sample("pg_scheduler_fire_lag_seconds_count") == 2
+
+
 class _FailingConn:
     """Wraps a real connection so an ``execute`` whose SQL matches ``fail_when``
     raises — to prove a statement failure rolls back cleanly. Everything else
@@ -46,6 +46,16 @@ WORKER_SCHEMA_CONTRACT = {
         "priority",
         "state",
     },
+    "pg_queue_stat": {
+        "id",
+        "queue_name",
+        "org_id",
+        "state",
+        "shard",
+        "depth",
+        "oldest_enqueued_at",
+        "updated_at",
+    },
     "pg_task_result": {
         "task_id",
         "status",
@@ -58,11 +68,15 @@ WORKER_SCHEMA_CONTRACT = {
         "execution_id",
         "organization_id",
         "remaining",
+        "completed",
+        # Deprecated, read-only: the final decrementer folds in results appended
+        # by previous-release workers during a rolling deploy.
         "results",
         "created_at",
         "expires_at",
         "last_progress_at",
     },
+    "pg_barrier_result": {"execution_id", "child_index", "result", "created_at"},
     "pg_batch_dedup": {"execution_id", "batch_index", "created_at"},
     "pg_orchestration_claim": {"execution_id", "organization_id", "claimed_at"},
     "pg_orchestrator_lock": {"id", "leader", "acquired_at"},
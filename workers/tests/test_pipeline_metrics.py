@@ -0,0 +1,225 @@
+"""Tests for the per-stage pipeline metrics (shared/infrastructure/monitoring).
+
+Covers label binding, outcome recording, the multiprocess aggregation a
+prefork worker relies on, the health server's ``/metrics`` route, and the PG
+consumer's queue-wait observation.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+from celery import shared_task
+from queue_backend.pg_queue.client import QueueMessage
+from queue_backend.pg_queue.consumer import PgQueueConsumer
+from queue_backend.pg_queue.metrics import render_multiprocess
+from shared.infrastructure.monitoring import pipeline_metrics
+from shared.infrastructure.monitoring.health import HealthChecker, HealthServer
+from shared.infrastructure.monitoring.pipeline_metrics import (
+    PipelineMetrics,
+    PipelineStage,
+    StageOutcome,
+    bind_stage_labels,
+    observe_stage,
+    time_stage,
+)
+
+_DURATION = "worker_pipeline_stage_duration_seconds"
+_TOTAL = "worker_pipeline_stage_total"
+
+
+@pytest.fixture
+def metrics(monkeypatch) -> PipelineMetrics:
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    fresh = PipelineMetrics()
+    monkeypatch.setattr(pipeline_metrics, "_metrics", fresh)
+    return fresh
+
+
+def _labels(stage, queue="", org="", connector_type="", **extra):
+    return {
+        "stage": stage,
+        "queue": queue,
+        "org": org,
+        "connector_type": connector_type,
+        **extra,
+    }
+
+
+def _count(metrics, stage, **labels):
+    return metrics.registry.get_sample_value(
+        f"{_DURATION}_count", _labels(stage, **labels)
+    )
+
+
+def _total(metrics, stage, outcome, **labels):
+    return metrics.registry.get_sample_value(
+        _TOTAL, _labels(stage, outcome=outcome, **labels)
+    )
+
+
+class TestStageRecording:
+    def test_bound_labels_merge_and_per_call_labels_win(self, metrics):
+        with bind_stage_labels(queue="file_processing", org="org1"):
+            with bind_stage_labels(queue=None, connector_type="FILESYSTEM"):
+                observe_stage(PipelineStage.SOURCE_FETCH, 0.2)
+            observe_stage(PipelineStage.DESTINATION_WRITE, 0.3, connector_type="DATABASE")
+        observe_stage(PipelineStage.CALLBACK, 0.1)
+
+        assert (
+            _count(
+                metrics,
+                "source_fetch",
+                queue="file_processing",
+                org="org1",
+                connector_type="FILESYSTEM",
+            )
+            == 1
+        )
+        assert (
+            _count(
+                metrics,
+                "destination_write",
+                queue="file_processing",
+                org="org1",
+                connector_type="DATABASE",
+            )
+            == 1
+        )
+        # Scope exited: nothing bound any more.
+        assert _count(metrics, "callback") == 1
+
+    def test_time_stage_records_outcomes(self, metrics):
+        with time_stage(PipelineStage.TOOL_RUN):
+            pass
+        with pytest.raises(RuntimeError):
+            with time_stage(PipelineStage.TOOL_RUN):
+                raise RuntimeError("tool crashed")
+        with pytest.raises(LookupError):
+            with time_stage(PipelineStage.TOOL_RUN) as stage:
+                stage.outcome = StageOutcome.DEFERRED
+                raise LookupError("handed off")
+
+        assert _total(metrics, "tool_run", "success") == 1
+        assert _total(metrics, "tool_run", "error") == 1
+        assert _total(metrics, "tool_run", "deferred") == 1
+        assert _count(metrics, "tool_run") == 3
+
+    def test_unknown_label_is_rejected_when_binding(self):
+        with pytest.raises(ValueError, match="tenant"):
+            with bind_stage_labels(tenant="x"):
+                pass
+
+    def test_observation_failure_never_reaches_the_pipeline(self, metrics):
+        with time_stage(PipelineStage.LLM_CALL, tenant="x"):
+            pass  # bad label is dropped with a debug log, block unaffected
+        assert _count(metrics, "llm_call") is None
+
+
+def _observe_in_child(stage: str) -> None:
+    from prometheus_client import Counter
+
+    pipeline_metrics.observe_stage(PipelineStage(stage), 1.5, org="org1")
+    # Another family sharing the directory must stay out of the pipeline render.
+    Counter("unrelated_events", "not a pipeline series", registry=None).inc()
+
+
+class TestMultiprocessAggregation:
+    def test_forked_children_are_summed_in_render(self, monkeypatch, tmp_path):
+        from prometheus_client import values
+
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        # prometheus_client picks its value class at import; switch this test
+        # to the mmap-file values a worker started with the env var gets.
+        monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue())
+        monkeypatch.setattr(pipeline_metrics, "_metrics", PipelineMetrics())
+
+        ctx = multiprocessing.get_context("fork")
+        children = [
+            ctx.Process(target=_observe_in_child, args=("tool_run",)) for _ in range(3)
+        ]
+        for child in children:
+            child.start()
+        for child in children:
+            child.join(timeout=30)
+            assert child.exitcode == 0
+
+        body = pipeline_metrics.render_pipeline_metrics().decode()
+        assert (
+            'worker_pipeline_stage_total{connector_type="",org="org1",'
+            'outcome="success",queue="",stage="tool_run"} 3.0'
+        ) in body
+        assert (
+            'worker_pipeline_stage_duration_seconds_sum{connector_type="",'
+            'org="org1",queue="",stage="tool_run"} 4.5'
+        ) in body
+        assert "unrelated_events" not in body
+        # The PG supervisor renders the same directory without the worker tree.
+        assert render_multiprocess("worker_pipeline_stage").decode() == body
+
+    def test_multiprocess_render_is_empty_without_directory(self, monkeypatch):
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        assert render_multiprocess("worker_pipeline_stage") == b""
+
+
+class TestHealthServerMetricsRoute:
+    def test_metrics_served_in_prometheus_text_format(self, metrics):
+        observe_stage(PipelineStage.EXECUTOR, 2.0, org="org1")
+        server = HealthServer(health_checker=MagicMock(spec=HealthChecker), port=0)
+        server.start()
+        try:
+            port = server.server.server_address[1]
+            with urllib.request.urlopen(
+                f"http://127.0.0.1:{port}/metrics", timeout=5
+            ) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.stop()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert f"{_DURATION}_bucket" in body
+        assert 'stage="executor"' in body
+
+
+@shared_task(name="test_pipeline_metrics.stage")
+def _stage_task():
+    observe_stage(PipelineStage.TOOL_RUN, 0.5)
+
+
+class TestConsumerQueueWait:
+    def test_queue_wait_and_task_stages_carry_queue_and_org(self, metrics):
+        client = MagicMock()
+        client.read.return_value = [
+            QueueMessage(
+                msg_id=1,
+                message={
+                    "task_name": "test_pipeline_metrics.stage",
+                    "args": [],
+                    "kwargs": {},
+                    "fairness": {
+                        "org_id": "org1",
+                        "workload_type": "etl",
+                        "pipeline_priority": 5,
+                    },
+                },
+                read_ct=1,
+                queue_wait_seconds=4.0,
+            )
+        ]
+
+        assert PgQueueConsumer(["file_processing"], client=client).poll_once() == 1
+
+        labels = {"queue": "file_processing", "org": "org1"}
+        assert _count(metrics, "queue_wait", **labels) == 1
+        assert (
+            metrics.registry.get_sample_value(
+                f"{_DURATION}_sum", _labels("queue_wait", **labels)
+            )
+            == 4.0
+        )
+        # The task body ran inside the consumer's label scope.
+        assert _count(metrics, "tool_run", **labels) == 1
@@ -0,0 +1,308 @@
+"""Single-pass batching of compatible prompts in answer_prompt.
+
+Scalar full-context prompts on one LLM profile are answered by one
+structured-output completion; values that fail type validation fall back to
+the per-prompt path. The benchmark case compares LLM round trips and prompt
+size against the per-prompt path on the same payload.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from executor.executors.answer_prompt import AnswerPromptService
+from executor.executors.constants import PromptServiceConstants as PSKeys
+
+from unstract.sdk1.execution.context import ExecutionContext, Operation
+
+
+def _make_prompt(
+    name: str,
+    prompt: str = "What?",
+    output_type: str = "text",
+    chunk_size: int = 0,
+    llm_id: str = "llm-1",
+):
+    return {
+        PSKeys.NAME: name,
+        PSKeys.PROMPT: prompt,
+        PSKeys.TYPE: output_type,
+        PSKeys.CHUNK_SIZE: chunk_size,
+        PSKeys.CHUNK_OVERLAP: 0,
+        PSKeys.RETRIEVAL_STRATEGY: "simple",
+        PSKeys.LLM: llm_id,
+        PSKeys.EMBEDDING: "emb-1",
+        PSKeys.VECTOR_DB: "vdb-1",
+        PSKeys.X2TEXT_ADAPTER: "x2t-1",
+        PSKeys.SIMILARITY_TOP_K: 5,
+    }
+
+
+def _make_context(prompts, tool_settings=None):
+    return ExecutionContext(
+        executor_name="legacy",
+        operation=Operation.ANSWER_PROMPT.value,
+        executor_params={
+            PSKeys.OUTPUTS: prompts,
+            PSKeys.TOOL_SETTINGS: tool_settings or {},
+            PSKeys.TOOL_ID: "tool-1",
+            PSKeys.EXECUTION_ID: "exec-1",
+            PSKeys.FILE_HASH: "abc123",
+            PSKeys.FILE_PATH: "/data/doc.txt",
+            PSKeys.FILE_NAME: "doc.txt",
+            PSKeys.LOG_EVENTS_ID: "",
+            PSKeys.CUSTOM_DATA: {},
+            PSKeys.EXECUTION_SOURCE: "ide",
+            PSKeys.PLATFORM_SERVICE_API_KEY: "pk-test",
+        },
+        run_id="run-1",
+        execution_source="ide",
+    )
+
+
+class _FakeLLM:
+    """Fake LLM recording every prompt it was sent.
+
+    Answers batched prompts with ``batch_answer`` and anything else with
+    ``single_answer``.
+    """
+
+    def __init__(self, batch_answer: dict, single_answer: str = "42") -> None:
+        self.batch_answer = batch_answer
+        self.single_answer = single_answer
+        self.prompts: list[str] = []
+
+    def complete(self, prompt, cache_prefix=None, **kwargs):
+        self.prompts.append((cache_prefix or "") + prompt)
+        response = MagicMock()
+        if "exactly one key per question" in prompt:
+            response.text = json.dumps(self.batch_answer)
+        else:
+            response.text = self.single_answer
+        return {PSKeys.RESPONSE: response}
+
+    def get_usage_reason(self):
+        return "extraction"
+
+    def get_metrics(self):
+        return {}
+
+    def flush_pending_usage(self):
+        return []
+
+
+def _mock_deps(llm):
+    """Mocked ``_get_prompt_deps()`` around the real AnswerPromptService."""
+    retrieval_svc = MagicMock(name="RetrievalService")
+    retrieval_svc.retrieve_complete_context.return_value = ["Invoice 7, total 1,200"]
+    variable_replacement_svc = MagicMock(name="VariableReplacementService")
+    variable_replacement_svc.is_variables_present.return_value = False
+    return (
+        AnswerPromptService,
+        retrieval_svc,
+        variable_replacement_svc,
+        MagicMock(name="Index"),
+        MagicMock(name="LLM", return_value=llm),
+        MagicMock(name="EmbeddingCompat"),
+        MagicMock(name="VectorDB"),
+    )
+
+
+def _names(batch):
+    return [p[PSKeys.NAME] for p in batch]
+
+
+@pytest.fixture(autouse=True)
+def _mock_indexing_utils():
+    with patch(
+        "unstract.sdk1.utils.indexing.IndexingUtils.generate_index_key",
+        return_value="doc-id-test",
+    ):
+        yield
+
+
+class TestPlanPromptBatches:
+    def test_scalar_full_context_prompts_grouped_per_llm(self):
+        prompts = [
+            _make_prompt("a"),
+            _make_prompt("rag", chunk_size=512),
+            _make_prompt("b", output_type="number"),
+            _make_prompt("js", output_type="json"),
+            _make_prompt("other", llm_id="llm-2"),
+            _make_prompt("c", output_type="date"),
+        ]
+        batches = AnswerPromptService.plan_prompt_batches(prompts, {})
+        assert [_names(b) for b in batches] == [["a", "b", "c"]]
+
+    def test_prompts_with_variables_or_plugins_are_not_batched(self):
+        lookup = _make_prompt("lookup")
+        lookup["lookup_config"] = {"lookup_name": "vendors"}
+        prompts = [
+            _make_prompt("a"),
+            _make_prompt("b"),
+            _make_prompt("uses_a", prompt="Given %a%, what?"),
+            _make_prompt("templated", prompt="Given {{b}}, what?"),
+            lookup,
+        ]
+        batches = AnswerPromptService.plan_prompt_batches(prompts, {})
+        assert [_names(b) for b in batches] == [["a", "b"]]
+
+    @pytest.mark.parametrize(
+        "setting", [PSKeys.ENABLE_HIGHLIGHT, PSKeys.ENABLE_CHALLENGE]
+    )
+    def test_highlight_or_challenge_disables_batching(self, setting):
+        prompts = [_make_prompt("a"), _make_prompt("b")]
+        assert AnswerPromptService.plan_prompt_batches(prompts, {setting: True}) == []
+
+    def test_batches_are_capped(self):
+        prompts = [_make_prompt(f"p{i}") for i in range(5)]
+        batches = AnswerPromptService.plan_prompt_batches(prompts, {}, max_size=2)
+        assert [_names(b) for b in batches] == [["p0", "p1"], ["p2", "p3"]]
+
+
+class TestCoerceBatchedAnswer:
+    @pytest.mark.parametrize(
+        "output_type,value,expected",
+        [
+            ("text", "Acme", "Acme"),
+            ("text", None, "NA"),
+            ("number", "1,200", 1200.0),
+            ("number", 7, 7.0),
+            ("number", "NA", None),
+            ("boolean", "yes", True),
+            ("boolean", False, False),
+            ("email", " a@b.co ", "a@b.co"),
+            ("date", "2024-01-31", "2024-01-31"),
+        ],
+    )
+    def test_valid_values(self, output_type, value, expected):
+        assert AnswerPromptService.coerce_batched_answer(output_type, value) == expected
+
+    @pytest.mark.parametrize(
+        "output_type,value",
+        [
+            ("number", "about ten"),
+            ("number", True),
+            ("boolean", "maybe"),
+            ("email", "not an email"),
+            ("date", "last Tuesday"),
+            ("text", {"nested": 1}),
+        ],
+    )
+    def test_invalid_values_raise(self, output_type, value):
+        with pytest.raises(ValueError):
+            AnswerPromptService.coerce_batched_answer(output_type, value)
+
+    def test_parse_drops_missing_and_invalid_keys(self):
+        batch = [
+            _make_prompt("a"),
+            _make_prompt("n", output_type="number"),
+            _make_prompt("missing"),
+        ]
+        answer = json.dumps({"a": "Acme", "n": "lots"})
+        assert AnswerPromptService.parse_batched_answers(answer, batch) == {"a": "Acme"}
+
+
+class TestHandleAnswerPromptBatching:
+    def _run(self, llm, prompts, tool_settings):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        with (
+            patch(
+                "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps",
+                return_value=_mock_deps(llm),
+            ),
+            patch("executor.executors.legacy_executor.ExecutorToolShim"),
+        ):
+            return LegacyExecutor()._handle_answer_prompt(
+                _make_context(prompts, tool_settings)
+            )
+
+    def _prompts(self):
+        return [
+            _make_prompt("vendor", "Who is the vendor?"),
+            _make_prompt("total", "What is the total?", output_type="number"),
+            _make_prompt("paid", "Is it paid?", output_type="boolean"),
+            _make_prompt("rag", "Summarise the terms", chunk_size=512),
+        ]
+
+    def test_batch_answers_in_one_completion(self):
+        llm = _FakeLLM({"vendor": "Acme", "total": 1200, "paid": True})
+        result = self._run(
+            llm, self._prompts()[:3], {PSKeys.ENABLE_PROMPT_BATCHING: True}
+        )
+
+        assert len(llm.prompts) == 1
+        assert result.data[PSKeys.OUTPUT] == {
+            "vendor": "Acme",
+            "total": 1200.0,
+            "paid": True,
+        }
+        stats = result.data[PSKeys.METADATA][PSKeys.PROMPT_BATCHING]
+        assert stats["batched_prompts"] == 3
+        assert stats["batches"][0]["fallback"] == []
+        assert result.data[PSKeys.METRICS]["total"]["prompt_batch"] == "vendor"
+
+    def test_invalid_value_falls_back_to_its_own_call(self):
+        llm = _FakeLLM({"vendor": "Acme", "total": "lots", "paid": True})
+        result = self._run(llm, self._prompts(), {PSKeys.ENABLE_PROMPT_BATCHING: True})
+
+        output = result.data[PSKeys.OUTPUT]
+        assert list(output) == ["vendor", "total", "paid", "rag"]
+        # Per-prompt path: answer + number conversion.
+        assert output["total"] == 42.0
+        assert output["vendor"] == "Acme"
+        stats = result.data[PSKeys.METADATA][PSKeys.PROMPT_BATCHING]
+        assert stats["batches"][0]["fallback"] == ["total"]
+        assert stats["individual_prompts"] == 2
+
+    def test_batching_is_opt_in(self):
+        llm = _FakeLLM({})
+        result = self._run(llm, self._prompts()[:3], {})
+        assert PSKeys.PROMPT_BATCHING not in result.data[PSKeys.METADATA]
+        assert not any("exactly one key per question" in p for p in llm.prompts)
+
+
+class TestBatchingBenchmark:
+    """Round trips and prompt size, batched vs per-prompt, on one payload."""
+
+    def _run(self, tool_settings):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        prompts = [
+            _make_prompt(f"field_{i}", f"What is field {i}?", output_type=t)
+            for i, t in enumerate(["text", "number", "date", "email", "boolean"] * 2)
+        ]
+        llm = _FakeLLM(
+            {
+                p[PSKeys.NAME]: {
+                    "text": "x",
+                    "number": 1,
+                    "date": "2024-01-31",
+                    "email": "a@b.co",
+                    "boolean": True,
+                }[p[PSKeys.TYPE]]
+                for p in prompts
+            },
+            single_answer="yes",
+        )
+        with (
+            patch(
+                "executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps",
+                return_value=_mock_deps(llm),
+            ),
+            patch("executor.executors.legacy_executor.ExecutorToolShim"),
+        ):
+            LegacyExecutor()._handle_answer_prompt(_make_context(prompts, tool_settings))
+        return llm.prompts
+
+    def test_batched_path_needs_one_round_trip_and_fewer_prompt_chars(self):
+        individual = self._run({})
+        batched = self._run({PSKeys.ENABLE_PROMPT_BATCHING: True})
+
+        # Ten scalar prompts: one completion each plus a conversion call for
+        # every non-text type, against one structured-output completion.
+        assert len(individual) == 18
+        assert len(batched) == 1
+        # The document context is sent once instead of once per prompt.
+        assert sum(map(len, batched)) < sum(map(len, individual))
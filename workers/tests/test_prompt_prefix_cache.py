@@ -0,0 +1,192 @@
+"""Prefix-cache-aware prompt layout for answer_prompt.
+
+Full-context prompts on one LLM run back to back (without crossing variable
+references), share a single document read, keep repeated RAG chunks in a stable
+order, and the run reports its cached-token hit rate.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from executor.executors.answer_prompt import AnswerPromptService, PromptContextRegistry
+from executor.executors.constants import PromptServiceConstants as PSKeys
+
+from unstract.sdk1.execution.context import ExecutionContext, Operation
+
+
+def _make_prompt(
+    name: str, prompt: str = "What?", chunk_size: int = 512, llm_id: str = "llm-1"
+):
+    return {
+        PSKeys.NAME: name,
+        PSKeys.PROMPT: prompt,
+        PSKeys.TYPE: "text",
+        PSKeys.CHUNK_SIZE: chunk_size,
+        PSKeys.CHUNK_OVERLAP: 0,
+        PSKeys.RETRIEVAL_STRATEGY: "simple",
+        PSKeys.LLM: llm_id,
+        PSKeys.EMBEDDING: "emb-1",
+        PSKeys.VECTOR_DB: "vdb-1",
+        PSKeys.X2TEXT_ADAPTER: "x2t-1",
+        PSKeys.SIMILARITY_TOP_K: 5,
+    }
+
+
+def _make_context(prompts):
+    return ExecutionContext(
+        executor_name="legacy",
+        operation=Operation.ANSWER_PROMPT.value,
+        executor_params={
+            PSKeys.OUTPUTS: prompts,
+            PSKeys.TOOL_SETTINGS: {},
+            PSKeys.TOOL_ID: "tool-1",
+            PSKeys.EXECUTION_ID: "exec-1",
+            PSKeys.FILE_HASH: "abc123",
+            PSKeys.FILE_PATH: "/data/doc.txt",
+            PSKeys.FILE_NAME: "doc.txt",
+            PSKeys.LOG_EVENTS_ID: "",
+            PSKeys.CUSTOM_DATA: {},
+            PSKeys.EXECUTION_SOURCE: "ide",
+            PSKeys.PLATFORM_SERVICE_API_KEY: "pk-test",
+        },
+        run_id="run-1",
+        execution_source="ide",
+    )
+
+
+def _mock_deps(llm):
+    """Mocked ``_get_prompt_deps()`` around the real AnswerPromptService."""
+    response = MagicMock()
+    response.text = "answer"
+    llm.complete.return_value = {PSKeys.RESPONSE: response}
+    llm.get_usage_reason.return_value = "extraction"
+    llm.get_metrics.return_value = {}
+    retrieval_svc = MagicMock(name="RetrievalService")
+    retrieval_svc.run_retrieval.return_value = ["chunk1", "chunk2"]
+    retrieval_svc.retrieve_complete_context.return_value = ["full content"]
+    variable_replacement_svc = MagicMock(name="VariableReplacementService")
+    variable_replacement_svc.is_variables_present.return_value = False
+    return (
+        AnswerPromptService,
+        retrieval_svc,
+        variable_replacement_svc,
+        MagicMock(name="Index"),
+        MagicMock(name="LLM", return_value=llm),
+        MagicMock(name="EmbeddingCompat"),
+        MagicMock(name="VectorDB"),
+    )
+
+
+def _names(prompts):
+    return [p[PSKeys.NAME] for p in prompts]
+
+
+@pytest.fixture(autouse=True)
+def _mock_indexing_utils():
+    with patch(
+        "unstract.sdk1.utils.indexing.IndexingUtils.generate_index_key",
+        return_value="doc-id-test",
+    ):
+        yield
+
+
+class TestOrderForPrefixCache:
+    def test_full_context_prompts_on_same_llm_are_grouped(self):
+        prompts = [
+            _make_prompt(name="a", chunk_size=0),
+            _make_prompt(name="rag", chunk_size=512),
+            _make_prompt(name="other_llm", chunk_size=0, llm_id="llm-2"),
+            _make_prompt(name="b", chunk_size=0),
+        ]
+        ordered = AnswerPromptService.order_for_prefix_cache(prompts)
+        assert _names(ordered) == ["a", "b", "rag", "other_llm"]
+
+    def test_rag_only_projects_keep_their_order(self):
+        prompts = [_make_prompt(name=n) for n in ("x", "y", "z")]
+        assert _names(AnswerPromptService.order_for_prefix_cache(prompts)) == [
+            "x",
+            "y",
+            "z",
+        ]
+
+    def test_variable_references_pin_relative_order(self):
+        prompts = [
+            _make_prompt(name="a", chunk_size=0),
+            _make_prompt(name="rag", chunk_size=512),
+            # References ``rag``, so it must not jump ahead of it.
+            _make_prompt(name="b", prompt="Given {{rag}}, what?", chunk_size=0),
+            _make_prompt(name="c", chunk_size=0),
+        ]
+        ordered = AnswerPromptService.order_for_prefix_cache(prompts)
+        assert _names(ordered) == ["a", "c", "rag", "b"]
+
+    def test_referenced_later_prompt_is_not_pulled_ahead(self):
+        prompts = [
+            _make_prompt(name="a", prompt="Uses %later%", chunk_size=512),
+            _make_prompt(name="x", chunk_size=0),
+            _make_prompt(name="later", chunk_size=0),
+        ]
+        ordered = AnswerPromptService.order_for_prefix_cache(prompts)
+        assert _names(ordered).index("a") < _names(ordered).index("later")
+
+
+class TestPromptContextRegistry:
+    def test_complete_context_loaded_once_per_file(self):
+        registry = PromptContextRegistry()
+        load = MagicMock(return_value=["doc"])
+        assert registry.complete_context("/f", load) == ["doc"]
+        assert registry.complete_context("/f", load) == ["doc"]
+        load.assert_called_once()
+
+    def test_same_chunk_set_reuses_first_layout(self):
+        registry = PromptContextRegistry()
+        assert registry.stable_layout(["c1", "c2"]) == ["c1", "c2"]
+        assert registry.stable_layout(["c2", "c1"]) == ["c1", "c2"]
+        assert registry.stable_layout(["c2", "c3"]) == ["c2", "c3"]
+
+    def test_cache_stats_report_hit_rate(self):
+        registry = PromptContextRegistry()
+        assert registry.cache_stats() == {}
+        llm = MagicMock()
+        llm.get_prompt_cache_usage.return_value = {
+            "prompt_tokens": 1000,
+            "cache_read_input_tokens": 750,
+            "cache_creation_input_tokens": 0,
+        }
+        registry.record_cache_usage(llm)
+        registry.record_cache_usage(MagicMock())  # no usage reported: ignored
+        assert registry.cache_stats()["cache_hit_rate"] == 0.75
+
+
+class TestHandleAnswerPromptPrefixCache:
+    @patch("executor.executors.legacy_executor.LegacyExecutor._get_prompt_deps")
+    @patch("executor.executors.legacy_executor.ExecutorToolShim")
+    def test_document_read_once_and_output_order_kept(
+        self, mock_shim_cls, mock_deps, monkeypatch
+    ):
+        from executor.executors.legacy_executor import LegacyExecutor
+
+        monkeypatch.setenv("ENABLE_PROMPT_CACHING", "true")
+        llm = MagicMock(name="llm")
+        llm.get_prompt_cache_usage.return_value = {
+            "prompt_tokens": 100,
+            "cache_read_input_tokens": 50,
+            "cache_creation_input_tokens": 50,
+        }
+        deps = _mock_deps(llm)
+        retrieval_svc = deps[1]
+        mock_deps.return_value = deps
+        mock_shim_cls.return_value = MagicMock()
+
+        prompts = [
+            _make_prompt(name="a", chunk_size=0),
+            _make_prompt(name="rag", chunk_size=512),
+            _make_prompt(name="b", chunk_size=0),
+        ]
+        result = LegacyExecutor()._handle_answer_prompt(_make_context(prompts=prompts))
+
+        retrieval_svc.retrieve_complete_context.assert_called_once()
+        assert list(result.data[PSKeys.OUTPUT]) == ["a", "rag", "b"]
+        cache = result.data[PSKeys.METADATA][PSKeys.PROMPT_CACHE]
+        assert cache["prompt_tokens"] == 300
+        assert cache["cache_hit_rate"] == 0.5
@@ -9,13 +9,14 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from executor.executors.constants import RetrievalStrategy
-from executor.executors.retrieval import RetrievalService
+from executor.executors.retrieval import RetrievalCache, RetrievalService
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+
 def _make_output(prompt: str = "What is X?", top_k: int = 5, name: str = "field_a"):
     """Build a minimal ``output`` dict matching PromptServiceConstants keys."""
     return {
@@ -40,6 +41,7 @@ def _mock_retriever_class(return_value=None):
 # Factory — run_retrieval
 # ---------------------------------------------------------------------------
 
+
 class TestRunRetrieval:
     """Tests for RetrievalService.run_retrieval()."""
 
@@ -153,10 +155,93 @@ class TestRunRetrieval:
         )
 
 
+# ---------------------------------------------------------------------------
+# Run-scoped memo — RetrievalCache
+# ---------------------------------------------------------------------------
+
+
+class TestRetrievalCache:
+    """Tests for run_retrieval() with a RetrievalCache."""
+
+    def _run(self, cache, output=None, strategy=RetrievalStrategy.SIMPLE, metrics=None):
+        return RetrievalService.run_retrieval(
+            output=output or _make_output(),
+            doc_id="doc-1",
+            llm=MagicMock(),
+            vector_db=MagicMock(),
+            retrieval_type=strategy.value,
+            context_retrieval_metrics=metrics,
+            retrieval_cache=cache,
+        )
+
+    @patch("executor.executors.retrieval.RetrievalService._get_retriever_map")
+    def test_repeated_prompt_skips_retriever(self, mock_map):
+        """A near-identical prompt is served from the memo."""
+        cls, inst = _mock_retriever_class(return_value=["c1", "c2"])
+        mock_map.return_value = {RetrievalStrategy.SIMPLE.value: cls}
+        cache = RetrievalCache()
+        metrics: dict = {}
+
+        first = self._run(cache, _make_output("What is  X?", name="a"), metrics=metrics)
+        second = self._run(cache, _make_output("what is x?\n", name="b"), metrics=metrics)
+
+        assert first == second == ["c1", "c2"]
+        inst.retrieve.assert_called_once()
+        assert metrics["a"]["retrieval_cache"] == "miss"
+        assert metrics["a"]["query_embedding_cache"] == {"hits": 0, "misses": 0}
+        assert metrics["b"]["retrieval_cache"] == "hit"
+
+    @patch("executor.executors.retrieval.RetrievalService._get_retriever_map")
+    def test_top_k_is_part_of_the_key(self, mock_map):
+        cls, inst = _mock_retriever_class(return_value=["c1"])
+        mock_map.return_value = {RetrievalStrategy.SIMPLE.value: cls}
+        cache = RetrievalCache()
+
+        self._run(cache, _make_output(top_k=5))
+        self._run(cache, _make_output(top_k=3))
+
+        assert inst.retrieve.call_count == 2
+
+    @patch("executor.executors.retrieval.RetrievalService._get_retriever_map")
+    def test_empty_result_is_not_memoised(self, mock_map):
+        cls, inst = _mock_retriever_class(return_value=[])
+        mock_map.return_value = {RetrievalStrategy.SIMPLE.value: cls}
+        cache = RetrievalCache()
+
+        self._run(cache)
+        self._run(cache)
+
+        assert inst.retrieve.call_count == 2
+
+    def test_llm_profile_keys_only_llm_backed_strategies(self):
+        simple = RetrievalStrategy.SIMPLE.value
+        fusion = RetrievalStrategy.FUSION.value
+        assert RetrievalCache.key("d", simple, 5, "q", "llm-1") == RetrievalCache.key(
+            "d", simple, 5, "q", "llm-2"
+        )
+        assert RetrievalCache.key("d", fusion, 5, "q", "llm-1") != RetrievalCache.key(
+            "d", fusion, 5, "q", "llm-2"
+        )
+
+    def test_attach_shares_query_embedding_cache(self):
+        cache = RetrievalCache()
+        embedding = MagicMock()
+        cache.attach(embedding)
+        embedding.use_query_embedding_cache.assert_called_once_with(
+            cache.query_embeddings
+        )
+
+        cache.query_embeddings[("m", "q")] = [0.1]
+        assert cache.query_embeddings.get(("m", "q")) == [0.1]
+        assert cache.query_embeddings.get(("m", "other")) is None
+        assert cache.embedding_counts() == (1, 1)
+
+
 # ---------------------------------------------------------------------------
 # Complete context — retrieve_complete_context
 # ---------------------------------------------------------------------------
 
+
 class TestRetrieveCompleteContext:
     """Tests for RetrievalService.retrieve_complete_context()."""
 
@@ -228,6 +313,7 @@ class TestRetrieveCompleteContext:
 # BaseRetriever interface
 # ---------------------------------------------------------------------------
 
+
 class TestBaseRetriever:
     """Tests for BaseRetriever base class."""
 
@@ -619,6 +619,297 @@ class TestStructureToolMultipleOutputs:
         assert outputs[1]["name"] == "field_b"
 
 
+class TestStructureToolAgenticTableFanOut:
+    """Agentic-table prompts and the structure_pipeline dispatch together."""
+
+    @patch(_PATCH_SHIM)
+    @patch(_PATCH_FILE_STORAGE)
+    @patch(_PATCH_PLATFORM_HELPER)
+    @patch(_PATCH_DISPATCHER)
+    def test_agentic_tables_merged_into_pipeline_output(
+        self,
+        mock_get_executor_dispatcher,
+        mock_create_ph,
+        mock_get_fs,
+        mock_shim_cls,
+        base_params,
+        tool_metadata_regular,
+        mock_fs,
+        mock_platform_helper,
+    ):
+        from file_processing.structure_tool_task import (
+            _execute_structure_tool_impl as execute_structure_tool,
+        )
+
+        mock_get_fs.return_value = mock_fs
+        mock_create_ph.return_value = mock_platform_helper
+        for name in ("table_a", "table_b"):
+            tool_metadata_regular["outputs"].append(
+                {
+                    "name": name,
+                    "type": "agentic_table",
+                    "llm": "llm-1",
+                    "agentic_table_settings": {
+                        "target_table": name,
+                        "json_structure": {"col": "string"},
+                    },
+                }
+            )
+        mock_platform_helper.get_prompt_studio_tool.return_value = {
+            "tool_metadata": tool_metadata_regular,
+        }
+
+        def _dispatch(ctx, timeout, headers):
+            if ctx.operation == "table_extract":
+                target = ctx.executor_params["target_table"]
+                return ExecutionResult(
+                    success=True, data={"output": {"tables": [target]}}
+                )
+            return _make_pipeline_result(output={"field_a": "$1M"})
+
+        dispatcher_instance = MagicMock()
+        dispatcher_instance.dispatch.side_effect = _dispatch
+        mock_get_executor_dispatcher.return_value = dispatcher_instance
+
+        result = execute_structure_tool(base_params)
+
+        assert result["success"] is True
+        assert result["data"]["output"] == {
+            "field_a": "$1M",
+            "table_a": ["table_a"],
+            "table_b": ["table_b"],
+        }
+        operations = sorted(
+            c.args[0].operation for c in dispatcher_instance.dispatch.call_args_list
+        )
+        assert operations == ["structure_pipeline", "table_extract", "table_extract"]
+        pipeline_ctx = next(
+            c.args[0]
+            for c in dispatcher_instance.dispatch.call_args_list
+            if c.args[0].operation == "structure_pipeline"
+        )
+        outputs = pipeline_ctx.executor_params["answer_params"]["outputs"]
+        assert [o["name"] for o in outputs] == ["field_a"]
+
+    @patch(_PATCH_SHIM)
+    @patch(_PATCH_FILE_STORAGE)
+    @patch(_PATCH_PLATFORM_HELPER)
+    @patch(_PATCH_DISPATCHER)
+    def test_agentic_table_failure_fails_file(
+        self,
+        mock_get_executor_dispatcher,
+        mock_create_ph,
+        mock_get_fs,
+        mock_shim_cls,
+        base_params,
+        tool_metadata_regular,
+        mock_fs,
+        mock_platform_helper,
+    ):
+        from file_processing.structure_tool_task import (
+            _execute_structure_tool_impl as execute_structure_tool,
+        )
+
+        mock_get_fs.return_value = mock_fs
+        mock_create_ph.return_value = mock_platform_helper
+        tool_metadata_regular["outputs"].append(
+            {
+                "name": "table_a",
+                "type": "agentic_table",
+                "llm": "llm-1",
+                "agentic_table_settings": {
+                    "target_table": "table_a",
+                    "json_structure": {"col": "string"},
+                },
+            }
+        )
+        mock_platform_helper.get_prompt_studio_tool.return_value = {
+            "tool_metadata": tool_metadata_regular,
+        }
+
+        def _dispatch(ctx, timeout, headers):
+            if ctx.operation == "table_extract":
+                return ExecutionResult.failure(error="table extraction failed")
+            return _make_pipeline_result(output={"field_a": "$1M"})
+
+        dispatcher_instance = MagicMock()
+        dispatcher_instance.dispatch.side_effect = _dispatch
+        mock_get_executor_dispatcher.return_value = dispatcher_instance
+
+        result = execute_structure_tool(base_params)
+
+        assert result["success"] is False
+        assert result["error"] == "table extraction failed"
+        mock_fs.json_dump.assert_not_called()
+
+
+class TestStructureToolContinuation:
+    """structure_pipeline handed off to, and resumed from, a continuation."""
+
+    _BATCH = {
+        "files": [["test.pdf", {"file_name": "test.pdf", "file_number": 3}]],
+        "file_data": {"execution_id": "exec-456"},
+    }
+    _BARRIER = {
+        "execution_id": "exec-456",
+        "batch_index": 0,
+        "callback_descriptor": {"task_name": "cb", "kwargs": {}, "queue": "q"},
+    }
+
+    @pytest.fixture(autouse=True)
+    def _clean_state(self):
+        from shared.infrastructure.context import StateStore
+
+        yield
+        StateStore.clear_all()
+
+    @patch("file_processing.structure_tool_task.extend_barrier", return_value=2)
+    @patch(
+        "file_processing.structure_tool_task.STRUCTURE_TOOL_CONTINUATIONS_ENABLED", True
+    )
+    @patch(_PATCH_SHIM)
+    @patch(_PATCH_FILE_STORAGE)
+    @patch(_PATCH_PLATFORM_HELPER)
+    @patch(_PATCH_DISPATCHER)
+    def test_single_pipeline_is_deferred_in_barrier_scope(
+        self,
+        mock_get_executor_dispatcher,
+        mock_create_ph,
+        mock_get_fs,
+        mock_shim_cls,
+        mock_extend,
+        base_params,
+        tool_metadata_regular,
+        mock_fs,
+        mock_platform_helper,
+    ):
+        from file_processing.structure_tool_task import (
+            CONTINUATION_BATCH_INDEX_OFFSET,
+            CONTINUATION_SCOPE_KEY,
+        )
+        from file_processing.structure_tool_task import (
+            _execute_structure_tool_impl as execute_structure_tool,
+        )
+        from shared.exceptions import ExecutionDeferred
+        from shared.infrastructure.context import StateStore
+
+        mock_get_fs.return_value = mock_fs
+        mock_create_ph.return_value = mock_platform_helper
+        mock_platform_helper.get_prompt_studio_tool.return_value = {
+            "tool_metadata": tool_metadata_regular,
+        }
+        dispatcher_instance = MagicMock()
+        mock_get_executor_dispatcher.return_value = dispatcher_instance
+        StateStore.set(
+            CONTINUATION_SCOPE_KEY,
+            {"file_batch_data": self._BATCH, "barrier_context": self._BARRIER},
+        )
+
+        with pytest.raises(ExecutionDeferred):
+            execute_structure_tool(base_params)
+
+        dispatcher_instance.dispatch.assert_not_called()
+        mock_extend.assert_called_once_with("exec-456")
+        call = dispatcher_instance.dispatch_with_callback.call_args
+        assert call.args[0].operation == "structure_pipeline"
+        on_success, on_error = call.kwargs["on_success"], call.kwargs["on_error"]
+        assert on_success.task == "resume_deferred_file"
+        assert on_error.task == "resume_deferred_file_error"
+        assert on_success.options["queue"] == "file_processing"
+        cb = on_success.kwargs["callback_kwargs"]
+        assert cb["file_execution_id"] == "fexec-789"
+        assert cb["file_batch_data"]["files"] == self._BATCH["files"]
+        assert cb["barrier_context"]["batch_index"] == CONTINUATION_BATCH_INDEX_OFFSET + 3
+        mock_fs.json_dump.assert_not_called()
+
+    @patch(_PATCH_SHIM)
+    @patch(_PATCH_FILE_STORAGE)
+    @patch(_PATCH_PLATFORM_HELPER)
+    @patch(_PATCH_DISPATCHER)
+    def test_resumed_result_written_without_dispatch(
+        self,
+        mock_get_executor_dispatcher,
+        mock_create_ph,
+        mock_get_fs,
+        mock_shim_cls,
+        base_params,
+        tool_metadata_regular,
+        mock_fs,
+        mock_platform_helper,
+    ):
+        from file_processing.structure_tool_task import CONTINUATION_RESULT_KEY
+        from file_processing.structure_tool_task import (
+            _execute_structure_tool_impl as execute_structure_tool,
+        )
+        from shared.infrastructure.context import StateStore
+
+        mock_get_fs.return_value = mock_fs
+        mock_create_ph.return_value = mock_platform_helper
+        mock_platform_helper.get_prompt_studio_tool.return_value = {
+            "tool_metadata": tool_metadata_regular,
+        }
+        dispatcher_instance = MagicMock()
+        mock_get_executor_dispatcher.return_value = dispatcher_instance
+        StateStore.set(
+            CONTINUATION_RESULT_KEY,
+            {
+                "file_execution_id": "fexec-789",
+                "result": _make_pipeline_result(output={"field_a": "$1M"}).to_dict(),
+                "dispatched_at": None,
+            },
+        )
+
+        result = execute_structure_tool(base_params)
+
+        assert result["success"] is True
+        assert result["data"]["output"]["field_a"] == "$1M"
+        dispatcher_instance.dispatch.assert_not_called()
+        dispatcher_instance.dispatch_with_callback.assert_not_called()
+        assert mock_fs.json_dump.call_count == 3
+        assert StateStore.get(CONTINUATION_RESULT_KEY) is None
+
+    @patch(_PATCH_SHIM)
+    @patch(_PATCH_FILE_STORAGE)
+    @patch(_PATCH_PLATFORM_HELPER)
+    @patch(_PATCH_DISPATCHER)
+    def test_resumed_failure_fails_file(
+        self,
+        mock_get_executor_dispatcher,
+        mock_create_ph,
+        mock_get_fs,
+        mock_shim_cls,
+        base_params,
+        tool_metadata_regular,
+        mock_fs,
+        mock_platform_helper,
+    ):
+        from file_processing.structure_tool_task import CONTINUATION_RESULT_KEY
+        from file_processing.structure_tool_task import (
+            _execute_structure_tool_impl as execute_structure_tool,
+        )
+        from shared.infrastructure.context import StateStore
+
+        mock_get_fs.return_value = mock_fs
+        mock_create_ph.return_value = mock_platform_helper
+        mock_platform_helper.get_prompt_studio_tool.return_value = {
+            "tool_metadata": tool_metadata_regular,
+        }
+        mock_get_executor_dispatcher.return_value = MagicMock()
+        StateStore.set(
+            CONTINUATION_RESULT_KEY,
+            {
+                "file_execution_id": "fexec-789",
+                "result": ExecutionResult.failure(error="executor died").to_dict(),
+            },
+        )
+
+        result = execute_structure_tool(base_params)
+
+        assert result["success"] is False
+        assert result["error"] == "executor died"
+        mock_fs.json_dump.assert_not_called()
+
+
 class TestStructureToolOutputWritten:
     """Output JSON written to correct path with correct structure."""
 
@@ -17,9 +17,12 @@ site forwards it".
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
+from unstract.sdk1.execution.context import ExecutionContext
+from unstract.sdk1.execution.result import ExecutionResult
 
 from file_processing import structure_tool_task as st
 from file_processing.structure_tool_task import _fairness_headers
@@ -89,5 +92,277 @@ class TestDispatcherFactory:
         factory.assert_called_once_with(celery_app=st.app)
 
 
+def _ctx(operation: str) -> ExecutionContext:
+    return ExecutionContext(
+        executor_name="agentic_table",
+        operation=operation,
+        run_id="fe1",
+        execution_source="tool",
+        organization_id="org1",
+        file_execution_id="fe1",
+    )
+
+
+class TestDispatchConcurrently:
+    """Agentic-table jobs and the structure_pipeline fan out concurrently;
+    results come back in submission order and the first failure wins.
+    """
+
+    def test_jobs_run_concurrently_and_keep_order(self):
+        contexts = [_ctx(f"op{i}") for i in range(3)]
+        # Every job blocks until all three are in flight — a sequential
+        # dispatch would time out on the barrier instead.
+        barrier = threading.Barrier(len(contexts), timeout=5)
+        dispatcher = MagicMock()
+
+        def _dispatch(ctx, timeout, headers):
+            barrier.wait()
+            return ExecutionResult(success=True, data={"output": ctx.operation})
+
+        dispatcher.dispatch.side_effect = _dispatch
+        results, failure = st._dispatch_concurrently(dispatcher, contexts, "org1")
+
+        assert failure is None
+        assert [r.data["output"] for r in results] == ["op0", "op1", "op2"]
+        headers = dispatcher.dispatch.call_args.kwargs["headers"]
+        assert headers == _fairness_headers("org1")
+
+    def test_first_failure_returned_without_waiting_for_stragglers(self):
+        contexts = [_ctx("slow"), _ctx("bad")]
+        release = threading.Event()
+        dispatcher = MagicMock()
+
+        def _dispatch(ctx, timeout, headers):
+            if ctx.operation == "slow":
+                release.wait(5)
+                return ExecutionResult(success=True, data={})
+            return ExecutionResult.failure(error="boom")
+
+        dispatcher.dispatch.side_effect = _dispatch
+        try:
+            results, failure = st._dispatch_concurrently(dispatcher, contexts, "org1")
+        finally:
+            release.set()
+
+        assert results == []
+        assert failure is not None and failure.error == "boom"
+
+    def test_raising_dispatch_becomes_failure(self):
+        dispatcher = MagicMock()
+        dispatcher.dispatch.side_effect = RuntimeError("broker down")
+
+        results, failure = st._dispatch_concurrently(dispatcher, [_ctx("op")], "org1")
+
+        assert results == []
+        assert "broker down" in failure.error
+
+    def test_no_jobs(self):
+        assert st._dispatch_concurrently(MagicMock(), [], "org1") == ([], None)
+
+
+class TestDeferToContinuation:
+    _BARRIER = {"execution_id": "exec-1", "batch_index": 0, "callback_descriptor": {}}
+
+    @pytest.fixture(autouse=True)
+    def _enabled(self, monkeypatch):
+        from shared.infrastructure.context import StateStore
+
+        monkeypatch.setattr(st, "STRUCTURE_TOOL_CONTINUATIONS_ENABLED", True)
+        StateStore.set(
+            st.CONTINUATION_SCOPE_KEY,
+            {
+                "file_batch_data": {
+                    "files": [["a.pdf", {"file_number": 1}], ["b.pdf", {}]]
+                },
+                "barrier_context": self._BARRIER,
+            },
+        )
+        yield
+        StateStore.clear_all()
+
+    def test_disabled_does_not_defer(self, monkeypatch):
+        monkeypatch.setattr(st, "STRUCTURE_TOOL_CONTINUATIONS_ENABLED", False)
+        dispatcher = MagicMock()
+        assert not st._defer_to_continuation(
+            dispatcher, _ctx("structure_pipeline"), "org-1", "a.pdf"
+        )
+        dispatcher.dispatch_with_callback.assert_not_called()
+
+    def test_outside_barrier_scope_does_not_defer(self):
+        from shared.infrastructure.context import StateStore
+
+        StateStore.clear(st.CONTINUATION_SCOPE_KEY)
+        assert not st._defer_to_continuation(
+            MagicMock(), _ctx("structure_pipeline"), "org-1", "a.pdf"
+        )
+
+    def test_file_without_number_does_not_defer(self):
+        with patch.object(st, "extend_barrier") as extend:
+            assert not st._defer_to_continuation(
+                MagicMock(), _ctx("structure_pipeline"), "org-1", "b.pdf"
+            )
+        extend.assert_not_called()
+
+    def test_gone_barrier_does_not_defer(self):
+        dispatcher = MagicMock()
+        with patch.object(st, "extend_barrier", return_value=None):
+            assert not st._defer_to_continuation(
+                dispatcher, _ctx("structure_pipeline"), "org-1", "a.pdf"
+            )
+        dispatcher.dispatch_with_callback.assert_not_called()
+
+    def test_dispatch_failure_releases_extension(self):
+        dispatcher = MagicMock()
+        dispatcher.dispatch_with_callback.side_effect = RuntimeError("enqueue down")
+        with patch.object(st, "extend_barrier", return_value=2) as extend:
+            assert not st._defer_to_continuation(
+                dispatcher, _ctx("structure_pipeline"), "org-1", "a.pdf"
+            )
+        assert [c.args for c in extend.call_args_list] == [("exec-1",), ("exec-1", -1)]
+
+    def test_defers_after_extending(self):
+        dispatcher = MagicMock()
+        with patch.object(st, "extend_barrier", return_value=2) as extend:
+            assert st._defer_to_continuation(
+                dispatcher, _ctx("structure_pipeline"), "org-1", "a.pdf"
+            )
+        extend.assert_called_once_with("exec-1")
+        assert dispatcher.dispatch_with_callback.call_count == 1
+
+
+class TestTakeContinuationResult:
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        from shared.infrastructure.context import StateStore
+
+        yield
+        StateStore.clear_all()
+
+    def _store(self, **overrides):
+        from shared.infrastructure.context import StateStore
+
+        stored = {
+            "file_execution_id": "fe-1",
+            "result": {"success": True, "data": {"output": {}}},
+            "dispatched_at": None,
+        }
+        stored.update(overrides)
+        StateStore.set(st.CONTINUATION_RESULT_KEY, stored)
+
+    def test_nothing_stored(self):
+        assert st._take_continuation_result("fe-1", 1) is None
+
+    def test_returns_success_and_consumes(self):
+        from shared.infrastructure.context import StateStore
+
+        self._store()
+        results, failure, elapsed = st._take_continuation_result("fe-1", 1)
+        assert failure is None
+        assert results[0].success
+        assert elapsed >= 0.0
+        assert StateStore.get(st.CONTINUATION_RESULT_KEY) is None
+
+    def test_returns_failure(self):
+        self._store(result={"success": False, "error": "boom"})
+        results, failure, _ = st._take_continuation_result("fe-1", 1)
+        assert results == []
+        assert failure.error == "boom"
+
+    def test_other_file_is_discarded(self):
+        self._store(file_execution_id="fe-other")
+        assert st._take_continuation_result("fe-1", 1) is None
+
+    def test_changed_job_count_is_discarded(self):
+        self._store()
+        assert st._take_continuation_result("fe-1", 2) is None
+
+
+class TestResolveToolMetadata:
+    def _helper(self, tool_metadata=None, profile=None):
+        helper = MagicMock()
+        helper.get_prompt_studio_tool.return_value = {
+            "tool_metadata": tool_metadata or {"name": "t", "outputs": []}
+        }
+        helper.get_llm_profile.return_value = profile
+        return helper
+
+    def _resolve(self, helper, execution_id="exec-1", exec_metadata=None):
+        return st._resolve_tool_metadata(
+            helper,
+            "preg-1",
+            exec_metadata or {},
+            organization_id="org-1",
+            execution_id=execution_id,
+        )
+
+    def test_fetched_once_per_execution(self):
+        helper = self._helper(profile={"profile_name": "p"})
+        for _ in range(3):
+            tool_metadata, is_agentic = self._resolve(
+                helper, exec_metadata={"llm_profile_id": "prof-1"}
+            )
+        assert tool_metadata["name"] == "t"
+        assert is_agentic is False
+        helper.get_prompt_studio_tool.assert_called_once()
+        helper.get_llm_profile.assert_called_once_with("prof-1")
+
+    def test_callers_get_private_copies(self):
+        helper = self._helper()
+        first, _ = self._resolve(helper)
+        first["outputs"].append("mutated")
+        second, _ = self._resolve(helper)
+        assert second["outputs"] == []
+
+    def test_keyed_by_execution_and_profile(self):
+        helper = self._helper()
+        self._resolve(helper, execution_id="exec-1")
+        self._resolve(helper, execution_id="exec-2")
+        self._resolve(helper, exec_metadata={"llm_profile_id": "prof-2"})
+        assert helper.get_prompt_studio_tool.call_count == 3
+
+    def test_no_execution_id_bypasses_cache(self):
+        helper = self._helper()
+        self._resolve(helper, execution_id="")
+        self._resolve(helper, execution_id="")
+        assert helper.get_prompt_studio_tool.call_count == 2
+
+    def test_expired_entry_is_refetched(self):
+        helper = self._helper()
+        with patch.object(st.time, "monotonic", return_value=1000.0):
+            self._resolve(helper)
+        with patch.object(
+            st.time, "monotonic", return_value=1000.0 + st.TOOL_METADATA_CACHE_TTL
+        ):
+            self._resolve(helper)
+        assert helper.get_prompt_studio_tool.call_count == 2
+
+    def test_ttl_zero_disables_cache(self):
+        helper = self._helper()
+        with patch.object(st, "TOOL_METADATA_CACHE_TTL", 0):
+            self._resolve(helper)
+            self._resolve(helper)
+        assert helper.get_prompt_studio_tool.call_count == 2
+
+    def test_failed_fetch_is_not_cached(self):
+        helper = self._helper()
+        helper.get_prompt_studio_tool.side_effect = [
+            RuntimeError("down"),
+            {"tool_metadata": {"name": "t"}},
+        ]
+        helper.get_agentic_studio_tool.side_effect = RuntimeError("down")
+        with pytest.raises(RuntimeError):
+            self._resolve(helper)
+        tool_metadata, _ = self._resolve(helper)
+        assert tool_metadata["name"] == "t"
+
+    def test_agentic_skips_profile_overrides(self):
+        helper = self._helper()
+        helper.get_prompt_studio_tool.return_value = None
+        helper.get_agentic_studio_tool.return_value = {"tool_metadata": {"name": "a"}}
+        _, is_agentic = self._resolve(helper, exec_metadata={"llm_profile_id": "prof-1"})
+        assert is_agentic is True
+        helper.get_llm_profile.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])